@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2021 eightballer
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""Bookkeeping for published assets that aquarius has not indexed yet."""
+import random
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+DEFAULT_MIN_INTERVAL = 1.0
+DEFAULT_MAX_INTERVAL = 15.0
+DEFAULT_JITTER = 0.2
+DEFAULT_TIMEOUT = 600.0
+
+
+class PendingReceipt:
+    """A receipt delivered once all the assets it lists are resolvable."""
+
+    def __init__(self, envelope: Any, dids: Iterable[str]) -> None:
+        """
+        Initialise the receipt.
+
+        :param envelope: the envelope to deliver.
+        :param dids: the dids of the assets the receipt lists.
+        """
+        self.envelope = envelope
+        self.pending = set(dids)
+        self.expired = False
+
+    def resolve(self, did: str) -> bool:
+        """
+        Mark an asset of the receipt as resolvable.
+
+        :param did: the did of the asset.
+        :return: whether the receipt is ready to be delivered.
+        """
+        self.pending.discard(did)
+        return not self.pending and not self.expired
+
+
+class PendingAsset:
+    """A published asset waiting to become resolvable."""
+
+    def __init__(self, did: str, receipt: Any, started_at: float) -> None:
+        """
+        Initialise the pending asset.
+
+        :param did: the did of the published asset.
+        :param receipt: what to deliver once the asset resolves.
+        :param started_at: the time the asset was published.
+        """
+        self.did = did
+        self.receipt = receipt
+        self.started_at = started_at
+        self.interval = 0.0
+        self.next_check_at = started_at
+
+
+class AquariusWatcher:
+    """
+    Keeps track of pending assets and decides when to check each.
+
+    The checks of an asset back off exponentially, with some jitter so
+    assets published together do not keep hitting aquarius together.
+    """
+
+    def __init__(
+        self,
+        min_interval: float = DEFAULT_MIN_INTERVAL,
+        max_interval: float = DEFAULT_MAX_INTERVAL,
+        jitter: float = DEFAULT_JITTER,
+        timeout: float = DEFAULT_TIMEOUT,
+    ) -> None:
+        """
+        Initialise the watcher.
+
+        :param min_interval: seconds before the first re-check of an asset.
+        :param max_interval: upper bound of the backoff between checks.
+        :param jitter: fraction by which each interval is randomly spread.
+        :param timeout: seconds after which an asset is given up on.
+        """
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.jitter = jitter
+        self.timeout = timeout
+        self._pending = {}  # type: Dict[int, PendingAsset]
+
+    def __len__(self) -> int:
+        """Get the number of pending assets."""
+        return len(self._pending)
+
+    def watch(self, asset: PendingAsset) -> None:
+        """Start watching an asset, it is checked on the next tick."""
+        self._pending[id(asset)] = asset
+
+    def unwatch(self, asset: PendingAsset) -> None:
+        """Stop watching an asset."""
+        self._pending.pop(id(asset), None)
+
+    def due(self, now: Optional[float] = None) -> List[PendingAsset]:
+        """Get the assets whose next check is due."""
+        now = time.time() if now is None else now
+        return [asset for asset in self._pending.values() if asset.next_check_at <= now]
+
+    def expired(self, now: Optional[float] = None) -> List[PendingAsset]:
+        """Get the assets that have been pending for longer than the timeout."""
+        now = time.time() if now is None else now
+        return [
+            asset
+            for asset in self._pending.values()
+            if now - asset.started_at > self.timeout
+        ]
+
+    def wake(self, did: str, now: Optional[float] = None) -> None:
+        """Check the assets of a did on the next tick, e.g. once its metadata is on chain."""
+        now = time.time() if now is None else now
+        for asset in self._pending.values():
+            if asset.did == did:
+                asset.interval = 0.0
+                asset.next_check_at = now
+
+    def backoff(self, asset: PendingAsset, now: Optional[float] = None) -> None:
+        """
+        Schedule the next check of an asset that did not resolve.
+
+        :param asset: the asset.
+        :param now: the current time.
+        """
+        now = time.time() if now is None else now
+        if asset.interval:
+            asset.interval = min(asset.interval * 2, self.max_interval)
+        else:
+            asset.interval = self.min_interval
+        spread = asset.interval * self.jitter
+        asset.next_check_at = now + asset.interval + random.uniform(-spread, spread)
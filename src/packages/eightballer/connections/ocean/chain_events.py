@@ -0,0 +1,243 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2021 eightballer
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""Bookkeeping for the contract events scanned by the ocean connection."""
+import threading
+from collections import deque
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+DEFAULT_CONFIRMATIONS = 0
+DEFAULT_MAX_BLOCK_RANGE = 1000
+DEFAULT_REORG_DEPTH = 64
+
+
+class ChainLog:
+    """A decoded contract event."""
+
+    def __init__(
+        self,
+        event_name: str,
+        address: str,
+        block_number: int,
+        block_hash: str,
+        transaction_hash: str,
+        log_index: int,
+        args: Dict[str, Any],
+        removed: bool = False,
+    ) -> None:
+        """
+        Initialise the log.
+
+        :param event_name: the name of the event.
+        :param address: the address of the contract that emitted the event.
+        :param block_number: the block the event was emitted in.
+        :param block_hash: the hash of that block.
+        :param transaction_hash: the transaction that emitted the event.
+        :param log_index: the position of the event in the block.
+        :param args: the decoded arguments of the event.
+        :param removed: whether the event was undone by a reorg.
+        """
+        self.event_name = event_name
+        self.address = address
+        self.block_number = block_number
+        self.block_hash = block_hash
+        self.transaction_hash = transaction_hash
+        self.log_index = log_index
+        self.args = args
+        self.removed = removed
+
+
+class EventSubscription:
+    """The events a skill asked to be sent."""
+
+    def __init__(
+        self, to: str, sender: str, event_names: Iterable[str], addresses: Iterable[str]
+    ) -> None:
+        """
+        Initialise the subscription.
+
+        :param to: the address to send the events to.
+        :param sender: the address the events are sent from.
+        :param event_names: the names of the events.
+        :param addresses: the contracts emitting the events, any contract if empty.
+        """
+        self.to = to
+        self.sender = sender
+        self.event_names = frozenset(event_names)
+        self.addresses = frozenset(address.lower() for address in addresses)
+
+    def matches(self, log: ChainLog) -> bool:
+        """Check whether a log is one of the subscribed events."""
+        return log.event_name in self.event_names and (
+            not self.addresses or log.address.lower() in self.addresses
+        )
+
+
+class ChainEventWatcher:
+    """
+    Keeps the block cursor of the event scan and the subscriptions.
+
+    Blocks are scanned in ranges of at most `max_block_range`, trailing the
+    head by `confirmations`. The hash of the last block of each range is
+    remembered for `reorg_depth` ranges, so when one no longer matches the
+    chain the cursor is rewound to the last range still on it, and the events
+    already sent from the dropped blocks are sent again marked as removed.
+
+    No block is scanned for a subscription before it is added and then
+    skipped: blocks scanned while there were no subscriptions are scanned
+    again for the first one, and a range whose scan started before a
+    subscription was added is dropped and scanned again with its events.
+    """
+
+    def __init__(
+        self,
+        confirmations: int = DEFAULT_CONFIRMATIONS,
+        max_block_range: int = DEFAULT_MAX_BLOCK_RANGE,
+        reorg_depth: int = DEFAULT_REORG_DEPTH,
+    ) -> None:
+        """
+        Initialise the watcher.
+
+        :param confirmations: blocks to wait for before scanning a block.
+        :param max_block_range: the most blocks scanned at once.
+        :param reorg_depth: the number of scanned ranges checked for reorgs.
+        """
+        self.confirmations = confirmations
+        self.max_block_range = max_block_range
+        self.cursor = None  # type: Optional[int]
+        # the first block, last block and hash of the last block of each range
+        self._scanned = deque(maxlen=reorg_depth)  # type: deque
+        self._sent = []  # type: List[ChainLog]
+        self._subscriptions = []  # type: List[EventSubscription]
+        # the first block scanned since there are no subscriptions
+        self._idle_from = None  # type: Optional[int]
+        self._subscribed = False
+        self._lock = threading.Lock()
+
+    @property
+    def event_names(self) -> Set[str]:
+        """Get the names of all the subscribed events."""
+        return {
+            name
+            for subscription in self._subscriptions
+            for name in subscription.event_names
+        }
+
+    def scan_event_names(self) -> Set[str]:
+        """Get the names of the events to scan the next range for."""
+        with self._lock:
+            self._subscribed = False
+            return self.event_names
+
+    def subscribe(self, subscription: EventSubscription) -> None:
+        """Add a subscription, replacing an identical one."""
+        with self._lock:
+            self.unsubscribe(subscription)
+            self._subscriptions.append(subscription)
+            self._subscribed = True
+            if self._idle_from is not None:
+                self._drop_from(self._idle_from)
+                self._idle_from = None
+
+    def unsubscribe(self, subscription: EventSubscription) -> None:
+        """Remove a subscription."""
+        self._subscriptions = [
+            existing
+            for existing in self._subscriptions
+            if (existing.to, existing.event_names, existing.addresses)
+            != (subscription.to, subscription.event_names, subscription.addresses)
+        ]
+
+    def subscribers(self, log: ChainLog) -> List[EventSubscription]:
+        """Get the subscriptions a log is sent to."""
+        return [
+            subscription
+            for subscription in self._subscriptions
+            if subscription.matches(log)
+        ]
+
+    def next_range(self, head: int) -> Optional[Tuple[int, int]]:
+        """
+        Get the next blocks to scan.
+
+        The first scan starts at the head, earlier blocks are not replayed.
+
+        :param head: the number of the latest block.
+        :return: the first and last block to scan, or None if up to date.
+        """
+        last = head - self.confirmations
+        if self.cursor is None:
+            self.cursor = last - 1
+        if last <= self.cursor:
+            return None
+        return self.cursor + 1, min(last, self.cursor + self.max_block_range)
+
+    def advance(
+        self, from_block: int, to_block: int, block_hash: str, logs: List[ChainLog]
+    ) -> List[ChainLog]:
+        """
+        Record a scanned range.
+
+        :param from_block: the first block scanned.
+        :param to_block: the last block scanned.
+        :param block_hash: the hash of the last block scanned.
+        :param logs: the events found in the range.
+        :return: the events in chain order.
+        """
+        with self._lock:
+            if self._subscribed or from_block - 1 != self.cursor:
+                # subscribed during the scan, scan the range again for its events
+                return []
+            if not self._subscriptions and self._idle_from is None:
+                self._idle_from = from_block
+        logs = sorted(logs, key=lambda log: (log.block_number, log.log_index))
+        self._scanned.append((from_block, to_block, block_hash))
+        self.cursor = to_block
+        oldest = self._scanned[0][0]
+        self._sent = [log for log in self._sent if log.block_number >= oldest] + logs
+        return logs
+
+    def _drop_from(self, block: int) -> None:
+        """Forget the blocks scanned from a block on, so they are scanned again."""
+        self.cursor = block - 1
+        while self._scanned and self._scanned[-1][0] >= block:
+            self._scanned.pop()
+        self._sent = [log for log in self._sent if log.block_number < block]
+
+    def rewind(self, get_block_hash: Callable[[int], str]) -> List[ChainLog]:
+        """
+        Check the scanned blocks are still on the chain and undo those which are not.
+
+        :param get_block_hash: gets the hash of a block on the chain now.
+        :return: the events of the dropped blocks, marked as removed.
+        """
+        dropped_from = None
+        while self._scanned:
+            from_block, to_block, block_hash = self._scanned[-1]
+            if get_block_hash(to_block) == block_hash:
+                break
+            self._scanned.pop()
+            dropped_from = from_block
+        if dropped_from is None:
+            return []
+        self.cursor = dropped_from - 1
+        removed = [log for log in self._sent if log.block_number >= dropped_from]
+        self._sent = [log for log in self._sent if log.block_number < dropped_from]
+        for log in removed:
+            log.removed = True
+        return removed[::-1]
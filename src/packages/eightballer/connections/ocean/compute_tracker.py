@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2021 eightballer
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""Bookkeeping for compute-to-data jobs polled by the ocean connection."""
+import threading
+import time
+from typing import Dict, List, Optional
+
+# status codes reported by the ocean compute provider
+STATUS_COMPLETED = 70
+FAILED_STATUSES = frozenset({31, 32})
+# publishing the results is quick, so poll these at the base rate
+FINISHING_STATUSES = frozenset({50, 60})
+
+DEFAULT_MIN_INTERVAL = 2.0
+DEFAULT_MAX_INTERVAL = 30.0
+DEFAULT_TIMEOUT = 3600.0
+
+
+class ComputeJob:
+    """A compute job started by the connection and not yet finished."""
+
+    def __init__(
+        self,
+        job_id: str,
+        data_did: str,
+        to: str,
+        sender: str,
+        started_at: float,
+        consumer: Optional[str] = None,
+        group: Optional["ComputeJobGroup"] = None,
+    ) -> None:
+        """
+        Initialise the job.
+
+        :param job_id: the id returned by the compute provider.
+        :param data_did: the did of the dataset the job runs on.
+        :param to: the address to send the results to.
+        :param sender: the address the results are sent from.
+        :param started_at: the time the job was started.
+        :param consumer: the address of the wallet that started the job.
+        :param group: the group whose results are sent together with this one.
+        """
+        self.job_id = job_id
+        self.data_did = data_did
+        self.to = to
+        self.sender = sender
+        self.started_at = started_at
+        self.consumer = consumer
+        self.group = group
+        self.status = None  # type: Optional[int]
+        self.interval = 0.0
+        self.next_poll_at = started_at
+
+
+class ComputeJobGroup:
+    """
+    The compute jobs started for a single request, answered with one reply.
+
+    Each dataset of the request is either part of a job or has failed. The
+    group is complete once it is sealed, when no more jobs are added, and
+    every job has finished.
+    """
+
+    def __init__(self, data_dids: List[str], to: str, sender: str) -> None:
+        """
+        Initialise the group.
+
+        :param data_dids: the dids of the datasets of the request.
+        :param to: the address to send the results to.
+        :param sender: the address the results are sent from.
+        """
+        self.data_dids = data_dids
+        self.to = to
+        self.sender = sender
+        self.job_ids = dict.fromkeys(data_dids, "")  # type: Dict[str, str]
+        self.file_paths = dict.fromkeys(data_dids, "")  # type: Dict[str, str]
+        self.errors = dict.fromkeys(data_dids, "")  # type: Dict[str, str]
+        self._running = {}  # type: Dict[str, List[str]]
+        self._sealed = False
+        self._completed = False
+        self._lock = threading.Lock()
+
+    def add(self, job_id: str, data_dids: List[str]) -> None:
+        """Add a job started on some of the datasets."""
+        with self._lock:
+            self._running[job_id] = data_dids
+            for did in data_dids:
+                self.job_ids[did] = job_id
+
+    def fail(self, data_dids: List[str], error: str) -> None:
+        """Record the error of datasets no job could be started on."""
+        with self._lock:
+            for did in data_dids:
+                self.errors[did] = error
+
+    def finish(self, job_id: str, file_path: str = "", error: str = "") -> bool:
+        """
+        Record the result or the error of a job.
+
+        :param job_id: the id of the job.
+        :param file_path: the path its result was saved to.
+        :param error: the reason it failed.
+        :return: whether the group has just completed.
+        """
+        with self._lock:
+            for did in self._running.pop(job_id, []):
+                self.file_paths[did] = file_path
+                self.errors[did] = error
+            return self._complete()
+
+    def seal(self) -> bool:
+        """
+        Stop adding jobs to the group.
+
+        :return: whether the group has just completed.
+        """
+        with self._lock:
+            self._sealed = True
+            return self._complete()
+
+    def _complete(self) -> bool:
+        if self._completed or not self._sealed or self._running:
+            return False
+        self._completed = True
+        return True
+
+
+class ComputeJobTracker:
+    """Keeps track of running compute jobs and decides when to poll each."""
+
+    def __init__(
+        self,
+        min_interval: float = DEFAULT_MIN_INTERVAL,
+        max_interval: float = DEFAULT_MAX_INTERVAL,
+        timeout: float = DEFAULT_TIMEOUT,
+    ) -> None:
+        """
+        Initialise the tracker.
+
+        :param min_interval: seconds between polls while the status changes.
+        :param max_interval: upper bound of the backoff between polls.
+        :param timeout: seconds after which a job is given up on.
+        """
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.timeout = timeout
+        self._jobs = {}  # type: Dict[str, ComputeJob]
+
+    def __len__(self) -> int:
+        """Get the number of tracked jobs."""
+        return len(self._jobs)
+
+    def track(self, job: ComputeJob) -> None:
+        """Start tracking a job, it is polled on the next tick."""
+        job.interval = self.min_interval
+        self._jobs[job.job_id] = job
+
+    def untrack(self, job: ComputeJob) -> None:
+        """Stop tracking a job."""
+        self._jobs.pop(job.job_id, None)
+
+    def due(self, now: Optional[float] = None) -> List[ComputeJob]:
+        """Get the jobs whose next poll is due."""
+        now = time.time() if now is None else now
+        return [job for job in self._jobs.values() if job.next_poll_at <= now]
+
+    def expired(self, now: Optional[float] = None) -> List[ComputeJob]:
+        """Get the jobs that have been running for longer than the timeout."""
+        now = time.time() if now is None else now
+        return [
+            job for job in self._jobs.values() if now - job.started_at > self.timeout
+        ]
+
+    def update(self, job: ComputeJob, status: int, now: Optional[float] = None) -> None:
+        """
+        Record the latest status of a job and schedule its next poll.
+
+        The interval is reset whenever the status changes and doubles, up to
+        `max_interval`, while the job stays in the same state.
+
+        :param job: the job.
+        :param status: the status code reported by the provider.
+        :param now: the current time.
+        """
+        now = time.time() if now is None else now
+        if status != job.status or status in FINISHING_STATUSES:
+            job.interval = self.min_interval
+        else:
+            job.interval = min(job.interval * 2, self.max_interval)
+        job.status = status
+        job.next_poll_at = now + job.interval
+
+    @staticmethod
+    def is_completed(job: ComputeJob) -> bool:
+        """Check whether the job has completed."""
+        return job.status == STATUS_COMPLETED
+
+    @staticmethod
+    def is_failed(job: ComputeJob) -> bool:
+        """Check whether the job has failed."""
+        return job.status in FAILED_STATUSES
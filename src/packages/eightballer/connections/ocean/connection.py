@@ -17,46 +17,193 @@
 #
 # ------------------------------------------------------------------------------
 """Scaffold connection and channel."""
+import asyncio
 import hashlib
 import os
+import threading
 import time
+from asyncio import AbstractEventLoop, CancelledError
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Dict, Optional, Union
+from functools import partial
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
 import requests
 from aea.configurations.base import PublicId
-from aea.connections.base import BaseSyncConnection, Connection
+from aea.connections.base import Connection, ConnectionStates
 from aea.mail.base import Envelope
 
+# fmt: off
+from packages.eightballer.connections.ocean.aquarius_watcher import (
+    AquariusWatcher, PendingAsset, PendingReceipt)
+from packages.eightballer.connections.ocean.chain_events import (
+    ChainEventWatcher, ChainLog, EventSubscription)
+from packages.eightballer.connections.ocean.compute_tracker import (
+    ComputeJob, ComputeJobGroup, ComputeJobTracker)
+from packages.eightballer.connections.ocean.ddo_cache import DDOCache
+from packages.eightballer.connections.ocean.http_session import PooledSession
+from packages.eightballer.connections.ocean.nonce_manager import NonceManager
+from packages.eightballer.connections.ocean.order_ledger import (OrderKey,
+                                                                 OrderLedger)
+from packages.eightballer.connections.ocean.pool_math import (DEFAULT_SLIPPAGE,
+                                                              PoolQuoter,
+                                                              PoolState)
+from packages.eightballer.connections.ocean.publish_index import (
+    DEFAULT_INDEX_PATH, PublishIndex)
+from packages.eightballer.connections.ocean.read_cache import BlockReadCache
+from packages.eightballer.connections.ocean.resilience import (
+    CircuitOpenError, Resilience, is_transient)
+from packages.eightballer.connections.ocean.rpc_router import RPCRouter
+from packages.eightballer.connections.ocean.wallet_pool import WalletPool
+from packages.eightballer.protocols.ocean.custom_types import ErrorCode
 from packages.eightballer.protocols.ocean.message import OceanMessage
 
-"""
-Choose one of the possible implementations:
-
-Sync (inherited from BaseSyncConnection) or Async (inherited from Connection) connection and remove unused one.
-"""
+# fmt: on
 
 CONNECTION_ID = PublicId.from_str("eightballer/ocean:0.1.0")
 
 import json
 import os
 
-import ocean_lib
 import web3
+from eth_abi import decode_abi, encode_abi
 from eth_account import Account
+from eth_utils import event_abi_to_log_topic, remove_0x_prefix
 from ocean_lib.common.agreements.service_types import ServiceTypes
+from ocean_lib.common.aquarius.aquarius import Aquarius
+from ocean_lib.common.aquarius.aquarius_provider import AquariusProvider
 from ocean_lib.data_provider.data_service_provider import DataServiceProvider
 from ocean_lib.example_config import ExampleConfig
+from ocean_lib.exceptions import AquariusError
+from ocean_lib.models.bpool import BPool
 from ocean_lib.models.compute_input import ComputeInput
+from ocean_lib.models.data_token import DataToken
+from ocean_lib.models.metadata import MetadataContract
 from ocean_lib.ocean.ocean import Ocean
 from ocean_lib.services.service import Service
 from ocean_lib.web3_internal.constants import ZERO_ADDRESS
+from ocean_lib.web3_internal.contract_utils import get_contract_definition
 from ocean_lib.web3_internal.currency import to_wei
 from ocean_lib.web3_internal.wallet import Wallet
-from web3._utils.threads import Timeout
+from web3._utils.events import get_event_data
 
 Account.enable_unaudited_hdwallet_features()
 
+# accounts whose nonces are assigned by a `NonceManager`, by lower case address
+NONCE_MANAGERS: Dict[str, NonceManager] = {}
+# the managers and nonces of the transactions signed in each thread
+_nonce_context = threading.local()
+_nonce_managers_lock = threading.Lock()
+_library_get_nonce = Wallet._get_nonce
+
+
+def _get_nonce(web3, address: str) -> int:
+    """Assign the nonce of a transaction signed by an ocean_lib `Wallet`."""
+    manager = NONCE_MANAGERS.get(address.lower())
+    if manager is None:
+        return _library_get_nonce(web3, address)
+    nonce = manager.next_nonce()
+    # some calls, like buying datatokens, approve then swap
+    reserved = getattr(_nonce_context, "reserved", None)
+    if reserved is not None:
+        reserved.append((manager, nonce))
+    return nonce
+
+
+def _add_nonce_manager(manager: NonceManager) -> None:
+    """Assign the nonces of an account with a manager, for as long as it is added."""
+    with _nonce_managers_lock:
+        if not NONCE_MANAGERS:
+            # ocean_lib signs every transaction through `Wallet._get_nonce`
+            Wallet._get_nonce = staticmethod(_get_nonce)
+        NONCE_MANAGERS[manager.address.lower()] = manager
+
+
+def _remove_nonce_manager(address: str) -> None:
+    """Give the nonces of an account back to ocean_lib."""
+    with _nonce_managers_lock:
+        NONCE_MANAGERS.pop(address.lower(), None)
+        if not NONCE_MANAGERS:
+            Wallet._get_nonce = staticmethod(_library_get_nonce)
+
+
+def _to_json(value: Any) -> str:
+    """Encode the bytes arguments of an event as hex strings."""
+    if isinstance(value, bytes):
+        return "0x" + value.hex()
+    raise TypeError(f"Can not encode {type(value)} as json")
+
+
+def _error_message(
+    error: Exception, performative: OceanMessage.Performative
+) -> OceanMessage:
+    """Get the error reply to an operation which failed."""
+    error_code = (
+        ErrorCode.SERVICE_UNAVAILABLE
+        if isinstance(error, CircuitOpenError)
+        else ErrorCode.OPERATION_FAILED
+    )
+    return OceanMessage(
+        performative=OceanMessage.Performative.ERROR,
+        error_code=error_code,
+        error_msg=str(error),
+        error_data={"performative": str(performative).encode()},
+    )
+
+
+def _aquarius_class(session: PooledSession) -> type:
+    """Get an aquarius client class sending its requests through a shared session."""
+
+    class PooledAquarius(Aquarius):
+        def __init__(self, aquarius_url: str) -> None:
+            super().__init__(aquarius_url)
+            # ocean_lib makes a client, with a new session, for every lookup
+            self.requests_session = session
+
+    return PooledAquarius
+
+
+def _read_cache_middleware(cache: BlockReadCache) -> Callable:
+    """Get a web3 middleware answering the plain reads at the latest block from a cache."""
+
+    def middleware(make_request: Callable, w3: web3.Web3) -> Callable:
+        def request(method: str, params: Any) -> Dict[str, Any]:
+            if (
+                method == "eth_call"
+                and set(params[0]) <= {"to", "data"}
+                and (len(params) < 2 or params[1] == "latest")
+            ):
+                try:
+                    result = cache.read(params[0]["to"], params[0]["data"])
+                    return {"jsonrpc": "2.0", "id": 0, "result": result}
+                except Exception:  # pylint: disable=broad-except
+                    # made again on its own, for web3 to get the error of the node
+                    return make_request(method, params)
+            response = make_request(method, params)
+            if method == "eth_getTransactionReceipt" and response.get("result"):
+                # reads after a transaction are at least at its block
+                cache.observe_block(int(response["result"]["blockNumber"], 16))
+            return response
+
+        return request
+
+    return middleware
+
+
+class RoutedProvider(web3.providers.BaseProvider):
+    """A web3 provider sending its requests through an `RPCRouter`."""
+
+    def __init__(self, router: RPCRouter) -> None:
+        super().__init__()
+        self.router = router
+
+    def make_request(self, method: str, params: Any) -> Dict[str, Any]:
+        return self.router.make_request(method, params)
+
+    def isConnected(self) -> bool:
+        return self.router.is_connected()
+
+
 from string import Template
 
 D2C_TEMPLATE = Template(
@@ -137,10 +284,131 @@ ALGO_SERVICE_TEMPLATE = Template(
 )
 
 
-class OceanConnection(BaseSyncConnection):
-    """Proxy to the functionality of the SDK or API."""
+# Performatives are grouped into classes, each with its own queue and worker
+# pool, so that slow work (compute jobs) can not starve fast work (purchases).
+PERFORMATIVE_CLASSES = {
+    OceanMessage.Performative.DEPLOY_D2C: "deploy",
+    OceanMessage.Performative.DEPLOY_ALGORITHM: "deploy",
+    OceanMessage.Performative.DEPLOY_BATCH: "deploy",
+    OceanMessage.Performative.DEPLOY_DATA_DOWNLOAD: "deploy",
+    OceanMessage.Performative.PERMISSION_DATASET: "permission",
+    OceanMessage.Performative.PERMISSION_DATASETS: "permission",
+    OceanMessage.Performative.CREATE_POOL: "pool",
+    OceanMessage.Performative.DOWNLOAD_JOB: "purchase",
+    OceanMessage.Performative.PURCHASE_DATATOKENS: "purchase",
+    OceanMessage.Performative.D2C_JOB: "compute",
+    OceanMessage.Performative.D2C_MULTI_JOB: "compute",
+}
+
+# the dids and addresses an operation works on, which decide the wallet it runs on
+WALLET_AFFINITY = {
+    OceanMessage.Performative.PERMISSION_DATASET: lambda msg: (msg.data_did,),
+    OceanMessage.Performative.PERMISSION_DATASETS: lambda msg: tuple(msg.data_dids),
+    OceanMessage.Performative.CREATE_POOL: lambda msg: (msg.datatoken_address,),
+    OceanMessage.Performative.DOWNLOAD_JOB: lambda msg: (
+        msg.asset_did,
+        msg.datatoken_address,
+    ),
+    OceanMessage.Performative.D2C_JOB: lambda msg: (msg.data_did, msg.algo_did),
+    OceanMessage.Performative.D2C_MULTI_JOB: lambda msg: (*msg.data_dids, msg.algo_did),
+}
+
+# the deploy performative and contents matching each type of batch asset spec
+DATA_SPEC_CONTENTS = (
+    "token0_name",
+    "token1_name",
+    "dataset_url",
+    "name",
+    "author",
+    "date_created",
+    "license",
+    "amount_to_mint",
+)
+ALGORITHM_SPEC_CONTENTS = (
+    "token0_name",
+    "token1_name",
+    "amount_to_mint",
+    "language",
+    "format",
+    "version",
+    "entrypoint",
+    "image",
+    "tag",
+    "files_url",
+    "name",
+    "author",
+    "date_created",
+    "license",
+)
+ASSET_SPEC_PERFORMATIVES = {
+    "algorithm": (OceanMessage.Performative.DEPLOY_ALGORITHM, ALGORITHM_SPEC_CONTENTS),
+    "d2c": (OceanMessage.Performative.DEPLOY_D2C, DATA_SPEC_CONTENTS),
+    "data_download": (
+        OceanMessage.Performative.DEPLOY_DATA_DOWNLOAD,
+        DATA_SPEC_CONTENTS,
+    ),
+}
+
+MAIN_LOOP_INTERVAL = 1.0
+
+# seconds between two logs of the usage of the caches and connection pools
+DEFAULT_STATS_INTERVAL = 300.0
+
+# the contract events skills can subscribe to, by the contract declaring them
+CHAIN_EVENTS = {
+    "OrderStarted": DataToken.CONTRACT_NAME,
+    "LOG_SWAP": BPool.CONTRACT_NAME,
+    "LOG_JOIN": BPool.CONTRACT_NAME,
+    "MetadataCreated": MetadataContract.CONTRACT_NAME,
+    "MetadataUpdated": MetadataContract.CONTRACT_NAME,
+}
+# watched while assets wait for aquarius, which indexes them after these events
+METADATA_EVENTS = frozenset({"MetadataCreated", "MetadataUpdated"})
+
+# reads batched into one call to a Multicall2 contract, when one is configured
+MULTICALL_TRY_AGGREGATE = "tryAggregate(bool,(address,bytes)[])"
+
+# the endpoint each operation depends on and the number of times it is tried,
+# operations which pay or start a job are not replayed
+OPERATION_POLICIES = {
+    "resolve": ("aquarius", 3),
+    "order": ("provider", 3),
+    "download": ("provider", 3),
+    "compute_start": ("provider", 1),
+    "compute_status": ("provider", 1),
+    "compute_result": ("provider", 1),
+    "read_pool": ("rpc", 3),
+    "chain_events": ("rpc", 1),
+    "transaction": ("rpc", 1),
+}
+
+DEFAULT_MAX_PIPELINED_TRANSACTIONS = 8
+
+DEFAULT_BATCH_CONCURRENCY = 8
+
+# downloads larger than this are referenced by path instead of sent inline
+DEFAULT_MAX_INLINE_DOWNLOAD_SIZE = 16 * 1024 * 1024
 
-    MAX_WORKER_THREADS = 5
+# compute results larger than one chunk are streamed as RESULT_CHUNK messages
+DEFAULT_RESULT_CHUNK_SIZE = 1024 * 1024
+DEFAULT_MAX_CHUNKS_IN_FLIGHT = 8
+
+# the most datasets a single compute job runs on, 0 for no limit
+DEFAULT_MAX_COMPUTE_INPUTS = 0
+# where the results of multi dataset compute jobs are saved
+DEFAULT_COMPUTE_RESULTS_DIR = "./compute_results/"
+
+DEFAULT_CONCURRENCY = {
+    "deploy": 4,
+    "permission": 2,
+    "pool": 4,
+    "purchase": 8,
+    "compute": 16,
+}
+
+
+class OceanConnection(Connection):
+    """Proxy to the functionality of the SDK or API."""
 
     connection_id = CONNECTION_ID
 
@@ -163,160 +431,473 @@ class OceanConnection(BaseSyncConnection):
         :param kwargs: keyword arguments passed to component base
         """
         super().__init__(*args, **kwargs)
+        self.concurrency = {
+            **DEFAULT_CONCURRENCY,
+            **(self.configuration.config.get("concurrency") or {}),
+        }
+        self._handlers = {
+            OceanMessage.Performative.DEPLOY_D2C: self._deploy_data_for_d2c,
+            OceanMessage.Performative.DEPLOY_ALGORITHM: self._deploy_algorithm,
+            OceanMessage.Performative.DEPLOY_BATCH: self._deploy_batch,
+            OceanMessage.Performative.DEPLOY_DATA_DOWNLOAD: self._deploy_data_to_download,
+            OceanMessage.Performative.PERMISSION_DATASET: self._permission_dataset,
+            OceanMessage.Performative.PERMISSION_DATASETS: self._permission_datasets,
+            OceanMessage.Performative.CREATE_POOL: self._create_pool,
+            OceanMessage.Performative.DOWNLOAD_JOB: self._download_asset,
+            OceanMessage.Performative.PURCHASE_DATATOKENS: self._purchase_datatokens,
+            OceanMessage.Performative.D2C_JOB: self._create_d2c_job,
+            OceanMessage.Performative.D2C_MULTI_JOB: self._create_d2c_multi_job,
+        }
+        self._loop: Optional[AbstractEventLoop] = None
+        self._incoming_messages_queue: Optional[asyncio.Queue] = None
+        self._queues: Dict[str, asyncio.Queue] = {}
+        self._executors: Dict[str, ThreadPoolExecutor] = {}
+        self._workers: List[asyncio.Task] = []
+        self._main_task: Optional[asyncio.Task] = None
+        self._context = threading.local()
+        self._next_stats_at = 0.0
+        self.rpc_router: Optional[RPCRouter] = None
+        # chunks put in the incoming queue and not yet received by the agent
+        self._chunk_credits = threading.BoundedSemaphore(
+            self.configuration.config.get(
+                "max_chunks_in_flight", DEFAULT_MAX_CHUNKS_IN_FLIGHT
+            )
+        )
 
-    def main(self) -> None:
-        """
-        Run synchronous code in background.
-
-        SyncConnection `main()` usage:
-        The idea of the `main` method in the sync connection
-        is to provide for a way to actively generate messages by the connection via the `put_envelope` method.
+        tracker_config = self.configuration.config.get("compute_tracker") or {}
+        self.compute_tracker = ComputeJobTracker(**tracker_config)
+        watcher_config = self.configuration.config.get("aquarius_watcher") or {}
+        self.aquarius_watcher = AquariusWatcher(**watcher_config)
+        self.ddo_cache = DDOCache(**(self.configuration.config.get("ddo_cache") or {}))
+        # the checksums of the trusted algorithms, by did and metadata version
+        self.algo_checksums = DDOCache(ttl=float("inf"))
+        self.chain_events = ChainEventWatcher(
+            **(self.configuration.config.get("chain_events") or {})
+        )
+        self.resilience = Resilience(
+            OPERATION_POLICIES, **(self.configuration.config.get("resilience") or {})
+        )
 
-        A simple example is the generation of a message every second:
-        ```
-        while self.is_connected:
-            envelope = make_envelope_for_current_time()
-            self.put_enevelope(envelope)
-            time.sleep(1)
-        ```
-        In this case, the connection will generate a message every second
-        regardless of envelopes sent to the connection by the agent.
-        For instance, this way one can implement periodically polling some internet resources
-        and generate envelopes for the agent if some updates are available.
-        Another example is the case where there is some framework that runs blocking
-        code and provides a callback on some internal event.
-        This blocking code can be executed in the main function and new envelops
-        can be created in the event callback.
+    async def connect(self) -> None:
+        """Set up the ocean client and start one worker pool per performative class."""
+        if self.is_connected:  # pragma: nocover
+            return
+        self.state = ConnectionStates.connecting
+        self._loop = asyncio.get_event_loop()
+        self._incoming_messages_queue = asyncio.Queue()
+        for performative_class, limit in self.concurrency.items():
+            self._queues[performative_class] = asyncio.Queue()
+            self._executors[performative_class] = ThreadPoolExecutor(
+                max_workers=limit, thread_name_prefix=f"ocean_{performative_class}"
+            )
+        self._executors["transactions"] = ThreadPoolExecutor(
+            max_workers=self.configuration.config.get(
+                "max_pipelined_transactions", DEFAULT_MAX_PIPELINED_TRANSACTIONS
+            ),
+            thread_name_prefix="ocean_transactions",
+        )
+        self._executors["events"] = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="ocean_events"
+        )
+        try:
+            await self._loop.run_in_executor(self._executors["deploy"], self.on_connect)
+        except Exception:  # pragma: nocover
+            self.state = ConnectionStates.disconnected
+            self._shutdown_executors()
+            raise
+        for performative_class, limit in self.concurrency.items():
+            self._workers.extend(
+                self._loop.create_task(self._worker(performative_class))
+                for _ in range(limit)
+            )
+        self._main_task = self._loop.create_task(self.main())
+        self.state = ConnectionStates.connected
+
+    async def disconnect(self) -> None:
+        """Stop the workers and tear down the ocean client."""
+        if self.is_disconnected:  # pragma: nocover
+            return
+        self.state = ConnectionStates.disconnecting
+        tasks = [*self._workers, self._main_task]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._workers = []
+        self._main_task = None
+        self.on_disconnect()
+        self._shutdown_executors()
+        if self._incoming_messages_queue is not None:
+            self._incoming_messages_queue.put_nowait(None)
+        self.state = ConnectionStates.disconnected
+
+    async def main(self) -> None:
         """
+        Supervise long running ocean work in the background.
 
-    def on_send(self, envelope: Envelope) -> None:
+        Runs for as long as the connection is connected and delivers the
+        replies of work that outlives its handler, such as compute jobs and
+        assets waiting to be indexed by aquarius, and the contract events
+        skills subscribed to.
+        """
+        pollers = {
+            "chain events": self._poll_chain_events,
+            "compute jobs": self._poll_compute_jobs,
+            "pending assets": self._poll_pending_assets,
+            "stats": self._log_stats,
+        }
+        while True:
+            for name, poll in pollers.items():
+                try:
+                    await poll()
+                except CancelledError:  # pragma: nocover
+                    raise
+                except Exception as e:  # pylint: disable=broad-except
+                    self.logger.error(f"Error while polling {name}: {e}")
+            await asyncio.sleep(MAIN_LOOP_INTERVAL)
+
+    async def send(self, envelope: Envelope) -> None:
         """
         Send an envelope.
 
+        The envelope is queued on the queue of its performative class and
+        returns immediately, the reply is delivered through `receive`.
+
         :param envelope: the envelope to send.
         """
         self.logger.debug(f"Receieved {envelope} in connection")
+        if envelope.message.performative == OceanMessage.Performative.SUBSCRIBE_EVENTS:
+            self._subscribe_events(envelope)
+            return
+        performative_class = PERFORMATIVE_CLASSES.get(envelope.message.performative)
+        if performative_class is None:
+            self.logger.error(
+                f"Unsupported performative! {envelope.message.performative}"
+            )
+            return
+        await self._queues[performative_class].put(envelope)
 
-        if envelope.message.performative == OceanMessage.Performative.DEPLOY_D2C:
-            self._deploy_data_for_d2c(envelope)
-        if envelope.message.performative == OceanMessage.Performative.DEPLOY_ALGORITHM:
-            self._deploy_algorithm(envelope)
-        if (
-            envelope.message.performative
-            == OceanMessage.Performative.PERMISSION_DATASET
-        ):
-            self._permission_dataset(envelope)
-        if envelope.message.performative == OceanMessage.Performative.D2C_JOB:
-            self._create_d2c_job(envelope)
+    async def receive(self, *args: Any, **kwargs: Any) -> Optional[Envelope]:
+        """
+        Receive an envelope.
+
+        :return: the envelope received, or None.
+        """
+        try:
+            envelope = await self._incoming_messages_queue.get()
+        except CancelledError:  # pragma: nocover
+            return None
         if (
-            envelope.message.performative
-            == OceanMessage.Performative.DEPLOY_DATA_DOWNLOAD
+            envelope is not None
+            and envelope.message.performative == OceanMessage.Performative.RESULT_CHUNK
         ):
-            self._deploy_data_to_download(envelope)
-        if envelope.message.performative == OceanMessage.Performative.CREATE_POOL:
-            self._create_pool(envelope)
-        if envelope.message.performative == OceanMessage.Performative.DOWNLOAD_JOB:
-            self._purchase_datatoken(envelope)
+            self._chunk_credits.release()
+        return envelope
+
+    def put_envelope(self, envelope: Envelope) -> None:
+        """
+        Put an envelope in the incoming queue, safe to call from worker threads.
+
+        :param envelope: the envelope to deliver to the agent.
+        """
+        if self._loop is None:  # pragma: nocover
+            raise ValueError("Connection is not connected, loop is not set!")
+        self._loop.call_soon_threadsafe(
+            self._incoming_messages_queue.put_nowait, envelope
+        )
+
+    async def _worker(self, performative_class: str) -> None:
+        """Process the envelopes of one performative class, one at a time."""
+        queue = self._queues[performative_class]
+        executor = self._executors[performative_class]
+        while True:
+            envelope = await queue.get()
+            handler = self._handlers[envelope.message.performative]
+            try:
+                await self._loop.run_in_executor(
+                    executor, self._handle, handler, envelope
+                )
+            except CancelledError:  # pragma: nocover
+                raise
+            except Exception as e:  # pylint: disable=broad-except
+                self.logger.error(
+                    f"Failed to handle {envelope.message.performative}: {e}"
+                )
+                self._put_error(envelope, e)
+            finally:
+                queue.task_done()
 
-    def _purchase_datatoken(self, envelope: Envelope):
+    def _put_error(self, envelope: Envelope, error: Exception) -> None:
+        """Reply to an envelope whose handler failed, so the skill does not wait on it."""
+        msg = _error_message(error, envelope.message.performative)
+        msg.sender = envelope.to
+        msg.to = envelope.sender
+        self.put_envelope(Envelope(to=msg.to, sender=msg.sender, message=msg))
+
+    def _put_job_error(self, job: ComputeJob, error: Exception) -> None:
+        """Reply to a compute job which failed, so the skill does not wait on it."""
+        self._put_result(job, _error_message(error, OceanMessage.Performative.D2C_JOB))
+
+    @property
+    def wallet(self) -> Wallet:
+        """Get the wallet of the operation running in the current thread."""
+        return getattr(self._context, "wallet", None) or self.wallets.default
+
+    def _handle(self, handler: Callable, envelope: Envelope) -> None:
+        """Run a handler on the wallet scheduled for its envelope."""
+        affinity = WALLET_AFFINITY.get(envelope.message.performative)
+        keys = affinity(envelope.message) if affinity is not None else ()
+        self._run_on_wallet(keys, handler, envelope)
+
+    def _run_on_wallet(self, keys: tuple, fn: Callable, *args: Any) -> Any:
+        """Run a function on the wallet scheduled for the given dids and addresses."""
+        wallet = self.wallets.acquire(*keys)
+        previous = getattr(self._context, "wallet", None)
+        self._context.wallet = wallet
         try:
-            self.ocean.pool.buy_data_tokens(
-                pool_address=envelope.message.pool_address,
-                amount=to_wei(envelope.message.datatoken_amt),
-                max_OCEAN_amount=to_wei(envelope.message.max_cost_ocean),
-                from_wallet=self.wallet,
-            )
+            return fn(*args)
+        finally:
+            self._context.wallet = previous
+            self.wallets.release(wallet)
+
+    def _shutdown_executors(self) -> None:
+        for executor in self._executors.values():
+            executor.shutdown(wait=False)
+        self._executors = {}
+
+    def _purchase_datatoken(self, message: OceanMessage) -> None:
+        """Buy the datatokens of a download from the cheapest pool."""
+        pool_address, max_cost = self._plan_purchase(
+            message.pool_address, message.datatoken_amt, message.max_cost_ocean,
+        )
+        self._transact(
+            self.ocean.pool.buy_data_tokens,
+            pool_address=pool_address,
+            amount=to_wei(message.datatoken_amt),
+            max_OCEAN_amount=max_cost,
+            from_wallet=self.wallet,
+        )
+        # the bought tokens are spent from this wallet
+        self.wallets.assign(self.wallet, message.asset_did, message.datatoken_address)
+        self.logger.info(f"Purchased {message.datatoken_amt} datatokens")
 
-            msg = OceanMessage(
-                performative=OceanMessage.Performative.DOWNLOAD_JOB,
-                **{
-                    "datatoken_address": "unused",
-                    "datatoken_amt": -1,
-                    "max_cost_ocean": -1,
-                    "asset_did": "unused",
-                    "pool_address": "unused",
-                },
-            )
-            msg.sender = envelope.to
-            msg.to = envelope.sender
+    def _purchase_datatokens(self, envelope: Envelope):
+        """
+        Buy datatokens from several pools at once.
 
-            envelope = Envelope(to=msg.to, sender=msg.sender, message=msg)
-            self.put_envelope(envelope)
-            self.logger.info(f"Purchased 1 datatoken")
+        The purchases are sent back to back from the wallet, each with its own
+        nonce, and their receipts are awaited together. The reply lists the
+        datatoken bought or the error for each pool, in the order requested.
+        """
+        message = envelope.message
+        purchases = []
+        for pool_address, datatoken_amt, max_cost_ocean in zip(
+            message.pool_addresses, message.datatoken_amts, message.max_costs_ocean
+        ):
+            purchase = Future()  # type: Future
+            try:
+                pool_address, max_cost = self._plan_purchase(
+                    pool_address, datatoken_amt, max_cost_ocean
+                )
+                purchase = self._submit_transaction(
+                    self.ocean.pool.buy_data_tokens,
+                    pool_address=pool_address,
+                    amount=to_wei(datatoken_amt),
+                    max_OCEAN_amount=max_cost,
+                    from_wallet=self.wallet,
+                )
+            except Exception as e:  # pylint: disable=broad-except
+                purchase.set_exception(e)
+            purchases.append(purchase)
+        datatoken_addresses, errors = [], []
+        for pool_address, purchase in zip(message.pool_addresses, purchases):
+            try:
+                purchase.result()
+                datatoken_address = self.pool_quoter.datatoken_of(
+                    pool_address
+                ) or self.ocean.pool.get_token_address(pool_address, validate=False)
+                error = ""
+            except Exception as e:  # pylint: disable=broad-except
+                self.logger.error(
+                    f"Couldn't purchase datatokens from {pool_address}: {e}"
+                )
+                datatoken_address, error = "", str(e) or repr(e)
+            else:
+                # the bought tokens are spent from this wallet
+                self.wallets.assign(self.wallet, datatoken_address)
+                self.logger.info(f"Purchased datatokens from {pool_address}")
+            datatoken_addresses.append(datatoken_address)
+            errors.append(error)
 
-        except Exception as e:
-            self.logger.error("Couldn't purchase datatokens")
-            self.logger.error(e)
+        msg = OceanMessage(
+            performative=OceanMessage.Performative.PURCHASE_RECIEPT,
+            pool_addresses=tuple(message.pool_addresses),
+            datatoken_addresses=tuple(datatoken_addresses),
+            errors=tuple(errors),
+        )
+        msg.sender = envelope.to
+        msg.to = envelope.sender
+        self.put_envelope(Envelope(to=msg.to, sender=msg.sender, message=msg))
+
+    def _read_pool(self, pool_address: str) -> PoolState:
+        """Read the reserves, weights and swap fee of a pool."""
+        pool = BPool(self.ocean.web3, pool_address)
+        ocean_address = self.ocean.pool.ocean_address
+        datatoken_address = self.ocean.pool.get_token_address(
+            pool_address, pool=pool, validate=False
+        )
+        return (
+            datatoken_address,
+            pool.getBalance(ocean_address),
+            pool.getBalance(datatoken_address),
+            pool.getDenormalizedWeight(ocean_address),
+            pool.getDenormalizedWeight(datatoken_address),
+            pool.getSwapFee(),
+        )
+
+    def _plan_purchase(
+        self, pool_address: str, datatoken_amt: int, max_cost_ocean: int
+    ) -> Tuple[str, int]:
+        """
+        Pick the pool to buy datatokens from and bound the OCEAN spent.
+
+        The cost is quoted locally in every known pool of the datatoken, from
+        a snapshot of those pools read once per block. The cheapest pool is
+        used, and the OCEAN spent is bounded by the quote plus the slippage
+        instead of the maximum cost requested. A pool of the datatoken which
+        can not be read is left out, only the requested pool must be read.
+
+        :return: the pool address and the maximum OCEAN amount in wei.
+        """
+        block = self.ocean.web3.eth.block_number
+        snapshot = self.pool_quoter.snapshot(block, [pool_address])
+        if pool_address in snapshot.errors:
+            raise snapshot.errors[pool_address]
+        datatoken_address = snapshot.datatoken_of(pool_address)
+        snapshot = self.pool_quoter.snapshot(
+            block, self.pool_quoter.pools_of(datatoken_address)
+        )
+        for pool, error in snapshot.errors.items():
+            self.logger.warning(f"Couldn't read pool {pool}: {error}")
+        best = snapshot.cheapest(datatoken_amt, datatoken_address)
+        if best is None:
+            raise ValueError(
+                f"No pool of {datatoken_address} can sell {datatoken_amt} datatokens"
+            )
+        best_pool, cost = best
+        if cost > max_cost_ocean:
+            raise ValueError(
+                f"{datatoken_amt} datatokens cost {cost:.6f} OCEAN, "
+                f"more than {max_cost_ocean}"
+            )
+        self.logger.info(
+            f"buying {datatoken_amt} datatokens from {best_pool} for {cost:.6f} OCEAN"
+        )
+        return best_pool, min(self.pool_quoter.max_cost(cost), to_wei(max_cost_ocean))
 
     def _download_asset(self, envelope: Envelope):
+        """
+        Download an asset, buying its datatokens first if the wallet lacks them.
+
+        The reply is `RESULTS` or `DOWNLOAD_RECIEPT`, see `_download_result`.
+        """
         did = envelope.message.asset_did
+        asset = self._resolve(did)
+        service = asset.get_service(ServiceTypes.ASSET_ACCESS)
+        order_key = self._order_key(asset.did, service)
+
         token_address = envelope.message.datatoken_address
         data_token = self.ocean.get_data_token(token_address)
-        if data_token.balanceOf(self.wallet.address) < envelope.message.datatoken_amt:
+        if self.order_ledger.get(order_key) is not None:
+            self.logger.info(f"Already ordered {did}, no datatokens needed.")
+        elif data_token.balanceOf(self.wallet.address) < to_wei(
+            envelope.message.datatoken_amt
+        ):
             self.logger.info(
                 f"insufficient data tokens.. Purchasing from the open market."
             )
-            self.ocean.pool.buy_data_tokens(
-                envelope.message.pool_address,
-                amount=to_wei(envelope.message.datatoken_amt),
-                max_OCEAN_amount=to_wei(envelope.message.max_cost_ocean),
-                from_wallet=self.wallet,
-            )
+            self._purchase_datatoken(envelope.message)
         else:
             self.logger.info(f"Already has sufficient Datatokens.")
 
-        asset = self.ocean.assets.resolve(did)
-        service = asset.get_service(ServiceTypes.ASSET_ACCESS)
-
-        # Bob sends his datatoken to the service
-        quote = self.ocean.assets.order(
-            asset.did, self.wallet.address, service_index=service.index
-        )
-        order_tx_id = self.ocean.assets.pay_for_service(
-            self.ocean.web3,
-            quote.amount,
-            quote.data_token_address,
-            asset.did,
-            service.index,
-            ZERO_ADDRESS,
-            self.wallet,
-            service.get_c2d_address(),
-        )
-        print(f"order_tx_id = '{order_tx_id}'")
+        # Bob sends his datatoken to the service, the provider checks that the
+        # order was made for the wallet which downloads
+        order_tx_id = self._order(
+            asset.did, service, consumer_address=self.wallet.address
+        ).result()
+        self.logger.info(f"order_tx_id = '{order_tx_id}'")
 
         # Bob downloads. If the connection breaks, Bob can request again by showing order_tx_id.
-        file_path = self.ocean.assets.download(
-            asset.did,
-            service.index,
-            self.wallet,
-            order_tx_id,
-            destination="./downloads/",
-        )
-        print(f"file_path = '{file_path}'")  # e.g. datafile.0xAf07...
-        data = open(file_path, "rb").read()
-
-        msg = OceanMessage(performative=OceanMessage.Performative.RESULTS, content=data)
+        try:
+            file_path = self.resilience.call(
+                "download",
+                self.ocean.assets.download,
+                asset.did,
+                service.index,
+                self.wallet,
+                order_tx_id,
+                destination="./downloads/",
+            )
+        except Exception as e:
+            # the provider may have rejected the order, pay again next time,
+            # unless it could not be reached and the order is still good
+            if not is_transient(e):
+                self.order_ledger.remove(order_key)
+            raise
+        self.logger.info(f"file_path = '{file_path}'")  # e.g. datafile.0xAf07...
+
+        msg = self._download_result(asset.did, file_path)
         msg.sender = envelope.to
         msg.to = envelope.sender
         envelope = Envelope(to=msg.to, sender=msg.sender, message=msg)
         self.put_envelope(envelope)
         self.logger.info(f"completed download! Sending result to handler!")
 
-    def _create_pool(self, envelope: Envelope, retries=2):
-        if retries == 0:
-            raise ValueError("Failed to deploy pool...")
-        try:
-            pool = self.ocean.pool.create(
-                envelope.message.datatoken_address,
-                data_token_amount=to_wei(envelope.message.datatoken_amt),
-                OCEAN_amount=to_wei(envelope.message.ocean_amt),
-                from_wallet=self.wallet,
-            )
-            pool_address = pool.address
-            print(f"Deployed pool_address = '{pool_address}'")
-        except (web3.exceptions.TransactionNotFound, ValueError) as e:
-            self.logger.error(f"Failed to deploy pool!")
-            self._create_pool(envelope, retries - 1)
+    def _download_result(self, did: str, path: str) -> OceanMessage:
+        """
+        Build the reply to a download.
+
+        The files are streamed to disk by ocean_lib. A download made of a
+        single small file is sent back inline as `RESULTS`, anything larger
+        is sent as a `DOWNLOAD_RECIEPT` referencing the files on disk, so the
+        memory used does not grow with the size of the asset.
+        """
+        if os.path.isdir(path):
+            files = [
+                os.path.join(root, name)
+                for root, _, names in os.walk(path)
+                for name in names
+            ]
+        else:
+            files = [path]
+        size = sum(os.path.getsize(file) for file in files)
+        max_inline_size = self.configuration.config.get(
+            "max_inline_download_size", DEFAULT_MAX_INLINE_DOWNLOAD_SIZE
+        )
+        if len(files) == 1 and size <= max_inline_size:
+            with open(files[0], "rb") as f:
+                return OceanMessage(
+                    performative=OceanMessage.Performative.RESULTS, content=f.read()
+                )
+        self.logger.info(f"downloaded {size} bytes to {path}, sending a reference")
+        return OceanMessage(
+            performative=OceanMessage.Performative.DOWNLOAD_RECIEPT,
+            did=did,
+            file_path=os.path.abspath(path),
+            size=size,
+        )
+
+    def _create_pool(self, envelope: Envelope):
+        pool = self._transact(
+            self.ocean.pool.create,
+            envelope.message.datatoken_address,
+            data_token_amount=to_wei(envelope.message.datatoken_amt),
+            OCEAN_amount=to_wei(envelope.message.ocean_amt),
+            from_wallet=self.wallet,
+        )
+        pool_address = pool.address
+        self.wallets.assign(self.wallet, pool_address)
+        self.pool_quoter.add(pool_address)
+        self.logger.info(f"Deployed pool_address = '{pool_address}'")
 
         msg = OceanMessage(
             performative=OceanMessage.Performative.POOL_DEPLOYMENT_RECIEPT,
@@ -331,85 +912,640 @@ class OceanConnection(BaseSyncConnection):
     def _create_d2c_job(self, envelope):
         DATA_did = envelope.message.data_did  # for convenience
         ALG_did = envelope.message.algo_did
-        DATA_DDO = self.ocean.assets.resolve(
+        DATA_DDO = self._resolve(
             DATA_did
         )  # make sure we operate on the updated and indexed metadata_cache_uri versions
-        ALG_DDO = self.ocean.assets.resolve(ALG_did)
+        ALG_DDO = self._resolve(ALG_did)
 
         compute_service = DATA_DDO.get_service("compute")
         algo_service = ALG_DDO.get_service("access")
 
         self.logger.info(f"ordering dataset {DATA_did}")
-        dataset_order_requirements = self.ocean.assets.order(
-            DATA_did, self.wallet.address, service_type=compute_service.type
-        )
-        self.logger.info(f"paying for dataset {DATA_did}")
-        DATA_order_tx_id = self.ocean.assets.pay_for_service(
-            self.ocean.web3,
-            dataset_order_requirements.amount,
-            dataset_order_requirements.data_token_address,
-            DATA_did,
-            compute_service.index,
-            ZERO_ADDRESS,
-            self.wallet,
-            dataset_order_requirements.computeAddress,
-        )
-        self.logger.info(f"paid for dataset {DATA_did} receipt: {DATA_order_tx_id}")
-
+        # the two orders are independent, so pay for both before waiting on either
+        DATA_order = self._order(DATA_did, compute_service)
         self.logger.info(f"ordering algorithm {ALG_did}")
-        algo_order_requirements = self.ocean.assets.order(
-            ALG_did, self.wallet.address, service_type=algo_service.type
-        )
-        self.logger.info(f"paying for algorithm {ALG_did}")
-        ALG_order_tx_id = self.ocean.assets.pay_for_service(
-            self.ocean.web3,
-            algo_order_requirements.amount,
-            algo_order_requirements.data_token_address,
-            ALG_did,
-            algo_service.index,
-            ZERO_ADDRESS,
-            self.wallet,
-            algo_order_requirements.computeAddress,
-        )
+        ALG_order_tx_id = self._order(ALG_did, algo_service).result()
         self.logger.info(f"paid for algo {ALG_did} receipt: {ALG_order_tx_id}")
+        DATA_order_tx_id = DATA_order.result()
+        self.logger.info(f"paid for dataset {DATA_did} receipt: {DATA_order_tx_id}")
         self.logger.info(f"starting compute job....")
         compute_inputs = [
             ComputeInput(DATA_did, DATA_order_tx_id, compute_service.index)
         ]
-        job_id = self.ocean.compute.start(
-            compute_inputs,
-            self.wallet,
-            algorithm_did=ALG_did,
-            algorithm_tx_id=ALG_order_tx_id,
-            algorithm_data_token=ALG_DDO.data_token_address,
-        )
+        try:
+            job_id = self.resilience.call(
+                "compute_start",
+                self.ocean.compute.start,
+                compute_inputs,
+                self.wallet,
+                algorithm_did=ALG_did,
+                algorithm_tx_id=ALG_order_tx_id,
+                algorithm_data_token=ALG_DDO.data_token_address,
+            )
+        except Exception as e:
+            # the provider may have rejected the orders, pay again next time
+            if not is_transient(e):
+                for did, service in (
+                    (DATA_did, compute_service),
+                    (ALG_did, algo_service),
+                ):
+                    self.order_ledger.remove(self._order_key(did, service))
+            raise
         self.logger.info(f"Started compute job with id: {job_id}")
-        res = self.ocean.compute.status(DATA_did, job_id, self.wallet)
-        while True:
-            res_1 = self.ocean.compute.status(DATA_did, job_id, self.wallet)
-            if res_1 != res:
-                res = res_1
-                self.logger.info(f"compute job with id: {job_id} @ {res_1}")
-                if (code := res_1["status"]) in [20, 30, 40, 50, 60]:
+        job = ComputeJob(
+            job_id,
+            DATA_did,
+            to=envelope.sender,
+            sender=envelope.to,
+            started_at=time.time(),
+            consumer=self.wallet.address,
+        )
+        self._loop.call_soon_threadsafe(self.compute_tracker.track, job)
+
+    def _create_d2c_multi_job(self, envelope: Envelope) -> None:
+        """
+        Run an algorithm over several datasets and answer with a single reply.
+
+        The algorithm is ordered once and the datasets are ordered together.
+        The datasets of each provider then go to a single compute job, or to
+        jobs of at most `max_compute_inputs` datasets when the provider limits
+        the inputs of a job. Once all the jobs have finished, their results
+        are saved in `compute_results_dir` and one `D2C_RESULTS` gives the
+        job, the result file or the error of each dataset.
+        """
+        message = envelope.message
+        data_dids = list(dict.fromkeys(message.data_dids))
+        group = ComputeJobGroup(data_dids, to=envelope.sender, sender=envelope.to)
+        ALG_did = message.algo_did
+        ALG_DDO = self._resolve(ALG_did)
+        algo_service = ALG_DDO.get_service("access")
+        self.logger.info(f"ordering algorithm {ALG_did} for {len(data_dids)} datasets")
+        ALG_order = self._order(ALG_did, algo_service)
+        services, orders = {}, {}  # type: Dict[str, Service], Dict[str, Future]
+        for did in data_dids:
+            try:
+                services[did] = self._resolve(did).get_service("compute")
+                orders[did] = self._order(did, services[did])
+            except Exception as e:  # pylint: disable=broad-except
+                self.logger.error(f"Couldn't order dataset {did}: {e}")
+                group.fail([did], str(e) or repr(e))
+        ALG_order_tx_id = ALG_order.result()
+        self.logger.info(f"paid for algo {ALG_did} receipt: {ALG_order_tx_id}")
+
+        # the inputs of a job must all be served by the provider of the first
+        inputs_by_provider = {}  # type: Dict[str, List[ComputeInput]]
+        for did, order in orders.items():
+            try:
+                order_tx_id = order.result()
+            except Exception as e:  # pylint: disable=broad-except
+                self.logger.error(f"Couldn't order dataset {did}: {e}")
+                group.fail([did], str(e) or repr(e))
+                continue
+            service = services[did]
+            inputs_by_provider.setdefault(service.service_endpoint, []).append(
+                ComputeInput(did, order_tx_id, service.index)
+            )
+        max_inputs = self.configuration.config.get(
+            "max_compute_inputs", DEFAULT_MAX_COMPUTE_INPUTS
+        )
+        for inputs in inputs_by_provider.values():
+            size = max_inputs or len(inputs)
+            for start in range(0, len(inputs), size):
+                compute_inputs = inputs[start : start + size]
+                dids = [compute_input.did for compute_input in compute_inputs]
+                try:
+                    job_id = self.resilience.call(
+                        "compute_start",
+                        self.ocean.compute.start,
+                        compute_inputs,
+                        self.wallet,
+                        algorithm_did=ALG_did,
+                        algorithm_tx_id=ALG_order_tx_id,
+                        algorithm_data_token=ALG_DDO.data_token_address,
+                    )
+                except Exception as e:  # pylint: disable=broad-except
+                    self.logger.error(f"Couldn't start compute job on {dids}: {e}")
+                    # the provider may have rejected the orders, pay again next time
+                    for compute_input in compute_inputs:
+                        if not is_transient(e):
+                            self.order_ledger.remove(
+                                OrderLedger.key(
+                                    compute_input.did,
+                                    compute_input.service_id,
+                                    self.wallet.address,
+                                )
+                            )
+                    group.fail(dids, str(e) or repr(e))
                     continue
-                elif code == 70:
-                    break
-            time.sleep(2)
+                self.logger.info(f"Started compute job with id: {job_id} on {dids}")
+                group.add(job_id, dids)
+                job = ComputeJob(
+                    job_id,
+                    dids[0],
+                    to=envelope.sender,
+                    sender=envelope.to,
+                    started_at=time.time(),
+                    consumer=self.wallet.address,
+                    group=group,
+                )
+                self._loop.call_soon_threadsafe(self.compute_tracker.track, job)
+        if group.seal():
+            self._put_group_results(group)
+
+    def _order_key(self, did: str, service: Service) -> OrderKey:
+        """Get the ledger key of the orders of the current wallet for a service."""
+        return OrderLedger.key(did, service.index, self.wallet.address)
+
+    def _order(
+        self, did: str, service: Service, consumer_address: Optional[str] = None
+    ) -> Future:
+        """
+        Pay for a service, or reuse the unexpired order of the wallet for it.
+
+        The order is recorded in the order ledger once its transaction is
+        mined, and the ledger lock of the service is held until then, so
+        concurrent jobs on the same service pay a single order.
+
+        :param did: the did of the asset.
+        :param service: the service to order.
+        :param consumer_address: the consumer of the order, the one required by the provider by default.
+        :return: the future of the order transaction id.
+        """
+        key = self._order_key(did, service)
+        lock = self.order_ledger.lock(key)
+        lock.acquire()
+        try:
+            order_tx_id = self.order_ledger.get(key)
+            if order_tx_id is not None:
+                self.logger.info(f"reusing order {order_tx_id} of {did}")
+                order = Future()  # type: Future
+                order.set_result(order_tx_id)
+                lock.release()
+                return order
+            requirements = self.resilience.call(
+                "order",
+                self.ocean.assets.order,
+                did,
+                self.wallet.address,
+                service_index=service.index,
+            )
+            self.logger.info(f"paying for {did}")
+            order = self._submit_transaction(
+                self.ocean.assets.pay_for_service,
+                self.ocean.web3,
+                requirements.amount,
+                requirements.data_token_address,
+                did,
+                service.index,
+                ZERO_ADDRESS,
+                self.wallet,
+                consumer_address or requirements.computeAddress,
+            )
+        except Exception:
+            lock.release()
+            raise
+
+        def record(order: Future) -> None:
+            try:
+                if order.exception() is None:
+                    self.order_ledger.put(
+                        key, order.result(), service.main.get("timeout", 0)
+                    )
+            finally:
+                lock.release()
+
+        order.add_done_callback(record)
+        return order
+
+    async def _poll_compute_jobs(self) -> None:
+        """Poll the status of all due compute jobs together."""
+        for job in self.compute_tracker.expired():
+            self.logger.error(
+                f"compute job with id: {job.job_id} timed out after {self.compute_tracker.timeout}s"
+            )
+            self.compute_tracker.untrack(job)
+            if job.group is not None:
+                self._finish_grouped_job(job, error="timed out")
+            else:
+                self._put_job_error(
+                    job,
+                    TimeoutError(
+                        f"compute job {job.job_id} timed out after "
+                        f"{self.compute_tracker.timeout}s"
+                    ),
+                )
+        jobs = self.compute_tracker.due()
+        if not jobs:
+            return
+        executor = self._executors["compute"]
+        statuses = await asyncio.gather(
+            *(
+                self._loop.run_in_executor(
+                    executor,
+                    self.resilience.call,
+                    "compute_status",
+                    self.ocean.compute.status,
+                    job.data_did,
+                    job.job_id,
+                    self.wallets.get(job.consumer),
+                )
+                for job in jobs
+            ),
+            return_exceptions=True,
+        )
+        for job, status in zip(jobs, statuses):
+            if isinstance(status, Exception):
+                self.logger.error(f"Failed to poll compute job {job.job_id}: {status}")
+                self.compute_tracker.update(job, job.status)
+                continue
+            if status["status"] != job.status:
+                self.logger.info(f"compute job with id: {job.job_id} @ {status}")
+            self.compute_tracker.update(job, status["status"])
+            if self.compute_tracker.is_failed(job):
+                self.logger.error(f"compute job with id: {job.job_id} failed: {status}")
+                self.compute_tracker.untrack(job)
+                if job.group is not None:
+                    self._finish_grouped_job(job, error=f"failed: {status}")
+                else:
+                    self._put_job_error(
+                        job, RuntimeError(f"compute job {job.job_id} failed: {status}")
+                    )
+            elif self.compute_tracker.is_completed(job):
+                self.compute_tracker.untrack(job)
+                if job.group is not None:
+                    result = self._loop.run_in_executor(
+                        executor, self._save_compute_result, job
+                    )
+                else:
+                    result = self._loop.run_in_executor(
+                        executor, self._send_compute_result, job
+                    )
+                result.add_done_callback(partial(self._check_result_sent, job))
+
+    async def _poll_pending_assets(self) -> None:
+        """Check all due pending assets in one pass and deliver their receipts."""
+        for asset in self.aquarius_watcher.expired():
+            self.logger.error(
+                f"{asset.did} was not cached in aquarius after {self.aquarius_watcher.timeout}s"
+            )
+            self.aquarius_watcher.unwatch(asset)
+            asset.receipt.expired = True
+        assets = self.aquarius_watcher.due()
+        if not assets:
+            return
+        resolved = await self._loop.run_in_executor(
+            self._executors["deploy"],
+            self._check_resolvable,
+            [asset.did for asset in assets],
+        )
+        for asset in assets:
+            if resolved.get(asset.did):
+                self.aquarius_watcher.unwatch(asset)
+                self.logger.info(f"{asset.did} is cached in aquarius")
+                if asset.receipt.resolve(asset.did):
+                    self.put_envelope(asset.receipt.envelope)
+            else:
+                self.aquarius_watcher.backoff(asset)
+
+    def _subscribe_events(self, envelope: Envelope) -> None:
+        """Send the contract events named in the envelope to its sender from now on."""
+        unknown = set(envelope.message.event_names) - set(CHAIN_EVENTS)
+        if unknown:
+            self.logger.error(f"Can not subscribe to unknown events {sorted(unknown)}")
+        self.chain_events.subscribe(
+            EventSubscription(
+                to=envelope.sender,
+                sender=envelope.to,
+                event_names=set(envelope.message.event_names) - unknown,
+                addresses=envelope.message.addresses,
+            )
+        )
 
-        result_file = self.ocean.compute.result_file(DATA_did, job_id, 0, self.wallet)
+    async def _poll_chain_events(self) -> None:
+        """Scan the new blocks for the watched events and deliver them."""
+        event_names = self.chain_events.scan_event_names()
+        if len(self.aquarius_watcher):
+            event_names |= METADATA_EVENTS
+        if not event_names:
+            return
+        removed, logs = await self._loop.run_in_executor(
+            self._executors["events"],
+            self.resilience.call,
+            "chain_events",
+            self._scan_chain_events,
+            event_names,
+        )
+        for log in removed + logs:
+            if log.event_name in METADATA_EVENTS and not log.removed:
+                did = f"did:op:{remove_0x_prefix(log.args['dataToken'])}"
+                self.aquarius_watcher.wake(did)
+            for subscription in self.chain_events.subscribers(log):
+                self._put_chain_event(subscription, log)
+
+    def _scan_chain_events(self, event_names: set) -> Tuple[list, list]:
+        """
+        Get the watched events of the blocks mined since the last scan.
 
+        All the events are fetched with one log filter over the range. When a
+        reorg dropped blocks already scanned, their events are returned as
+        removed and the blocks are scanned again on the new chain.
+
+        :return: the removed events and the new events.
+        """
+        eth = self.ocean.web3.eth
+
+        def get_block_hash(number: int) -> str:
+            return eth.get_block(number).hash.hex()
+
+        removed = self.chain_events.rewind(get_block_hash)
+        blocks = self.chain_events.next_range(eth.block_number)
+        if blocks is None:
+            return removed, []
+        from_block, to_block = blocks
+        block_hash = get_block_hash(to_block)
+        topics = [
+            topic
+            for topic, abi in self._event_abis.items()
+            if abi["name"] in event_names
+        ]
+        raw_logs = eth.get_logs(
+            {"fromBlock": from_block, "toBlock": to_block, "topics": [topics]}
+        )
+        if get_block_hash(to_block) != block_hash:
+            # the range changed while it was scanned, scan it again next time
+            return removed, []
+        logs = [self._decode_log(raw_log) for raw_log in raw_logs]
+        return (
+            removed,
+            self.chain_events.advance(from_block, to_block, block_hash, logs),
+        )
+
+    def _decode_log(self, raw_log: Any) -> ChainLog:
+        """Decode a raw log with the abi of its event."""
+        abi = self._event_abis[web3.Web3.toHex(raw_log["topics"][0])]
+        event = get_event_data(self.ocean.web3.codec, abi, raw_log)
+        return ChainLog(
+            event_name=event.event,
+            address=event.address,
+            block_number=event.blockNumber,
+            block_hash=event.blockHash.hex(),
+            transaction_hash=event.transactionHash.hex(),
+            log_index=event.logIndex,
+            args=dict(event.args),
+        )
+
+    def _put_chain_event(self, subscription: EventSubscription, log: ChainLog) -> None:
         msg = OceanMessage(
-            performative=OceanMessage.Performative.RESULTS, content=result_file
+            performative=OceanMessage.Performative.CHAIN_EVENT,
+            event_name=log.event_name,
+            address=log.address,
+            block_number=log.block_number,
+            transaction_hash=log.transaction_hash,
+            log_index=log.log_index,
+            event_args=json.dumps(log.args, default=_to_json),
+            removed=log.removed,
         )
-        msg.sender = envelope.to
-        msg.to = envelope.sender
+        msg.sender = subscription.sender
+        msg.to = subscription.to
+        self.put_envelope(Envelope(to=msg.to, sender=msg.sender, message=msg))
+
+    async def _log_stats(self) -> None:
+        """Log the usage of the caches and connection pools every `stats_interval`."""
+        now = time.time()
+        if now < self._next_stats_at:
+            return
+        self._next_stats_at = now + self.configuration.config.get(
+            "stats_interval", DEFAULT_STATS_INTERVAL
+        )
+        self.logger.info(f"HTTP session stats: {self.http_session.stats()}")
+        self.logger.info(f"DDO cache stats: {self.ddo_cache.stats()}")
+        self.logger.info(f"Circuit breakers: {self.resilience.stats()}")
+        if self.rpc_router is not None:
+            self.logger.info(f"RPC router stats: {self.rpc_router.stats()}")
+        self.logger.info(f"Read cache stats: {self.read_cache.stats()}")
+
+    def _execute_reads(self, calls: List[Tuple[str, str]], block: int) -> list:
+        """
+        Make contract reads at a block.
+
+        Several reads are made with a single `eth_call` to the `tryAggregate`
+        of the Multicall2 contract, a single read is made directly.
+
+        :return: the hex encoded result of each read, None for those which failed.
+        """
+        provider = self.ocean.web3.provider
+        block_identifier = hex(block)
+        if len(calls) == 1:
+            ((to, data),) = calls
+            response = provider.make_request(
+                "eth_call", [{"to": to, "data": data}, block_identifier]
+            )
+            return [response.get("result")]
+        selector = web3.Web3.keccak(text=MULTICALL_TRY_AGGREGATE)[:4]
+        calldata = selector + encode_abi(
+            ["bool", "(address,bytes)[]"],
+            [
+                False,
+                [
+                    (web3.Web3.toChecksumAddress(to), web3.Web3.toBytes(hexstr=data))
+                    for to, data in calls
+                ],
+            ],
+        )
+        response = provider.make_request(
+            "eth_call",
+            [
+                {
+                    "to": self.configuration.config.get("multicall_address"),
+                    "data": web3.Web3.toHex(calldata),
+                },
+                block_identifier,
+            ],
+        )
+        if "error" in response:
+            raise ValueError(response["error"])
+        (results,) = decode_abi(
+            ["(bool,bytes)[]"], web3.Web3.toBytes(hexstr=response["result"])
+        )
+        return [web3.Web3.toHex(data) if success else None for success, data in results]
+
+    def _get_block_number(self) -> int:
+        """Get the latest block number, bypassing the read cache."""
+        response = self.ocean.web3.provider.make_request("eth_blockNumber", [])
+        return int(response["result"], 16)
+
+    def _check_resolvable(self, dids: List[str]) -> Dict[str, bool]:
+        """Resolve a batch of dids, a failed lookup counts as not resolvable."""
+        resolved = {}
+        for did in dids:
+            try:
+                resolved[did] = self._resolve(did) is not None
+            except Exception as e:  # pylint: disable=broad-except
+                self.logger.debug(f"Failed to resolve {did}: {e}")
+                resolved[did] = False
+        return resolved
+
+    def _send_compute_result(self, job: ComputeJob) -> None:
+        """
+        Stream the result of a compute job to the agent.
+
+        A result which fits in one chunk is sent as `RESULTS`. A larger one
+        is sent as numbered `RESULT_CHUNK` messages while it is read from the
+        provider, the last of which carries the sha256 digest of the whole
+        result. At most `max_chunks_in_flight` chunks wait in the incoming
+        queue at once, so reading from the provider is paced by the agent.
+        """
+        chunks = self._stream_result_file(
+            job.data_did,
+            job.job_id,
+            0,
+            self.wallets.get(job.consumer),
+            self.configuration.config.get(
+                "result_chunk_size", DEFAULT_RESULT_CHUNK_SIZE
+            ),
+        )
+        chunk = next(chunks, b"")
+        following = next(chunks, None)
+        if following is None:
+            self._put_result(
+                job,
+                OceanMessage(
+                    performative=OceanMessage.Performative.RESULTS, content=chunk
+                ),
+            )
+            self.logger.info(f"completed D2C! Sending result to handler!")
+            return
+
+        digest = hashlib.sha256()
+        sequence = 0
+        while chunk is not None:
+            digest.update(chunk)
+            is_last = following is None
+            msg = OceanMessage(
+                performative=OceanMessage.Performative.RESULT_CHUNK,
+                content=chunk,
+                sequence=sequence,
+                is_last=is_last,
+                digest=digest.hexdigest() if is_last else "",
+            )
+            while not self._chunk_credits.acquire(timeout=MAIN_LOOP_INTERVAL):
+                if not self.is_connected:
+                    self.logger.warning(f"Dropping the result of {job.job_id}")
+                    return
+            self._put_result(job, msg)
+            sequence += 1
+            chunk, following = following, next(chunks, None) if not is_last else None
+        self.logger.info(
+            f"completed D2C! Sent the result of {job.job_id} in {sequence} chunks"
+        )
+
+    def _check_result_sent(self, job: ComputeJob, result: asyncio.Future) -> None:
+        """Reply with an error when the result of a compute job could not be sent."""
+        if result.cancelled() or result.exception() is None:
+            return
+        error = result.exception()
+        self.logger.error(f"Couldn't send the result of {job.job_id}: {error}")
+        if job.group is not None:
+            self._finish_grouped_job(job, error=str(error) or repr(error))
+        else:
+            self._put_job_error(job, error)
+
+    def _save_compute_result(self, job: ComputeJob) -> None:
+        """Save the result of a job of a group to disk, then finish the job."""
+        results_dir = self.configuration.config.get(
+            "compute_results_dir", DEFAULT_COMPUTE_RESULTS_DIR
+        )
+        path = os.path.abspath(os.path.join(results_dir, job.job_id))
+        try:
+            os.makedirs(results_dir, exist_ok=True)
+            with open(path, "wb") as f:
+                for chunk in self._stream_result_file(
+                    job.data_did,
+                    job.job_id,
+                    0,
+                    self.wallets.get(job.consumer),
+                    self.configuration.config.get(
+                        "result_chunk_size", DEFAULT_RESULT_CHUNK_SIZE
+                    ),
+                ):
+                    f.write(chunk)
+        except Exception as e:  # pylint: disable=broad-except
+            self.logger.error(f"Couldn't save the result of {job.job_id}: {e}")
+            if os.path.exists(path):
+                os.remove(path)
+            self._finish_grouped_job(job, error=str(e) or repr(e))
+            return
+        self._finish_grouped_job(job, file_path=path)
+
+    def _finish_grouped_job(
+        self, job: ComputeJob, file_path: str = "", error: str = ""
+    ) -> None:
+        """Record the outcome of a job of a group, replying once all have finished."""
+        if job.group.finish(job.job_id, file_path=file_path, error=error):
+            self._put_group_results(job.group)
+
+    def _put_group_results(self, group: ComputeJobGroup) -> None:
+        msg = OceanMessage(
+            performative=OceanMessage.Performative.D2C_RESULTS,
+            data_dids=tuple(group.data_dids),
+            job_ids=tuple(group.job_ids[did] for did in group.data_dids),
+            file_paths=tuple(group.file_paths[did] for did in group.data_dids),
+            errors=tuple(group.errors[did] for did in group.data_dids),
+        )
+        msg.sender = group.sender
+        msg.to = group.to
+        self.put_envelope(Envelope(to=msg.to, sender=msg.sender, message=msg))
+        self.logger.info(
+            f"completed D2C on {len(group.data_dids)} datasets! Sending results to handler!"
+        )
+
+    def _put_result(self, job: ComputeJob, msg: OceanMessage) -> None:
+        msg.sender = job.sender
+        msg.to = job.to
         envelope = Envelope(to=msg.to, sender=msg.sender, message=msg)
         self.put_envelope(envelope)
-        self.logger.info(f"completed D2C! Sending result to handler!")
+
+    def _stream_result_file(
+        self, did: str, job_id: str, index: int, wallet: Wallet, chunk_size: int
+    ) -> Iterator[bytes]:
+        """
+        Read a compute result from the provider in chunks.
+
+        Same request as `ocean.compute.result_file`, which loads the whole
+        result into memory, but the response is streamed.
+        """
+        compute = self.ocean.compute
+        _, service_endpoint = compute._get_compute_result_file_endpoint(did)
+        signature = compute._sign_message(
+            wallet,
+            f"{wallet.address}{job_id}{str(index)}",
+            service_endpoint=service_endpoint,
+        )
+        request = requests.PreparedRequest()
+        request.prepare_url(
+            service_endpoint,
+            {
+                "signature": signature,
+                "jobId": job_id,
+                "index": index,
+                "consumerAddress": wallet.address,
+            },
+        )
+        with self.resilience.call(
+            "compute_result",
+            DataServiceProvider.get_http_client().get,
+            request.url,
+            stream=True,
+        ) as response:
+            if response.status_code != 200:
+                raise Exception(response.content)
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                if chunk:
+                    yield chunk
 
     def _permission_dataset(self, envelope: Envelope):
-        data_ddo = self.ocean.assets.resolve(envelope.message.data_did)
-        algo_ddo = self.ocean.assets.resolve(envelope.message.algo_did)
+        data_ddo = self._resolve(envelope.message.data_did)
+        algo_ddo = self._resolve(envelope.message.algo_did)
 
         if data_ddo is None or algo_ddo is None:
             raise ValueError(
@@ -424,7 +1560,16 @@ class OceanConnection(BaseSyncConnection):
             allow_all=True,
             allow_raw_algorithm=True,
         )
-        self.ocean.assets.update(data_ddo, publisher_wallet=self.wallet)
+        # only the publisher may update, which is unknown for assets published
+        # before the connection was started
+        publisher_wallet = self.wallets.get(data_ddo.publisher or "") or self.wallet
+        try:
+            self._transact(
+                self.ocean.assets.update, data_ddo, publisher_wallet=publisher_wallet
+            )
+        finally:
+            # the cached ddo was modified in place, reload it on next use
+            self.ddo_cache.invalidate(data_ddo.did)
         msg = OceanMessage(
             performative=OceanMessage.Performative.DEPLOYMENT_RECIEPT,
             type="permissions",
@@ -437,11 +1582,85 @@ class OceanConnection(BaseSyncConnection):
         self.put_envelope(envelope)
         self.logger.info(f"Permissioned datasets. ")
 
-    def _deploy_data_to_download(self, envelope: Envelope):
-        datatoken = self._deploy_datatoken(envelope)
+    def _permission_datasets(self, envelope: Envelope) -> None:
+        """
+        Trust several algorithms on several datasets at once.
+
+        The checksums of each algorithm are computed once, and the privacy
+        block of each dataset is updated with all the algorithms in a single
+        transaction, so M datasets cost M transactions whatever the number
+        of algorithms. The updates are sent back to back and the reply gives
+        the error, if any, for each dataset.
+        """
+        message = envelope.message
+        for algo_did in message.algo_dids:
+            self.generate_trusted_algo_dict(asset_or_did=algo_did)
+        updates = []
+        for data_did in message.data_dids:
+            update = Future()  # type: Future
+            try:
+                data_ddo = self._resolve(data_did)
+                if data_ddo is None:
+                    raise ValueError(f"Unable to resolve {data_did}")
+                trusted_algos = self.add_publisher_trusted_algorithms(
+                    data_ddo, message.algo_dids
+                )
+                data_ddo.update_compute_privacy(
+                    trusted_algorithms=trusted_algos,
+                    trusted_algo_publishers=[],
+                    allow_all=True,
+                    allow_raw_algorithm=True,
+                )
+                publisher_wallet = (
+                    self.wallets.get(data_ddo.publisher or "") or self.wallet
+                )
+                update = self._submit_transaction(
+                    self.ocean.assets.update,
+                    data_ddo,
+                    publisher_wallet=publisher_wallet,
+                )
+            except Exception as e:  # pylint: disable=broad-except
+                update.set_exception(e)
+            updates.append(update)
+        errors = []
+        for data_did, update in zip(message.data_dids, updates):
+            try:
+                update.result()
+                error = ""
+            except Exception as e:  # pylint: disable=broad-except
+                self.logger.error(f"Couldn't permission {data_did}: {e}")
+                error = str(e) or repr(e)
+            finally:
+                # the cached ddo was modified in place, reload it on next use
+                self.ddo_cache.invalidate(data_did)
+            errors.append(error)
+
+        msg = OceanMessage(
+            performative=OceanMessage.Performative.PERMISSION_RECIEPT,
+            data_dids=tuple(message.data_dids),
+            errors=tuple(errors),
+        )
+        msg.sender = envelope.to
+        msg.to = envelope.sender
+        self.put_envelope(Envelope(to=msg.to, sender=msg.sender, message=msg))
+        self.logger.info(
+            f"Permissioned {len(message.algo_dids)} algorithms on {len(message.data_dids)} datasets."
+        )
 
-        provider_url = DataServiceProvider.get_url(self.ocean.config)
+    def _deploy_data_to_download(self, envelope: Envelope):
+        did, datatoken_address = self._publish_data_to_download(envelope)
+        msg = OceanMessage(
+            performative=OceanMessage.Performative.DEPLOYMENT_RECIEPT,
+            type="data_download",
+            did=did,
+            datatoken_contract_address=datatoken_address,
+        )
+        msg.sender = envelope.to
+        msg.to = envelope.sender
+        deployment_envelope = Envelope(to=msg.to, sender=msg.sender, message=msg)
+        self._put_when_resolvable(deployment_envelope, did)
 
+    def _publish_data_to_download(self, envelope: Envelope) -> Tuple[str, str]:
         # Calc DATA service compute descriptor
         service_attributes = json.loads(
             DATA_SERVICES_TEMPLATE.substitute(
@@ -450,12 +1669,6 @@ class OceanConnection(BaseSyncConnection):
             )
         )
 
-        DATA_service = Service(
-            service_endpoint=provider_url,
-            service_type=ServiceTypes.ASSET_ACCESS,
-            attributes=service_attributes,
-        )
-
         data_metadata = json.loads(
             D2C_TEMPLATE.substitute(
                 url=envelope.message.dataset_url,
@@ -465,42 +1678,28 @@ class OceanConnection(BaseSyncConnection):
                 date_created=envelope.message.date_created,
             )
         )
+        return self._publish_asset(
+            envelope,
+            data_metadata,
+            ServiceTypes.ASSET_ACCESS,
+            service_attributes,
+            encrypt=True,
+        )
 
-        try:
-            DATA_ddo = self.ocean.assets.create(
-                metadata=data_metadata,
-                publisher_wallet=self.wallet,
-                services=[DATA_service],
-                data_token_address=datatoken.address,
-                encrypt=True,
-            )
-            self.logger.info(f"DATA did = '{DATA_ddo.did}'")
-        except ocean_lib.exceptions.AquariusError as error:  # and how exactly is the did generated???
-            self.logger.error(f"Error with creating asset. {error}")
-            msg = error.args[0]
-            if "is already registered to another asset." in msg:
-                self.logger.error(f"Trying to resolve pre-existing did..")
-                DATA_ddo = self.ocean.assets.resolve(msg.split(" ")[2])
-
-        self.logger.info(f"Ensure asset is cached in aquarius")
-        self._ensure_asset_cached_in_aquarius(DATA_ddo.did)
-
+    def _deploy_data_for_d2c(self, envelope: Envelope):
+        did, datatoken_address = self._publish_data_for_d2c(envelope)
         msg = OceanMessage(
             performative=OceanMessage.Performative.DEPLOYMENT_RECIEPT,
-            type="data_download",
-            did=DATA_ddo.did,
-            datatoken_contract_address=datatoken.address,
+            type="d2c",
+            did=did,
+            datatoken_contract_address=datatoken_address,
         )
         msg.sender = envelope.to
         msg.to = envelope.sender
         deployment_envelope = Envelope(to=msg.to, sender=msg.sender, message=msg)
-        self.put_envelope(deployment_envelope)
-
-    def _deploy_data_for_d2c(self, envelope: Envelope):
-        datatoken = self._deploy_datatoken(envelope)
-
-        provider_url = DataServiceProvider.get_url(self.ocean.config)
+        self._put_when_resolvable(deployment_envelope, did)
 
+    def _publish_data_for_d2c(self, envelope: Envelope) -> Tuple[str, str]:
         # Calc DATA service compute descriptor
         service_attributes = json.loads(
             DATA_SERVICES_TEMPLATE.substitute(
@@ -509,12 +1708,6 @@ class OceanConnection(BaseSyncConnection):
             )
         )
 
-        DATA_compute_service = Service(
-            service_endpoint=provider_url,
-            service_type=ServiceTypes.CLOUD_COMPUTE,
-            attributes=service_attributes,
-        )
-
         data_metadata = json.loads(
             D2C_TEMPLATE.substitute(
                 url=envelope.message.dataset_url,
@@ -524,53 +1717,34 @@ class OceanConnection(BaseSyncConnection):
                 date_created=envelope.message.date_created,
             )
         )
+        return self._publish_asset(
+            envelope,
+            data_metadata,
+            ServiceTypes.CLOUD_COMPUTE,
+            service_attributes,
+            encrypt=True,
+        )
 
-        # Publish metadata and service info on-chain
-        try:
-            DATA_ddo = self.ocean.assets.create(
-                metadata=data_metadata,
-                publisher_wallet=self.wallet,
-                services=[DATA_compute_service],
-                data_token_address=datatoken.address,
-                encrypt=True,
-            )
-            self.logger.info(f"DATA did = '{DATA_ddo.did}'")
-        except ocean_lib.exceptions.AquariusError as error:  # and how exactly is the did generated???
-            self.logger.error(f"Error with creating asset. {error}")
-            msg = error.args[0]
-            if "is already registered to another asset." in msg:
-                self.logger.error(f"Trying to resolve pre-existing did..")
-                DATA_ddo = self.ocean.assets.resolve(msg.split(" ")[2])
-
-        self.logger.info(f"Ensure asset is cached in aquarius")
-        self._ensure_asset_cached_in_aquarius(DATA_ddo.did)
-
+    def _deploy_algorithm(self, envelope: Envelope):
+        did, datatoken_address = self._publish_algorithm(envelope)
         msg = OceanMessage(
             performative=OceanMessage.Performative.DEPLOYMENT_RECIEPT,
-            type="d2c",
-            did=DATA_ddo.did,
-            datatoken_contract_address=datatoken.address,
+            type="algorithm",
+            did=did,
+            datatoken_contract_address=datatoken_address,
         )
         msg.sender = envelope.to
         msg.to = envelope.sender
         deployment_envelope = Envelope(to=msg.to, sender=msg.sender, message=msg)
-        self.put_envelope(deployment_envelope)
+        self._put_when_resolvable(deployment_envelope, did)
 
-    def _deploy_algorithm(self, envelope: Envelope):
-        """ """
-        datatoken = self._deploy_datatoken(envelope)
-        provider_url = DataServiceProvider.get_url(self.ocean.config)
+    def _publish_algorithm(self, envelope: Envelope) -> Tuple[str, str]:
         service_attributes = json.loads(
             ALGO_SERVICE_TEMPLATE.substitute(
                 address=self.wallet.address,
                 date_published=datetime.now().strftime("%Y-%m-%dT%H:%M:%SZ"),
             )
         )
-        ALG_access_service = Service(
-            service_endpoint=provider_url,
-            service_type=ServiceTypes.CLOUD_COMPUTE,
-            attributes=service_attributes,
-        )
         metadata = json.loads(
             ALGO_TEMPLATE.substitute(
                 files_url=envelope.message.files_url,
@@ -586,67 +1760,245 @@ class OceanConnection(BaseSyncConnection):
                 tag=envelope.message.tag,
             )
         )
+        # {"main" : {"type" : "algorithm", ..}, ..}
+        return self._publish_asset(
+            envelope, metadata, ServiceTypes.CLOUD_COMPUTE, service_attributes
+        )
+
+    def _publish_asset(
+        self,
+        envelope: Envelope,
+        metadata: Dict[str, Any],
+        service_type: str,
+        service_attributes: Dict[str, Any],
+        encrypt: bool = False,
+    ) -> Tuple[str, str]:
+        """
+        Create, mint and publish the datatoken of an asset, unless its content is already published.
 
-        # Publish metadata and service info on-chain
-        ALG_ddo = self.ocean.assets.create(
-            metadata=metadata,  # {"main" : {"type" : "algorithm", ..}, ..}
-            publisher_wallet=self.wallet,
-            services=[ALG_access_service],
-            data_token_address=datatoken.address,
+        :return: the did of the asset and the address of its datatoken.
+        """
+        content_hash = PublishIndex.content_hash(
+            metadata, service_type, service_attributes, self.ocean_config.network_url
         )
-        self.logger.info(f"ALG did = '{ALG_ddo.did}'")
+        with self.publish_index.lock(content_hash):
+            published = self.publish_index.get(content_hash)
+            if published is not None:
+                did, datatoken_address, publisher = published
+                self.logger.info(f"{did} already publishes this content, reusing it")
+                self.wallets.assign(
+                    self.wallets.get(publisher) or self.wallet, datatoken_address, did
+                )
+                return did, datatoken_address
+
+            datatoken = self._create_datatoken(envelope)
+            # minting and publishing only need the token address, send them together
+            minted = self._submit_transaction(
+                datatoken.mint,
+                self.wallet.address,
+                to_wei(envelope.message.amount_to_mint),
+                self.wallet,
+            )
+            service = Service(
+                service_endpoint=DataServiceProvider.get_url(self.ocean.config),
+                service_type=service_type,
+                attributes=service_attributes,
+            )
 
-        self.logger.info(f"Ensure asset is cached in aquarius")
-        self._ensure_asset_cached_in_aquarius(ALG_ddo.did)
+            # Publish metadata and service info on-chain
+            try:
+                ddo = self._transact(
+                    self.ocean.assets.create,
+                    metadata=metadata,
+                    publisher_wallet=self.wallet,
+                    services=[service],
+                    data_token_address=datatoken.address,
+                    encrypt=encrypt,
+                )
+                publisher = self.wallet.address
+            except AquariusError as error:
+                message = str(error.args[0]) if error.args else ""
+                if "is already registered to another asset." not in message:
+                    raise
+                # published without the index knowing, e.g. by another agent
+                self.logger.error(f"Error with creating asset. {error}")
+                self.logger.info(f"Trying to resolve pre-existing did..")
+                ddo = self._resolve(message.split(" ")[2])
+                publisher = ddo.publisher or self.wallet.address
+            self.logger.info(f"{metadata['main']['type']} did = '{ddo.did}'")
+            minted.result()
+            self.logger.info(f"minted {envelope.message.amount_to_mint} datatokens")
+            self.wallets.assign(
+                self.wallets.get(publisher) or self.wallet,
+                ddo.data_token_address,
+                ddo.did,
+            )
+            self.publish_index.put(
+                content_hash, ddo.did, ddo.data_token_address, publisher
+            )
+        return ddo.did, ddo.data_token_address
+
+    def _deploy_batch(self, envelope: Envelope):
+        """Publish many assets concurrently and reply with a single receipt."""
+        asset_specs = list(envelope.message.asset_specs)
+        self.logger.info(f"publishing a batch of {len(asset_specs)} assets")
+        with ThreadPoolExecutor(
+            max_workers=self.configuration.config.get(
+                "batch_concurrency", DEFAULT_BATCH_CONCURRENCY
+            ),
+            thread_name_prefix="ocean_batch",
+        ) as executor:
+            futures = [
+                executor.submit(self._publish_asset_spec, envelope, asset_spec)
+                for asset_spec in asset_specs
+            ]
+        dids, datatoken_addresses, errors = [], [], []
+        for index, future in enumerate(futures):
+            try:
+                did, datatoken_address = future.result()
+                error = ""
+            except Exception as e:  # pylint: disable=broad-except
+                self.logger.error(f"Failed to publish asset {index} of batch: {e}")
+                did, datatoken_address, error = "", "", str(e) or repr(e)
+            dids.append(did)
+            datatoken_addresses.append(datatoken_address)
+            errors.append(error)
+        self.logger.info(
+            f"published {len(asset_specs) - sum(map(bool, errors))} of {len(asset_specs)} assets"
+        )
 
         msg = OceanMessage(
-            performative=OceanMessage.Performative.DEPLOYMENT_RECIEPT,
-            type="algorithm",
-            did=ALG_ddo.did,
-            datatoken_contract_address=datatoken.address,
+            performative=OceanMessage.Performative.BATCH_DEPLOYMENT_RECIEPT,
+            types=tuple(asset_spec["type"] for asset_spec in asset_specs),
+            dids=tuple(dids),
+            datatoken_contract_addresses=tuple(datatoken_addresses),
+            errors=tuple(errors),
         )
         msg.sender = envelope.to
         msg.to = envelope.sender
         deployment_envelope = Envelope(to=msg.to, sender=msg.sender, message=msg)
-        self.put_envelope(deployment_envelope)
-
-    def _ensure_asset_cached_in_aquarius(
-        self, did: str, timeout: float = 600, poll_latency: float = 1
-    ):
-        """Ensure asset is cached in Aquarius
-        Default timeout = 10 mins
-        Default poll_latency = 1 second
-        """
-        with Timeout(timeout) as _timeout:
-            while True:
-                asset = self.ocean.assets.resolve(did)
-                if asset is not None:
-                    break
-                _timeout.sleep(poll_latency)
+        self._put_when_resolvable(deployment_envelope, *(did for did in dids if did))
 
-    def _deploy_datatoken(self, envelope: Envelope):
+    def _publish_asset_spec(
+        self, envelope: Envelope, asset_spec: Dict[str, Any]
+    ) -> Tuple[str, str]:
+        """Publish one asset of a batch, on its own wallet."""
+        performative, contents = ASSET_SPEC_PERFORMATIVES[asset_spec["type"]]
+        msg = OceanMessage(
+            performative=performative,
+            **{content: asset_spec[content] for content in contents},
+        )
+        asset_envelope = Envelope(to=envelope.to, sender=envelope.sender, message=msg)
+        publish = {
+            OceanMessage.Performative.DEPLOY_ALGORITHM: self._publish_algorithm,
+            OceanMessage.Performative.DEPLOY_D2C: self._publish_data_for_d2c,
+            OceanMessage.Performative.DEPLOY_DATA_DOWNLOAD: self._publish_data_to_download,
+        }[performative]
+        return self._run_on_wallet((), publish, asset_envelope)
+
+    def _put_when_resolvable(self, envelope: Envelope, *dids: str) -> None:
+        """Deliver an envelope once aquarius has indexed all the assets."""
+        if not dids:
+            self.put_envelope(envelope)
+            return
+        receipt = PendingReceipt(envelope, dids)
+        started_at = time.time()
+        for did in dids:
+            self.logger.info(f"Waiting for {did} to be cached in aquarius")
+            asset = PendingAsset(did, receipt, started_at=started_at)
+            self._loop.call_soon_threadsafe(self.aquarius_watcher.watch, asset)
+
+    def _resolve(self, did: str):
+        """Resolve a did, serving the ddo from the cache when possible."""
+        return self.ddo_cache.resolve(
+            did,
+            lambda did: self.resilience.call("resolve", self.ocean.assets.resolve, did),
+        )
+
+    def _create_datatoken(self, envelope: Envelope):
         self.logger.info(f"interacting with ocean to deploy data token ...")
-        datatoken = self.ocean.create_data_token(
+        datatoken = self._transact(
+            self.ocean.create_data_token,
             envelope.message.token0_name,
             envelope.message.token1_name,
             self.wallet,
             blob=self.ocean.config.metadata_cache_uri,
         )
+        self.logger.info(f"DATA_datatoken.address = '{datatoken.address}'")
+        return datatoken
+
+    def _deploy_datatoken(self, envelope: Envelope):
+        datatoken = self._create_datatoken(envelope)
         self.logger.info(f"created the data token. Minting tokens to address....")
-        datatoken.mint(
-            self.wallet.address, to_wei(envelope.message.amount_to_mint), self.wallet
+        self._transact(
+            datatoken.mint,
+            self.wallet.address,
+            to_wei(envelope.message.amount_to_mint),
+            self.wallet,
         )
-        self.logger.info(f"DATA_datatoken.address = '{datatoken.address}'\n publishing")
+        self.logger.info(f"minted {envelope.message.amount_to_mint} datatokens")
         return datatoken
 
+    def _transact(self, fn: Callable, *args: Any, **kwargs: Any) -> Any:
+        """
+        Run an ocean_lib call that sends transactions from the wallet.
+
+        Failures which leave a gap in the nonces of the wallet, such as a
+        dropped or replaced transaction, re-synchronise the nonce manager so
+        that the next transaction fills the gap. Transactions are never
+        replayed, but failing to reach the node opens the rpc circuit.
+
+        A call may send several transactions, each waiting for the receipt of
+        the one before, so all the nonces it reserved are settled: the last
+        one failed with the call, the others were mined.
+        """
+        _nonce_context.reserved = reserved = []
+        try:
+            result = self.resilience.call("transaction", fn, *args, **kwargs)
+        except Exception as e:
+            if reserved:
+                *mined, (manager, nonce) = reserved
+                for mined_manager, mined_nonce in mined:
+                    mined_manager.confirm(mined_nonce)
+                if manager.fail(e, nonce):
+                    self.logger.warning(
+                        f"Re-synchronising nonces of {manager.address} after error: {e}"
+                    )
+            raise
+        finally:
+            _nonce_context.reserved = None
+        for manager, nonce in reserved:
+            manager.confirm(nonce)
+        return result
+
+    def _submit_transaction(self, fn: Callable, *args: Any, **kwargs: Any) -> Future:
+        """
+        Send a transaction without waiting for its receipt.
+
+        The call is made from the transactions pool, where it is signed with
+        the next local nonce and waits for its own receipt, so independent
+        transactions are mined together instead of one after the other.
+        """
+        return self._executors["transactions"].submit(
+            self._transact, fn, *args, **kwargs
+        )
+
     def add_publisher_trusted_algorithm(
         self, asset_or_did: str, algo_did: str, metadata_cache_uri: str
     ) -> list:
         """
         :return: List of trusted algos
         """
-        asset = self.ocean.assets.resolve(asset_or_did)
+        return self.add_publisher_trusted_algorithms(
+            self._resolve(asset_or_did), [algo_did]
+        )
 
+    def add_publisher_trusted_algorithms(self, asset: Any, algo_dids: list) -> list:
+        """
+        Add several trusted algorithms to the privacy block of an asset.
+
+        :return: List of trusted algos
+        """
         compute_service = asset.get_service(ServiceTypes.CLOUD_COMPUTE)
         assert (
             compute_service
@@ -658,12 +2010,12 @@ class OceanConnection(BaseSyncConnection):
 
         assert isinstance(privacy_values, dict), "Privacy key is not a dictionary."
         trusted_algos = privacy_values.get("publisherTrustedAlgorithms", [])
-        # remove algo_did if already in the list
-        trusted_algos = [ta for ta in trusted_algos if ta["did"] != algo_did]
+        # remove the algo_dids already in the list
+        trusted_algos = [ta for ta in trusted_algos if ta["did"] not in algo_dids]
 
-        # now add this algo_did as trusted algo
-        algo_ddo = self.ocean.assets.resolve(algo_did)
-        trusted_algos.append(self.generate_trusted_algo_dict(asset_or_did=algo_ddo.did))
+        # now add the algo_dids as trusted algos
+        for algo_did in algo_dids:
+            trusted_algos.append(self.generate_trusted_algo_dict(asset_or_did=algo_did))
 
         # update with the new list
         privacy_values["publisherTrustedAlgorithms"] = trusted_algos
@@ -685,8 +2037,16 @@ class OceanConnection(BaseSyncConnection):
         }
         ```
         """
-        ddo = self.ocean.assets.resolve(asset_or_did)
-
+        ddo = self._resolve(asset_or_did)
+        # the checksums only change when the metadata of the algorithm is updated
+        version = f"{ddo.did}@{ddo.values.get('updated') or ddo.created}"
+        trusted_algo = self.algo_checksums.get(version)
+        if trusted_algo is None:
+            trusted_algo = self._checksum_algorithm(ddo)
+            self.algo_checksums.put(version, trusted_algo)
+        return dict(trusted_algo)
+
+    def _checksum_algorithm(self, ddo: Any) -> dict:
         algo_metadata = ddo.metadata
         return {
             "did": ddo.did,
@@ -714,27 +2074,92 @@ class OceanConnection(BaseSyncConnection):
 
         Connection status set automatically.
         """
-        os.environ["OCEAN_NETWORK_URL"] = self.configuration.config.get(
-            "ocean_network_url"
-        )
+        network_urls = self.configuration.config.get("ocean_network_urls") or [
+            self.configuration.config.get("ocean_network_url")
+        ]
+        os.environ["OCEAN_NETWORK_URL"] = network_urls[0]
         self.ocean_config = ExampleConfig.get_config()
+        http_config = self.configuration.config.get("http_session") or {}
+        self.http_session = PooledSession(**http_config)
+        DataServiceProvider.set_http_client(self.http_session)
+        AquariusProvider.set_aquarius_class(_aquarius_class(self.http_session))
+        self._next_stats_at = time.time() + self.configuration.config.get(
+            "stats_interval", DEFAULT_STATS_INTERVAL
+        )
         self.ocean = Ocean(self.ocean_config)
+        if all(url.startswith("http") for url in network_urls):
+            # every contract shares the web3 of ocean, so they all use the router
+            self.rpc_router = RPCRouter(
+                network_urls,
+                session=PooledSession(**http_config),
+                **(self.configuration.config.get("rpc_router") or {}),
+            )
+            self.ocean.web3.provider = RoutedProvider(self.rpc_router)
+        else:
+            self.logger.warning(
+                f"Not routing RPC requests, {network_urls} are not all http urls"
+            )
+        read_cache_config = self.configuration.config.get("read_cache") or {}
+        if not self.configuration.config.get("multicall_address"):
+            # without multicall a batch costs a call per read, so reads are not batched
+            read_cache_config = {**read_cache_config, "max_batch_size": 1}
+        self.read_cache = BlockReadCache(
+            self._execute_reads, self._get_block_number, **read_cache_config
+        )
+        # innermost, so that it sees the requests as sent to the node
+        self.ocean.web3.middleware_onion.inject(
+            _read_cache_middleware(self.read_cache), layer=0
+        )
 
-        with open(self.configuration.config.get("key_path"), "r") as f:
-            key = f.read()
-        acct = Account.from_key(key)
-
-        # Create wallet
-        self.wallet = Wallet(
-            self.ocean.web3,
-            acct.privateKey.hex(),
-            self.ocean_config.block_confirmations,
-            self.ocean_config.transaction_timeout,
+        key_paths = self.configuration.config.get("key_paths") or [
+            self.configuration.config.get("key_path")
+        ]
+        wallets = []
+        for key_path in key_paths:
+            with open(key_path, "r") as f:
+                key = f.read()
+            acct = Account.from_key(key)
+
+            # Create wallet
+            wallet = Wallet(
+                self.ocean.web3,
+                acct.privateKey.hex(),
+                self.ocean_config.block_confirmations,
+                self.ocean_config.transaction_timeout,
+            )
+            _add_nonce_manager(
+                NonceManager(
+                    wallet.address,
+                    lambda address: self.ocean.web3.eth.get_transaction_count(
+                        address, "pending"
+                    ),
+                )
+            )
+            wallets.append(wallet)
+        self.wallets = WalletPool(wallets)
+        self._event_abis = {
+            web3.Web3.toHex(event_abi_to_log_topic(abi)): abi
+            for name, contract_name in CHAIN_EVENTS.items()
+            for abi in get_contract_definition(contract_name)["abi"]
+            if abi["type"] == "event" and abi["name"] == name
+        }
+        self.pool_quoter = PoolQuoter(
+            lambda pool: self.resilience.call("read_pool", self._read_pool, pool),
+            slippage=self.configuration.config.get("slippage", DEFAULT_SLIPPAGE),
+        )
+        self.publish_index = PublishIndex(
+            self.configuration.config.get("publish_index_path") or DEFAULT_INDEX_PATH
+        )
+        self.order_ledger = OrderLedger(
+            **(self.configuration.config.get("order_ledger") or {})
         )
+        self.logger.info(f"Forgot {self.order_ledger.prune()} expired orders")
 
         self.logger.info(
             f"connected to Ocean with config.network_url = '{self.ocean_config.network_url}'"
         )
+        if self.rpc_router is not None:
+            self.logger.info(f"routing RPC requests over {', '.join(network_urls)}")
         self.logger.info(
             f"connected to Ocean with config.block_confirmations = {self.ocean_config.block_confirmations.value}"
         )
@@ -744,7 +2169,9 @@ class OceanConnection(BaseSyncConnection):
         self.logger.info(
             f"connected to Ocean with config.provider_url = '{self.ocean_config.provider_url}'"
         )
-        self.logger.info(f"Address used: {acct.address}")
+        self.logger.info(
+            f"Addresses used: {', '.join(wallet.address for wallet in wallets)}"
+        )
 
     def on_disconnect(self) -> None:
         """
@@ -752,3 +2179,16 @@ class OceanConnection(BaseSyncConnection):
 
         Connection status set automatically.
         """
+        self.logger.info(f"DDO cache stats: {self.ddo_cache.stats()}")
+        self.logger.info(f"HTTP session stats: {self.http_session.stats()}")
+        self.logger.info(f"Circuit breakers: {self.resilience.stats()}")
+        self.logger.info(f"Read cache stats: {self.read_cache.stats()}")
+        AquariusProvider.set_aquarius_class(Aquarius)
+        self.http_session.close()
+        if self.rpc_router is not None:
+            self.logger.info(f"RPC router stats: {self.rpc_router.stats()}")
+            self.rpc_router.close()
+        for wallet in self.wallets.wallets:
+            _remove_nonce_manager(wallet.address)
+        self.publish_index.close()
+        self.order_ledger.close()
@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2021 eightballer
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""An LRU cache with expiry for DDOs resolved from aquarius."""
+import copy
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+DEFAULT_MAXSIZE = 256
+DEFAULT_TTL = 300.0
+
+
+class DDOCache:
+    """
+    Caches resolved DDOs by did.
+
+    Entries are evicted least recently used first once `maxsize` is reached
+    and are reloaded once older than `ttl` seconds. The cache is shared by
+    the worker threads of the connection, so all access is locked, and each
+    caller gets its own copy of a DDO which it may change before the update
+    is committed.
+    """
+
+    def __init__(
+        self, maxsize: int = DEFAULT_MAXSIZE, ttl: float = DEFAULT_TTL
+    ) -> None:
+        """
+        Initialise the cache.
+
+        :param maxsize: the maximum number of DDOs kept.
+        :param ttl: seconds a DDO is served from the cache.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # type: OrderedDict[str, Tuple[float, Any]]
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Get the number of cached DDOs."""
+        return len(self._entries)
+
+    def get(self, did: str, now: Optional[float] = None) -> Optional[Any]:
+        """
+        Get a cached DDO.
+
+        :param did: the did of the asset.
+        :param now: the current time.
+        :return: the DDO, or None if it is not cached or has expired.
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            entry = self._entries.get(did)
+            if entry is None or now - entry[0] > self.ttl:
+                self._entries.pop(did, None)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(did)
+            self.hits += 1
+            return copy.deepcopy(entry[1])
+
+    def put(self, did: str, ddo: Any, now: Optional[float] = None) -> None:
+        """Cache a DDO, evicting the least recently used one if full."""
+        now = time.time() if now is None else now
+        with self._lock:
+            self._entries[did] = (now, copy.deepcopy(ddo))
+            self._entries.move_to_end(did)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def resolve(self, did: str, loader: Callable[[str], Any]) -> Optional[Any]:
+        """
+        Get a DDO from the cache, loading and caching it on a miss.
+
+        Assets which do not resolve yet are not cached, so a did that is still
+        being indexed is looked up again on the next call.
+
+        :param did: the did of the asset.
+        :param loader: resolves the did when it is not cached.
+        :return: the DDO or None.
+        """
+        ddo = self.get(did)
+        if ddo is None:
+            ddo = loader(did)
+            if ddo is not None:
+                self.put(did, ddo)
+        return ddo
+
+    def invalidate(self, did: str) -> None:
+        """Drop a DDO, e.g. after its metadata has been updated."""
+        with self._lock:
+            self._entries.pop(did, None)
+
+    def clear(self) -> None:
+        """Drop all DDOs."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get the hit and miss counters of the cache."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+            }
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2021 eightballer
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""A pooled HTTP session shared by the aquarius and provider calls."""
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple, Union
+
+from requests import PreparedRequest, Response, Session
+from requests.adapters import HTTPAdapter
+
+DEFAULT_POOL_CONNECTIONS = 16
+DEFAULT_POOL_MAXSIZE = 32
+DEFAULT_CONNECT_TIMEOUT = 5.0
+DEFAULT_READ_TIMEOUT = 60.0
+DEFAULT_TIMEOUT = (DEFAULT_CONNECT_TIMEOUT, DEFAULT_READ_TIMEOUT)
+
+
+class MeteredHTTPAdapter(HTTPAdapter):
+    """
+    An adapter keeping connections alive per host and counting their use.
+
+    At most `pool_maxsize` connections are open to a host, further requests
+    wait for one to be free instead of opening more. Requests sent without a
+    timeout get the default one.
+    """
+
+    def __init__(
+        self,
+        timeout: Union[float, Tuple[float, float]] = DEFAULT_TIMEOUT,
+        **kwargs: Any,
+    ) -> None:
+        """
+        Initialise the adapter.
+
+        :param timeout: the default connect and read timeouts in seconds.
+        :param kwargs: the arguments of `HTTPAdapter`.
+        """
+        self.timeout = timeout
+        self.requests = 0
+        self.errors = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.total_time = 0.0
+        self._lock = threading.Lock()
+        super().__init__(**kwargs)
+
+    def send(
+        self,
+        request: PreparedRequest,
+        stream: bool = False,
+        timeout: Optional[Union[float, Tuple[float, float]]] = None,
+        **kwargs: Any,
+    ) -> Response:
+        """Send a request, counting it and the time until its response."""
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        started_at = time.time()
+        try:
+            return super().send(
+                request,
+                stream=stream,
+                timeout=self.timeout if timeout is None else timeout,
+                **kwargs,
+            )
+        except Exception:
+            with self._lock:
+                self.errors += 1
+            raise
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+                self.requests += 1
+                self.total_time += time.time() - started_at
+
+    def stats(self) -> Dict[str, Any]:
+        """Get the usage counters of the adapter and of its connection pools."""
+        pools = [
+            self.poolmanager.pools.get(key) for key in self.poolmanager.pools.keys()
+        ]
+        pools = [pool for pool in pools if pool is not None]
+        opened = sum(pool.num_connections for pool in pools)
+        idle = sum(
+            sum(1 for conn in list(pool.pool.queue) if conn is not None)
+            for pool in pools
+            if pool.pool is not None
+        )
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "errors": self.errors,
+                "in_flight": self.in_flight,
+                "max_in_flight": self.max_in_flight,
+                "mean_latency": self.total_time / self.requests
+                if self.requests
+                else 0.0,
+                "hosts": len(pools),
+                "connections_opened": opened,
+                "idle_connections": idle,
+                "reuse_ratio": 1 - opened / self.requests if self.requests else 0.0,
+            }
+
+
+class PooledSession(Session):
+    """A session sending all its requests through one `MeteredHTTPAdapter`."""
+
+    def __init__(
+        self,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+        read_timeout: float = DEFAULT_READ_TIMEOUT,
+    ) -> None:
+        """
+        Initialise the session.
+
+        :param pool_connections: the number of hosts to keep connections to.
+        :param pool_maxsize: the most connections open to one host.
+        :param connect_timeout: seconds to wait for a connection.
+        :param read_timeout: seconds to wait for data from the server.
+        """
+        super().__init__()
+        self.adapter = MeteredHTTPAdapter(
+            timeout=(connect_timeout, read_timeout),
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=True,
+        )
+        self.mount("http://", self.adapter)
+        self.mount("https://", self.adapter)
+
+    def stats(self) -> Dict[str, Any]:
+        """Get the usage counters of the session."""
+        return self.adapter.stats()
@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2021 eightballer
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""Local nonce assignment for an account that sends transactions from many threads."""
+import threading
+from typing import Callable, Optional, Set
+
+# messages of node errors which mean the local nonce is out of sync with the chain
+NONCE_ERRORS = (
+    "nonce too low",
+    "nonce too high",
+    "already known",
+    "known transaction",
+    "replacement transaction underpriced",
+    "transaction underpriced",
+)
+
+
+class NonceManager:
+    """
+    Hands out nonces for one account without asking the node each time.
+
+    Nonces are assigned from a local counter so transactions of independent
+    operations can be signed and submitted back to back, each worker then
+    waits for its own receipt. The counter is seeded from the pending
+    transaction count of the node, and is re-seeded whenever a transaction
+    fails in a way that means it never made it into a block (dropped,
+    replaced or rejected), so the next transaction fills the gap.
+    """
+
+    def __init__(
+        self, address: str, get_transaction_count: Callable[[str], int]
+    ) -> None:
+        """
+        Initialise the manager.
+
+        :param address: the address of the account.
+        :param get_transaction_count: returns the pending transaction count of an address.
+        """
+        self.address = address
+        self._get_transaction_count = get_transaction_count
+        self._next_nonce = None  # type: Optional[int]
+        self._in_flight = set()  # type: Set[int]
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    @property
+    def in_flight(self) -> int:
+        """Get the number of transactions submitted and not yet settled."""
+        return len(self._in_flight)
+
+    def next_nonce(self) -> int:
+        """
+        Assign the next nonce of the account.
+
+        The nonce is remembered for the calling thread, so the caller can
+        report on the transaction it was used for with `confirm` or `fail`.
+
+        :return: the nonce.
+        """
+        with self._lock:
+            if self._next_nonce is None:
+                self._next_nonce = self._get_transaction_count(self.address)
+            nonce = self._next_nonce
+            self._next_nonce += 1
+            self._in_flight.add(nonce)
+        self._local.nonce = nonce
+        return nonce
+
+    def last_nonce(self) -> Optional[int]:
+        """Get the nonce last assigned to the calling thread."""
+        return getattr(self._local, "nonce", None)
+
+    def confirm(self, nonce: Optional[int] = None) -> None:
+        """
+        Mark a transaction as mined.
+
+        :param nonce: the nonce of the transaction, the calling thread's last one by default.
+        """
+        nonce = self.last_nonce() if nonce is None else nonce
+        with self._lock:
+            self._in_flight.discard(nonce)
+
+    def fail(self, error: Exception, nonce: Optional[int] = None) -> bool:
+        """
+        Handle a transaction that did not make it into a block.
+
+        The counter is re-seeded from the node on the next assignment when the
+        error shows the nonce was not consumed, e.g. the transaction was
+        rejected, dropped from the mempool or replaced.
+
+        :param error: the error raised while sending or waiting for the transaction.
+        :param nonce: the nonce of the transaction, the calling thread's last one by default.
+        :return: whether the nonces were re-synchronised.
+        """
+        nonce = self.last_nonce() if nonce is None else nonce
+        with self._lock:
+            self._in_flight.discard(nonce)
+            if not self.is_nonce_error(error):
+                return False
+            self._next_nonce = None
+            return True
+
+    def resync(self) -> None:
+        """Re-seed the counter from the node on the next assignment."""
+        with self._lock:
+            self._next_nonce = None
+
+    @staticmethod
+    def is_nonce_error(error: Exception) -> bool:
+        """Check whether an error means the transaction's nonce was not consumed."""
+        if type(error).__name__ in ("TimeExhausted", "TransactionNotFound"):
+            return True
+        message = str(error).lower()
+        return any(text in message for text in NONCE_ERRORS)
@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2021 eightballer
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""A local ledger of the service orders paid by the ocean connection."""
+import sqlite3
+import threading
+import time
+from collections import defaultdict
+from typing import Dict, Optional, Tuple
+
+DEFAULT_LEDGER_PATH = "service_orders.db"
+
+# an order is not reused when it expires sooner than this, in seconds
+DEFAULT_MIN_VALIDITY = 300.0
+
+# the did, service index and consumer address of an order
+OrderKey = Tuple[str, int, str]
+
+
+class OrderLedger:
+    """
+    Remembers the orders paid for each service, until they expire.
+
+    A service order stays valid for the timeout of the service, so while
+    it does the same consumer can show its transaction again to download
+    or compute instead of paying another order. Orders of the same service
+    are serialised with a per key lock, so concurrent jobs wait for the
+    first one to pay and then reuse its order.
+    """
+
+    def __init__(
+        self,
+        path: str = DEFAULT_LEDGER_PATH,
+        min_validity: float = DEFAULT_MIN_VALIDITY,
+    ) -> None:
+        """
+        Initialise the ledger, creating the database if needed.
+
+        :param path: the path of the SQLite database, `:memory:` for a transient one.
+        :param min_validity: seconds an order must still be valid for to be reused.
+        """
+        self.path = path
+        self.min_validity = min_validity
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._key_locks = defaultdict(
+            threading.Lock
+        )  # type: Dict[OrderKey, threading.Lock]
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS orders ("
+                "did TEXT NOT NULL, service_index INTEGER NOT NULL, "
+                "consumer TEXT NOT NULL, tx_id TEXT NOT NULL, "
+                "ordered_at REAL NOT NULL, expires_at REAL, "
+                "PRIMARY KEY (did, service_index, consumer))"
+            )
+
+    @staticmethod
+    def key(did: str, service_index: int, consumer: str) -> OrderKey:
+        """Get the key of the orders of a consumer for a service."""
+        return did, service_index, consumer.lower()
+
+    def lock(self, key: OrderKey) -> threading.Lock:
+        """Get the lock serialising the orders of a service by a consumer."""
+        with self._lock:
+            return self._key_locks[key]
+
+    def get(self, key: OrderKey, now: Optional[float] = None) -> Optional[str]:
+        """
+        Get an order which can be reused.
+
+        :param key: the key of the order.
+        :param now: the current time.
+        :return: the transaction id of the order, or None.
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT tx_id FROM orders WHERE did = ? AND service_index = ? "
+                "AND consumer = ? AND (expires_at IS NULL OR expires_at > ?)",
+                (*key, now + self.min_validity),
+            ).fetchone()
+        return None if row is None else row[0]
+
+    def put(
+        self, key: OrderKey, tx_id: str, timeout: int, now: Optional[float] = None
+    ) -> None:
+        """
+        Record a paid order.
+
+        :param key: the key of the order.
+        :param tx_id: the transaction id of the order.
+        :param timeout: the timeout of the service in seconds, 0 if orders never expire.
+        :param now: the time the order was paid.
+        """
+        now = time.time() if now is None else now
+        expires_at = now + timeout if timeout else None
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO orders VALUES (?, ?, ?, ?, ?, ?)",
+                (*key, tx_id, now, expires_at),
+            )
+
+    def remove(self, key: OrderKey) -> None:
+        """Forget an order, so the service is paid again."""
+        with self._lock, self._connection:
+            self._connection.execute(
+                "DELETE FROM orders WHERE did = ? AND service_index = ? "
+                "AND consumer = ?",
+                key,
+            )
+
+    def prune(self, now: Optional[float] = None) -> int:
+        """
+        Forget the expired orders.
+
+        :param now: the current time.
+        :return: the number of orders forgotten.
+        """
+        now = time.time() if now is None else now
+        with self._lock, self._connection:
+            return self._connection.execute(
+                "DELETE FROM orders WHERE expires_at <= ?", (now,)
+            ).rowcount
+
+    def close(self) -> None:
+        """Close the database."""
+        with self._lock:
+            self._connection.close()
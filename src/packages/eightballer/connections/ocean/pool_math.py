@@ -0,0 +1,236 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2021 eightballer
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""Balancer pool math evaluated locally over many OCEAN / datatoken pools at once."""
+import threading
+from decimal import ROUND_CEILING, Decimal
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+WEI = 10 ** 18
+
+# balancer rejects swaps taking more than a third of a reserve out of a pool,
+# or putting more than half of a reserve into it
+MAX_OUT_RATIO = 1 / 3
+MAX_IN_RATIO = 1 / 2
+
+DEFAULT_SLIPPAGE = 0.005
+
+# datatoken address, OCEAN balance, datatoken balance, OCEAN weight,
+# datatoken weight and swap fee of a pool, all as returned by the contract
+PoolState = Tuple[str, int, int, int, int, int]
+
+
+class PoolSnapshot:
+    """
+    The reserves, weights and fees of a set of pools at one block.
+
+    Prices are computed with the constant value formulas of the balancer
+    contracts, for all the pools at once. OCEAN is always the token going in
+    and the datatoken the token coming out. Amounts are in whole tokens.
+    """
+
+    def __init__(
+        self,
+        block: int,
+        states: Dict[str, PoolState],
+        errors: Optional[Dict[str, Exception]] = None,
+    ) -> None:
+        """
+        Initialise the snapshot.
+
+        :param block: the block the states were read at.
+        :param states: the state of each pool by address.
+        :param errors: the error of each pool which could not be read.
+        """
+        self.block = block
+        self.pools = list(states)
+        self.errors = dict(errors or {})
+        self.datatokens = np.array(
+            [states[pool][0].lower() for pool in self.pools], dtype=object
+        )
+        values = np.array(
+            [states[pool][1:] for pool in self.pools], dtype=float
+        ).reshape(-1, 5)
+        self.ocean_balances = values[:, 0] / WEI
+        self.datatoken_balances = values[:, 1] / WEI
+        self.ocean_weights = values[:, 2]
+        self.datatoken_weights = values[:, 3]
+        self.swap_fees = values[:, 4] / WEI
+
+    def __len__(self) -> int:
+        """Get the number of pools."""
+        return len(self.pools)
+
+    def datatoken_of(self, pool: str) -> str:
+        """Get the datatoken traded by a pool."""
+        return self.datatokens[self.pools.index(pool)]
+
+    def spot_prices(self) -> np.ndarray:
+        """Get the OCEAN price of one datatoken in each pool, swap fee included."""
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratio = (self.ocean_balances / self.ocean_weights) / (
+                self.datatoken_balances / self.datatoken_weights
+            )
+            return ratio / (1 - self.swap_fees)
+
+    def in_given_out(self, datatoken_amount: float) -> np.ndarray:
+        """
+        Get the OCEAN to pay in each pool to buy an amount of datatokens.
+
+        :param datatoken_amount: the datatokens to buy.
+        :return: the OCEAN cost per pool, infinite where the pool can not sell the amount.
+        """
+        with np.errstate(divide="ignore", invalid="ignore"):
+            weight_ratio = self.datatoken_weights / self.ocean_weights
+            remaining = self.datatoken_balances - datatoken_amount
+            growth = np.power(self.datatoken_balances / remaining, weight_ratio) - 1
+            cost = self.ocean_balances * growth / (1 - self.swap_fees)
+        return np.where(
+            datatoken_amount <= self.datatoken_balances * MAX_OUT_RATIO, cost, np.inf
+        )
+
+    def out_given_in(self, ocean_amount: float) -> np.ndarray:
+        """
+        Get the datatokens bought in each pool for an amount of OCEAN.
+
+        :param ocean_amount: the OCEAN to pay.
+        :return: the datatokens per pool, zero where the pool can not take the amount.
+        """
+        with np.errstate(divide="ignore", invalid="ignore"):
+            weight_ratio = self.ocean_weights / self.datatoken_weights
+            adjusted_in = ocean_amount * (1 - self.swap_fees)
+            ratio = self.ocean_balances / (self.ocean_balances + adjusted_in)
+            bought = self.datatoken_balances * (1 - np.power(ratio, weight_ratio))
+        return np.where(ocean_amount <= self.ocean_balances * MAX_IN_RATIO, bought, 0.0)
+
+    def cheapest(
+        self, datatoken_amount: float, datatoken: Optional[str] = None
+    ) -> Optional[Tuple[str, float]]:
+        """
+        Find the pool selling an amount of datatokens for the least OCEAN.
+
+        :param datatoken_amount: the datatokens to buy.
+        :param datatoken: only consider the pools of this datatoken.
+        :return: the pool and its OCEAN cost, or None if no pool can sell the amount.
+        """
+        if not self.pools:
+            return None
+        costs = self.in_given_out(datatoken_amount)
+        if datatoken is not None:
+            costs = np.where(self.datatokens == datatoken.lower(), costs, np.inf)
+        costs = np.where(np.isnan(costs), np.inf, costs)
+        index = int(np.argmin(costs))
+        if not np.isfinite(costs[index]):
+            return None
+        return self.pools[index], float(costs[index])
+
+
+class PoolQuoter:
+    """
+    Keeps the states of the pools read at the current block.
+
+    All quotes made at the same block are answered from the states already
+    read, so a pool is read from the chain at most once per block whatever
+    the number of quotes, and only when a quote needs it. The reads are made
+    without holding the lock, and a pool which can not be read is reported
+    on its own instead of failing the other pools.
+    """
+
+    def __init__(
+        self, read_pool: Callable[[str], PoolState], slippage: float = DEFAULT_SLIPPAGE
+    ) -> None:
+        """
+        Initialise the quoter.
+
+        :param read_pool: reads the state of a pool from the chain.
+        :param slippage: the fraction a price may move between the quote and the swap.
+        """
+        self.slippage = slippage
+        self._read_pool = read_pool
+        self._known = []  # type: List[str]
+        self._datatokens = {}  # type: Dict[str, str]
+        self._block = None  # type: Optional[int]
+        self._states = {}  # type: Dict[str, PoolState]
+        self._lock = threading.Lock()
+
+    @property
+    def pools(self) -> List[str]:
+        """Get the known pools."""
+        with self._lock:
+            return list(self._known)
+
+    def add(self, *pools: str) -> None:
+        """Add pools to quote, they are read when a quote needs them."""
+        with self._lock:
+            for pool in pools:
+                if pool not in self._known:
+                    self._known.append(pool)
+
+    def datatoken_of(self, pool: str) -> Optional[str]:
+        """Get the datatoken of a pool which has been read."""
+        with self._lock:
+            return self._datatokens.get(pool)
+
+    def pools_of(self, datatoken: str) -> List[str]:
+        """Get the known pools of a datatoken, and those not read yet."""
+        with self._lock:
+            return [
+                pool
+                for pool in self._known
+                if self._datatokens.get(pool, datatoken).lower() == datatoken.lower()
+            ]
+
+    def snapshot(self, block: int, pools: Iterable[str]) -> PoolSnapshot:
+        """
+        Get the snapshot of some pools at a block.
+
+        :param block: the current block.
+        :param pools: the pools to quote, added to the known pools.
+        :return: the snapshot, without the pools which could not be read.
+        """
+        pools = list(dict.fromkeys(pools))
+        self.add(*pools)
+        with self._lock:
+            if self._block != block:
+                self._block, self._states = block, {}
+            states = {
+                pool: self._states[pool] for pool in pools if pool in self._states
+            }
+        read, errors = {}, {}  # type: Dict[str, PoolState], Dict[str, Exception]
+        for pool in pools:
+            if pool not in states:
+                try:
+                    read[pool] = self._read_pool(pool)
+                except Exception as e:  # pylint: disable=broad-except
+                    errors[pool] = e
+        with self._lock:
+            for pool, state in read.items():
+                self._datatokens[pool] = state[0]
+                if self._block == block:
+                    self._states[pool] = state
+        states.update(read)
+        return PoolSnapshot(
+            block, {pool: states[pool] for pool in pools if pool in states}, errors
+        )
+
+    def max_cost(self, cost: float) -> int:
+        """Get the bound in wei of the OCEAN paid for a quoted cost."""
+        bound = Decimal(repr(cost)) * (1 + Decimal(repr(self.slippage))) * WEI
+        return int(bound.to_integral_value(rounding=ROUND_CEILING))
@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2021 eightballer
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""A local index of published assets keyed by the hash of their content."""
+import copy
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Dict, Optional, Tuple
+
+DEFAULT_INDEX_PATH = "published_assets.db"
+
+# service attributes which change on every publish without changing the asset
+VOLATILE_SERVICE_ATTRIBUTES = ("creator", "datePublished")
+
+
+class PublishIndex:
+    """
+    Remembers which content has already been published.
+
+    Publishing is keyed on a hash of the metadata (which holds the dataset
+    or algorithm url) and the service descriptor, so a duplicate request is
+    answered from the index before any transaction is sent. Publishes of the
+    same content are serialised with a per hash lock, so concurrent
+    duplicates wait for the first one and then reuse its asset.
+    """
+
+    def __init__(self, path: str = DEFAULT_INDEX_PATH) -> None:
+        """
+        Initialise the index, creating the database if needed.
+
+        :param path: the path of the SQLite database, `:memory:` for a transient one.
+        """
+        self.path = path
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._content_locks = defaultdict(
+            threading.Lock
+        )  # type: Dict[str, threading.Lock]
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS published ("
+                "content_hash TEXT PRIMARY KEY, did TEXT NOT NULL, "
+                "datatoken_address TEXT NOT NULL, publisher TEXT NOT NULL, "
+                "published_at REAL NOT NULL)"
+            )
+
+    @staticmethod
+    def content_hash(
+        metadata: Dict[str, Any],
+        service_type: str,
+        service_attributes: Dict[str, Any],
+        network: str = "",
+    ) -> str:
+        """
+        Hash the content of an asset.
+
+        :param metadata: the metadata of the asset.
+        :param service_type: the type of the service of the asset.
+        :param service_attributes: the attributes of the service.
+        :param network: the network the asset is published on.
+        :return: the hex digest.
+        """
+        attributes = copy.deepcopy(service_attributes)
+        for name in VOLATILE_SERVICE_ATTRIBUTES:
+            attributes.get("main", {}).pop(name, None)
+        content = json.dumps(
+            {
+                "metadata": metadata,
+                "network": network,
+                "service_attributes": attributes,
+                "service_type": service_type,
+            },
+            sort_keys=True,
+            separators=(",", ":"),
+        )
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+    def lock(self, content_hash: str) -> threading.Lock:
+        """Get the lock serialising the publishes of some content."""
+        with self._lock:
+            return self._content_locks[content_hash]
+
+    def get(self, content_hash: str) -> Optional[Tuple[str, str, str]]:
+        """
+        Get a published asset.
+
+        :param content_hash: the hash of the content.
+        :return: the did, datatoken address and publisher, or None.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT did, datatoken_address, publisher FROM published "
+                "WHERE content_hash = ?",
+                (content_hash,),
+            ).fetchone()
+        return None if row is None else tuple(row)
+
+    def put(
+        self, content_hash: str, did: str, datatoken_address: str, publisher: str
+    ) -> None:
+        """Record a published asset."""
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO published VALUES (?, ?, ?, ?, ?)",
+                (content_hash, did, datatoken_address, publisher, time.time()),
+            )
+
+    def remove(self, content_hash: str) -> None:
+        """Forget a published asset, so its content is published again."""
+        with self._lock, self._connection:
+            self._connection.execute(
+                "DELETE FROM published WHERE content_hash = ?", (content_hash,)
+            )
+
+    def close(self) -> None:
+        """Close the database."""
+        with self._lock:
+            self._connection.close()
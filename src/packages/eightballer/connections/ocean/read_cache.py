@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2021 eightballer
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""A per-block cache of contract reads, batching the concurrent ones."""
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+DEFAULT_BATCH_WINDOW = 0.01
+DEFAULT_BLOCK_TTL = 1.0
+DEFAULT_MAX_BATCH_SIZE = 100
+
+# the contract and calldata of a read
+Call = Tuple[str, str]
+
+
+class BlockReadCache:
+    """
+    Answers contract reads from a cache of the results at the current block.
+
+    Reads are made at an explicit block number, which is looked up at most
+    once every `block_ttl` seconds, so a cached result is exactly the state
+    at that block. Reads missing from the cache wait `batch_window` seconds
+    for other threads to make theirs, then all are executed together in
+    batches of at most `max_batch_size`.
+    """
+
+    def __init__(
+        self,
+        execute: Callable[[List[Call], int], List[Optional[str]]],
+        get_block_number: Callable[[], int],
+        batch_window: float = DEFAULT_BATCH_WINDOW,
+        block_ttl: float = DEFAULT_BLOCK_TTL,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+    ) -> None:
+        """
+        Initialise the cache.
+
+        :param execute: makes reads at a block, returning None for those which failed.
+        :param get_block_number: gets the number of the latest block.
+        :param batch_window: seconds a read waits for others to batch with.
+        :param block_ttl: seconds the block number is reused for.
+        :param max_batch_size: the most reads executed at once.
+        """
+        self.batch_window = batch_window
+        self.block_ttl = block_ttl
+        self.max_batch_size = max_batch_size
+        self.hits = 0
+        self.misses = 0
+        self.batches = 0
+        self.batched_calls = 0
+        self.max_batch = 0
+        self._execute = execute
+        self._get_block_number = get_block_number
+        self._block = None  # type: Optional[int]
+        self._block_expires_at = 0.0
+        self._results = {}  # type: Dict[Call, str]
+        self._in_flight = {}  # type: Dict[Call, Future]
+        self._pending = []  # type: List[Tuple[Call, Future]]
+        self._lock = threading.Lock()
+
+    def block_number(self) -> int:
+        """Get the block the reads are made at, dropping the results of older blocks."""
+        with self._lock:
+            if self._block is not None and time.time() < self._block_expires_at:
+                return self._block
+        number = self._get_block_number()
+        self.observe_block(number)
+        with self._lock:
+            self._block_expires_at = time.time() + self.block_ttl
+            return self._block
+
+    def observe_block(self, number: int) -> None:
+        """Move to a block known to be mined, such as the block of a receipt."""
+        with self._lock:
+            if self._block is not None and number <= self._block:
+                return
+            self._block = number
+            self._results = {}
+
+    def read(self, to: str, data: str) -> str:
+        """
+        Read from a contract at the current block.
+
+        :param to: the address of the contract.
+        :param data: the hex encoded calldata.
+        :return: the hex encoded return data.
+        """
+        block = self.block_number()
+        call = (to.lower(), data)
+        with self._lock:
+            if block == self._block and call in self._results:
+                self.hits += 1
+                return self._results[call]
+            future = self._in_flight.get(call)
+            is_first = is_full = False
+            if future is not None:
+                # the same read is already being made for another thread
+                self.hits += 1
+            else:
+                self.misses += 1
+                future = Future()
+                self._in_flight[call] = future
+                self._pending.append((call, future))
+                # the first read of a batch waits for others then executes it,
+                # unless a later read fills the batch and executes it first
+                is_first = len(self._pending) == 1
+                is_full = len(self._pending) >= self.max_batch_size
+        if is_first and not is_full and self.batch_window > 0:
+            time.sleep(self.batch_window)
+        if is_first or is_full:
+            self._flush()
+        return future.result()
+
+    def _flush(self) -> None:
+        """Execute the pending reads at the latest block known."""
+        with self._lock:
+            pending, self._pending = self._pending, []
+            block = self._block
+        for start in range(0, len(pending), self.max_batch_size):
+            batch = pending[start : start + self.max_batch_size]
+            calls = [call for call, _ in batch]
+            try:
+                results = self._execute(calls, block)
+            except Exception as e:  # pylint: disable=broad-except
+                results = [e] * len(batch)
+            with self._lock:
+                self.batches += 1
+                self.batched_calls += len(batch)
+                self.max_batch = max(self.max_batch, len(batch))
+                for (call, future), result in zip(batch, results):
+                    self._in_flight.pop(call, None)
+                    if isinstance(result, str) and block == self._block:
+                        self._results[call] = result
+            for (call, future), result in zip(batch, results):
+                if isinstance(result, Exception):
+                    future.set_exception(result)
+                elif result is None:
+                    future.set_exception(ValueError(f"Call to {call[0]} failed"))
+                else:
+                    future.set_result(result)
+
+    def stats(self) -> Dict[str, Any]:
+        """Get the hit ratio of the cache and the size of the batches."""
+        with self._lock:
+            reads = self.hits + self.misses
+            return {
+                "block": self._block,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / reads if reads else 0.0,
+                "batches": self.batches,
+                "mean_batch_size": self.batched_calls / self.batches
+                if self.batches
+                else 0.0,
+                "max_batch_size": self.max_batch,
+            }
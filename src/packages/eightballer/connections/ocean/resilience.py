@@ -0,0 +1,231 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2021 eightballer
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""Retries and circuit breakers for the calls made by the ocean connection."""
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple, Type
+
+DEFAULT_FAILURE_THRESHOLD = 5
+DEFAULT_RESET_TIMEOUT = 30.0
+DEFAULT_BASE_DELAY = 0.5
+DEFAULT_MAX_DELAY = 8.0
+DEFAULT_JITTER = 0.5
+
+# connection errors and timeouts, including those raised by requests
+TRANSIENT_ERRORS = (OSError,)  # type: Tuple[Type[BaseException], ...]
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling an endpoint which is failing."""
+
+
+def is_transient(error: BaseException) -> bool:
+    """Check if an error came from reaching an endpoint rather than from the call."""
+    return isinstance(error, TRANSIENT_ERRORS + (CircuitOpenError,))
+
+
+class CircuitBreaker:
+    """
+    Stops calling an endpoint after consecutive transient failures.
+
+    Once `failure_threshold` calls in a row failed the circuit opens and
+    calls fail straight away. After `reset_timeout` seconds a single call is
+    let through: the circuit closes if it succeeds and opens again if not.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        reset_timeout: float = DEFAULT_RESET_TIMEOUT,
+    ) -> None:
+        """
+        Initialise the breaker.
+
+        :param name: the name of the endpoint.
+        :param failure_threshold: consecutive failures opening the circuit.
+        :param reset_timeout: seconds before a call is tried on an open circuit.
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None  # type: Optional[float]
+        self._probing = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """Get the state of the circuit."""
+        if self.opened_at is None:
+            return self.CLOSED
+        if self._probing or time.time() - self.opened_at < self.reset_timeout:
+            return self.OPEN
+        return self.HALF_OPEN
+
+    def before_call(self, now: Optional[float] = None) -> None:
+        """Check that the endpoint may be called, raising `CircuitOpenError` if not."""
+        now = time.time() if now is None else now
+        with self._lock:
+            if self.opened_at is None:
+                return
+            if self._probing or now - self.opened_at < self.reset_timeout:
+                raise CircuitOpenError(
+                    f"{self.name} is unavailable after {self.failures} failures"
+                )
+            self._probing = True
+
+    def record_success(self) -> None:
+        """Close the circuit after a call reached the endpoint."""
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._probing = False
+
+    def record_failure(self, now: Optional[float] = None) -> None:
+        """Count a transient failure, opening the circuit at the threshold."""
+        now = time.time() if now is None else now
+        with self._lock:
+            self.failures += 1
+            if self._probing or self.failures >= self.failure_threshold:
+                self.opened_at = now
+            self._probing = False
+
+
+class RetryPolicy:
+    """How many times an operation is tried, and how long to wait in between."""
+
+    def __init__(
+        self,
+        attempts: int = 1,
+        base_delay: float = DEFAULT_BASE_DELAY,
+        max_delay: float = DEFAULT_MAX_DELAY,
+        jitter: float = DEFAULT_JITTER,
+        retry_on: Tuple[Type[BaseException], ...] = TRANSIENT_ERRORS,
+    ) -> None:
+        """
+        Initialise the policy.
+
+        :param attempts: the number of tries, 1 for operations which must not be replayed.
+        :param base_delay: seconds before the first retry.
+        :param max_delay: upper bound of the backoff between retries.
+        :param jitter: fraction by which each delay is randomly spread.
+        :param retry_on: the errors worth retrying.
+        """
+        self.attempts = attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.retry_on = retry_on
+
+    def delay(self, retry: int) -> float:
+        """Get the seconds to wait before a retry, counted from 0."""
+        delay = min(self.base_delay * 2 ** retry, self.max_delay)
+        spread = delay * self.jitter
+        return max(0.0, delay + random.uniform(-spread, spread))
+
+
+class Resilience:
+    """
+    Runs the operations of the connection with their retry policy and breaker.
+
+    Each operation is declared with the endpoint it depends on and its
+    number of attempts. All the operations of an endpoint share its circuit
+    breaker, so once aquarius, the provider or the node is failing every call
+    to it fails fast instead of holding a worker until it times out.
+    """
+
+    def __init__(
+        self,
+        operations: Dict[str, Tuple[str, int]],
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        reset_timeout: float = DEFAULT_RESET_TIMEOUT,
+        base_delay: float = DEFAULT_BASE_DELAY,
+        max_delay: float = DEFAULT_MAX_DELAY,
+        jitter: float = DEFAULT_JITTER,
+        attempts: Optional[Dict[str, int]] = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """
+        Initialise the layer.
+
+        :param operations: the endpoint and number of attempts of each operation.
+        :param failure_threshold: consecutive failures opening a circuit.
+        :param reset_timeout: seconds before a call is tried on an open circuit.
+        :param base_delay: seconds before the first retry.
+        :param max_delay: upper bound of the backoff between retries.
+        :param jitter: fraction by which each delay is randomly spread.
+        :param attempts: overrides of the number of attempts by operation.
+        :param sleep: waits between retries.
+        """
+        attempts = attempts or {}
+        self.policies = {
+            operation: (
+                endpoint,
+                RetryPolicy(
+                    attempts.get(operation, default_attempts),
+                    base_delay,
+                    max_delay,
+                    jitter,
+                ),
+            )
+            for operation, (endpoint, default_attempts) in operations.items()
+        }
+        self.breakers = {
+            endpoint: CircuitBreaker(endpoint, failure_threshold, reset_timeout)
+            for endpoint, _ in operations.values()
+        }
+        self._sleep = sleep
+
+    def call(self, operation: str, fn: Callable, *args: Any, **kwargs: Any) -> Any:
+        """
+        Run an operation.
+
+        :param operation: the name of the operation.
+        :param fn: the function making the call.
+        :return: the result of the call.
+        """
+        endpoint, policy = self.policies[operation]
+        breaker = self.breakers[endpoint]
+        for retry in range(policy.attempts):
+            breaker.before_call()
+            try:
+                result = fn(*args, **kwargs)
+            except policy.retry_on:
+                breaker.record_failure()
+                if retry + 1 >= policy.attempts:
+                    raise
+            except Exception:
+                # the endpoint answered, the operation itself failed
+                breaker.record_success()
+                raise
+            else:
+                breaker.record_success()
+                return result
+            self._sleep(policy.delay(retry))
+        raise ValueError(f"{operation} has no attempts")  # pragma: nocover
+
+    def stats(self) -> Dict[str, str]:
+        """Get the state of the circuit of each endpoint."""
+        return {endpoint: breaker.state for endpoint, breaker in self.breakers.items()}
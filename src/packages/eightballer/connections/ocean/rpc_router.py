@@ -0,0 +1,272 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2021 eightballer
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""Routes the JSON-RPC requests of the connection over several nodes."""
+# fmt: off
+import itertools
+import threading
+import time
+from concurrent.futures import (FIRST_COMPLETED, Future, ThreadPoolExecutor,
+                                wait)
+from typing import Any, Dict, List, Optional
+
+from requests import Session
+
+from packages.eightballer.connections.ocean.resilience import (
+    CircuitBreaker, CircuitOpenError)
+
+# fmt: on
+
+DEFAULT_FAILURE_THRESHOLD = 3
+DEFAULT_RESET_TIMEOUT = 15.0
+DEFAULT_MIN_HEDGE_DELAY = 0.25
+DEFAULT_HEDGE_FACTOR = 3.0
+DEFAULT_LATENCY_ALPHA = 0.2
+DEFAULT_MAX_WORKERS = 16
+
+# methods which change the state of a node, or depend on state held by the
+# node they were first sent to, such as its pending transactions and filters
+PRIMARY_METHODS = frozenset(
+    {
+        "eth_sendRawTransaction",
+        "eth_sendTransaction",
+        "eth_getTransactionCount",
+        "eth_newFilter",
+        "eth_newBlockFilter",
+        "eth_getFilterChanges",
+        "eth_getFilterLogs",
+        "eth_uninstallFilter",
+    }
+)
+
+
+class RPCEndpoint:
+    """A node, with the moving average of its latency and its circuit breaker."""
+
+    def __init__(
+        self,
+        url: str,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        reset_timeout: float = DEFAULT_RESET_TIMEOUT,
+        latency_alpha: float = DEFAULT_LATENCY_ALPHA,
+    ) -> None:
+        """
+        Initialise the endpoint.
+
+        :param url: the url of the node.
+        :param failure_threshold: consecutive failures taking the node out of rotation.
+        :param reset_timeout: seconds before a node out of rotation is tried again.
+        :param latency_alpha: the weight of the latest response in the average latency.
+        """
+        self.url = url
+        self.breaker = CircuitBreaker(url, failure_threshold, reset_timeout)
+        self.latency_alpha = latency_alpha
+        self.latency = 0.0
+        self.requests = 0
+        self.errors = 0
+        self._lock = threading.Lock()
+
+    @property
+    def is_healthy(self) -> bool:
+        """Check whether requests may be sent to the node."""
+        return self.breaker.state != CircuitBreaker.OPEN
+
+    def record(self, latency: Optional[float]) -> None:
+        """Record a response time, or a failure when None."""
+        with self._lock:
+            self.requests += 1
+            if latency is None:
+                self.errors += 1
+            elif self.requests - self.errors == 1:
+                self.latency = latency
+            else:
+                self.latency += self.latency_alpha * (latency - self.latency)
+        if latency is None:
+            self.breaker.record_failure()
+        else:
+            self.breaker.record_success()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get the usage counters of the node."""
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "errors": self.errors,
+                "latency": self.latency,
+                "state": self.breaker.state,
+            }
+
+
+class RPCRouter:
+    """
+    Sends JSON-RPC requests to the best of several nodes.
+
+    Requests which change the state of the chain, or rely on state held by
+    one node, go to the first healthy node in the configured order, so the
+    first url is the primary. Reads go to the healthy node with the lowest
+    average latency. When it has not answered after `hedge_factor` times its
+    average latency, the read is sent to the next node as well and the first
+    answer is used. A node which can not be reached is failed over straight
+    away and taken out of rotation after `failure_threshold` failures.
+    """
+
+    def __init__(
+        self,
+        urls: List[str],
+        session: Optional[Session] = None,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        reset_timeout: float = DEFAULT_RESET_TIMEOUT,
+        min_hedge_delay: float = DEFAULT_MIN_HEDGE_DELAY,
+        hedge_factor: float = DEFAULT_HEDGE_FACTOR,
+        latency_alpha: float = DEFAULT_LATENCY_ALPHA,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> None:
+        """
+        Initialise the router.
+
+        :param urls: the urls of the nodes, the primary first.
+        :param session: the session to send the requests with.
+        :param failure_threshold: consecutive failures taking a node out of rotation.
+        :param reset_timeout: seconds before a node out of rotation is tried again.
+        :param min_hedge_delay: the least seconds to wait before hedging a read.
+        :param hedge_factor: the multiple of the average latency to wait before hedging.
+        :param latency_alpha: the weight of the latest response in the average latency.
+        :param max_workers: the most requests in flight at once.
+        """
+        if not urls:
+            raise ValueError("At least one RPC url is required.")
+        self.endpoints = [
+            RPCEndpoint(url, failure_threshold, reset_timeout, latency_alpha)
+            for url in urls
+        ]
+        self.min_hedge_delay = min_hedge_delay
+        self.hedge_factor = hedge_factor
+        self.hedged = 0
+        self.hedges_won = 0
+        self._session = session or Session()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="rpc"
+        )
+        self._ids = itertools.count()
+        self._lock = threading.Lock()
+
+    def ranked(self) -> List[RPCEndpoint]:
+        """Get the healthy nodes, fastest first."""
+        return sorted(
+            (endpoint for endpoint in self.endpoints if endpoint.is_healthy),
+            key=lambda endpoint: endpoint.latency,
+        )
+
+    def make_request(self, method: str, params: Any) -> Dict[str, Any]:
+        """
+        Send a JSON-RPC request.
+
+        :param method: the JSON-RPC method.
+        :param params: its parameters.
+        :return: the decoded JSON-RPC response, which may hold an error.
+        """
+        payload = {
+            "jsonrpc": "2.0",
+            "method": method,
+            "params": params,
+            "id": next(self._ids),
+        }
+        if method in PRIMARY_METHODS:
+            return self._send_to_primary(payload)
+        return self._send_hedged(payload)
+
+    def is_connected(self) -> bool:
+        """Check whether any node answers."""
+        try:
+            self.make_request("web3_clientVersion", [])
+        except Exception:  # pylint: disable=broad-except
+            return False
+        return True
+
+    def _post(self, endpoint: RPCEndpoint, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Send a request to a node, recording its latency or failure."""
+        endpoint.breaker.before_call()
+        started_at = time.time()
+        try:
+            response = self._session.post(endpoint.url, json=payload)
+            response.raise_for_status()
+            result = response.json()
+        except Exception:
+            endpoint.record(None)
+            raise
+        endpoint.record(time.time() - started_at)
+        return result
+
+    def _send_to_primary(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Send a request to the primary, failing over in the configured order."""
+        error = None  # type: Optional[Exception]
+        for endpoint in self.endpoints:
+            if not endpoint.is_healthy:
+                continue
+            try:
+                return self._post(endpoint, payload)
+            except Exception as e:  # pylint: disable=broad-except
+                error = e
+        raise error or CircuitOpenError("No healthy RPC endpoint.")
+
+    def _send_hedged(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Send a read to the fastest node, hedging on the next ones when slow."""
+        candidates = self.ranked()
+        if not candidates:
+            raise CircuitOpenError("No healthy RPC endpoint.")
+        pending = {}  # type: Dict[Future, bool]
+        error = None  # type: Optional[Exception]
+        while candidates or pending:
+            timeout = None  # type: Optional[float]
+            if candidates:
+                # a failed request is followed straight away, a slow one is hedged
+                endpoint = candidates.pop(0)
+                is_hedge = bool(pending)
+                pending[self._executor.submit(self._post, endpoint, payload)] = is_hedge
+                timeout = max(
+                    self.min_hedge_delay, self.hedge_factor * endpoint.latency
+                )
+                with self._lock:
+                    self.hedged += is_hedge
+            done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                is_hedge = pending.pop(future)
+                try:
+                    result = future.result()
+                except Exception as e:  # pylint: disable=broad-except
+                    error = e
+                    continue
+                with self._lock:
+                    self.hedges_won += is_hedge
+                return result
+        raise error or CircuitOpenError("No healthy RPC endpoint.")
+
+    def stats(self) -> Dict[str, Any]:
+        """Get the usage counters of the nodes and of hedging."""
+        with self._lock:
+            hedged, hedges_won = self.hedged, self.hedges_won
+        return {
+            "hedged": hedged,
+            "hedges_won": hedges_won,
+            **{endpoint.url: endpoint.stats() for endpoint in self.endpoints},
+        }
+
+    def close(self) -> None:
+        """Stop the threads sending the hedged requests and close the session."""
+        self._executor.shutdown(wait=False)
+        self._session.close()
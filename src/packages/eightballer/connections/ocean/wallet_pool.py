@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2021 eightballer
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""Spreads the on-chain work of the ocean connection over several wallets."""
+import threading
+from typing import Any, Dict, List, Optional
+
+
+class WalletPool:
+    """
+    Schedules operations on a set of wallets.
+
+    New work goes to the wallet with the fewest operations in progress, so
+    transactions of independent operations are sent from different accounts.
+    Assets, datatokens and pools remember the wallet that created or bought
+    them, and later operations on them always run on that wallet.
+    """
+
+    def __init__(self, wallets: List[Any]) -> None:
+        """
+        Initialise the pool.
+
+        :param wallets: the wallets, each with an `address`.
+        """
+        if not wallets:
+            raise ValueError("At least one wallet is required.")
+        self.wallets = list(wallets)
+        self._by_address = {wallet.address.lower(): wallet for wallet in wallets}
+        self._busy = {wallet.address: 0 for wallet in wallets}  # type: Dict[str, int]
+        self._owners = {}  # type: Dict[str, Any]
+        self._next = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Get the number of wallets."""
+        return len(self.wallets)
+
+    @property
+    def default(self) -> Any:
+        """Get the wallet used outside of scheduled operations."""
+        return self.wallets[0]
+
+    def get(self, address: str) -> Optional[Any]:
+        """Get a wallet by address."""
+        return self._by_address.get(address.lower())
+
+    def owner(self, key: str) -> Optional[Any]:
+        """Get the wallet owning a did, datatoken or pool address."""
+        with self._lock:
+            return self._owners.get(key.lower())
+
+    def assign(self, wallet: Any, *keys: str) -> None:
+        """
+        Record the wallet owning some dids, datatokens or pools.
+
+        :param wallet: the wallet.
+        :param keys: the dids or addresses the wallet owns.
+        """
+        with self._lock:
+            for key in keys:
+                if key:
+                    self._owners[key.lower()] = wallet
+
+    def acquire(self, *keys: str) -> Any:
+        """
+        Get the wallet to run an operation on.
+
+        :param keys: the dids or addresses the operation works on.
+        :return: the owner of the first known key, otherwise the least busy wallet.
+        """
+        with self._lock:
+            wallet = next(
+                (
+                    self._owners[key.lower()]
+                    for key in keys
+                    if key and key.lower() in self._owners
+                ),
+                None,
+            )
+            if wallet is None:
+                # round robin between the least busy wallets
+                ordered = self.wallets[self._next :] + self.wallets[: self._next]
+                wallet = min(ordered, key=lambda w: self._busy[w.address])
+                self._next = (self.wallets.index(wallet) + 1) % len(self.wallets)
+            self._busy[wallet.address] += 1
+            return wallet
+
+    def release(self, wallet: Any) -> None:
+        """Mark an operation on a wallet as done."""
+        with self._lock:
+            self._busy[wallet.address] -= 1
@@ -17,7 +17,10 @@
 #
 # ------------------------------------------------------------------------------
 """Scaffold connection and channel."""
-from typing import Any, Optional
+import hashlib
+import os
+import time
+from typing import Any, Optional, Tuple
 
 import boto3
 from aea.configurations.base import PublicId
@@ -32,6 +35,18 @@ Sync (inherited from BaseSyncConnection) or Async (inherited from Connection) co
 
 CONNECTION_ID = PublicId.from_str("eightballer/storj_file_transfer:0.1.0")
 
+# files are read from disk in chunks of this size to compute their digest
+DEFAULT_READ_CHUNK_SIZE = 1024 * 1024
+
+# presigned urls stay valid for a week
+PRESIGNED_URL_EXPIRY = 604800
+
+from packages.eightballer.connections.storj_file_transfer.manifest import (
+    DEFAULT_MANIFEST_PATH, ContentManifest, content_key)
+from packages.eightballer.connections.storj_file_transfer.multipart import (
+    DEFAULT_MULTIPART_THRESHOLD, MultipartUploader, RangedDownloader,
+    SequentialDigest)
+from packages.eightballer.protocols.file_storage.custom_types import ErrorCode
 from packages.eightballer.protocols.file_storage.message import \
     FileStorageMessage
 
@@ -64,6 +79,20 @@ class StorjSyncConnection(BaseSyncConnection):
 
         self.storj_creds = kwargs.get("configuration").config["storj_creds"]
         self.target_skill = kwargs.get("configuration").config["target_skill_id"]
+        self.multipart_config = dict(
+            kwargs.get("configuration").config.get("multipart") or {}
+        )
+        self.multipart_threshold = self.multipart_config.pop(
+            "threshold", DEFAULT_MULTIPART_THRESHOLD
+        )
+        self.content_addressed = kwargs.get("configuration").config.get(
+            "content_addressed", False
+        )
+        self.manifest_path = (
+            kwargs.get("configuration").config.get("manifest_path")
+            or DEFAULT_MANIFEST_PATH
+        )
+        self.manifest = None  # type: Optional[ContentManifest]
         super().__init__(*args, **kwargs)
 
     def main(self) -> None:
@@ -100,6 +129,13 @@ class StorjSyncConnection(BaseSyncConnection):
         """
         if envelope.message.performative == FileStorageMessage.Performative.FILE_UPLOAD:
             self._upload(envelope)
+        elif (
+            envelope.message.performative
+            == FileStorageMessage.Performative.FILE_UPLOAD_PATH
+        ):
+            self._upload_file(envelope)
+        elif envelope.message.performative == FileStorageMessage.Performative.FILE_FETCH:
+            self._fetch_file(envelope)
         else:
             self.logger.error(
                 f"Unsupported performative! {envelope.message.performative}"
@@ -108,26 +144,184 @@ class StorjSyncConnection(BaseSyncConnection):
 
     def _upload(self, envelope: Envelope) -> None:
         self.logger.info(f"Message got! {envelope.message.content[:100]}")
-        self.s3.put_object(
-            Body=envelope.message_bytes,
-            Bucket=self.bucket_name,
-            Key=envelope.message.key,
-        )
-        url = self.s3.generate_presigned_url(
-            ClientMethod="get_object",
-            Params={"Bucket": self.bucket_name, "Key": envelope.message.key,},
-            ExpiresIn=604800,
-        )
-        msg = FileStorageMessage(
-            performative=FileStorageMessage.Performative.FILE_DOWNLOAD,
-            content=envelope.message.content,
-            access_url=url,
-        )
+        body = envelope.message.content
+        key = envelope.message.key
+        try:
+            if self.content_addressed:
+                digest = hashlib.sha256(body).hexdigest()
+                key = content_key(digest)
+            if self.content_addressed and self._is_stored(key, digest, len(body)):
+                self.logger.info(f"Content already stored as {key}, upload skipped")
+            elif len(body) > self.multipart_threshold:
+                # large payloads are sent as parts in parallel, each retried on its own
+                self.uploader.upload(
+                    key,
+                    len(body),
+                    lambda offset, length: body[offset : offset + length],
+                )
+                self.logger.info(f"Multipart upload stats: {self.uploader.stats()}")
+            else:
+                self.s3.put_object(
+                    Body=body, Bucket=self.bucket_name, Key=key,
+                )
+            if self.content_addressed:
+                self.manifest.put(digest, key, len(body))
+            # the content is not echoed back, the agent already has it
+            msg = FileStorageMessage(
+                performative=FileStorageMessage.Performative.FILE_DOWNLOAD,
+                content=b"",
+                access_url=self._presigned_url(key),
+            )
+        except Exception as e:  # pylint: disable=broad-except
+            self.logger.error(f"Could not upload {key}: {e}")
+            msg = _error_message(f"Upload failed: {e}", key=key)
         msg.sender = envelope.to
         msg.to = envelope.sender
         file_download_envolope = Envelope(to=msg.to, sender=msg.sender, message=msg)
         self.put_envelope(file_download_envolope)
 
+    def _upload_file(self, envelope: Envelope) -> None:
+        """
+        Upload a local file, streamed from disk.
+
+        A file up to the multipart threshold is read once, hashed and sent as
+        the body of a single put. A larger one is sent as parts read with
+        positional reads by the upload threads and hashed as they are read,
+        so only a few parts are in memory at once whatever the size of the
+        file. The reply carries the url and the sha256 digest of the object,
+        not its bytes. In content addressed mode the digest is the key of the
+        object, so a file which is stored already is not sent again. A file
+        which could not be read or stored is replied to with an error.
+        """
+        file_path = envelope.message.file_path
+        key = envelope.message.key
+        try:
+            size = os.path.getsize(file_path)
+            self.logger.info(f"Uploading {file_path} ({size} bytes)")
+            if size > self.multipart_threshold:
+                key, digest = self._upload_parts(file_path, key, size)
+            else:
+                with open(file_path, "rb") as f:
+                    body = f.read()
+                digest = hashlib.sha256(body).hexdigest()
+                if self.content_addressed:
+                    key = content_key(digest)
+                if self.content_addressed and self._is_stored(key, digest, size):
+                    self.logger.info(f"Content already stored as {key}, upload skipped")
+                else:
+                    self.s3.put_object(Body=body, Bucket=self.bucket_name, Key=key)
+            if self.content_addressed:
+                self.manifest.put(digest, key, size)
+            msg = FileStorageMessage(
+                performative=FileStorageMessage.Performative.UPLOAD_RECIEPT,
+                key=key,
+                access_url=self._presigned_url(key),
+                digest=digest,
+                size=size,
+            )
+        except Exception as e:  # pylint: disable=broad-except
+            self.logger.error(f"Could not upload {file_path} to {key}: {e}")
+            msg = _error_message(f"Upload failed: {e}", file_path=file_path, key=key)
+        msg.sender = envelope.to
+        msg.to = envelope.sender
+        self.put_envelope(Envelope(to=msg.to, sender=msg.sender, message=msg))
+
+    def _upload_parts(self, file_path: str, key: str, size: int) -> Tuple[str, str]:
+        """
+        Upload a large file in parts, hashing the parts as they are read.
+
+        In content addressed mode the digest names the object, so the file is
+        hashed before anything is sent and is only sent if it is not stored.
+
+        :return: the key and the sha256 digest of the object.
+        """
+        digest = None
+        if self.content_addressed:
+            digest = _file_digest(file_path)
+            key = content_key(digest)
+            if self._is_stored(key, digest, size):
+                self.logger.info(f"Content already stored as {key}, upload skipped")
+                return key, digest
+        parts_digest = SequentialDigest()
+        fd = os.open(file_path, os.O_RDONLY)
+        try:
+            self.uploader.upload(
+                key,
+                size,
+                parts_digest.wrap(lambda offset, length: os.pread(fd, length, offset)),
+            )
+        finally:
+            os.close(fd)
+        self.logger.info(f"Multipart upload stats: {self.uploader.stats()}")
+        if digest is not None and parts_digest.hexdigest() != digest:
+            # the object does not hold the content its key names
+            self.s3.delete_object(Bucket=self.bucket_name, Key=key)
+            raise IOError(f"{file_path} changed while it was uploaded to {key}")
+        return key, parts_digest.hexdigest()
+
+    def _fetch_file(self, envelope: Envelope) -> None:
+        """
+        Download an object to a local file, with ranged gets in parallel.
+
+        The ranges are written to their offset in the file as they arrive,
+        then the file is hashed and checked against the expected digest, if
+        one is given. A file which could not be fetched or does not match is
+        removed, and the reply carries the error instead.
+        """
+        key = envelope.message.key
+        file_path = envelope.message.file_path
+        size, digest, throughput, error = 0, "", 0.0, ""
+        started = time.monotonic()
+        try:
+            size, digest = self.downloader.download(key, file_path)
+            throughput = size / max(time.monotonic() - started, 1e-6)
+            if envelope.message.digest and envelope.message.digest != digest:
+                error = f"Digest mismatch, expected {envelope.message.digest}"
+        except Exception as e:  # pylint: disable=broad-except
+            error = f"Fetch failed: {e}"
+        if error:
+            self.logger.error(f"Could not fetch {key} to {file_path}: {error}")
+            if os.path.exists(file_path):
+                os.remove(file_path)
+        else:
+            self.logger.info(
+                f"Fetched {key} ({size} bytes) at {throughput / 1024 / 1024:.2f}MiB/s, "
+                f"stats: {self.downloader.stats()}"
+            )
+        msg = FileStorageMessage(
+            performative=FileStorageMessage.Performative.FETCH_RECIEPT,
+            key=key,
+            file_path=file_path,
+            digest=digest,
+            size=size,
+            throughput=throughput,
+            error=error,
+        )
+        msg.sender = envelope.to
+        msg.to = envelope.sender
+        self.put_envelope(Envelope(to=msg.to, sender=msg.sender, message=msg))
+
+    def _is_stored(self, key: str, digest: str, size: int) -> bool:
+        """Check if a content addressed object is stored, by the manifest or a HEAD."""
+        if self.manifest.get(digest) == key:
+            return True
+        try:
+            self.s3.head_object(Bucket=self.bucket_name, Key=key)
+        except self.s3.exceptions.ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey"):
+                return False
+            raise
+        # stored by an earlier run or another agent, remember it
+        self.manifest.put(digest, key, size)
+        return True
+
+    def _presigned_url(self, key: str) -> str:
+        return self.s3.generate_presigned_url(
+            ClientMethod="get_object",
+            Params={"Bucket": self.bucket_name, "Key": key},
+            ExpiresIn=PRESIGNED_URL_EXPIRY,
+        )
+
     def on_connect(self) -> None:
         """
         Tear down the connection.
@@ -147,6 +341,14 @@ class StorjSyncConnection(BaseSyncConnection):
             self.s3.create_bucket(Bucket="bucketto")
         except self.s3.exceptions.BucketAlreadyExists:
             self.logger.info("bucket already exists")
+        self.uploader = MultipartUploader(
+            self.s3, self.bucket_name, **self.multipart_config
+        )
+        self.downloader = RangedDownloader(
+            self.s3, self.bucket_name, **self.multipart_config
+        )
+        if self.content_addressed:
+            self.manifest = ContentManifest(self.manifest_path)
 
     def on_disconnect(self) -> None:
         """
@@ -154,4 +356,25 @@ class StorjSyncConnection(BaseSyncConnection):
 
         Connection status set automatically.
         """
-        pass
+        if self.manifest is not None:
+            self.manifest.close()
+            self.manifest = None
+
+
+def _error_message(error_msg: str, **error_data: str) -> FileStorageMessage:
+    """Build the reply to a request which failed."""
+    return FileStorageMessage(
+        performative=FileStorageMessage.Performative.ERROR,
+        error_code=ErrorCode.OPERATION_FAILED,
+        error_msg=error_msg,
+        error_data={name: value.encode() for name, value in error_data.items()},
+    )
+
+
+def _file_digest(path: str, chunk_size: int = DEFAULT_READ_CHUNK_SIZE) -> str:
+    """Get the sha256 digest of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
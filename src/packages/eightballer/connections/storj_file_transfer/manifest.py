@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2021 eightballer
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""A local manifest of the content stored on Storj, keyed by its digest."""
+import sqlite3
+import threading
+from typing import Optional
+
+DEFAULT_MANIFEST_PATH = "storj_manifest.db"
+
+# content addressed objects are stored under this prefix and their sha256 digest
+CONTENT_KEY_PREFIX = "sha256/"
+
+
+def content_key(digest: str) -> str:
+    """Get the key of the content addressed object with a digest."""
+    return CONTENT_KEY_PREFIX + digest
+
+
+class ContentManifest:
+    """
+    Remembers the objects uploaded in content addressed mode.
+
+    Content addressed objects are only ever written once, so an entry stays
+    true for as long as the bucket is not cleared, and lets an upload of
+    known content be skipped without asking the gateway. The manifest is a
+    cache of the bucket: a digest which is not in it is looked up on the
+    gateway before uploading.
+    """
+
+    def __init__(self, path: str = DEFAULT_MANIFEST_PATH) -> None:
+        """
+        Initialise the manifest, creating the database if needed.
+
+        :param path: the path of the SQLite database, `:memory:` for a transient one.
+        """
+        self.path = path
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS objects ("
+                "digest TEXT PRIMARY KEY, key TEXT NOT NULL, size INTEGER NOT NULL)"
+            )
+
+    def get(self, digest: str) -> Optional[str]:
+        """
+        Get the key of the object holding some content.
+
+        :param digest: the sha256 digest of the content.
+        :return: the key of the object, or None.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT key FROM objects WHERE digest = ?", (digest,)
+            ).fetchone()
+        return None if row is None else row[0]
+
+    def put(self, digest: str, key: str, size: int) -> None:
+        """
+        Record a stored object.
+
+        :param digest: the sha256 digest of the content.
+        :param key: the key of the object.
+        :param size: the size of the content.
+        """
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO objects VALUES (?, ?, ?)", (digest, key, size)
+            )
+
+    def remove(self, digest: str) -> None:
+        """Forget an object, so its content is uploaded again."""
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM objects WHERE digest = ?", (digest,))
+
+    def close(self) -> None:
+        """Close the database."""
+        with self._lock:
+            self._connection.close()
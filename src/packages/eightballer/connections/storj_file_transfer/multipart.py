@@ -0,0 +1,285 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2021 eightballer
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""Multipart transfers to and from an S3 gateway, with the parts sent in parallel."""
+import hashlib
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Tuple
+
+# payloads larger than this are uploaded in parts
+DEFAULT_MULTIPART_THRESHOLD = 64 * 1024 * 1024
+# the storj gateway stores objects in segments of 64MiB
+DEFAULT_PART_SIZE = 64 * 1024 * 1024
+DEFAULT_MAX_WORKERS = 4
+DEFAULT_ATTEMPTS = 3
+DEFAULT_BASE_DELAY = 0.5
+
+# the smallest part accepted by S3, except for the last one
+MIN_PART_SIZE = 5 * 1024 * 1024
+
+# downloaded parts are written to disk in chunks of this size
+DEFAULT_WRITE_CHUNK_SIZE = 1024 * 1024
+
+# reads `length` bytes of the payload from `offset`
+ReadPart = Callable[[int, int], bytes]
+
+
+def split_ranges(size: int, part_size: int) -> List[Tuple[int, int]]:
+    """Split a payload into the offset and length of each part."""
+    return [
+        (offset, min(part_size, size - offset)) for offset in range(0, size, part_size)
+    ]
+
+
+class SequentialDigest:
+    """
+    Hashes the parts of a payload as they are read, in any order.
+
+    A part waits until the parts before it are hashed, so the digest is that
+    of the whole payload without holding more parts than are already in the
+    hands of the upload threads. Parts must be read by threads picking them
+    in order, as the executor of the uploader does, and a part which can not
+    be read releases the parts waiting after it.
+    """
+
+    def __init__(self) -> None:
+        """Initialise the digest."""
+        self.position = 0
+        self.failed = False
+        self._digest = hashlib.sha256()
+        self._turn = threading.Condition()
+
+    def wrap(self, read_part: ReadPart) -> ReadPart:
+        """Hash the parts returned by a reader as they are read."""
+
+        def read(offset: int, length: int) -> bytes:
+            try:
+                data = read_part(offset, length)
+            except Exception:
+                self.fail()
+                raise
+            self.update(offset, data)
+            return data
+
+        return read
+
+    def update(self, offset: int, data: bytes) -> None:
+        """Hash the part of the payload at an offset once its turn comes."""
+        with self._turn:
+            self._turn.wait_for(lambda: self.failed or self.position == offset)
+            if self.failed:
+                raise IOError(f"A part before {offset} could not be read")
+            self._digest.update(data)
+            self.position += len(data)
+            self._turn.notify_all()
+
+    def fail(self) -> None:
+        """Give up hashing, a part could not be read."""
+        with self._turn:
+            self.failed = True
+            self._turn.notify_all()
+
+    def hexdigest(self) -> str:
+        """Get the sha256 digest of the parts hashed so far."""
+        with self._turn:
+            return self._digest.hexdigest()
+
+
+class PartTransfer:
+    """Transfers objects as parts in parallel, retrying each part on its own."""
+
+    def __init__(
+        self,
+        s3: Any,
+        bucket: str,
+        part_size: int = DEFAULT_PART_SIZE,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        attempts: int = DEFAULT_ATTEMPTS,
+        base_delay: float = DEFAULT_BASE_DELAY,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """
+        Initialise the transfer.
+
+        :param s3: the boto3 s3 client, which is thread safe.
+        :param bucket: the bucket of the objects.
+        :param part_size: the size of every part but the last.
+        :param max_workers: the most parts transferred at once.
+        :param attempts: the times a part is tried.
+        :param base_delay: seconds waited before the first retry of a part.
+        :param sleep: waits between retries.
+        """
+        self.s3 = s3
+        self.bucket = bucket
+        self.part_size = max(part_size, MIN_PART_SIZE)
+        self.max_workers = max_workers
+        self.attempts = attempts
+        self.base_delay = base_delay
+        self.parts = 0
+        self.retries = 0
+        self._sleep = sleep
+        self._lock = threading.Lock()
+
+    def _retry(self, fn: Callable[[], Any]) -> Any:
+        """Call a function, again after a jittered backoff if it fails."""
+        for attempt in range(self.attempts):
+            try:
+                result = fn()
+                break
+            except Exception:  # pylint: disable=broad-except
+                if attempt + 1 >= self.attempts:
+                    raise
+                with self._lock:
+                    self.retries += 1
+                self._sleep(self.base_delay * 2 ** attempt * random.uniform(0.5, 1.5))
+        with self._lock:
+            self.parts += 1
+        return result
+
+    def stats(self) -> Dict[str, int]:
+        """Get the number of parts transferred and of retries."""
+        with self._lock:
+            return {"parts": self.parts, "retries": self.retries}
+
+
+class MultipartUploader(PartTransfer):
+    """
+    Uploads a payload as parts sent in parallel.
+
+    At most `max_workers` parts are read and sent at once, so the memory
+    used is bounded by `max_workers * part_size` whatever the size of the
+    payload. A part which fails is sent again, up to `attempts` times with
+    a jittered exponential backoff, instead of restarting the whole upload.
+    An upload which can not be completed is aborted, so the gateway drops
+    the parts already stored.
+    """
+
+    def upload(self, key: str, size: int, read_part: ReadPart) -> Dict[str, Any]:
+        """
+        Upload a payload in parts.
+
+        :param key: the key of the object.
+        :param size: the size of the payload.
+        :param read_part: reads a part of the payload.
+        :return: the response completing the upload.
+        """
+        upload_id = self.s3.create_multipart_upload(Bucket=self.bucket, Key=key)[
+            "UploadId"
+        ]
+        ranges = [
+            (number, offset, length)
+            for number, (offset, length) in enumerate(
+                split_ranges(size, self.part_size), 1
+            )
+        ]
+        try:
+            with ThreadPoolExecutor(self.max_workers) as executor:
+                parts = list(
+                    executor.map(
+                        lambda part: self._upload_part(key, upload_id, part, read_part),
+                        ranges,
+                    )
+                )
+            return self.s3.complete_multipart_upload(
+                Bucket=self.bucket,
+                Key=key,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": parts},
+            )
+        except Exception:
+            self.s3.abort_multipart_upload(
+                Bucket=self.bucket, Key=key, UploadId=upload_id
+            )
+            raise
+
+    def _upload_part(
+        self, key: str, upload_id: str, part: Tuple[int, int, int], read_part: ReadPart,
+    ) -> Dict[str, Any]:
+        number, offset, length = part
+        body = read_part(offset, length)
+        response = self._retry(
+            lambda: self.s3.upload_part(
+                Bucket=self.bucket,
+                Key=key,
+                UploadId=upload_id,
+                PartNumber=number,
+                Body=body,
+            )
+        )
+        return {"ETag": response["ETag"], "PartNumber": number}
+
+
+class RangedDownloader(PartTransfer):
+    """
+    Downloads an object with ranged GETs made in parallel.
+
+    The object is split in ranges of `part_size` bytes, at most
+    `max_workers` of which are fetched at once. Each range is streamed to
+    its offset in the file, so the memory used is a chunk per worker, and a
+    range which fails is fetched again on its own.
+    """
+
+    def download(
+        self, key: str, path: str, chunk_size: int = DEFAULT_WRITE_CHUNK_SIZE
+    ) -> Tuple[int, str]:
+        """
+        Download an object to a file.
+
+        :param key: the key of the object.
+        :param path: the path of the file, which is overwritten.
+        :param chunk_size: the size of the writes to the file.
+        :return: the size and the sha256 digest of the object.
+        """
+        size = self.s3.head_object(Bucket=self.bucket, Key=key)["ContentLength"]
+        with open(path, "wb") as f:
+            f.truncate(size)
+        fd = os.open(path, os.O_WRONLY)
+        try:
+            with ThreadPoolExecutor(self.max_workers) as executor:
+                list(
+                    executor.map(
+                        lambda part: self._retry(
+                            lambda: self._download_part(key, fd, part, chunk_size)
+                        ),
+                        split_ranges(size, self.part_size),
+                    )
+                )
+        finally:
+            os.close(fd)
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(chunk_size), b""):
+                digest.update(chunk)
+        return size, digest.hexdigest()
+
+    def _download_part(
+        self, key: str, fd: int, part: Tuple[int, int], chunk_size: int
+    ) -> None:
+        offset, length = part
+        response = self.s3.get_object(
+            Bucket=self.bucket, Key=key, Range=f"bytes={offset}-{offset + length - 1}"
+        )
+        position = offset
+        for chunk in iter(lambda: response["Body"].read(chunk_size), b""):
+            position += os.pwrite(fd, chunk, position)
+        if position != offset + length:
+            raise IOError(f"Got {position - offset} of {length} bytes at {offset}")
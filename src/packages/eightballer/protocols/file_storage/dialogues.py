@@ -41,16 +41,24 @@ class FileStorageDialogue(Dialogue):
     INITIAL_PERFORMATIVES = frozenset(
         {
             FileStorageMessage.Performative.FILE_UPLOAD,
+            FileStorageMessage.Performative.FILE_UPLOAD_PATH,
             FileStorageMessage.Performative.FILE_DOWNLOAD,
+            FileStorageMessage.Performative.FILE_FETCH,
             FileStorageMessage.Performative.ERROR,
         }
     )
     TERMINAL_PERFORMATIVES = frozenset(
-        {FileStorageMessage.Performative.END, FileStorageMessage.Performative.ERROR}
+        {
+            FileStorageMessage.Performative.UPLOAD_RECIEPT,
+            FileStorageMessage.Performative.FETCH_RECIEPT,
+            FileStorageMessage.Performative.END,
+            FileStorageMessage.Performative.ERROR,
+        }
     )
     VALID_REPLIES = {
         FileStorageMessage.Performative.END: frozenset(),
         FileStorageMessage.Performative.ERROR: frozenset(),
+        FileStorageMessage.Performative.FETCH_RECIEPT: frozenset(),
         FileStorageMessage.Performative.FILE_DOWNLOAD: frozenset(
             {
                 FileStorageMessage.Performative.FILE_UPLOAD,
@@ -58,6 +66,13 @@ class FileStorageDialogue(Dialogue):
                 FileStorageMessage.Performative.END,
             }
         ),
+        FileStorageMessage.Performative.FILE_FETCH: frozenset(
+            {
+                FileStorageMessage.Performative.FETCH_RECIEPT,
+                FileStorageMessage.Performative.ERROR,
+                FileStorageMessage.Performative.END,
+            }
+        ),
         FileStorageMessage.Performative.FILE_UPLOAD: frozenset(
             {
                 FileStorageMessage.Performative.FILE_DOWNLOAD,
@@ -65,6 +80,14 @@ class FileStorageDialogue(Dialogue):
                 FileStorageMessage.Performative.END,
             }
         ),
+        FileStorageMessage.Performative.FILE_UPLOAD_PATH: frozenset(
+            {
+                FileStorageMessage.Performative.UPLOAD_RECIEPT,
+                FileStorageMessage.Performative.ERROR,
+                FileStorageMessage.Performative.END,
+            }
+        ),
+        FileStorageMessage.Performative.UPLOAD_RECIEPT: frozenset(),
     }
 
     class Role(Dialogue.Role):
@@ -20,7 +20,7 @@ DESCRIPTOR = _descriptor.FileDescriptor(
     syntax="proto3",
     serialized_options=None,
     serialized_pb=_b(
-        '\n\x12\x66ile_storage.proto\x12\x1d\x61\x65\x61.mobix.file_storage.v0_1_0"\xbf\x08\n\x12\x46ileStorageMessage\x12Q\n\x03\x65nd\x18\x05 \x01(\x0b\x32\x42.aea.mobix.file_storage.v0_1_0.FileStorageMessage.End_PerformativeH\x00\x12U\n\x05\x65rror\x18\x06 \x01(\x0b\x32\x44.aea.mobix.file_storage.v0_1_0.FileStorageMessage.Error_PerformativeH\x00\x12\x65\n\rfile_download\x18\x07 \x01(\x0b\x32L.aea.mobix.file_storage.v0_1_0.FileStorageMessage.File_Download_PerformativeH\x00\x12\x61\n\x0b\x66ile_upload\x18\x08 \x01(\x0b\x32J.aea.mobix.file_storage.v0_1_0.FileStorageMessage.File_Upload_PerformativeH\x00\x1a\xeb\x01\n\tErrorCode\x12]\n\nerror_code\x18\x01 \x01(\x0e\x32I.aea.mobix.file_storage.v0_1_0.FileStorageMessage.ErrorCode.ErrorCodeEnum"\x7f\n\rErrorCodeEnum\x12\x18\n\x14UNSUPPORTED_PROTOCOL\x10\x00\x12\x12\n\x0e\x44\x45\x43ODING_ERROR\x10\x01\x12\x13\n\x0fINVALID_MESSAGE\x10\x02\x12\x15\n\x11UNSUPPORTED_SKILL\x10\x03\x12\x14\n\x10INVALID_DIALOGUE\x10\x04\x1aJ\n\x18\x46ile_Upload_Performative\x12\x0f\n\x07\x63ontent\x18\x01 \x01(\x0c\x12\x10\n\x08\x66ilename\x18\x02 \x01(\t\x12\x0b\n\x03key\x18\x03 \x01(\t\x1a\x41\n\x1a\x46ile_Download_Performative\x12\x12\n\naccess_url\x18\x01 \x01(\t\x12\x0f\n\x07\x63ontent\x18\x02 \x01(\x0c\x1a\x93\x02\n\x12\x45rror_Performative\x12O\n\nerror_code\x18\x01 \x01(\x0b\x32;.aea.mobix.file_storage.v0_1_0.FileStorageMessage.ErrorCode\x12\x11\n\terror_msg\x18\x02 \x01(\t\x12g\n\nerror_data\x18\x03 \x03(\x0b\x32S.aea.mobix.file_storage.v0_1_0.FileStorageMessage.Error_Performative.ErrorDataEntry\x1a\x30\n\x0e\x45rrorDataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x0c:\x02\x38\x01\x1a\x12\n\x10\x45nd_PerformativeB\x0e\n\x0cperformativeb\x06proto3'
+        '\n\x12\x66ile_storage.proto\x12\x1d\x61\x65\x61.mobix.file_storage.v0_1_0"\xf6\x0e\n\x12\x46ileStorageMessage\x12Q\n\x03\x65nd\x18\x05 \x01(\x0b\x32\x42.aea.mobix.file_storage.v0_1_0.FileStorageMessage.End_PerformativeH\x00\x12U\n\x05\x65rror\x18\x06 \x01(\x0b\x32\x44.aea.mobix.file_storage.v0_1_0.FileStorageMessage.Error_PerformativeH\x00\x12\x65\n\rfetch_reciept\x18\x07 \x01(\x0b\x32L.aea.mobix.file_storage.v0_1_0.FileStorageMessage.Fetch_Reciept_PerformativeH\x00\x12\x65\n\rfile_download\x18\x08 \x01(\x0b\x32L.aea.mobix.file_storage.v0_1_0.FileStorageMessage.File_Download_PerformativeH\x00\x12_\n\nfile_fetch\x18\t \x01(\x0b\x32I.aea.mobix.file_storage.v0_1_0.FileStorageMessage.File_Fetch_PerformativeH\x00\x12\x61\n\x0b\x66ile_upload\x18\n \x01(\x0b\x32J.aea.mobix.file_storage.v0_1_0.FileStorageMessage.File_Upload_PerformativeH\x00\x12k\n\x10\x66ile_upload_path\x18\x0b \x01(\x0b\x32O.aea.mobix.file_storage.v0_1_0.FileStorageMessage.File_Upload_Path_PerformativeH\x00\x12g\n\x0eupload_reciept\x18\x0c \x01(\x0b\x32M.aea.mobix.file_storage.v0_1_0.FileStorageMessage.Upload_Reciept_PerformativeH\x00\x1a\x9b\x02\n\tErrorCode\x12]\n\nerror_code\x18\x01 \x01(\x0e\x32I.aea.mobix.file_storage.v0_1_0.FileStorageMessage.ErrorCode.ErrorCodeEnum"\xae\x01\n\rErrorCodeEnum\x12\x18\n\x14UNSUPPORTED_PROTOCOL\x10\x00\x12\x12\n\x0e\x44\x45\x43ODING_ERROR\x10\x01\x12\x13\n\x0fINVALID_MESSAGE\x10\x02\x12\x15\n\x11UNSUPPORTED_SKILL\x10\x03\x12\x14\n\x10INVALID_DIALOGUE\x10\x04\x12\x17\n\x13SERVICE_UNAVAILABLE\x10\x05\x12\x14\n\x10OPERATION_FAILED\x10\x06\x1aJ\n\x18\x46ile_Upload_Performative\x12\x0f\n\x07\x63ontent\x18\x01 \x01(\x0c\x12\x10\n\x08\x66ilename\x18\x02 \x01(\t\x12\x0b\n\x03key\x18\x03 \x01(\t\x1a\x41\n\x1a\x46ile_Download_Performative\x12\x12\n\naccess_url\x18\x01 \x01(\t\x12\x0f\n\x07\x63ontent\x18\x02 \x01(\x0c\x1a?\n\x1d\x46ile_Upload_Path_Performative\x12\x11\n\tfile_path\x18\x01 \x01(\t\x12\x0b\n\x03key\x18\x02 \x01(\t\x1a\\\n\x1bUpload_Reciept_Performative\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\x12\n\naccess_url\x18\x02 \x01(\t\x12\x0e\n\x06\x64igest\x18\x03 \x01(\t\x12\x0c\n\x04size\x18\x04 \x01(\x03\x1a}\n\x1a\x46\x65tch_Reciept_Performative\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\x11\n\tfile_path\x18\x02 \x01(\t\x12\x0e\n\x06\x64igest\x18\x03 \x01(\t\x12\x0c\n\x04size\x18\x04 \x01(\x03\x12\x12\n\nthroughput\x18\x05 \x01(\x01\x12\r\n\x05\x65rror\x18\x06 \x01(\t\x1aI\n\x17\x46ile_Fetch_Performative\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\x11\n\tfile_path\x18\x02 \x01(\t\x12\x0e\n\x06\x64igest\x18\x03 \x01(\t\x1a\x93\x02\n\x12\x45rror_Performative\x12O\n\nerror_code\x18\x01 \x01(\x0b\x32;.aea.mobix.file_storage.v0_1_0.FileStorageMessage.ErrorCode\x12\x11\n\terror_msg\x18\x02 \x01(\t\x12g\n\nerror_data\x18\x03 \x03(\x0b\x32S.aea.mobix.file_storage.v0_1_0.FileStorageMessage.Error_Performative.ErrorDataEntry\x1a\x30\n\x0e\x45rrorDataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x0c:\x02\x38\x01\x1a\x12\n\x10\x45nd_PerformativeB\x0e\n\x0cperformativeb\x06proto3'
     ),
 )
 
@@ -62,11 +62,25 @@ _FILESTORAGEMESSAGE_ERRORCODE_ERRORCODEENUM = _descriptor.EnumDescriptor(
             serialized_options=None,
             type=None,
         ),
+        _descriptor.EnumValueDescriptor(
+            name="SERVICE_UNAVAILABLE",
+            index=5,
+            number=5,
+            serialized_options=None,
+            type=None,
+        ),
+        _descriptor.EnumValueDescriptor(
+            name="OPERATION_FAILED",
+            index=6,
+            number=6,
+            serialized_options=None,
+            type=None,
+        ),
     ],
     containing_type=None,
     serialized_options=None,
-    serialized_start=557,
-    serialized_end=684,
+    serialized_start=972,
+    serialized_end=1146,
 )
 _sym_db.RegisterEnumDescriptor(_FILESTORAGEMESSAGE_ERRORCODE_ERRORCODEENUM)
 
@@ -105,8 +119,8 @@ _FILESTORAGEMESSAGE_ERRORCODE = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=449,
-    serialized_end=684,
+    serialized_start=863,
+    serialized_end=1146,
 )
 
 _FILESTORAGEMESSAGE_FILE_UPLOAD_PERFORMATIVE = _descriptor.Descriptor(
@@ -179,8 +193,8 @@ _FILESTORAGEMESSAGE_FILE_UPLOAD_PERFORMATIVE = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=686,
-    serialized_end=760,
+    serialized_start=1148,
+    serialized_end=1222,
 )
 
 _FILESTORAGEMESSAGE_FILE_DOWNLOAD_PERFORMATIVE = _descriptor.Descriptor(
@@ -235,8 +249,358 @@ _FILESTORAGEMESSAGE_FILE_DOWNLOAD_PERFORMATIVE = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=762,
-    serialized_end=827,
+    serialized_start=1224,
+    serialized_end=1289,
+)
+
+_FILESTORAGEMESSAGE_FILE_UPLOAD_PATH_PERFORMATIVE = _descriptor.Descriptor(
+    name="File_Upload_Path_Performative",
+    full_name="aea.mobix.file_storage.v0_1_0.FileStorageMessage.File_Upload_Path_Performative",
+    filename=None,
+    file=DESCRIPTOR,
+    containing_type=None,
+    fields=[
+        _descriptor.FieldDescriptor(
+            name="file_path",
+            full_name="aea.mobix.file_storage.v0_1_0.FileStorageMessage.File_Upload_Path_Performative.file_path",
+            index=0,
+            number=1,
+            type=9,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=_b("").decode("utf-8"),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="key",
+            full_name="aea.mobix.file_storage.v0_1_0.FileStorageMessage.File_Upload_Path_Performative.key",
+            index=1,
+            number=2,
+            type=9,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=_b("").decode("utf-8"),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+    ],
+    extensions=[],
+    nested_types=[],
+    enum_types=[],
+    serialized_options=None,
+    is_extendable=False,
+    syntax="proto3",
+    extension_ranges=[],
+    oneofs=[],
+    serialized_start=1291,
+    serialized_end=1354,
+)
+
+_FILESTORAGEMESSAGE_UPLOAD_RECIEPT_PERFORMATIVE = _descriptor.Descriptor(
+    name="Upload_Reciept_Performative",
+    full_name="aea.mobix.file_storage.v0_1_0.FileStorageMessage.Upload_Reciept_Performative",
+    filename=None,
+    file=DESCRIPTOR,
+    containing_type=None,
+    fields=[
+        _descriptor.FieldDescriptor(
+            name="key",
+            full_name="aea.mobix.file_storage.v0_1_0.FileStorageMessage.Upload_Reciept_Performative.key",
+            index=0,
+            number=1,
+            type=9,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=_b("").decode("utf-8"),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="access_url",
+            full_name="aea.mobix.file_storage.v0_1_0.FileStorageMessage.Upload_Reciept_Performative.access_url",
+            index=1,
+            number=2,
+            type=9,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=_b("").decode("utf-8"),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="digest",
+            full_name="aea.mobix.file_storage.v0_1_0.FileStorageMessage.Upload_Reciept_Performative.digest",
+            index=2,
+            number=3,
+            type=9,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=_b("").decode("utf-8"),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="size",
+            full_name="aea.mobix.file_storage.v0_1_0.FileStorageMessage.Upload_Reciept_Performative.size",
+            index=3,
+            number=4,
+            type=3,
+            cpp_type=2,
+            label=1,
+            has_default_value=False,
+            default_value=0,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+    ],
+    extensions=[],
+    nested_types=[],
+    enum_types=[],
+    serialized_options=None,
+    is_extendable=False,
+    syntax="proto3",
+    extension_ranges=[],
+    oneofs=[],
+    serialized_start=1356,
+    serialized_end=1448,
+)
+
+_FILESTORAGEMESSAGE_FETCH_RECIEPT_PERFORMATIVE = _descriptor.Descriptor(
+    name="Fetch_Reciept_Performative",
+    full_name="aea.mobix.file_storage.v0_1_0.FileStorageMessage.Fetch_Reciept_Performative",
+    filename=None,
+    file=DESCRIPTOR,
+    containing_type=None,
+    fields=[
+        _descriptor.FieldDescriptor(
+            name="key",
+            full_name="aea.mobix.file_storage.v0_1_0.FileStorageMessage.Fetch_Reciept_Performative.key",
+            index=0,
+            number=1,
+            type=9,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=_b("").decode("utf-8"),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="file_path",
+            full_name="aea.mobix.file_storage.v0_1_0.FileStorageMessage.Fetch_Reciept_Performative.file_path",
+            index=1,
+            number=2,
+            type=9,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=_b("").decode("utf-8"),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="digest",
+            full_name="aea.mobix.file_storage.v0_1_0.FileStorageMessage.Fetch_Reciept_Performative.digest",
+            index=2,
+            number=3,
+            type=9,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=_b("").decode("utf-8"),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="size",
+            full_name="aea.mobix.file_storage.v0_1_0.FileStorageMessage.Fetch_Reciept_Performative.size",
+            index=3,
+            number=4,
+            type=3,
+            cpp_type=2,
+            label=1,
+            has_default_value=False,
+            default_value=0,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="throughput",
+            full_name="aea.mobix.file_storage.v0_1_0.FileStorageMessage.Fetch_Reciept_Performative.throughput",
+            index=4,
+            number=5,
+            type=1,
+            cpp_type=5,
+            label=1,
+            has_default_value=False,
+            default_value=float(0),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="error",
+            full_name="aea.mobix.file_storage.v0_1_0.FileStorageMessage.Fetch_Reciept_Performative.error",
+            index=5,
+            number=6,
+            type=9,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=_b("").decode("utf-8"),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+    ],
+    extensions=[],
+    nested_types=[],
+    enum_types=[],
+    serialized_options=None,
+    is_extendable=False,
+    syntax="proto3",
+    extension_ranges=[],
+    oneofs=[],
+    serialized_start=1450,
+    serialized_end=1575,
+)
+
+_FILESTORAGEMESSAGE_FILE_FETCH_PERFORMATIVE = _descriptor.Descriptor(
+    name="File_Fetch_Performative",
+    full_name="aea.mobix.file_storage.v0_1_0.FileStorageMessage.File_Fetch_Performative",
+    filename=None,
+    file=DESCRIPTOR,
+    containing_type=None,
+    fields=[
+        _descriptor.FieldDescriptor(
+            name="key",
+            full_name="aea.mobix.file_storage.v0_1_0.FileStorageMessage.File_Fetch_Performative.key",
+            index=0,
+            number=1,
+            type=9,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=_b("").decode("utf-8"),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="file_path",
+            full_name="aea.mobix.file_storage.v0_1_0.FileStorageMessage.File_Fetch_Performative.file_path",
+            index=1,
+            number=2,
+            type=9,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=_b("").decode("utf-8"),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="digest",
+            full_name="aea.mobix.file_storage.v0_1_0.FileStorageMessage.File_Fetch_Performative.digest",
+            index=2,
+            number=3,
+            type=9,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=_b("").decode("utf-8"),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+    ],
+    extensions=[],
+    nested_types=[],
+    enum_types=[],
+    serialized_options=None,
+    is_extendable=False,
+    syntax="proto3",
+    extension_ranges=[],
+    oneofs=[],
+    serialized_start=1577,
+    serialized_end=1650,
 )
 
 _FILESTORAGEMESSAGE_ERROR_PERFORMATIVE_ERRORDATAENTRY = _descriptor.Descriptor(
@@ -291,8 +655,8 @@ _FILESTORAGEMESSAGE_ERROR_PERFORMATIVE_ERRORDATAENTRY = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=1057,
-    serialized_end=1105,
+    serialized_start=1880,
+    serialized_end=1928,
 )
 
 _FILESTORAGEMESSAGE_ERROR_PERFORMATIVE = _descriptor.Descriptor(
@@ -365,8 +729,8 @@ _FILESTORAGEMESSAGE_ERROR_PERFORMATIVE = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=830,
-    serialized_end=1105,
+    serialized_start=1653,
+    serialized_end=1928,
 )
 
 _FILESTORAGEMESSAGE_END_PERFORMATIVE = _descriptor.Descriptor(
@@ -384,8 +748,8 @@ _FILESTORAGEMESSAGE_END_PERFORMATIVE = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=1107,
-    serialized_end=1125,
+    serialized_start=1930,
+    serialized_end=1948,
 )
 
 _FILESTORAGEMESSAGE = _descriptor.Descriptor(
@@ -432,8 +796,8 @@ _FILESTORAGEMESSAGE = _descriptor.Descriptor(
             file=DESCRIPTOR,
         ),
         _descriptor.FieldDescriptor(
-            name="file_download",
-            full_name="aea.mobix.file_storage.v0_1_0.FileStorageMessage.file_download",
+            name="fetch_reciept",
+            full_name="aea.mobix.file_storage.v0_1_0.FileStorageMessage.fetch_reciept",
             index=2,
             number=7,
             type=11,
@@ -450,8 +814,8 @@ _FILESTORAGEMESSAGE = _descriptor.Descriptor(
             file=DESCRIPTOR,
         ),
         _descriptor.FieldDescriptor(
-            name="file_upload",
-            full_name="aea.mobix.file_storage.v0_1_0.FileStorageMessage.file_upload",
+            name="file_download",
+            full_name="aea.mobix.file_storage.v0_1_0.FileStorageMessage.file_download",
             index=3,
             number=8,
             type=11,
@@ -467,12 +831,88 @@ _FILESTORAGEMESSAGE = _descriptor.Descriptor(
             serialized_options=None,
             file=DESCRIPTOR,
         ),
+        _descriptor.FieldDescriptor(
+            name="file_fetch",
+            full_name="aea.mobix.file_storage.v0_1_0.FileStorageMessage.file_fetch",
+            index=4,
+            number=9,
+            type=11,
+            cpp_type=10,
+            label=1,
+            has_default_value=False,
+            default_value=None,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="file_upload",
+            full_name="aea.mobix.file_storage.v0_1_0.FileStorageMessage.file_upload",
+            index=5,
+            number=10,
+            type=11,
+            cpp_type=10,
+            label=1,
+            has_default_value=False,
+            default_value=None,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="file_upload_path",
+            full_name="aea.mobix.file_storage.v0_1_0.FileStorageMessage.file_upload_path",
+            index=6,
+            number=11,
+            type=11,
+            cpp_type=10,
+            label=1,
+            has_default_value=False,
+            default_value=None,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="upload_reciept",
+            full_name="aea.mobix.file_storage.v0_1_0.FileStorageMessage.upload_reciept",
+            index=7,
+            number=12,
+            type=11,
+            cpp_type=10,
+            label=1,
+            has_default_value=False,
+            default_value=None,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
     ],
     extensions=[],
     nested_types=[
         _FILESTORAGEMESSAGE_ERRORCODE,
         _FILESTORAGEMESSAGE_FILE_UPLOAD_PERFORMATIVE,
         _FILESTORAGEMESSAGE_FILE_DOWNLOAD_PERFORMATIVE,
+        _FILESTORAGEMESSAGE_FILE_UPLOAD_PATH_PERFORMATIVE,
+        _FILESTORAGEMESSAGE_UPLOAD_RECIEPT_PERFORMATIVE,
+        _FILESTORAGEMESSAGE_FETCH_RECIEPT_PERFORMATIVE,
+        _FILESTORAGEMESSAGE_FILE_FETCH_PERFORMATIVE,
         _FILESTORAGEMESSAGE_ERROR_PERFORMATIVE,
         _FILESTORAGEMESSAGE_END_PERFORMATIVE,
     ],
@@ -491,7 +931,7 @@ _FILESTORAGEMESSAGE = _descriptor.Descriptor(
         ),
     ],
     serialized_start=54,
-    serialized_end=1141,
+    serialized_end=1964,
 )
 
 _FILESTORAGEMESSAGE_ERRORCODE.fields_by_name[
@@ -503,6 +943,10 @@ _FILESTORAGEMESSAGE_ERRORCODE_ERRORCODEENUM.containing_type = (
 )
 _FILESTORAGEMESSAGE_FILE_UPLOAD_PERFORMATIVE.containing_type = _FILESTORAGEMESSAGE
 _FILESTORAGEMESSAGE_FILE_DOWNLOAD_PERFORMATIVE.containing_type = _FILESTORAGEMESSAGE
+_FILESTORAGEMESSAGE_FILE_UPLOAD_PATH_PERFORMATIVE.containing_type = _FILESTORAGEMESSAGE
+_FILESTORAGEMESSAGE_UPLOAD_RECIEPT_PERFORMATIVE.containing_type = _FILESTORAGEMESSAGE
+_FILESTORAGEMESSAGE_FETCH_RECIEPT_PERFORMATIVE.containing_type = _FILESTORAGEMESSAGE
+_FILESTORAGEMESSAGE_FILE_FETCH_PERFORMATIVE.containing_type = _FILESTORAGEMESSAGE
 _FILESTORAGEMESSAGE_ERROR_PERFORMATIVE_ERRORDATAENTRY.containing_type = (
     _FILESTORAGEMESSAGE_ERROR_PERFORMATIVE
 )
@@ -520,12 +964,24 @@ _FILESTORAGEMESSAGE.fields_by_name[
 _FILESTORAGEMESSAGE.fields_by_name[
     "error"
 ].message_type = _FILESTORAGEMESSAGE_ERROR_PERFORMATIVE
+_FILESTORAGEMESSAGE.fields_by_name[
+    "fetch_reciept"
+].message_type = _FILESTORAGEMESSAGE_FETCH_RECIEPT_PERFORMATIVE
 _FILESTORAGEMESSAGE.fields_by_name[
     "file_download"
 ].message_type = _FILESTORAGEMESSAGE_FILE_DOWNLOAD_PERFORMATIVE
+_FILESTORAGEMESSAGE.fields_by_name[
+    "file_fetch"
+].message_type = _FILESTORAGEMESSAGE_FILE_FETCH_PERFORMATIVE
 _FILESTORAGEMESSAGE.fields_by_name[
     "file_upload"
 ].message_type = _FILESTORAGEMESSAGE_FILE_UPLOAD_PERFORMATIVE
+_FILESTORAGEMESSAGE.fields_by_name[
+    "file_upload_path"
+].message_type = _FILESTORAGEMESSAGE_FILE_UPLOAD_PATH_PERFORMATIVE
+_FILESTORAGEMESSAGE.fields_by_name[
+    "upload_reciept"
+].message_type = _FILESTORAGEMESSAGE_UPLOAD_RECIEPT_PERFORMATIVE
 _FILESTORAGEMESSAGE.oneofs_by_name["performative"].fields.append(
     _FILESTORAGEMESSAGE.fields_by_name["end"]
 )
@@ -538,18 +994,42 @@ _FILESTORAGEMESSAGE.oneofs_by_name["performative"].fields.append(
 _FILESTORAGEMESSAGE.fields_by_name[
     "error"
 ].containing_oneof = _FILESTORAGEMESSAGE.oneofs_by_name["performative"]
+_FILESTORAGEMESSAGE.oneofs_by_name["performative"].fields.append(
+    _FILESTORAGEMESSAGE.fields_by_name["fetch_reciept"]
+)
+_FILESTORAGEMESSAGE.fields_by_name[
+    "fetch_reciept"
+].containing_oneof = _FILESTORAGEMESSAGE.oneofs_by_name["performative"]
 _FILESTORAGEMESSAGE.oneofs_by_name["performative"].fields.append(
     _FILESTORAGEMESSAGE.fields_by_name["file_download"]
 )
 _FILESTORAGEMESSAGE.fields_by_name[
     "file_download"
 ].containing_oneof = _FILESTORAGEMESSAGE.oneofs_by_name["performative"]
+_FILESTORAGEMESSAGE.oneofs_by_name["performative"].fields.append(
+    _FILESTORAGEMESSAGE.fields_by_name["file_fetch"]
+)
+_FILESTORAGEMESSAGE.fields_by_name[
+    "file_fetch"
+].containing_oneof = _FILESTORAGEMESSAGE.oneofs_by_name["performative"]
 _FILESTORAGEMESSAGE.oneofs_by_name["performative"].fields.append(
     _FILESTORAGEMESSAGE.fields_by_name["file_upload"]
 )
 _FILESTORAGEMESSAGE.fields_by_name[
     "file_upload"
 ].containing_oneof = _FILESTORAGEMESSAGE.oneofs_by_name["performative"]
+_FILESTORAGEMESSAGE.oneofs_by_name["performative"].fields.append(
+    _FILESTORAGEMESSAGE.fields_by_name["file_upload_path"]
+)
+_FILESTORAGEMESSAGE.fields_by_name[
+    "file_upload_path"
+].containing_oneof = _FILESTORAGEMESSAGE.oneofs_by_name["performative"]
+_FILESTORAGEMESSAGE.oneofs_by_name["performative"].fields.append(
+    _FILESTORAGEMESSAGE.fields_by_name["upload_reciept"]
+)
+_FILESTORAGEMESSAGE.fields_by_name[
+    "upload_reciept"
+].containing_oneof = _FILESTORAGEMESSAGE.oneofs_by_name["performative"]
 DESCRIPTOR.message_types_by_name["FileStorageMessage"] = _FILESTORAGEMESSAGE
 _sym_db.RegisterFileDescriptor(DESCRIPTOR)
 
@@ -584,6 +1064,42 @@ FileStorageMessage = _reflection.GeneratedProtocolMessageType(
                 # @@protoc_insertion_point(class_scope:aea.mobix.file_storage.v0_1_0.FileStorageMessage.File_Download_Performative)
             ),
         ),
+        File_Upload_Path_Performative=_reflection.GeneratedProtocolMessageType(
+            "File_Upload_Path_Performative",
+            (_message.Message,),
+            dict(
+                DESCRIPTOR=_FILESTORAGEMESSAGE_FILE_UPLOAD_PATH_PERFORMATIVE,
+                __module__="file_storage_pb2"
+                # @@protoc_insertion_point(class_scope:aea.mobix.file_storage.v0_1_0.FileStorageMessage.File_Upload_Path_Performative)
+            ),
+        ),
+        Upload_Reciept_Performative=_reflection.GeneratedProtocolMessageType(
+            "Upload_Reciept_Performative",
+            (_message.Message,),
+            dict(
+                DESCRIPTOR=_FILESTORAGEMESSAGE_UPLOAD_RECIEPT_PERFORMATIVE,
+                __module__="file_storage_pb2"
+                # @@protoc_insertion_point(class_scope:aea.mobix.file_storage.v0_1_0.FileStorageMessage.Upload_Reciept_Performative)
+            ),
+        ),
+        Fetch_Reciept_Performative=_reflection.GeneratedProtocolMessageType(
+            "Fetch_Reciept_Performative",
+            (_message.Message,),
+            dict(
+                DESCRIPTOR=_FILESTORAGEMESSAGE_FETCH_RECIEPT_PERFORMATIVE,
+                __module__="file_storage_pb2"
+                # @@protoc_insertion_point(class_scope:aea.mobix.file_storage.v0_1_0.FileStorageMessage.Fetch_Reciept_Performative)
+            ),
+        ),
+        File_Fetch_Performative=_reflection.GeneratedProtocolMessageType(
+            "File_Fetch_Performative",
+            (_message.Message,),
+            dict(
+                DESCRIPTOR=_FILESTORAGEMESSAGE_FILE_FETCH_PERFORMATIVE,
+                __module__="file_storage_pb2"
+                # @@protoc_insertion_point(class_scope:aea.mobix.file_storage.v0_1_0.FileStorageMessage.File_Fetch_Performative)
+            ),
+        ),
         Error_Performative=_reflection.GeneratedProtocolMessageType(
             "Error_Performative",
             (_message.Message,),
@@ -620,6 +1136,10 @@ _sym_db.RegisterMessage(FileStorageMessage)
 _sym_db.RegisterMessage(FileStorageMessage.ErrorCode)
 _sym_db.RegisterMessage(FileStorageMessage.File_Upload_Performative)
 _sym_db.RegisterMessage(FileStorageMessage.File_Download_Performative)
+_sym_db.RegisterMessage(FileStorageMessage.File_Upload_Path_Performative)
+_sym_db.RegisterMessage(FileStorageMessage.Upload_Reciept_Performative)
+_sym_db.RegisterMessage(FileStorageMessage.Fetch_Reciept_Performative)
+_sym_db.RegisterMessage(FileStorageMessage.File_Fetch_Performative)
 _sym_db.RegisterMessage(FileStorageMessage.Error_Performative)
 _sym_db.RegisterMessage(FileStorageMessage.Error_Performative.ErrorDataEntry)
 _sym_db.RegisterMessage(FileStorageMessage.End_Performative)
@@ -50,14 +50,27 @@ class FileStorageMessage(Message):
 
         END = "end"
         ERROR = "error"
+        FETCH_RECIEPT = "fetch_reciept"
         FILE_DOWNLOAD = "file_download"
+        FILE_FETCH = "file_fetch"
         FILE_UPLOAD = "file_upload"
+        FILE_UPLOAD_PATH = "file_upload_path"
+        UPLOAD_RECIEPT = "upload_reciept"
 
         def __str__(self) -> str:
             """Get the string representation."""
             return str(self.value)
 
-    _performatives = {"end", "error", "file_download", "file_upload"}
+    _performatives = {
+        "end",
+        "error",
+        "fetch_reciept",
+        "file_download",
+        "file_fetch",
+        "file_upload",
+        "file_upload_path",
+        "upload_reciept",
+    }
     __slots__: Tuple[str, ...] = tuple()
 
     class _SlotsCls:
@@ -65,14 +78,19 @@ class FileStorageMessage(Message):
             "access_url",
             "content",
             "dialogue_reference",
+            "digest",
+            "error",
             "error_code",
             "error_data",
             "error_msg",
+            "file_path",
             "filename",
             "key",
             "message_id",
             "performative",
+            "size",
             "target",
+            "throughput",
         )
 
     def __init__(
@@ -140,6 +158,18 @@ class FileStorageMessage(Message):
         enforce(self.is_set("content"), "'content' content is not set.")
         return cast(bytes, self.get("content"))
 
+    @property
+    def digest(self) -> str:
+        """Get the 'digest' content from the message."""
+        enforce(self.is_set("digest"), "'digest' content is not set.")
+        return cast(str, self.get("digest"))
+
+    @property
+    def error(self) -> str:
+        """Get the 'error' content from the message."""
+        enforce(self.is_set("error"), "'error' content is not set.")
+        return cast(str, self.get("error"))
+
     @property
     def error_code(self) -> CustomErrorCode:
         """Get the 'error_code' content from the message."""
@@ -158,6 +188,12 @@ class FileStorageMessage(Message):
         enforce(self.is_set("error_msg"), "'error_msg' content is not set.")
         return cast(str, self.get("error_msg"))
 
+    @property
+    def file_path(self) -> str:
+        """Get the 'file_path' content from the message."""
+        enforce(self.is_set("file_path"), "'file_path' content is not set.")
+        return cast(str, self.get("file_path"))
+
     @property
     def filename(self) -> str:
         """Get the 'filename' content from the message."""
@@ -170,6 +206,18 @@ class FileStorageMessage(Message):
         enforce(self.is_set("key"), "'key' content is not set.")
         return cast(str, self.get("key"))
 
+    @property
+    def size(self) -> int:
+        """Get the 'size' content from the message."""
+        enforce(self.is_set("size"), "'size' content is not set.")
+        return cast(int, self.get("size"))
+
+    @property
+    def throughput(self) -> float:
+        """Get the 'throughput' content from the message."""
+        enforce(self.is_set("throughput"), "'throughput' content is not set.")
+        return cast(float, self.get("throughput"))
+
     def _is_consistent(self) -> bool:
         """Check that the message follows the file_storage protocol."""
         try:
@@ -250,6 +298,104 @@ class FileStorageMessage(Message):
                         type(self.content)
                     ),
                 )
+            elif self.performative == FileStorageMessage.Performative.FILE_UPLOAD_PATH:
+                expected_nb_of_contents = 2
+                enforce(
+                    isinstance(self.file_path, str),
+                    "Invalid type for content 'file_path'. Expected 'str'. Found '{}'.".format(
+                        type(self.file_path)
+                    ),
+                )
+                enforce(
+                    isinstance(self.key, str),
+                    "Invalid type for content 'key'. Expected 'str'. Found '{}'.".format(
+                        type(self.key)
+                    ),
+                )
+            elif self.performative == FileStorageMessage.Performative.UPLOAD_RECIEPT:
+                expected_nb_of_contents = 4
+                enforce(
+                    isinstance(self.key, str),
+                    "Invalid type for content 'key'. Expected 'str'. Found '{}'.".format(
+                        type(self.key)
+                    ),
+                )
+                enforce(
+                    isinstance(self.access_url, str),
+                    "Invalid type for content 'access_url'. Expected 'str'. Found '{}'.".format(
+                        type(self.access_url)
+                    ),
+                )
+                enforce(
+                    isinstance(self.digest, str),
+                    "Invalid type for content 'digest'. Expected 'str'. Found '{}'.".format(
+                        type(self.digest)
+                    ),
+                )
+                enforce(
+                    type(self.size) is int,
+                    "Invalid type for content 'size'. Expected 'int'. Found '{}'.".format(
+                        type(self.size)
+                    ),
+                )
+            elif self.performative == FileStorageMessage.Performative.FETCH_RECIEPT:
+                expected_nb_of_contents = 6
+                enforce(
+                    isinstance(self.key, str),
+                    "Invalid type for content 'key'. Expected 'str'. Found '{}'.".format(
+                        type(self.key)
+                    ),
+                )
+                enforce(
+                    isinstance(self.file_path, str),
+                    "Invalid type for content 'file_path'. Expected 'str'. Found '{}'.".format(
+                        type(self.file_path)
+                    ),
+                )
+                enforce(
+                    isinstance(self.digest, str),
+                    "Invalid type for content 'digest'. Expected 'str'. Found '{}'.".format(
+                        type(self.digest)
+                    ),
+                )
+                enforce(
+                    type(self.size) is int,
+                    "Invalid type for content 'size'. Expected 'int'. Found '{}'.".format(
+                        type(self.size)
+                    ),
+                )
+                enforce(
+                    isinstance(self.throughput, float),
+                    "Invalid type for content 'throughput'. Expected 'float'. Found '{}'.".format(
+                        type(self.throughput)
+                    ),
+                )
+                enforce(
+                    isinstance(self.error, str),
+                    "Invalid type for content 'error'. Expected 'str'. Found '{}'.".format(
+                        type(self.error)
+                    ),
+                )
+            elif self.performative == FileStorageMessage.Performative.FILE_FETCH:
+                expected_nb_of_contents = 3
+                enforce(
+                    isinstance(self.key, str),
+                    "Invalid type for content 'key'. Expected 'str'. Found '{}'.".format(
+                        type(self.key)
+                    ),
+                )
+                enforce(
+                    isinstance(self.file_path, str),
+                    "Invalid type for content 'file_path'. Expected 'str'. Found '{}'.".format(
+                        type(self.file_path)
+                    ),
+                )
+                enforce(
+                    isinstance(self.digest, str),
+                    "Invalid type for content 'digest'. Expected 'str'. Found '{}'.".format(
+                        type(self.digest)
+                    ),
+                )
             elif self.performative == FileStorageMessage.Performative.ERROR:
                 expected_nb_of_contents = 3
                 enforce(
@@ -71,6 +71,48 @@ class FileStorageSerializer(Serializer):
             content = msg.content
             performative.content = content
             file_storage_msg.file_download.CopyFrom(performative)
+        elif performative_id == FileStorageMessage.Performative.FILE_UPLOAD_PATH:
+            performative = file_storage_pb2.FileStorageMessage.File_Upload_Path_Performative()  # type: ignore
+            file_path = msg.file_path
+            performative.file_path = file_path
+            key = msg.key
+            performative.key = key
+            file_storage_msg.file_upload_path.CopyFrom(performative)
+        elif performative_id == FileStorageMessage.Performative.UPLOAD_RECIEPT:
+            performative = file_storage_pb2.FileStorageMessage.Upload_Reciept_Performative()  # type: ignore
+            key = msg.key
+            performative.key = key
+            access_url = msg.access_url
+            performative.access_url = access_url
+            digest = msg.digest
+            performative.digest = digest
+            size = msg.size
+            performative.size = size
+            file_storage_msg.upload_reciept.CopyFrom(performative)
+        elif performative_id == FileStorageMessage.Performative.FETCH_RECIEPT:
+            performative = file_storage_pb2.FileStorageMessage.Fetch_Reciept_Performative()  # type: ignore
+            key = msg.key
+            performative.key = key
+            file_path = msg.file_path
+            performative.file_path = file_path
+            digest = msg.digest
+            performative.digest = digest
+            size = msg.size
+            performative.size = size
+            throughput = msg.throughput
+            performative.throughput = throughput
+            error = msg.error
+            performative.error = error
+            file_storage_msg.fetch_reciept.CopyFrom(performative)
+        elif performative_id == FileStorageMessage.Performative.FILE_FETCH:
+            performative = file_storage_pb2.FileStorageMessage.File_Fetch_Performative()  # type: ignore
+            key = msg.key
+            performative.key = key
+            file_path = msg.file_path
+            performative.file_path = file_path
+            digest = msg.digest
+            performative.digest = digest
+            file_storage_msg.file_fetch.CopyFrom(performative)
         elif performative_id == FileStorageMessage.Performative.ERROR:
             performative = file_storage_pb2.FileStorageMessage.Error_Performative()  # type: ignore
             error_code = msg.error_code
@@ -126,6 +168,40 @@ class FileStorageSerializer(Serializer):
             performative_content["access_url"] = access_url
             content = file_storage_pb.file_download.content
             performative_content["content"] = content
+        elif performative_id == FileStorageMessage.Performative.FILE_UPLOAD_PATH:
+            file_path = file_storage_pb.file_upload_path.file_path
+            performative_content["file_path"] = file_path
+            key = file_storage_pb.file_upload_path.key
+            performative_content["key"] = key
+        elif performative_id == FileStorageMessage.Performative.UPLOAD_RECIEPT:
+            key = file_storage_pb.upload_reciept.key
+            performative_content["key"] = key
+            access_url = file_storage_pb.upload_reciept.access_url
+            performative_content["access_url"] = access_url
+            digest = file_storage_pb.upload_reciept.digest
+            performative_content["digest"] = digest
+            size = file_storage_pb.upload_reciept.size
+            performative_content["size"] = size
+        elif performative_id == FileStorageMessage.Performative.FETCH_RECIEPT:
+            key = file_storage_pb.fetch_reciept.key
+            performative_content["key"] = key
+            file_path = file_storage_pb.fetch_reciept.file_path
+            performative_content["file_path"] = file_path
+            digest = file_storage_pb.fetch_reciept.digest
+            performative_content["digest"] = digest
+            size = file_storage_pb.fetch_reciept.size
+            performative_content["size"] = size
+            throughput = file_storage_pb.fetch_reciept.throughput
+            performative_content["throughput"] = throughput
+            error = file_storage_pb.fetch_reciept.error
+            performative_content["error"] = error
+        elif performative_id == FileStorageMessage.Performative.FILE_FETCH:
+            key = file_storage_pb.file_fetch.key
+            performative_content["key"] = key
+            file_path = file_storage_pb.file_fetch.file_path
+            performative_content["file_path"] = file_path
+            digest = file_storage_pb.file_fetch.digest
+            performative_content["digest"] = digest
         elif performative_id == FileStorageMessage.Performative.ERROR:
             pb2_error_code = file_storage_pb.error.error_code
             error_code = ErrorCode.decode(pb2_error_code)
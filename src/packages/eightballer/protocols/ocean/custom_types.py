@@ -19,13 +19,102 @@
 
 """This module contains class representations corresponding to every custom type in the protocol specification."""
 
+from enum import Enum
+from typing import Any, Dict, List
 
-class ErrorCode:
+
+class AssetSpecs:
+    """This class represents an instance of AssetSpecs."""
+
+    TYPES = ("algorithm", "d2c", "data_download")
+    FIELDS = (
+        "token0_name",
+        "token1_name",
+        "amount_to_mint",
+        "dataset_url",
+        "files_url",
+        "name",
+        "author",
+        "date_created",
+        "license",
+        "language",
+        "format",
+        "version",
+        "entrypoint",
+        "image",
+        "tag",
+    )
+
+    def __init__(self, asset_specs: List[Dict[str, Any]]):
+        """
+        Initialise an instance of AssetSpecs.
+
+        :param asset_specs: the assets to publish, each with a 'type' of 'algorithm', 'd2c' or 'data_download' and the contents of the matching deploy performative.
+        """
+        for spec in asset_specs:
+            if spec.get("type") not in self.TYPES:
+                raise ValueError(f"Unknown asset type: {spec.get('type')}")
+        self.asset_specs = asset_specs
+
+    def __len__(self) -> int:
+        """Get the number of assets."""
+        return len(self.asset_specs)
+
+    def __iter__(self):
+        """Iterate over the assets."""
+        return iter(self.asset_specs)
+
+    @staticmethod
+    def encode(asset_specs_protobuf_object, asset_specs_object: "AssetSpecs") -> None:
+        """
+        Encode an instance of this class into the protocol buffer object.
+
+        The protocol buffer object in the asset_specs_protobuf_object argument is matched with the instance of this class in the 'asset_specs_object' argument.
+
+        :param asset_specs_protobuf_object: the protocol buffer object whose type corresponds with this class.
+        :param asset_specs_object: an instance of this class to be encoded in the protocol buffer object.
+        :return: None
+        """
+        for spec in asset_specs_object.asset_specs:
+            spec_protobuf_object = asset_specs_protobuf_object.asset_specs.add()
+            spec_protobuf_object.type = spec["type"]
+            for field in AssetSpecs.FIELDS:
+                if field in spec:
+                    setattr(spec_protobuf_object, field, spec[field])
+
+    @classmethod
+    def decode(cls, asset_specs_protobuf_object) -> "AssetSpecs":
+        """
+        Decode a protocol buffer object that corresponds with this class into an instance of this class.
+
+        A new instance of this class is created that matches the protocol buffer object in the 'asset_specs_protobuf_object' argument.
+
+        :param asset_specs_protobuf_object: the protocol buffer object whose type corresponds with this class.
+        :return: A new instance of this class that matches the protocol buffer object in the 'asset_specs_protobuf_object' argument.
+        """
+        asset_specs = [
+            {
+                "type": spec_protobuf_object.type,
+                **{field: getattr(spec_protobuf_object, field) for field in cls.FIELDS},
+            }
+            for spec_protobuf_object in asset_specs_protobuf_object.asset_specs
+        ]
+        return cls(asset_specs)
+
+    def __eq__(self, other):
+        return isinstance(other, AssetSpecs) and self.asset_specs == other.asset_specs
+
+
+class ErrorCode(Enum):
     """This class represents an instance of ErrorCode."""
 
-    def __init__(self):
-        """Initialise an instance of ErrorCode."""
-        raise NotImplementedError
+    UNSUPPORTED_PROTOCOL = 0
+    DECODING_ERROR = 1
+    INVALID_MESSAGE = 2
+    UNSUPPORTED_SKILL = 3
+    INVALID_DIALOGUE = 4
+    SERVICE_UNAVAILABLE = 5
+    OPERATION_FAILED = 6
 
     @staticmethod
     def encode(error_code_protobuf_object, error_code_object: "ErrorCode") -> None:
@@ -38,7 +127,7 @@ class ErrorCode:
         :param error_code_object: an instance of this class to be encoded in the protocol buffer object.
         :return: None
         """
-        raise NotImplementedError
+        error_code_protobuf_object.error_code = error_code_object.value
 
     @classmethod
     def decode(cls, error_code_protobuf_object) -> "ErrorCode":
@@ -50,7 +139,5 @@ class ErrorCode:
         :param error_code_protobuf_object: the protocol buffer object whose type corresponds with this class.
         :return: A new instance of this class that matches the protocol buffer object in the 'error_code_protobuf_object' argument.
         """
-        raise NotImplementedError
-
-    def __eq__(self, other):
-        raise NotImplementedError
+        enum_value_from_pb2 = error_code_protobuf_object.error_code
+        return ErrorCode(enum_value_from_pb2)
@@ -41,19 +41,37 @@ class OceanDialogue(Dialogue):
         {
             OceanMessage.Performative.DEPLOY_D2C,
             OceanMessage.Performative.DEPLOY_ALGORITHM,
+            OceanMessage.Performative.DEPLOY_BATCH,
             OceanMessage.Performative.D2C_JOB,
+            OceanMessage.Performative.D2C_MULTI_JOB,
             OceanMessage.Performative.DOWNLOAD_JOB,
+            OceanMessage.Performative.PERMISSION_DATASETS,
+            OceanMessage.Performative.PURCHASE_DATATOKENS,
+            OceanMessage.Performative.SUBSCRIBE_EVENTS,
         }
     )
     TERMINAL_PERFORMATIVES = frozenset(
         {
             OceanMessage.Performative.DEPLOYMENT_RECIEPT,
+            OceanMessage.Performative.BATCH_DEPLOYMENT_RECIEPT,
+            OceanMessage.Performative.D2C_RESULTS,
+            OceanMessage.Performative.DOWNLOAD_RECIEPT,
+            OceanMessage.Performative.PERMISSION_RECIEPT,
             OceanMessage.Performative.POOL_DEPLOYMENT_RECIEPT,
+            OceanMessage.Performative.PURCHASE_RECIEPT,
             OceanMessage.Performative.END,
             OceanMessage.Performative.ERROR,
         }
     )
     VALID_REPLIES = {
+        OceanMessage.Performative.BATCH_DEPLOYMENT_RECIEPT: frozenset(),
+        OceanMessage.Performative.CHAIN_EVENT: frozenset(
+            {
+                OceanMessage.Performative.CHAIN_EVENT,
+                OceanMessage.Performative.ERROR,
+                OceanMessage.Performative.END,
+            }
+        ),
         OceanMessage.Performative.CREATE_POOL: frozenset(
             {
                 OceanMessage.Performative.POOL_DEPLOYMENT_RECIEPT,
@@ -64,10 +82,19 @@ class OceanDialogue(Dialogue):
         OceanMessage.Performative.D2C_JOB: frozenset(
             {
                 OceanMessage.Performative.RESULTS,
+                OceanMessage.Performative.RESULT_CHUNK,
+                OceanMessage.Performative.ERROR,
+                OceanMessage.Performative.END,
+            }
+        ),
+        OceanMessage.Performative.D2C_MULTI_JOB: frozenset(
+            {
+                OceanMessage.Performative.D2C_RESULTS,
                 OceanMessage.Performative.ERROR,
                 OceanMessage.Performative.END,
             }
         ),
+        OceanMessage.Performative.D2C_RESULTS: frozenset(),
         OceanMessage.Performative.DEPLOY_ALGORITHM: frozenset(
             {
                 OceanMessage.Performative.DEPLOYMENT_RECIEPT,
@@ -75,6 +102,13 @@ class OceanDialogue(Dialogue):
                 OceanMessage.Performative.END,
             }
         ),
+        OceanMessage.Performative.DEPLOY_BATCH: frozenset(
+            {
+                OceanMessage.Performative.BATCH_DEPLOYMENT_RECIEPT,
+                OceanMessage.Performative.ERROR,
+                OceanMessage.Performative.END,
+            }
+        ),
         OceanMessage.Performative.DEPLOY_D2C: frozenset(
             {
                 OceanMessage.Performative.DEPLOYMENT_RECIEPT,
@@ -93,19 +127,51 @@ class OceanDialogue(Dialogue):
         OceanMessage.Performative.DOWNLOAD_JOB: frozenset(
             {
                 OceanMessage.Performative.RESULTS,
+                OceanMessage.Performative.DOWNLOAD_RECIEPT,
                 OceanMessage.Performative.ERROR,
                 OceanMessage.Performative.END,
             }
         ),
+        OceanMessage.Performative.DOWNLOAD_RECIEPT: frozenset(),
         OceanMessage.Performative.END: frozenset(),
         OceanMessage.Performative.ERROR: frozenset(),
         OceanMessage.Performative.PERMISSION_DATASET: frozenset(
             {OceanMessage.Performative.ERROR, OceanMessage.Performative.END}
         ),
+        OceanMessage.Performative.PERMISSION_DATASETS: frozenset(
+            {
+                OceanMessage.Performative.PERMISSION_RECIEPT,
+                OceanMessage.Performative.ERROR,
+                OceanMessage.Performative.END,
+            }
+        ),
+        OceanMessage.Performative.PERMISSION_RECIEPT: frozenset(),
         OceanMessage.Performative.POOL_DEPLOYMENT_RECIEPT: frozenset(),
+        OceanMessage.Performative.PURCHASE_DATATOKENS: frozenset(
+            {
+                OceanMessage.Performative.PURCHASE_RECIEPT,
+                OceanMessage.Performative.ERROR,
+                OceanMessage.Performative.END,
+            }
+        ),
+        OceanMessage.Performative.PURCHASE_RECIEPT: frozenset(),
+        OceanMessage.Performative.RESULT_CHUNK: frozenset(
+            {
+                OceanMessage.Performative.RESULT_CHUNK,
+                OceanMessage.Performative.ERROR,
+                OceanMessage.Performative.END,
+            }
+        ),
         OceanMessage.Performative.RESULTS: frozenset(
             {OceanMessage.Performative.ERROR, OceanMessage.Performative.END}
         ),
+        OceanMessage.Performative.SUBSCRIBE_EVENTS: frozenset(
+            {
+                OceanMessage.Performative.CHAIN_EVENT,
+                OceanMessage.Performative.ERROR,
+                OceanMessage.Performative.END,
+            }
+        ),
     }
 
     class Role(Dialogue.Role):
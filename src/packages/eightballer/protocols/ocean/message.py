@@ -27,6 +27,8 @@ from aea.configurations.base import PublicId
 from aea.exceptions import AEAEnforceError, enforce
 from aea.protocols.base import Message
 
+from packages.eightballer.protocols.ocean.custom_types import \
+    AssetSpecs as CustomAssetSpecs
 from packages.eightballer.protocols.ocean.custom_types import \
     ErrorCode as CustomErrorCode
 
@@ -41,79 +43,131 @@ class OceanMessage(Message):
     protocol_id = PublicId.from_str("eightballer/ocean:0.1.0")
     protocol_specification_id = PublicId.from_str("eightballer/ocean:0.1.0")
 
+    AssetSpecs = CustomAssetSpecs
+
     ErrorCode = CustomErrorCode
 
     class Performative(Message.Performative):
         """Performatives for the ocean protocol."""
 
+        BATCH_DEPLOYMENT_RECIEPT = "batch_deployment_reciept"
+        CHAIN_EVENT = "chain_event"
         CREATE_POOL = "create_pool"
         D2C_JOB = "d2c_job"
+        D2C_MULTI_JOB = "d2c_multi_job"
+        D2C_RESULTS = "d2c_results"
         DEPLOY_ALGORITHM = "deploy_algorithm"
+        DEPLOY_BATCH = "deploy_batch"
         DEPLOY_D2C = "deploy_d2c"
         DEPLOY_DATA_DOWNLOAD = "deploy_data_download"
         DEPLOYMENT_RECIEPT = "deployment_reciept"
         DOWNLOAD_JOB = "download_job"
+        DOWNLOAD_RECIEPT = "download_reciept"
         END = "end"
         ERROR = "error"
         PERMISSION_DATASET = "permission_dataset"
+        PERMISSION_DATASETS = "permission_datasets"
+        PERMISSION_RECIEPT = "permission_reciept"
         POOL_DEPLOYMENT_RECIEPT = "pool_deployment_reciept"
+        PURCHASE_DATATOKENS = "purchase_datatokens"
+        PURCHASE_RECIEPT = "purchase_reciept"
+        RESULT_CHUNK = "result_chunk"
         RESULTS = "results"
+        SUBSCRIBE_EVENTS = "subscribe_events"
 
         def __str__(self) -> str:
             """Get the string representation."""
             return str(self.value)
 
     _performatives = {
+        "batch_deployment_reciept",
+        "chain_event",
         "create_pool",
         "d2c_job",
+        "d2c_multi_job",
+        "d2c_results",
         "deploy_algorithm",
+        "deploy_batch",
         "deploy_d2c",
         "deploy_data_download",
         "deployment_reciept",
         "download_job",
+        "download_reciept",
         "end",
         "error",
         "permission_dataset",
+        "permission_datasets",
+        "permission_reciept",
         "pool_deployment_reciept",
+        "purchase_datatokens",
+        "purchase_reciept",
+        "result_chunk",
         "results",
+        "subscribe_events",
     }
     __slots__: Tuple[str, ...] = tuple()
 
     class _SlotsCls:
         __slots__ = (
+            "addresses",
             "algo_did",
+            "algo_dids",
             "amount_to_mint",
             "asset_did",
+            "asset_specs",
             "author",
+            "block_number",
             "content",
             "data_did",
+            "data_dids",
             "dataset_url",
             "datatoken_address",
+            "datatoken_addresses",
             "datatoken_amt",
+            "datatoken_amts",
             "datatoken_contract_address",
+            "datatoken_contract_addresses",
             "date_created",
             "dialogue_reference",
             "did",
+            "dids",
+            "digest",
             "entrypoint",
             "error_code",
             "error_data",
             "error_msg",
+            "errors",
+            "event_args",
+            "event_name",
+            "event_names",
+            "file_path",
+            "file_paths",
             "files_url",
             "format",
             "image",
+            "is_last",
+            "job_ids",
             "language",
             "license",
+            "log_index",
             "max_cost_ocean",
+            "max_costs_ocean",
             "message_id",
             "name",
             "ocean_amt",
             "performative",
             "pool_address",
+            "pool_addresses",
+            "removed",
+            "sequence",
+            "size",
             "tag",
             "target",
             "token0_name",
             "token1_name",
+            "transaction_hash",
             "type",
+            "types",
             "version",
         )
 
@@ -170,12 +224,24 @@ class OceanMessage(Message):
         enforce(self.is_set("target"), "target is not set.")
         return cast(int, self.get("target"))
 
+    @property
+    def addresses(self) -> Tuple[str, ...]:
+        """Get the 'addresses' content from the message."""
+        enforce(self.is_set("addresses"), "'addresses' content is not set.")
+        return cast(Tuple[str, ...], self.get("addresses"))
+
     @property
     def algo_did(self) -> str:
         """Get the 'algo_did' content from the message."""
         enforce(self.is_set("algo_did"), "'algo_did' content is not set.")
         return cast(str, self.get("algo_did"))
 
+    @property
+    def algo_dids(self) -> Tuple[str, ...]:
+        """Get the 'algo_dids' content from the message."""
+        enforce(self.is_set("algo_dids"), "'algo_dids' content is not set.")
+        return cast(Tuple[str, ...], self.get("algo_dids"))
+
     @property
     def amount_to_mint(self) -> int:
         """Get the 'amount_to_mint' content from the message."""
@@ -188,12 +254,24 @@ class OceanMessage(Message):
         enforce(self.is_set("asset_did"), "'asset_did' content is not set.")
         return cast(str, self.get("asset_did"))
 
+    @property
+    def asset_specs(self) -> CustomAssetSpecs:
+        """Get the 'asset_specs' content from the message."""
+        enforce(self.is_set("asset_specs"), "'asset_specs' content is not set.")
+        return cast(CustomAssetSpecs, self.get("asset_specs"))
+
     @property
     def author(self) -> str:
         """Get the 'author' content from the message."""
         enforce(self.is_set("author"), "'author' content is not set.")
         return cast(str, self.get("author"))
 
+    @property
+    def block_number(self) -> int:
+        """Get the 'block_number' content from the message."""
+        enforce(self.is_set("block_number"), "'block_number' content is not set.")
+        return cast(int, self.get("block_number"))
+
     @property
     def content(self) -> bytes:
         """Get the 'content' content from the message."""
@@ -206,6 +284,12 @@ class OceanMessage(Message):
         enforce(self.is_set("data_did"), "'data_did' content is not set.")
         return cast(str, self.get("data_did"))
 
+    @property
+    def data_dids(self) -> Tuple[str, ...]:
+        """Get the 'data_dids' content from the message."""
+        enforce(self.is_set("data_dids"), "'data_dids' content is not set.")
+        return cast(Tuple[str, ...], self.get("data_dids"))
+
     @property
     def dataset_url(self) -> str:
         """Get the 'dataset_url' content from the message."""
@@ -220,12 +304,24 @@ class OceanMessage(Message):
         )
         return cast(str, self.get("datatoken_address"))
 
+    @property
+    def datatoken_addresses(self) -> Tuple[str, ...]:
+        """Get the 'datatoken_addresses' content from the message."""
+        enforce(self.is_set("datatoken_addresses"), "'datatoken_addresses' content is not set.")
+        return cast(Tuple[str, ...], self.get("datatoken_addresses"))
+
     @property
     def datatoken_amt(self) -> int:
         """Get the 'datatoken_amt' content from the message."""
         enforce(self.is_set("datatoken_amt"), "'datatoken_amt' content is not set.")
         return cast(int, self.get("datatoken_amt"))
 
+    @property
+    def datatoken_amts(self) -> Tuple[int, ...]:
+        """Get the 'datatoken_amts' content from the message."""
+        enforce(self.is_set("datatoken_amts"), "'datatoken_amts' content is not set.")
+        return cast(Tuple[int, ...], self.get("datatoken_amts"))
+
     @property
     def datatoken_contract_address(self) -> str:
         """Get the 'datatoken_contract_address' content from the message."""
@@ -235,6 +331,15 @@ class OceanMessage(Message):
         )
         return cast(str, self.get("datatoken_contract_address"))
 
+    @property
+    def datatoken_contract_addresses(self) -> Tuple[str, ...]:
+        """Get the 'datatoken_contract_addresses' content from the message."""
+        enforce(
+            self.is_set("datatoken_contract_addresses"),
+            "'datatoken_contract_addresses' content is not set.",
+        )
+        return cast(Tuple[str, ...], self.get("datatoken_contract_addresses"))
+
     @property
     def date_created(self) -> str:
         """Get the 'date_created' content from the message."""
@@ -247,6 +352,18 @@ class OceanMessage(Message):
         enforce(self.is_set("did"), "'did' content is not set.")
         return cast(str, self.get("did"))
 
+    @property
+    def dids(self) -> Tuple[str, ...]:
+        """Get the 'dids' content from the message."""
+        enforce(self.is_set("dids"), "'dids' content is not set.")
+        return cast(Tuple[str, ...], self.get("dids"))
+
+    @property
+    def digest(self) -> str:
+        """Get the 'digest' content from the message."""
+        enforce(self.is_set("digest"), "'digest' content is not set.")
+        return cast(str, self.get("digest"))
+
     @property
     def entrypoint(self) -> str:
         """Get the 'entrypoint' content from the message."""
@@ -271,6 +388,42 @@ class OceanMessage(Message):
         enforce(self.is_set("error_msg"), "'error_msg' content is not set.")
         return cast(str, self.get("error_msg"))
 
+    @property
+    def errors(self) -> Tuple[str, ...]:
+        """Get the 'errors' content from the message."""
+        enforce(self.is_set("errors"), "'errors' content is not set.")
+        return cast(Tuple[str, ...], self.get("errors"))
+
+    @property
+    def event_args(self) -> str:
+        """Get the 'event_args' content from the message."""
+        enforce(self.is_set("event_args"), "'event_args' content is not set.")
+        return cast(str, self.get("event_args"))
+
+    @property
+    def event_name(self) -> str:
+        """Get the 'event_name' content from the message."""
+        enforce(self.is_set("event_name"), "'event_name' content is not set.")
+        return cast(str, self.get("event_name"))
+
+    @property
+    def event_names(self) -> Tuple[str, ...]:
+        """Get the 'event_names' content from the message."""
+        enforce(self.is_set("event_names"), "'event_names' content is not set.")
+        return cast(Tuple[str, ...], self.get("event_names"))
+
+    @property
+    def file_path(self) -> str:
+        """Get the 'file_path' content from the message."""
+        enforce(self.is_set("file_path"), "'file_path' content is not set.")
+        return cast(str, self.get("file_path"))
+
+    @property
+    def file_paths(self) -> Tuple[str, ...]:
+        """Get the 'file_paths' content from the message."""
+        enforce(self.is_set("file_paths"), "'file_paths' content is not set.")
+        return cast(Tuple[str, ...], self.get("file_paths"))
+
     @property
     def files_url(self) -> str:
         """Get the 'files_url' content from the message."""
@@ -289,6 +442,18 @@ class OceanMessage(Message):
         enforce(self.is_set("image"), "'image' content is not set.")
         return cast(str, self.get("image"))
 
+    @property
+    def is_last(self) -> bool:
+        """Get the 'is_last' content from the message."""
+        enforce(self.is_set("is_last"), "'is_last' content is not set.")
+        return cast(bool, self.get("is_last"))
+
+    @property
+    def job_ids(self) -> Tuple[str, ...]:
+        """Get the 'job_ids' content from the message."""
+        enforce(self.is_set("job_ids"), "'job_ids' content is not set.")
+        return cast(Tuple[str, ...], self.get("job_ids"))
+
     @property
     def language(self) -> str:
         """Get the 'language' content from the message."""
@@ -301,12 +466,24 @@ class OceanMessage(Message):
         enforce(self.is_set("license"), "'license' content is not set.")
         return cast(str, self.get("license"))
 
+    @property
+    def log_index(self) -> int:
+        """Get the 'log_index' content from the message."""
+        enforce(self.is_set("log_index"), "'log_index' content is not set.")
+        return cast(int, self.get("log_index"))
+
     @property
     def max_cost_ocean(self) -> int:
         """Get the 'max_cost_ocean' content from the message."""
         enforce(self.is_set("max_cost_ocean"), "'max_cost_ocean' content is not set.")
         return cast(int, self.get("max_cost_ocean"))
 
+    @property
+    def max_costs_ocean(self) -> Tuple[int, ...]:
+        """Get the 'max_costs_ocean' content from the message."""
+        enforce(self.is_set("max_costs_ocean"), "'max_costs_ocean' content is not set.")
+        return cast(Tuple[int, ...], self.get("max_costs_ocean"))
+
     @property
     def name(self) -> str:
         """Get the 'name' content from the message."""
@@ -325,6 +502,30 @@ class OceanMessage(Message):
         enforce(self.is_set("pool_address"), "'pool_address' content is not set.")
         return cast(str, self.get("pool_address"))
 
+    @property
+    def pool_addresses(self) -> Tuple[str, ...]:
+        """Get the 'pool_addresses' content from the message."""
+        enforce(self.is_set("pool_addresses"), "'pool_addresses' content is not set.")
+        return cast(Tuple[str, ...], self.get("pool_addresses"))
+
+    @property
+    def removed(self) -> bool:
+        """Get the 'removed' content from the message."""
+        enforce(self.is_set("removed"), "'removed' content is not set.")
+        return cast(bool, self.get("removed"))
+
+    @property
+    def sequence(self) -> int:
+        """Get the 'sequence' content from the message."""
+        enforce(self.is_set("sequence"), "'sequence' content is not set.")
+        return cast(int, self.get("sequence"))
+
+    @property
+    def size(self) -> int:
+        """Get the 'size' content from the message."""
+        enforce(self.is_set("size"), "'size' content is not set.")
+        return cast(int, self.get("size"))
+
     @property
     def tag(self) -> str:
         """Get the 'tag' content from the message."""
@@ -343,12 +544,26 @@ class OceanMessage(Message):
         enforce(self.is_set("token1_name"), "'token1_name' content is not set.")
         return cast(str, self.get("token1_name"))
 
+    @property
+    def transaction_hash(self) -> str:
+        """Get the 'transaction_hash' content from the message."""
+        enforce(
+            self.is_set("transaction_hash"), "'transaction_hash' content is not set."
+        )
+        return cast(str, self.get("transaction_hash"))
+
     @property
     def type(self) -> str:
         """Get the 'type' content from the message."""
         enforce(self.is_set("type"), "'type' content is not set.")
         return cast(str, self.get("type"))
 
+    @property
+    def types(self) -> Tuple[str, ...]:
+        """Get the 'types' content from the message."""
+        enforce(self.is_set("types"), "'types' content is not set.")
+        return cast(Tuple[str, ...], self.get("types"))
+
     @property
     def version(self) -> str:
         """Get the 'version' content from the message."""
@@ -703,6 +918,341 @@ class OceanMessage(Message):
                         type(self.content)
                     ),
                 )
+            elif self.performative == OceanMessage.Performative.PURCHASE_DATATOKENS:
+                expected_nb_of_contents = 3
+                enforce(
+                    isinstance(self.pool_addresses, tuple),
+                    "Invalid type for content 'pool_addresses'. Expected 'tuple'. Found '{}'.".format(
+                        type(self.pool_addresses)
+                    ),
+                )
+                enforce(
+                    all(isinstance(element, str) for element in self.pool_addresses),
+                    "Invalid type for tuple elements in content 'pool_addresses'. Expected 'str'.",
+                )
+                enforce(
+                    isinstance(self.datatoken_amts, tuple),
+                    "Invalid type for content 'datatoken_amts'. Expected 'tuple'. Found '{}'.".format(
+                        type(self.datatoken_amts)
+                    ),
+                )
+                enforce(
+                    all(type(element) is int for element in self.datatoken_amts),
+                    "Invalid type for tuple elements in content 'datatoken_amts'. Expected 'int'.",
+                )
+                enforce(
+                    isinstance(self.max_costs_ocean, tuple),
+                    "Invalid type for content 'max_costs_ocean'. Expected 'tuple'. Found '{}'.".format(
+                        type(self.max_costs_ocean)
+                    ),
+                )
+                enforce(
+                    all(type(element) is int for element in self.max_costs_ocean),
+                    "Invalid type for tuple elements in content 'max_costs_ocean'. Expected 'int'.",
+                )
+            elif self.performative == OceanMessage.Performative.PURCHASE_RECIEPT:
+                expected_nb_of_contents = 3
+                enforce(
+                    isinstance(self.pool_addresses, tuple),
+                    "Invalid type for content 'pool_addresses'. Expected 'tuple'. Found '{}'.".format(
+                        type(self.pool_addresses)
+                    ),
+                )
+                enforce(
+                    all(isinstance(element, str) for element in self.pool_addresses),
+                    "Invalid type for tuple elements in content 'pool_addresses'. Expected 'str'.",
+                )
+                enforce(
+                    isinstance(self.datatoken_addresses, tuple),
+                    "Invalid type for content 'datatoken_addresses'. Expected 'tuple'. Found '{}'.".format(
+                        type(self.datatoken_addresses)
+                    ),
+                )
+                enforce(
+                    all(isinstance(element, str) for element in self.datatoken_addresses),
+                    "Invalid type for tuple elements in content 'datatoken_addresses'. Expected 'str'.",
+                )
+                enforce(
+                    isinstance(self.errors, tuple),
+                    "Invalid type for content 'errors'. Expected 'tuple'. Found '{}'.".format(
+                        type(self.errors)
+                    ),
+                )
+                enforce(
+                    all(isinstance(element, str) for element in self.errors),
+                    "Invalid type for tuple elements in content 'errors'. Expected 'str'.",
+                )
+            elif self.performative == OceanMessage.Performative.RESULT_CHUNK:
+                expected_nb_of_contents = 4
+                enforce(
+                    isinstance(self.content, bytes),
+                    "Invalid type for content 'content'. Expected 'bytes'. Found '{}'.".format(
+                        type(self.content)
+                    ),
+                )
+                enforce(
+                    type(self.sequence) is int,
+                    "Invalid type for content 'sequence'. Expected 'int'. Found '{}'.".format(
+                        type(self.sequence)
+                    ),
+                )
+                enforce(
+                    isinstance(self.is_last, bool),
+                    "Invalid type for content 'is_last'. Expected 'bool'. Found '{}'.".format(
+                        type(self.is_last)
+                    ),
+                )
+                enforce(
+                    isinstance(self.digest, str),
+                    "Invalid type for content 'digest'. Expected 'str'. Found '{}'.".format(
+                        type(self.digest)
+                    ),
+                )
+            elif self.performative == OceanMessage.Performative.DOWNLOAD_RECIEPT:
+                expected_nb_of_contents = 3
+                enforce(
+                    isinstance(self.did, str),
+                    "Invalid type for content 'did'. Expected 'str'. Found '{}'.".format(
+                        type(self.did)
+                    ),
+                )
+                enforce(
+                    isinstance(self.file_path, str),
+                    "Invalid type for content 'file_path'. Expected 'str'. Found '{}'.".format(
+                        type(self.file_path)
+                    ),
+                )
+                enforce(
+                    type(self.size) is int,
+                    "Invalid type for content 'size'. Expected 'int'. Found '{}'.".format(
+                        type(self.size)
+                    ),
+                )
+            elif self.performative == OceanMessage.Performative.DEPLOY_BATCH:
+                expected_nb_of_contents = 1
+                enforce(
+                    isinstance(self.asset_specs, CustomAssetSpecs),
+                    "Invalid type for content 'asset_specs'. Expected 'AssetSpecs'. Found '{}'.".format(
+                        type(self.asset_specs)
+                    ),
+                )
+            elif (
+                self.performative == OceanMessage.Performative.BATCH_DEPLOYMENT_RECIEPT
+            ):
+                expected_nb_of_contents = 4
+                enforce(
+                    isinstance(self.types, tuple),
+                    "Invalid type for content 'types'. Expected 'tuple'. Found '{}'.".format(
+                        type(self.types)
+                    ),
+                )
+                enforce(
+                    all(isinstance(element, str) for element in self.types),
+                    "Invalid type for tuple elements in content 'types'. Expected 'str'.",
+                )
+                enforce(
+                    isinstance(self.dids, tuple),
+                    "Invalid type for content 'dids'. Expected 'tuple'. Found '{}'.".format(
+                        type(self.dids)
+                    ),
+                )
+                enforce(
+                    all(isinstance(element, str) for element in self.dids),
+                    "Invalid type for tuple elements in content 'dids'. Expected 'str'.",
+                )
+                enforce(
+                    isinstance(self.datatoken_contract_addresses, tuple),
+                    "Invalid type for content 'datatoken_contract_addresses'. Expected 'tuple'. Found '{}'.".format(
+                        type(self.datatoken_contract_addresses)
+                    ),
+                )
+                enforce(
+                    all(
+                        isinstance(element, str)
+                        for element in self.datatoken_contract_addresses
+                    ),
+                    "Invalid type for tuple elements in content 'datatoken_contract_addresses'. Expected 'str'.",
+                )
+                enforce(
+                    isinstance(self.errors, tuple),
+                    "Invalid type for content 'errors'. Expected 'tuple'. Found '{}'.".format(
+                        type(self.errors)
+                    ),
+                )
+                enforce(
+                    all(isinstance(element, str) for element in self.errors),
+                    "Invalid type for tuple elements in content 'errors'. Expected 'str'.",
+                )
+            elif self.performative == OceanMessage.Performative.SUBSCRIBE_EVENTS:
+                expected_nb_of_contents = 2
+                enforce(
+                    isinstance(self.event_names, tuple),
+                    "Invalid type for content 'event_names'. Expected 'tuple'. Found '{}'.".format(
+                        type(self.event_names)
+                    ),
+                )
+                enforce(
+                    all(isinstance(element, str) for element in self.event_names),
+                    "Invalid type for tuple elements in content 'event_names'. Expected 'str'.",
+                )
+                enforce(
+                    isinstance(self.addresses, tuple),
+                    "Invalid type for content 'addresses'. Expected 'tuple'. Found '{}'.".format(
+                        type(self.addresses)
+                    ),
+                )
+                enforce(
+                    all(isinstance(element, str) for element in self.addresses),
+                    "Invalid type for tuple elements in content 'addresses'. Expected 'str'.",
+                )
+            elif self.performative == OceanMessage.Performative.CHAIN_EVENT:
+                expected_nb_of_contents = 7
+                enforce(
+                    isinstance(self.event_name, str),
+                    "Invalid type for content 'event_name'. Expected 'str'. Found '{}'.".format(
+                        type(self.event_name)
+                    ),
+                )
+                enforce(
+                    isinstance(self.address, str),
+                    "Invalid type for content 'address'. Expected 'str'. Found '{}'.".format(
+                        type(self.address)
+                    ),
+                )
+                enforce(
+                    type(self.block_number) is int,
+                    "Invalid type for content 'block_number'. Expected 'int'. Found '{}'.".format(
+                        type(self.block_number)
+                    ),
+                )
+                enforce(
+                    isinstance(self.transaction_hash, str),
+                    "Invalid type for content 'transaction_hash'. Expected 'str'. Found '{}'.".format(
+                        type(self.transaction_hash)
+                    ),
+                )
+                enforce(
+                    type(self.log_index) is int,
+                    "Invalid type for content 'log_index'. Expected 'int'. Found '{}'.".format(
+                        type(self.log_index)
+                    ),
+                )
+                enforce(
+                    isinstance(self.event_args, str),
+                    "Invalid type for content 'event_args'. Expected 'str'. Found '{}'.".format(
+                        type(self.event_args)
+                    ),
+                )
+                enforce(
+                    isinstance(self.removed, bool),
+                    "Invalid type for content 'removed'. Expected 'bool'. Found '{}'.".format(
+                        type(self.removed)
+                    ),
+                )
+            elif self.performative == OceanMessage.Performative.D2C_MULTI_JOB:
+                expected_nb_of_contents = 2
+                enforce(
+                    isinstance(self.data_dids, tuple),
+                    "Invalid type for content 'data_dids'. Expected 'tuple'. Found '{}'.".format(
+                        type(self.data_dids)
+                    ),
+                )
+                enforce(
+                    all(isinstance(element, str) for element in self.data_dids),
+                    "Invalid type for tuple elements in content 'data_dids'. Expected 'str'.",
+                )
+                enforce(
+                    isinstance(self.algo_did, str),
+                    "Invalid type for content 'algo_did'. Expected 'str'. Found '{}'.".format(
+                        type(self.algo_did)
+                    ),
+                )
+            elif self.performative == OceanMessage.Performative.D2C_RESULTS:
+                expected_nb_of_contents = 4
+                enforce(
+                    isinstance(self.data_dids, tuple),
+                    "Invalid type for content 'data_dids'. Expected 'tuple'. Found '{}'.".format(
+                        type(self.data_dids)
+                    ),
+                )
+                enforce(
+                    all(isinstance(element, str) for element in self.data_dids),
+                    "Invalid type for tuple elements in content 'data_dids'. Expected 'str'.",
+                )
+                enforce(
+                    isinstance(self.job_ids, tuple),
+                    "Invalid type for content 'job_ids'. Expected 'tuple'. Found '{}'.".format(
+                        type(self.job_ids)
+                    ),
+                )
+                enforce(
+                    all(isinstance(element, str) for element in self.job_ids),
+                    "Invalid type for tuple elements in content 'job_ids'. Expected 'str'.",
+                )
+                enforce(
+                    isinstance(self.file_paths, tuple),
+                    "Invalid type for content 'file_paths'. Expected 'tuple'. Found '{}'.".format(
+                        type(self.file_paths)
+                    ),
+                )
+                enforce(
+                    all(isinstance(element, str) for element in self.file_paths),
+                    "Invalid type for tuple elements in content 'file_paths'. Expected 'str'.",
+                )
+                enforce(
+                    isinstance(self.errors, tuple),
+                    "Invalid type for content 'errors'. Expected 'tuple'. Found '{}'.".format(
+                        type(self.errors)
+                    ),
+                )
+                enforce(
+                    all(isinstance(element, str) for element in self.errors),
+                    "Invalid type for tuple elements in content 'errors'. Expected 'str'.",
+                )
+            elif self.performative == OceanMessage.Performative.PERMISSION_DATASETS:
+                expected_nb_of_contents = 2
+                enforce(
+                    isinstance(self.data_dids, tuple),
+                    "Invalid type for content 'data_dids'. Expected 'tuple'. Found '{}'.".format(
+                        type(self.data_dids)
+                    ),
+                )
+                enforce(
+                    all(isinstance(element, str) for element in self.data_dids),
+                    "Invalid type for tuple elements in content 'data_dids'. Expected 'str'.",
+                )
+                enforce(
+                    isinstance(self.algo_dids, tuple),
+                    "Invalid type for content 'algo_dids'. Expected 'tuple'. Found '{}'.".format(
+                        type(self.algo_dids)
+                    ),
+                )
+                enforce(
+                    all(isinstance(element, str) for element in self.algo_dids),
+                    "Invalid type for tuple elements in content 'algo_dids'. Expected 'str'.",
+                )
+            elif self.performative == OceanMessage.Performative.PERMISSION_RECIEPT:
+                expected_nb_of_contents = 2
+                enforce(
+                    isinstance(self.data_dids, tuple),
+                    "Invalid type for content 'data_dids'. Expected 'tuple'. Found '{}'.".format(
+                        type(self.data_dids)
+                    ),
+                )
+                enforce(
+                    all(isinstance(element, str) for element in self.data_dids),
+                    "Invalid type for tuple elements in content 'data_dids'. Expected 'str'.",
+                )
+                enforce(
+                    isinstance(self.errors, tuple),
+                    "Invalid type for content 'errors'. Expected 'tuple'. Found '{}'.".format(
+                        type(self.errors)
+                    ),
+                )
+                enforce(
+                    all(isinstance(element, str) for element in self.errors),
+                    "Invalid type for tuple elements in content 'errors'. Expected 'str'.",
+                )
             elif self.performative == OceanMessage.Performative.ERROR:
                 expected_nb_of_contents = 3
                 enforce(
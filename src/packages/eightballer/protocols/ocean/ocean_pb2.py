@@ -20,7 +20,7 @@ DESCRIPTOR = _descriptor.FileDescriptor(
     syntax="proto3",
     serialized_options=None,
     serialized_pb=_b(
-        '\n\x0bocean.proto\x12\x1c\x61\x65\x61.eightballer.ocean.v0_1_0"\xec\x16\n\x0cOceanMessage\x12Z\n\x0b\x63reate_pool\x18\x05 \x01(\x0b\x32\x43.aea.eightballer.ocean.v0_1_0.OceanMessage.Create_Pool_PerformativeH\x00\x12R\n\x07\x64\x32\x63_job\x18\x06 \x01(\x0b\x32?.aea.eightballer.ocean.v0_1_0.OceanMessage.D2C_Job_PerformativeH\x00\x12\x64\n\x10\x64\x65ploy_algorithm\x18\x07 \x01(\x0b\x32H.aea.eightballer.ocean.v0_1_0.OceanMessage.Deploy_Algorithm_PerformativeH\x00\x12X\n\ndeploy_d2c\x18\x08 \x01(\x0b\x32\x42.aea.eightballer.ocean.v0_1_0.OceanMessage.Deploy_D2C_PerformativeH\x00\x12l\n\x14\x64\x65ploy_data_download\x18\t \x01(\x0b\x32L.aea.eightballer.ocean.v0_1_0.OceanMessage.Deploy_Data_Download_PerformativeH\x00\x12h\n\x12\x64\x65ployment_reciept\x18\n \x01(\x0b\x32J.aea.eightballer.ocean.v0_1_0.OceanMessage.Deployment_Reciept_PerformativeH\x00\x12\\\n\x0c\x64ownload_job\x18\x0b \x01(\x0b\x32\x44.aea.eightballer.ocean.v0_1_0.OceanMessage.Download_Job_PerformativeH\x00\x12J\n\x03\x65nd\x18\x0c \x01(\x0b\x32;.aea.eightballer.ocean.v0_1_0.OceanMessage.End_PerformativeH\x00\x12N\n\x05\x65rror\x18\r \x01(\x0b\x32=.aea.eightballer.ocean.v0_1_0.OceanMessage.Error_PerformativeH\x00\x12h\n\x12permission_dataset\x18\x0e \x01(\x0b\x32J.aea.eightballer.ocean.v0_1_0.OceanMessage.Permission_Dataset_PerformativeH\x00\x12r\n\x17pool_deployment_reciept\x18\x0f \x01(\x0b\x32O.aea.eightballer.ocean.v0_1_0.OceanMessage.Pool_Deployment_Reciept_PerformativeH\x00\x12R\n\x07results\x18\x10 \x01(\x0b\x32?.aea.eightballer.ocean.v0_1_0.OceanMessage.Results_PerformativeH\x00\x1a\xe4\x01\n\tErrorCode\x12V\n\nerror_code\x18\x01 \x01(\x0e\x32\x42.aea.eightballer.ocean.v0_1_0.OceanMessage.ErrorCode.ErrorCodeEnum"\x7f\n\rErrorCodeEnum\x12\x18\n\x14UNSUPPORTED_PROTOCOL\x10\x00\x12\x12\n\x0e\x44\x45\x43ODING_ERROR\x10\x01\x12\x13\n\x0fINVALID_MESSAGE\x10\x02\x12\x15\n\x11UNSUPPORTED_SKILL\x10\x03\x12\x14\n\x10INVALID_DIALOGUE\x10\x04\x1a\xbf\x01\n!Deploy_Data_Download_Performative\x12\x13\n\x0btoken0_name\x18\x01 \x01(\t\x12\x13\n\x0btoken1_name\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x61taset_url\x18\x03 \x01(\t\x12\x0c\n\x04name\x18\x04 \x01(\t\x12\x0e\n\x06\x61uthor\x18\x05 \x01(\t\x12\x14\n\x0c\x64\x61te_created\x18\x06 \x01(\t\x12\x0f\n\x07license\x18\x07 \x01(\t\x12\x16\n\x0e\x61mount_to_mint\x18\x08 \x01(\x05\x1a\xb5\x01\n\x17\x44\x65ploy_D2C_Performative\x12\x13\n\x0btoken0_name\x18\x01 \x01(\t\x12\x13\n\x0btoken1_name\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x61taset_url\x18\x03 \x01(\t\x12\x0c\n\x04name\x18\x04 \x01(\t\x12\x0e\n\x06\x61uthor\x18\x05 \x01(\t\x12\x14\n\x0c\x64\x61te_created\x18\x06 \x01(\t\x12\x0f\n\x07license\x18\x07 \x01(\t\x12\x16\n\x0e\x61mount_to_mint\x18\x08 \x01(\x05\x1a\x9c\x02\n\x1d\x44\x65ploy_Algorithm_Performative\x12\x13\n\x0btoken0_name\x18\x01 \x01(\t\x12\x13\n\x0btoken1_name\x18\x02 \x01(\t\x12\x16\n\x0e\x61mount_to_mint\x18\x03 \x01(\x05\x12\x10\n\x08language\x18\x04 \x01(\t\x12\x0e\n\x06\x66ormat\x18\x05 \x01(\t\x12\x0f\n\x07version\x18\x06 \x01(\t\x12\x12\n\nentrypoint\x18\x07 \x01(\t\x12\r\n\x05image\x18\x08 \x01(\t\x12\x0b\n\x03tag\x18\t \x01(\t\x12\x11\n\tfiles_url\x18\n \x01(\t\x12\x0c\n\x04name\x18\x0b \x01(\t\x12\x0e\n\x06\x61uthor\x18\x0c \x01(\t\x12\x14\n\x0c\x64\x61te_created\x18\r \x01(\t\x12\x0f\n\x07license\x18\x0e \x01(\t\x1a<\n$Pool_Deployment_Reciept_Performative\x12\x14\n\x0cpool_address\x18\x01 \x01(\t\x1a`\n\x1f\x44\x65ployment_Reciept_Performative\x12\x0c\n\x04type\x18\x01 \x01(\t\x12\x0b\n\x03\x64id\x18\x02 \x01(\t\x12"\n\x1a\x64\x61tatoken_contract_address\x18\x03 \x01(\t\x1a_\n\x18\x43reate_Pool_Performative\x12\x19\n\x11\x64\x61tatoken_address\x18\x01 \x01(\t\x12\x15\n\rdatatoken_amt\x18\x02 \x01(\x05\x12\x11\n\tocean_amt\x18\x03 \x01(\x05\x1a\x8e\x01\n\x19\x44ownload_Job_Performative\x12\x19\n\x11\x64\x61tatoken_address\x18\x01 \x01(\t\x12\x15\n\rdatatoken_amt\x18\x02 \x01(\x05\x12\x16\n\x0emax_cost_ocean\x18\x03 \x01(\x05\x12\x11\n\tasset_did\x18\x04 \x01(\t\x12\x14\n\x0cpool_address\x18\x05 \x01(\t\x1a\x45\n\x1fPermission_Dataset_Performative\x12\x10\n\x08\x61lgo_did\x18\x01 \x01(\t\x12\x10\n\x08\x64\x61ta_did\x18\x02 \x01(\t\x1a:\n\x14\x44\x32\x43_Job_Performative\x12\x10\n\x08\x64\x61ta_did\x18\x01 \x01(\t\x12\x10\n\x08\x61lgo_did\x18\x02 \x01(\t\x1a\'\n\x14Results_Performative\x12\x0f\n\x07\x63ontent\x18\x01 \x01(\x0c\x1a\x85\x02\n\x12\x45rror_Performative\x12H\n\nerror_code\x18\x01 \x01(\x0b\x32\x34.aea.eightballer.ocean.v0_1_0.OceanMessage.ErrorCode\x12\x11\n\terror_msg\x18\x02 \x01(\t\x12`\n\nerror_data\x18\x03 \x03(\x0b\x32L.aea.eightballer.ocean.v0_1_0.OceanMessage.Error_Performative.ErrorDataEntry\x1a\x30\n\x0e\x45rrorDataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x0c:\x02\x38\x01\x1a\x12\n\x10\x45nd_PerformativeB\x0e\n\x0cperformativeb\x06proto3'
+        '\n\x0bocean.proto\x12\x1c\x61\x65\x61.eightballer.ocean.v0_1_0"\xff,\n\x0cOceanMessage\x12t\n\x18\x62\x61tch_deployment_reciept\x18\x05 \x01(\x0b\x32P.aea.eightballer.ocean.v0_1_0.OceanMessage.Batch_Deployment_Reciept_PerformativeH\x00\x12Z\n\x0b\x63hain_event\x18\x06 \x01(\x0b\x32\x43.aea.eightballer.ocean.v0_1_0.OceanMessage.Chain_Event_PerformativeH\x00\x12Z\n\x0b\x63reate_pool\x18\x07 \x01(\x0b\x32\x43.aea.eightballer.ocean.v0_1_0.OceanMessage.Create_Pool_PerformativeH\x00\x12R\n\x07\x64\x32\x63_job\x18\x08 \x01(\x0b\x32?.aea.eightballer.ocean.v0_1_0.OceanMessage.D2C_Job_PerformativeH\x00\x12^\n\rd2c_multi_job\x18\t \x01(\x0b\x32\x45.aea.eightballer.ocean.v0_1_0.OceanMessage.D2C_Multi_Job_PerformativeH\x00\x12Z\n\x0b\x64\x32\x63_results\x18\n \x01(\x0b\x32\x43.aea.eightballer.ocean.v0_1_0.OceanMessage.D2C_Results_PerformativeH\x00\x12\x64\n\x10\x64\x65ploy_algorithm\x18\x0b \x01(\x0b\x32H.aea.eightballer.ocean.v0_1_0.OceanMessage.Deploy_Algorithm_PerformativeH\x00\x12\\\n\x0c\x64\x65ploy_batch\x18\x0c \x01(\x0b\x32\x44.aea.eightballer.ocean.v0_1_0.OceanMessage.Deploy_Batch_PerformativeH\x00\x12X\n\ndeploy_d2c\x18\r \x01(\x0b\x32\x42.aea.eightballer.ocean.v0_1_0.OceanMessage.Deploy_D2C_PerformativeH\x00\x12l\n\x14\x64\x65ploy_data_download\x18\x0e \x01(\x0b\x32L.aea.eightballer.ocean.v0_1_0.OceanMessage.Deploy_Data_Download_PerformativeH\x00\x12h\n\x12\x64\x65ployment_reciept\x18\x0f \x01(\x0b\x32J.aea.eightballer.ocean.v0_1_0.OceanMessage.Deployment_Reciept_PerformativeH\x00\x12\\\n\x0c\x64ownload_job\x18\x10 \x01(\x0b\x32\x44.aea.eightballer.ocean.v0_1_0.OceanMessage.Download_Job_PerformativeH\x00\x12\x64\n\x10\x64ownload_reciept\x18\x11 \x01(\x0b\x32H.aea.eightballer.ocean.v0_1_0.OceanMessage.Download_Reciept_PerformativeH\x00\x12J\n\x03\x65nd\x18\x12 \x01(\x0b\x32;.aea.eightballer.ocean.v0_1_0.OceanMessage.End_PerformativeH\x00\x12N\n\x05\x65rror\x18\x13 \x01(\x0b\x32=.aea.eightballer.ocean.v0_1_0.OceanMessage.Error_PerformativeH\x00\x12h\n\x12permission_dataset\x18\x14 \x01(\x0b\x32J.aea.eightballer.ocean.v0_1_0.OceanMessage.Permission_Dataset_PerformativeH\x00\x12j\n\x13permission_datasets\x18\x15 \x01(\x0b\x32K.aea.eightballer.ocean.v0_1_0.OceanMessage.Permission_Datasets_PerformativeH\x00\x12h\n\x12permission_reciept\x18\x16 \x01(\x0b\x32J.aea.eightballer.ocean.v0_1_0.OceanMessage.Permission_Reciept_PerformativeH\x00\x12r\n\x17pool_deployment_reciept\x18\x17 \x01(\x0b\x32O.aea.eightballer.ocean.v0_1_0.OceanMessage.Pool_Deployment_Reciept_PerformativeH\x00\x12j\n\x13purchase_datatokens\x18\x18 \x01(\x0b\x32K.aea.eightballer.ocean.v0_1_0.OceanMessage.Purchase_Datatokens_PerformativeH\x00\x12\x64\n\x10purchase_reciept\x18\x19 \x01(\x0b\x32H.aea.eightballer.ocean.v0_1_0.OceanMessage.Purchase_Reciept_PerformativeH\x00\x12\\\n\x0cresult_chunk\x18\x1a \x01(\x0b\x32\x44.aea.eightballer.ocean.v0_1_0.OceanMessage.Result_Chunk_PerformativeH\x00\x12R\n\x07results\x18\x1b \x01(\x0b\x32?.aea.eightballer.ocean.v0_1_0.OceanMessage.Results_PerformativeH\x00\x12\x64\n\x10subscribe_events\x18\x1c \x01(\x0b\x32H.aea.eightballer.ocean.v0_1_0.OceanMessage.Subscribe_Events_PerformativeH\x00\x1a\x94\x02\n\tErrorCode\x12V\n\nerror_code\x18\x01 \x01(\x0e\x32\x42.aea.eightballer.ocean.v0_1_0.OceanMessage.ErrorCode.ErrorCodeEnum"\xae\x01\n\rErrorCodeEnum\x12\x18\n\x14UNSUPPORTED_PROTOCOL\x10\x00\x12\x12\n\x0e\x44\x45\x43ODING_ERROR\x10\x01\x12\x13\n\x0fINVALID_MESSAGE\x10\x02\x12\x15\n\x11UNSUPPORTED_SKILL\x10\x03\x12\x14\n\x10INVALID_DIALOGUE\x10\x04\x12\x17\n\x13SERVICE_UNAVAILABLE\x10\x05\x12\x14\n\x10OPERATION_FAILED\x10\x06\x1a\x90\x03\n\nAssetSpecs\x12T\n\x0b\x61sset_specs\x18\x01 \x03(\x0b\x32?.aea.eightballer.ocean.v0_1_0.OceanMessage.AssetSpecs.AssetSpec\x1a\xab\x02\n\tAssetSpec\x12\x0c\n\x04type\x18\x01 \x01(\t\x12\x13\n\x0btoken0_name\x18\x02 \x01(\t\x12\x13\n\x0btoken1_name\x18\x03 \x01(\t\x12\x16\n\x0e\x61mount_to_mint\x18\x04 \x01(\x05\x12\x13\n\x0b\x64\x61taset_url\x18\x05 \x01(\t\x12\x11\n\tfiles_url\x18\x06 \x01(\t\x12\x0c\n\x04name\x18\x07 \x01(\t\x12\x0e\n\x06\x61uthor\x18\x08 \x01(\t\x12\x14\n\x0c\x64\x61te_created\x18\t \x01(\t\x12\x0f\n\x07license\x18\n \x01(\t\x12\x10\n\x08language\x18\x0b \x01(\t\x12\x0e\n\x06\x66ormat\x18\x0c \x01(\t\x12\x0f\n\x07version\x18\r \x01(\t\x12\x12\n\nentrypoint\x18\x0e \x01(\t\x12\r\n\x05image\x18\x0f \x01(\t\x12\x0b\n\x03tag\x18\x10 \x01(\t\x1a\xbf\x01\n!Deploy_Data_Download_Performative\x12\x13\n\x0btoken0_name\x18\x01 \x01(\t\x12\x13\n\x0btoken1_name\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x61taset_url\x18\x03 \x01(\t\x12\x0c\n\x04name\x18\x04 \x01(\t\x12\x0e\n\x06\x61uthor\x18\x05 \x01(\t\x12\x14\n\x0c\x64\x61te_created\x18\x06 \x01(\t\x12\x0f\n\x07license\x18\x07 \x01(\t\x12\x16\n\x0e\x61mount_to_mint\x18\x08 \x01(\x05\x1a\xb5\x01\n\x17\x44\x65ploy_D2C_Performative\x12\x13\n\x0btoken0_name\x18\x01 \x01(\t\x12\x13\n\x0btoken1_name\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x61taset_url\x18\x03 \x01(\t\x12\x0c\n\x04name\x18\x04 \x01(\t\x12\x0e\n\x06\x61uthor\x18\x05 \x01(\t\x12\x14\n\x0c\x64\x61te_created\x18\x06 \x01(\t\x12\x0f\n\x07license\x18\x07 \x01(\t\x12\x16\n\x0e\x61mount_to_mint\x18\x08 \x01(\x05\x1a\x9c\x02\n\x1d\x44\x65ploy_Algorithm_Performative\x12\x13\n\x0btoken0_name\x18\x01 \x01(\t\x12\x13\n\x0btoken1_name\x18\x02 \x01(\t\x12\x16\n\x0e\x61mount_to_mint\x18\x03 \x01(\x05\x12\x10\n\x08language\x18\x04 \x01(\t\x12\x0e\n\x06\x66ormat\x18\x05 \x01(\t\x12\x0f\n\x07version\x18\x06 \x01(\t\x12\x12\n\nentrypoint\x18\x07 \x01(\t\x12\r\n\x05image\x18\x08 \x01(\t\x12\x0b\n\x03tag\x18\t \x01(\t\x12\x11\n\tfiles_url\x18\n \x01(\t\x12\x0c\n\x04name\x18\x0b \x01(\t\x12\x0e\n\x06\x61uthor\x18\x0c \x01(\t\x12\x14\n\x0c\x64\x61te_created\x18\r \x01(\t\x12\x0f\n\x07license\x18\x0e \x01(\t\x1a<\n$Pool_Deployment_Reciept_Performative\x12\x14\n\x0cpool_address\x18\x01 \x01(\t\x1a`\n\x1f\x44\x65ployment_Reciept_Performative\x12\x0c\n\x04type\x18\x01 \x01(\t\x12\x0b\n\x03\x64id\x18\x02 \x01(\t\x12"\n\x1a\x64\x61tatoken_contract_address\x18\x03 \x01(\t\x1a_\n\x18\x43reate_Pool_Performative\x12\x19\n\x11\x64\x61tatoken_address\x18\x01 \x01(\t\x12\x15\n\rdatatoken_amt\x18\x02 \x01(\x05\x12\x11\n\tocean_amt\x18\x03 \x01(\x05\x1a\x8e\x01\n\x19\x44ownload_Job_Performative\x12\x19\n\x11\x64\x61tatoken_address\x18\x01 \x01(\t\x12\x15\n\rdatatoken_amt\x18\x02 \x01(\x05\x12\x16\n\x0emax_cost_ocean\x18\x03 \x01(\x05\x12\x11\n\tasset_did\x18\x04 \x01(\t\x12\x14\n\x0cpool_address\x18\x05 \x01(\t\x1a\x45\n\x1fPermission_Dataset_Performative\x12\x10\n\x08\x61lgo_did\x18\x01 \x01(\t\x12\x10\n\x08\x64\x61ta_did\x18\x02 \x01(\t\x1a:\n\x14\x44\x32\x43_Job_Performative\x12\x10\n\x08\x64\x61ta_did\x18\x01 \x01(\t\x12\x10\n\x08\x61lgo_did\x18\x02 \x01(\t\x1a\'\n\x14Results_Performative\x12\x0f\n\x07\x63ontent\x18\x01 \x01(\x0c\x1ak\n Purchase_Datatokens_Performative\x12\x16\n\x0epool_addresses\x18\x01 \x03(\t\x12\x16\n\x0e\x64\x61tatoken_amts\x18\x02 \x03(\x05\x12\x17\n\x0fmax_costs_ocean\x18\x03 \x03(\x05\x1a\x64\n\x1dPurchase_Reciept_Performative\x12\x16\n\x0epool_addresses\x18\x01 \x03(\t\x12\x1b\n\x13\x64\x61tatoken_addresses\x18\x02 \x03(\t\x12\x0e\n\x06\x65rrors\x18\x03 \x03(\t\x1a_\n\x19Result_Chunk_Performative\x12\x0f\n\x07\x63ontent\x18\x01 \x01(\x0c\x12\x10\n\x08sequence\x18\x02 \x01(\x05\x12\x0f\n\x07is_last\x18\x03 \x01(\x08\x12\x0e\n\x06\x64igest\x18\x04 \x01(\t\x1aM\n\x1d\x44ownload_Reciept_Performative\x12\x0b\n\x03\x64id\x18\x01 \x01(\t\x12\x11\n\tfile_path\x18\x02 \x01(\t\x12\x0c\n\x04size\x18\x03 \x01(\x03\x1ag\n\x19\x44\x65ploy_Batch_Performative\x12J\n\x0b\x61sset_specs\x18\x01 \x01(\x0b\x32\x35.aea.eightballer.ocean.v0_1_0.OceanMessage.AssetSpecs\x1az\n%Batch_Deployment_Reciept_Performative\x12\r\n\x05types\x18\x01 \x03(\t\x12\x0c\n\x04\x64ids\x18\x02 \x03(\t\x12$\n\x1c\x64\x61tatoken_contract_addresses\x18\x03 \x03(\t\x12\x0e\n\x06\x65rrors\x18\x04 \x03(\t\x1aG\n\x1dSubscribe_Events_Performative\x12\x13\n\x0b\x65vent_names\x18\x01 \x03(\t\x12\x11\n\taddresses\x18\x02 \x03(\t\x1a\xa7\x01\n\x18\x43hain_Event_Performative\x12\x12\n\nevent_name\x18\x01 \x01(\t\x12\x0f\n\x07\x61\x64\x64ress\x18\x02 \x01(\t\x12\x14\n\x0c\x62lock_number\x18\x03 \x01(\x03\x12\x18\n\x10transaction_hash\x18\x04 \x01(\t\x12\x11\n\tlog_index\x18\x05 \x01(\x05\x12\x12\n\nevent_args\x18\x06 \x01(\t\x12\x0f\n\x07removed\x18\x07 \x01(\x08\x1a\x41\n\x1a\x44\x32\x43_Multi_Job_Performative\x12\x11\n\tdata_dids\x18\x01 \x03(\t\x12\x10\n\x08\x61lgo_did\x18\x02 \x01(\t\x1a\x62\n\x18\x44\x32\x43_Results_Performative\x12\x11\n\tdata_dids\x18\x01 \x03(\t\x12\x0f\n\x07job_ids\x18\x02 \x03(\t\x12\x12\n\nfile_paths\x18\x03 \x03(\t\x12\x0e\n\x06\x65rrors\x18\x04 \x03(\t\x1aH\n Permission_Datasets_Performative\x12\x11\n\tdata_dids\x18\x01 \x03(\t\x12\x11\n\talgo_dids\x18\x02 \x03(\t\x1a\x44\n\x1fPermission_Reciept_Performative\x12\x11\n\tdata_dids\x18\x01 \x03(\t\x12\x0e\n\x06\x65rrors\x18\x02 \x03(\t\x1a\x85\x02\n\x12\x45rror_Performative\x12H\n\nerror_code\x18\x01 \x01(\x0b\x32\x34.aea.eightballer.ocean.v0_1_0.OceanMessage.ErrorCode\x12\x11\n\terror_msg\x18\x02 \x01(\t\x12`\n\nerror_data\x18\x03 \x03(\x0b\x32L.aea.eightballer.ocean.v0_1_0.OceanMessage.Error_Performative.ErrorDataEntry\x1a\x30\n\x0e\x45rrorDataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x0c:\x02\x38\x01\x1a\x12\n\x10\x45nd_PerformativeB\x0e\n\x0cperformativeb\x06proto3'
     ),
 )
 
@@ -62,11 +62,25 @@ _OCEANMESSAGE_ERRORCODE_ERRORCODEENUM = _descriptor.EnumDescriptor(
             serialized_options=None,
             type=None,
         ),
+        _descriptor.EnumValueDescriptor(
+            name="SERVICE_UNAVAILABLE",
+            index=5,
+            number=5,
+            serialized_options=None,
+            type=None,
+        ),
+        _descriptor.EnumValueDescriptor(
+            name="OPERATION_FAILED",
+            index=6,
+            number=6,
+            serialized_options=None,
+            type=None,
+        ),
     ],
     containing_type=None,
     serialized_options=None,
-    serialized_start=1304,
-    serialized_end=1431,
+    serialized_start=2519,
+    serialized_end=2693,
 )
 _sym_db.RegisterEnumDescriptor(_OCEANMESSAGE_ERRORCODE_ERRORCODEENUM)
 
@@ -105,20 +119,20 @@ _OCEANMESSAGE_ERRORCODE = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=1203,
-    serialized_end=1431,
+    serialized_start=2417,
+    serialized_end=2693,
 )
 
-_OCEANMESSAGE_DEPLOY_DATA_DOWNLOAD_PERFORMATIVE = _descriptor.Descriptor(
-    name="Deploy_Data_Download_Performative",
-    full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Deploy_Data_Download_Performative",
+_OCEANMESSAGE_ASSETSPECS_ASSETSPEC = _descriptor.Descriptor(
+    name="AssetSpec",
+    full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.AssetSpecs.AssetSpec",
     filename=None,
     file=DESCRIPTOR,
     containing_type=None,
     fields=[
         _descriptor.FieldDescriptor(
-            name="token0_name",
-            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Deploy_Data_Download_Performative.token0_name",
+            name="type",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.AssetSpecs.AssetSpec.type",
             index=0,
             number=1,
             type=9,
@@ -135,8 +149,8 @@ _OCEANMESSAGE_DEPLOY_DATA_DOWNLOAD_PERFORMATIVE = _descriptor.Descriptor(
             file=DESCRIPTOR,
         ),
         _descriptor.FieldDescriptor(
-            name="token1_name",
-            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Deploy_Data_Download_Performative.token1_name",
+            name="token0_name",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.AssetSpecs.AssetSpec.token0_name",
             index=1,
             number=2,
             type=9,
@@ -153,8 +167,8 @@ _OCEANMESSAGE_DEPLOY_DATA_DOWNLOAD_PERFORMATIVE = _descriptor.Descriptor(
             file=DESCRIPTOR,
         ),
         _descriptor.FieldDescriptor(
-            name="dataset_url",
-            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Deploy_Data_Download_Performative.dataset_url",
+            name="token1_name",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.AssetSpecs.AssetSpec.token1_name",
             index=2,
             number=3,
             type=9,
@@ -171,15 +185,15 @@ _OCEANMESSAGE_DEPLOY_DATA_DOWNLOAD_PERFORMATIVE = _descriptor.Descriptor(
             file=DESCRIPTOR,
         ),
         _descriptor.FieldDescriptor(
-            name="name",
-            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Deploy_Data_Download_Performative.name",
+            name="amount_to_mint",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.AssetSpecs.AssetSpec.amount_to_mint",
             index=3,
             number=4,
-            type=9,
-            cpp_type=9,
+            type=5,
+            cpp_type=1,
             label=1,
             has_default_value=False,
-            default_value=_b("").decode("utf-8"),
+            default_value=0,
             message_type=None,
             enum_type=None,
             containing_type=None,
@@ -189,8 +203,8 @@ _OCEANMESSAGE_DEPLOY_DATA_DOWNLOAD_PERFORMATIVE = _descriptor.Descriptor(
             file=DESCRIPTOR,
         ),
         _descriptor.FieldDescriptor(
-            name="author",
-            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Deploy_Data_Download_Performative.author",
+            name="dataset_url",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.AssetSpecs.AssetSpec.dataset_url",
             index=4,
             number=5,
             type=9,
@@ -207,8 +221,8 @@ _OCEANMESSAGE_DEPLOY_DATA_DOWNLOAD_PERFORMATIVE = _descriptor.Descriptor(
             file=DESCRIPTOR,
         ),
         _descriptor.FieldDescriptor(
-            name="date_created",
-            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Deploy_Data_Download_Performative.date_created",
+            name="files_url",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.AssetSpecs.AssetSpec.files_url",
             index=5,
             number=6,
             type=9,
@@ -225,8 +239,8 @@ _OCEANMESSAGE_DEPLOY_DATA_DOWNLOAD_PERFORMATIVE = _descriptor.Descriptor(
             file=DESCRIPTOR,
         ),
         _descriptor.FieldDescriptor(
-            name="license",
-            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Deploy_Data_Download_Performative.license",
+            name="name",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.AssetSpecs.AssetSpec.name",
             index=6,
             number=7,
             type=9,
@@ -243,15 +257,15 @@ _OCEANMESSAGE_DEPLOY_DATA_DOWNLOAD_PERFORMATIVE = _descriptor.Descriptor(
             file=DESCRIPTOR,
         ),
         _descriptor.FieldDescriptor(
-            name="amount_to_mint",
-            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Deploy_Data_Download_Performative.amount_to_mint",
+            name="author",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.AssetSpecs.AssetSpec.author",
             index=7,
             number=8,
-            type=5,
-            cpp_type=1,
+            type=9,
+            cpp_type=9,
             label=1,
             has_default_value=False,
-            default_value=0,
+            default_value=_b("").decode("utf-8"),
             message_type=None,
             enum_type=None,
             containing_type=None,
@@ -260,31 +274,11 @@ _OCEANMESSAGE_DEPLOY_DATA_DOWNLOAD_PERFORMATIVE = _descriptor.Descriptor(
             serialized_options=None,
             file=DESCRIPTOR,
         ),
-    ],
-    extensions=[],
-    nested_types=[],
-    enum_types=[],
-    serialized_options=None,
-    is_extendable=False,
-    syntax="proto3",
-    extension_ranges=[],
-    oneofs=[],
-    serialized_start=1434,
-    serialized_end=1625,
-)
-
-_OCEANMESSAGE_DEPLOY_D2C_PERFORMATIVE = _descriptor.Descriptor(
-    name="Deploy_D2C_Performative",
-    full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Deploy_D2C_Performative",
-    filename=None,
-    file=DESCRIPTOR,
-    containing_type=None,
-    fields=[
         _descriptor.FieldDescriptor(
-            name="token0_name",
-            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Deploy_D2C_Performative.token0_name",
-            index=0,
-            number=1,
+            name="date_created",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.AssetSpecs.AssetSpec.date_created",
+            index=8,
+            number=9,
             type=9,
             cpp_type=9,
             label=1,
@@ -299,10 +293,10 @@ _OCEANMESSAGE_DEPLOY_D2C_PERFORMATIVE = _descriptor.Descriptor(
             file=DESCRIPTOR,
         ),
         _descriptor.FieldDescriptor(
-            name="token1_name",
-            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Deploy_D2C_Performative.token1_name",
-            index=1,
-            number=2,
+            name="license",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.AssetSpecs.AssetSpec.license",
+            index=9,
+            number=10,
             type=9,
             cpp_type=9,
             label=1,
@@ -317,10 +311,10 @@ _OCEANMESSAGE_DEPLOY_D2C_PERFORMATIVE = _descriptor.Descriptor(
             file=DESCRIPTOR,
         ),
         _descriptor.FieldDescriptor(
-            name="dataset_url",
-            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Deploy_D2C_Performative.dataset_url",
-            index=2,
-            number=3,
+            name="language",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.AssetSpecs.AssetSpec.language",
+            index=10,
+            number=11,
             type=9,
             cpp_type=9,
             label=1,
@@ -335,10 +329,10 @@ _OCEANMESSAGE_DEPLOY_D2C_PERFORMATIVE = _descriptor.Descriptor(
             file=DESCRIPTOR,
         ),
         _descriptor.FieldDescriptor(
-            name="name",
-            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Deploy_D2C_Performative.name",
-            index=3,
-            number=4,
+            name="format",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.AssetSpecs.AssetSpec.format",
+            index=11,
+            number=12,
             type=9,
             cpp_type=9,
             label=1,
@@ -353,10 +347,10 @@ _OCEANMESSAGE_DEPLOY_D2C_PERFORMATIVE = _descriptor.Descriptor(
             file=DESCRIPTOR,
         ),
         _descriptor.FieldDescriptor(
-            name="author",
-            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Deploy_D2C_Performative.author",
-            index=4,
-            number=5,
+            name="version",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.AssetSpecs.AssetSpec.version",
+            index=12,
+            number=13,
             type=9,
             cpp_type=9,
             label=1,
@@ -371,10 +365,10 @@ _OCEANMESSAGE_DEPLOY_D2C_PERFORMATIVE = _descriptor.Descriptor(
             file=DESCRIPTOR,
         ),
         _descriptor.FieldDescriptor(
-            name="date_created",
-            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Deploy_D2C_Performative.date_created",
-            index=5,
-            number=6,
+            name="entrypoint",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.AssetSpecs.AssetSpec.entrypoint",
+            index=13,
+            number=14,
             type=9,
             cpp_type=9,
             label=1,
@@ -389,10 +383,10 @@ _OCEANMESSAGE_DEPLOY_D2C_PERFORMATIVE = _descriptor.Descriptor(
             file=DESCRIPTOR,
         ),
         _descriptor.FieldDescriptor(
-            name="license",
-            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Deploy_D2C_Performative.license",
-            index=6,
-            number=7,
+            name="image",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.AssetSpecs.AssetSpec.image",
+            index=14,
+            number=15,
             type=9,
             cpp_type=9,
             label=1,
@@ -407,15 +401,15 @@ _OCEANMESSAGE_DEPLOY_D2C_PERFORMATIVE = _descriptor.Descriptor(
             file=DESCRIPTOR,
         ),
         _descriptor.FieldDescriptor(
-            name="amount_to_mint",
-            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Deploy_D2C_Performative.amount_to_mint",
-            index=7,
-            number=8,
-            type=5,
-            cpp_type=1,
+            name="tag",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.AssetSpecs.AssetSpec.tag",
+            index=15,
+            number=16,
+            type=9,
+            cpp_type=9,
             label=1,
             has_default_value=False,
-            default_value=0,
+            default_value=_b("").decode("utf-8"),
             message_type=None,
             enum_type=None,
             containing_type=None,
@@ -433,20 +427,58 @@ _OCEANMESSAGE_DEPLOY_D2C_PERFORMATIVE = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=1628,
-    serialized_end=1809,
+    serialized_start=2797,
+    serialized_end=3096,
 )
 
-_OCEANMESSAGE_DEPLOY_ALGORITHM_PERFORMATIVE = _descriptor.Descriptor(
-    name="Deploy_Algorithm_Performative",
-    full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Deploy_Algorithm_Performative",
+_OCEANMESSAGE_ASSETSPECS = _descriptor.Descriptor(
+    name="AssetSpecs",
+    full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.AssetSpecs",
+    filename=None,
+    file=DESCRIPTOR,
+    containing_type=None,
+    fields=[
+        _descriptor.FieldDescriptor(
+            name="asset_specs",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.AssetSpecs.asset_specs",
+            index=0,
+            number=1,
+            type=11,
+            cpp_type=10,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+    ],
+    extensions=[],
+    nested_types=[_OCEANMESSAGE_ASSETSPECS_ASSETSPEC,],
+    enum_types=[],
+    serialized_options=None,
+    is_extendable=False,
+    syntax="proto3",
+    extension_ranges=[],
+    oneofs=[],
+    serialized_start=2696,
+    serialized_end=3096,
+)
+
+_OCEANMESSAGE_DEPLOY_DATA_DOWNLOAD_PERFORMATIVE = _descriptor.Descriptor(
+    name="Deploy_Data_Download_Performative",
+    full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Deploy_Data_Download_Performative",
     filename=None,
     file=DESCRIPTOR,
     containing_type=None,
     fields=[
         _descriptor.FieldDescriptor(
             name="token0_name",
-            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Deploy_Algorithm_Performative.token0_name",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Deploy_Data_Download_Performative.token0_name",
             index=0,
             number=1,
             type=9,
@@ -464,7 +496,7 @@ _OCEANMESSAGE_DEPLOY_ALGORITHM_PERFORMATIVE = _descriptor.Descriptor(
         ),
         _descriptor.FieldDescriptor(
             name="token1_name",
-            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Deploy_Algorithm_Performative.token1_name",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Deploy_Data_Download_Performative.token1_name",
             index=1,
             number=2,
             type=9,
@@ -481,15 +513,15 @@ _OCEANMESSAGE_DEPLOY_ALGORITHM_PERFORMATIVE = _descriptor.Descriptor(
             file=DESCRIPTOR,
         ),
         _descriptor.FieldDescriptor(
-            name="amount_to_mint",
-            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Deploy_Algorithm_Performative.amount_to_mint",
+            name="dataset_url",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Deploy_Data_Download_Performative.dataset_url",
             index=2,
             number=3,
-            type=5,
-            cpp_type=1,
+            type=9,
+            cpp_type=9,
             label=1,
             has_default_value=False,
-            default_value=0,
+            default_value=_b("").decode("utf-8"),
             message_type=None,
             enum_type=None,
             containing_type=None,
@@ -499,8 +531,8 @@ _OCEANMESSAGE_DEPLOY_ALGORITHM_PERFORMATIVE = _descriptor.Descriptor(
             file=DESCRIPTOR,
         ),
         _descriptor.FieldDescriptor(
-            name="language",
-            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Deploy_Algorithm_Performative.language",
+            name="name",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Deploy_Data_Download_Performative.name",
             index=3,
             number=4,
             type=9,
@@ -517,8 +549,8 @@ _OCEANMESSAGE_DEPLOY_ALGORITHM_PERFORMATIVE = _descriptor.Descriptor(
             file=DESCRIPTOR,
         ),
         _descriptor.FieldDescriptor(
-            name="format",
-            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Deploy_Algorithm_Performative.format",
+            name="author",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Deploy_Data_Download_Performative.author",
             index=4,
             number=5,
             type=9,
@@ -535,8 +567,8 @@ _OCEANMESSAGE_DEPLOY_ALGORITHM_PERFORMATIVE = _descriptor.Descriptor(
             file=DESCRIPTOR,
         ),
         _descriptor.FieldDescriptor(
-            name="version",
-            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Deploy_Algorithm_Performative.version",
+            name="date_created",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Deploy_Data_Download_Performative.date_created",
             index=5,
             number=6,
             type=9,
@@ -553,8 +585,8 @@ _OCEANMESSAGE_DEPLOY_ALGORITHM_PERFORMATIVE = _descriptor.Descriptor(
             file=DESCRIPTOR,
         ),
         _descriptor.FieldDescriptor(
-            name="entrypoint",
-            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Deploy_Algorithm_Performative.entrypoint",
+            name="license",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Deploy_Data_Download_Performative.license",
             index=6,
             number=7,
             type=9,
@@ -571,15 +603,15 @@ _OCEANMESSAGE_DEPLOY_ALGORITHM_PERFORMATIVE = _descriptor.Descriptor(
             file=DESCRIPTOR,
         ),
         _descriptor.FieldDescriptor(
-            name="image",
-            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Deploy_Algorithm_Performative.image",
+            name="amount_to_mint",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Deploy_Data_Download_Performative.amount_to_mint",
             index=7,
             number=8,
-            type=9,
-            cpp_type=9,
+            type=5,
+            cpp_type=1,
             label=1,
             has_default_value=False,
-            default_value=_b("").decode("utf-8"),
+            default_value=0,
             message_type=None,
             enum_type=None,
             containing_type=None,
@@ -588,11 +620,31 @@ _OCEANMESSAGE_DEPLOY_ALGORITHM_PERFORMATIVE = _descriptor.Descriptor(
             serialized_options=None,
             file=DESCRIPTOR,
         ),
+    ],
+    extensions=[],
+    nested_types=[],
+    enum_types=[],
+    serialized_options=None,
+    is_extendable=False,
+    syntax="proto3",
+    extension_ranges=[],
+    oneofs=[],
+    serialized_start=3099,
+    serialized_end=3290,
+)
+
+_OCEANMESSAGE_DEPLOY_D2C_PERFORMATIVE = _descriptor.Descriptor(
+    name="Deploy_D2C_Performative",
+    full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Deploy_D2C_Performative",
+    filename=None,
+    file=DESCRIPTOR,
+    containing_type=None,
+    fields=[
         _descriptor.FieldDescriptor(
-            name="tag",
-            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Deploy_Algorithm_Performative.tag",
-            index=8,
-            number=9,
+            name="token0_name",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Deploy_D2C_Performative.token0_name",
+            index=0,
+            number=1,
             type=9,
             cpp_type=9,
             label=1,
@@ -607,10 +659,10 @@ _OCEANMESSAGE_DEPLOY_ALGORITHM_PERFORMATIVE = _descriptor.Descriptor(
             file=DESCRIPTOR,
         ),
         _descriptor.FieldDescriptor(
-            name="files_url",
-            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Deploy_Algorithm_Performative.files_url",
-            index=9,
-            number=10,
+            name="token1_name",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Deploy_D2C_Performative.token1_name",
+            index=1,
+            number=2,
             type=9,
             cpp_type=9,
             label=1,
@@ -625,10 +677,10 @@ _OCEANMESSAGE_DEPLOY_ALGORITHM_PERFORMATIVE = _descriptor.Descriptor(
             file=DESCRIPTOR,
         ),
         _descriptor.FieldDescriptor(
-            name="name",
-            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Deploy_Algorithm_Performative.name",
-            index=10,
-            number=11,
+            name="dataset_url",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Deploy_D2C_Performative.dataset_url",
+            index=2,
+            number=3,
             type=9,
             cpp_type=9,
             label=1,
@@ -643,10 +695,10 @@ _OCEANMESSAGE_DEPLOY_ALGORITHM_PERFORMATIVE = _descriptor.Descriptor(
             file=DESCRIPTOR,
         ),
         _descriptor.FieldDescriptor(
-            name="author",
-            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Deploy_Algorithm_Performative.author",
-            index=11,
-            number=12,
+            name="name",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Deploy_D2C_Performative.name",
+            index=3,
+            number=4,
             type=9,
             cpp_type=9,
             label=1,
@@ -661,10 +713,10 @@ _OCEANMESSAGE_DEPLOY_ALGORITHM_PERFORMATIVE = _descriptor.Descriptor(
             file=DESCRIPTOR,
         ),
         _descriptor.FieldDescriptor(
-            name="date_created",
-            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Deploy_Algorithm_Performative.date_created",
-            index=12,
-            number=13,
+            name="author",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Deploy_D2C_Performative.author",
+            index=4,
+            number=5,
             type=9,
             cpp_type=9,
             label=1,
@@ -679,10 +731,10 @@ _OCEANMESSAGE_DEPLOY_ALGORITHM_PERFORMATIVE = _descriptor.Descriptor(
             file=DESCRIPTOR,
         ),
         _descriptor.FieldDescriptor(
-            name="license",
-            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Deploy_Algorithm_Performative.license",
-            index=13,
-            number=14,
+            name="date_created",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Deploy_D2C_Performative.date_created",
+            index=5,
+            number=6,
             type=9,
             cpp_type=9,
             label=1,
@@ -696,31 +748,11 @@ _OCEANMESSAGE_DEPLOY_ALGORITHM_PERFORMATIVE = _descriptor.Descriptor(
             serialized_options=None,
             file=DESCRIPTOR,
         ),
-    ],
-    extensions=[],
-    nested_types=[],
-    enum_types=[],
-    serialized_options=None,
-    is_extendable=False,
-    syntax="proto3",
-    extension_ranges=[],
-    oneofs=[],
-    serialized_start=1812,
-    serialized_end=2096,
-)
-
-_OCEANMESSAGE_POOL_DEPLOYMENT_RECIEPT_PERFORMATIVE = _descriptor.Descriptor(
-    name="Pool_Deployment_Reciept_Performative",
-    full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Pool_Deployment_Reciept_Performative",
-    filename=None,
-    file=DESCRIPTOR,
-    containing_type=None,
-    fields=[
         _descriptor.FieldDescriptor(
-            name="pool_address",
-            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Pool_Deployment_Reciept_Performative.pool_address",
-            index=0,
-            number=1,
+            name="license",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Deploy_D2C_Performative.license",
+            index=6,
+            number=7,
             type=9,
             cpp_type=9,
             label=1,
@@ -734,6 +766,24 @@ _OCEANMESSAGE_POOL_DEPLOYMENT_RECIEPT_PERFORMATIVE = _descriptor.Descriptor(
             serialized_options=None,
             file=DESCRIPTOR,
         ),
+        _descriptor.FieldDescriptor(
+            name="amount_to_mint",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Deploy_D2C_Performative.amount_to_mint",
+            index=7,
+            number=8,
+            type=5,
+            cpp_type=1,
+            label=1,
+            has_default_value=False,
+            default_value=0,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
     ],
     extensions=[],
     nested_types=[],
@@ -743,20 +793,20 @@ _OCEANMESSAGE_POOL_DEPLOYMENT_RECIEPT_PERFORMATIVE = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=2098,
-    serialized_end=2158,
+    serialized_start=3293,
+    serialized_end=3474,
 )
 
-_OCEANMESSAGE_DEPLOYMENT_RECIEPT_PERFORMATIVE = _descriptor.Descriptor(
-    name="Deployment_Reciept_Performative",
-    full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Deployment_Reciept_Performative",
+_OCEANMESSAGE_DEPLOY_ALGORITHM_PERFORMATIVE = _descriptor.Descriptor(
+    name="Deploy_Algorithm_Performative",
+    full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Deploy_Algorithm_Performative",
     filename=None,
     file=DESCRIPTOR,
     containing_type=None,
     fields=[
         _descriptor.FieldDescriptor(
-            name="type",
-            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Deployment_Reciept_Performative.type",
+            name="token0_name",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Deploy_Algorithm_Performative.token0_name",
             index=0,
             number=1,
             type=9,
@@ -773,8 +823,8 @@ _OCEANMESSAGE_DEPLOYMENT_RECIEPT_PERFORMATIVE = _descriptor.Descriptor(
             file=DESCRIPTOR,
         ),
         _descriptor.FieldDescriptor(
-            name="did",
-            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Deployment_Reciept_Performative.did",
+            name="token1_name",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Deploy_Algorithm_Performative.token1_name",
             index=1,
             number=2,
             type=9,
@@ -791,10 +841,28 @@ _OCEANMESSAGE_DEPLOYMENT_RECIEPT_PERFORMATIVE = _descriptor.Descriptor(
             file=DESCRIPTOR,
         ),
         _descriptor.FieldDescriptor(
-            name="datatoken_contract_address",
-            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Deployment_Reciept_Performative.datatoken_contract_address",
+            name="amount_to_mint",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Deploy_Algorithm_Performative.amount_to_mint",
             index=2,
             number=3,
+            type=5,
+            cpp_type=1,
+            label=1,
+            has_default_value=False,
+            default_value=0,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="language",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Deploy_Algorithm_Performative.language",
+            index=3,
+            number=4,
             type=9,
             cpp_type=9,
             label=1,
@@ -808,31 +876,11 @@ _OCEANMESSAGE_DEPLOYMENT_RECIEPT_PERFORMATIVE = _descriptor.Descriptor(
             serialized_options=None,
             file=DESCRIPTOR,
         ),
-    ],
-    extensions=[],
-    nested_types=[],
-    enum_types=[],
-    serialized_options=None,
-    is_extendable=False,
-    syntax="proto3",
-    extension_ranges=[],
-    oneofs=[],
-    serialized_start=2160,
-    serialized_end=2256,
-)
-
-_OCEANMESSAGE_CREATE_POOL_PERFORMATIVE = _descriptor.Descriptor(
-    name="Create_Pool_Performative",
-    full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Create_Pool_Performative",
-    filename=None,
-    file=DESCRIPTOR,
-    containing_type=None,
-    fields=[
         _descriptor.FieldDescriptor(
-            name="datatoken_address",
-            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Create_Pool_Performative.datatoken_address",
-            index=0,
-            number=1,
+            name="format",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Deploy_Algorithm_Performative.format",
+            index=4,
+            number=5,
             type=9,
             cpp_type=9,
             label=1,
@@ -847,15 +895,15 @@ _OCEANMESSAGE_CREATE_POOL_PERFORMATIVE = _descriptor.Descriptor(
             file=DESCRIPTOR,
         ),
         _descriptor.FieldDescriptor(
-            name="datatoken_amt",
-            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Create_Pool_Performative.datatoken_amt",
-            index=1,
-            number=2,
-            type=5,
-            cpp_type=1,
+            name="version",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Deploy_Algorithm_Performative.version",
+            index=5,
+            number=6,
+            type=9,
+            cpp_type=9,
             label=1,
             has_default_value=False,
-            default_value=0,
+            default_value=_b("").decode("utf-8"),
             message_type=None,
             enum_type=None,
             containing_type=None,
@@ -865,15 +913,15 @@ _OCEANMESSAGE_CREATE_POOL_PERFORMATIVE = _descriptor.Descriptor(
             file=DESCRIPTOR,
         ),
         _descriptor.FieldDescriptor(
-            name="ocean_amt",
-            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Create_Pool_Performative.ocean_amt",
-            index=2,
-            number=3,
-            type=5,
-            cpp_type=1,
+            name="entrypoint",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Deploy_Algorithm_Performative.entrypoint",
+            index=6,
+            number=7,
+            type=9,
+            cpp_type=9,
             label=1,
             has_default_value=False,
-            default_value=0,
+            default_value=_b("").decode("utf-8"),
             message_type=None,
             enum_type=None,
             containing_type=None,
@@ -882,31 +930,11 @@ _OCEANMESSAGE_CREATE_POOL_PERFORMATIVE = _descriptor.Descriptor(
             serialized_options=None,
             file=DESCRIPTOR,
         ),
-    ],
-    extensions=[],
-    nested_types=[],
-    enum_types=[],
-    serialized_options=None,
-    is_extendable=False,
-    syntax="proto3",
-    extension_ranges=[],
-    oneofs=[],
-    serialized_start=2258,
-    serialized_end=2353,
-)
-
-_OCEANMESSAGE_DOWNLOAD_JOB_PERFORMATIVE = _descriptor.Descriptor(
-    name="Download_Job_Performative",
-    full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Download_Job_Performative",
-    filename=None,
-    file=DESCRIPTOR,
-    containing_type=None,
-    fields=[
         _descriptor.FieldDescriptor(
-            name="datatoken_address",
-            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Download_Job_Performative.datatoken_address",
-            index=0,
-            number=1,
+            name="image",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Deploy_Algorithm_Performative.image",
+            index=7,
+            number=8,
             type=9,
             cpp_type=9,
             label=1,
@@ -921,15 +949,15 @@ _OCEANMESSAGE_DOWNLOAD_JOB_PERFORMATIVE = _descriptor.Descriptor(
             file=DESCRIPTOR,
         ),
         _descriptor.FieldDescriptor(
-            name="datatoken_amt",
-            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Download_Job_Performative.datatoken_amt",
-            index=1,
-            number=2,
-            type=5,
-            cpp_type=1,
+            name="tag",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Deploy_Algorithm_Performative.tag",
+            index=8,
+            number=9,
+            type=9,
+            cpp_type=9,
             label=1,
             has_default_value=False,
-            default_value=0,
+            default_value=_b("").decode("utf-8"),
             message_type=None,
             enum_type=None,
             containing_type=None,
@@ -939,15 +967,15 @@ _OCEANMESSAGE_DOWNLOAD_JOB_PERFORMATIVE = _descriptor.Descriptor(
             file=DESCRIPTOR,
         ),
         _descriptor.FieldDescriptor(
-            name="max_cost_ocean",
-            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Download_Job_Performative.max_cost_ocean",
-            index=2,
-            number=3,
-            type=5,
-            cpp_type=1,
+            name="files_url",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Deploy_Algorithm_Performative.files_url",
+            index=9,
+            number=10,
+            type=9,
+            cpp_type=9,
             label=1,
             has_default_value=False,
-            default_value=0,
+            default_value=_b("").decode("utf-8"),
             message_type=None,
             enum_type=None,
             containing_type=None,
@@ -957,10 +985,10 @@ _OCEANMESSAGE_DOWNLOAD_JOB_PERFORMATIVE = _descriptor.Descriptor(
             file=DESCRIPTOR,
         ),
         _descriptor.FieldDescriptor(
-            name="asset_did",
-            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Download_Job_Performative.asset_did",
-            index=3,
-            number=4,
+            name="name",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Deploy_Algorithm_Performative.name",
+            index=10,
+            number=11,
             type=9,
             cpp_type=9,
             label=1,
@@ -975,10 +1003,10 @@ _OCEANMESSAGE_DOWNLOAD_JOB_PERFORMATIVE = _descriptor.Descriptor(
             file=DESCRIPTOR,
         ),
         _descriptor.FieldDescriptor(
-            name="pool_address",
-            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Download_Job_Performative.pool_address",
-            index=4,
-            number=5,
+            name="author",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Deploy_Algorithm_Performative.author",
+            index=11,
+            number=12,
             type=9,
             cpp_type=9,
             label=1,
@@ -992,31 +1020,11 @@ _OCEANMESSAGE_DOWNLOAD_JOB_PERFORMATIVE = _descriptor.Descriptor(
             serialized_options=None,
             file=DESCRIPTOR,
         ),
-    ],
-    extensions=[],
-    nested_types=[],
-    enum_types=[],
-    serialized_options=None,
-    is_extendable=False,
-    syntax="proto3",
-    extension_ranges=[],
-    oneofs=[],
-    serialized_start=2356,
-    serialized_end=2498,
-)
-
-_OCEANMESSAGE_PERMISSION_DATASET_PERFORMATIVE = _descriptor.Descriptor(
-    name="Permission_Dataset_Performative",
-    full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Permission_Dataset_Performative",
-    filename=None,
-    file=DESCRIPTOR,
-    containing_type=None,
-    fields=[
         _descriptor.FieldDescriptor(
-            name="algo_did",
-            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Permission_Dataset_Performative.algo_did",
-            index=0,
-            number=1,
+            name="date_created",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Deploy_Algorithm_Performative.date_created",
+            index=12,
+            number=13,
             type=9,
             cpp_type=9,
             label=1,
@@ -1031,10 +1039,10 @@ _OCEANMESSAGE_PERMISSION_DATASET_PERFORMATIVE = _descriptor.Descriptor(
             file=DESCRIPTOR,
         ),
         _descriptor.FieldDescriptor(
-            name="data_did",
-            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Permission_Dataset_Performative.data_did",
-            index=1,
-            number=2,
+            name="license",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Deploy_Algorithm_Performative.license",
+            index=13,
+            number=14,
             type=9,
             cpp_type=9,
             label=1,
@@ -1057,20 +1065,20 @@ _OCEANMESSAGE_PERMISSION_DATASET_PERFORMATIVE = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=2500,
-    serialized_end=2569,
+    serialized_start=3477,
+    serialized_end=3761,
 )
 
-_OCEANMESSAGE_D2C_JOB_PERFORMATIVE = _descriptor.Descriptor(
-    name="D2C_Job_Performative",
-    full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.D2C_Job_Performative",
+_OCEANMESSAGE_POOL_DEPLOYMENT_RECIEPT_PERFORMATIVE = _descriptor.Descriptor(
+    name="Pool_Deployment_Reciept_Performative",
+    full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Pool_Deployment_Reciept_Performative",
     filename=None,
     file=DESCRIPTOR,
     containing_type=None,
     fields=[
         _descriptor.FieldDescriptor(
-            name="data_did",
-            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.D2C_Job_Performative.data_did",
+            name="pool_address",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Pool_Deployment_Reciept_Performative.pool_address",
             index=0,
             number=1,
             type=9,
@@ -1086,9 +1094,47 @@ _OCEANMESSAGE_D2C_JOB_PERFORMATIVE = _descriptor.Descriptor(
             serialized_options=None,
             file=DESCRIPTOR,
         ),
+    ],
+    extensions=[],
+    nested_types=[],
+    enum_types=[],
+    serialized_options=None,
+    is_extendable=False,
+    syntax="proto3",
+    extension_ranges=[],
+    oneofs=[],
+    serialized_start=3763,
+    serialized_end=3823,
+)
+
+_OCEANMESSAGE_DEPLOYMENT_RECIEPT_PERFORMATIVE = _descriptor.Descriptor(
+    name="Deployment_Reciept_Performative",
+    full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Deployment_Reciept_Performative",
+    filename=None,
+    file=DESCRIPTOR,
+    containing_type=None,
+    fields=[
         _descriptor.FieldDescriptor(
-            name="algo_did",
-            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.D2C_Job_Performative.algo_did",
+            name="type",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Deployment_Reciept_Performative.type",
+            index=0,
+            number=1,
+            type=9,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=_b("").decode("utf-8"),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="did",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Deployment_Reciept_Performative.did",
             index=1,
             number=2,
             type=9,
@@ -1104,6 +1150,24 @@ _OCEANMESSAGE_D2C_JOB_PERFORMATIVE = _descriptor.Descriptor(
             serialized_options=None,
             file=DESCRIPTOR,
         ),
+        _descriptor.FieldDescriptor(
+            name="datatoken_contract_address",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Deployment_Reciept_Performative.datatoken_contract_address",
+            index=2,
+            number=3,
+            type=9,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=_b("").decode("utf-8"),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
     ],
     extensions=[],
     nested_types=[],
@@ -1113,27 +1177,63 @@ _OCEANMESSAGE_D2C_JOB_PERFORMATIVE = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=2571,
-    serialized_end=2629,
+    serialized_start=3825,
+    serialized_end=3921,
 )
 
-_OCEANMESSAGE_RESULTS_PERFORMATIVE = _descriptor.Descriptor(
-    name="Results_Performative",
-    full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Results_Performative",
+_OCEANMESSAGE_CREATE_POOL_PERFORMATIVE = _descriptor.Descriptor(
+    name="Create_Pool_Performative",
+    full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Create_Pool_Performative",
     filename=None,
     file=DESCRIPTOR,
     containing_type=None,
     fields=[
         _descriptor.FieldDescriptor(
-            name="content",
-            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Results_Performative.content",
+            name="datatoken_address",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Create_Pool_Performative.datatoken_address",
             index=0,
             number=1,
-            type=12,
+            type=9,
             cpp_type=9,
             label=1,
             has_default_value=False,
-            default_value=_b(""),
+            default_value=_b("").decode("utf-8"),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="datatoken_amt",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Create_Pool_Performative.datatoken_amt",
+            index=1,
+            number=2,
+            type=5,
+            cpp_type=1,
+            label=1,
+            has_default_value=False,
+            default_value=0,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="ocean_amt",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Create_Pool_Performative.ocean_amt",
+            index=2,
+            number=3,
+            type=5,
+            cpp_type=1,
+            label=1,
+            has_default_value=False,
+            default_value=0,
             message_type=None,
             enum_type=None,
             containing_type=None,
@@ -1151,20 +1251,20 @@ _OCEANMESSAGE_RESULTS_PERFORMATIVE = _descriptor.Descriptor(
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=2631,
-    serialized_end=2670,
+    serialized_start=3923,
+    serialized_end=4018,
 )
 
-_OCEANMESSAGE_ERROR_PERFORMATIVE_ERRORDATAENTRY = _descriptor.Descriptor(
-    name="ErrorDataEntry",
-    full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Error_Performative.ErrorDataEntry",
+_OCEANMESSAGE_DOWNLOAD_JOB_PERFORMATIVE = _descriptor.Descriptor(
+    name="Download_Job_Performative",
+    full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Download_Job_Performative",
     filename=None,
     file=DESCRIPTOR,
     containing_type=None,
     fields=[
         _descriptor.FieldDescriptor(
-            name="key",
-            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Error_Performative.ErrorDataEntry.key",
+            name="datatoken_address",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Download_Job_Performative.datatoken_address",
             index=0,
             number=1,
             type=9,
@@ -1181,15 +1281,69 @@ _OCEANMESSAGE_ERROR_PERFORMATIVE_ERRORDATAENTRY = _descriptor.Descriptor(
             file=DESCRIPTOR,
         ),
         _descriptor.FieldDescriptor(
-            name="value",
-            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Error_Performative.ErrorDataEntry.value",
+            name="datatoken_amt",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Download_Job_Performative.datatoken_amt",
             index=1,
             number=2,
-            type=12,
+            type=5,
+            cpp_type=1,
+            label=1,
+            has_default_value=False,
+            default_value=0,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="max_cost_ocean",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Download_Job_Performative.max_cost_ocean",
+            index=2,
+            number=3,
+            type=5,
+            cpp_type=1,
+            label=1,
+            has_default_value=False,
+            default_value=0,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="asset_did",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Download_Job_Performative.asset_did",
+            index=3,
+            number=4,
+            type=9,
             cpp_type=9,
             label=1,
             has_default_value=False,
-            default_value=_b(""),
+            default_value=_b("").decode("utf-8"),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="pool_address",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Download_Job_Performative.pool_address",
+            index=4,
+            number=5,
+            type=9,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=_b("").decode("utf-8"),
             message_type=None,
             enum_type=None,
             containing_type=None,
@@ -1202,27 +1356,1394 @@ _OCEANMESSAGE_ERROR_PERFORMATIVE_ERRORDATAENTRY = _descriptor.Descriptor(
     extensions=[],
     nested_types=[],
     enum_types=[],
-    serialized_options=_b("8\001"),
+    serialized_options=None,
     is_extendable=False,
     syntax="proto3",
     extension_ranges=[],
     oneofs=[],
-    serialized_start=2886,
-    serialized_end=2934,
+    serialized_start=4021,
+    serialized_end=4163,
 )
 
-_OCEANMESSAGE_ERROR_PERFORMATIVE = _descriptor.Descriptor(
-    name="Error_Performative",
-    full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Error_Performative",
+_OCEANMESSAGE_PERMISSION_DATASET_PERFORMATIVE = _descriptor.Descriptor(
+    name="Permission_Dataset_Performative",
+    full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Permission_Dataset_Performative",
     filename=None,
     file=DESCRIPTOR,
     containing_type=None,
     fields=[
         _descriptor.FieldDescriptor(
-            name="error_code",
-            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Error_Performative.error_code",
+            name="algo_did",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Permission_Dataset_Performative.algo_did",
+            index=0,
+            number=1,
+            type=9,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=_b("").decode("utf-8"),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="data_did",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Permission_Dataset_Performative.data_did",
+            index=1,
+            number=2,
+            type=9,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=_b("").decode("utf-8"),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+    ],
+    extensions=[],
+    nested_types=[],
+    enum_types=[],
+    serialized_options=None,
+    is_extendable=False,
+    syntax="proto3",
+    extension_ranges=[],
+    oneofs=[],
+    serialized_start=4165,
+    serialized_end=4234,
+)
+
+_OCEANMESSAGE_D2C_JOB_PERFORMATIVE = _descriptor.Descriptor(
+    name="D2C_Job_Performative",
+    full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.D2C_Job_Performative",
+    filename=None,
+    file=DESCRIPTOR,
+    containing_type=None,
+    fields=[
+        _descriptor.FieldDescriptor(
+            name="data_did",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.D2C_Job_Performative.data_did",
             index=0,
             number=1,
+            type=9,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=_b("").decode("utf-8"),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="algo_did",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.D2C_Job_Performative.algo_did",
+            index=1,
+            number=2,
+            type=9,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=_b("").decode("utf-8"),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+    ],
+    extensions=[],
+    nested_types=[],
+    enum_types=[],
+    serialized_options=None,
+    is_extendable=False,
+    syntax="proto3",
+    extension_ranges=[],
+    oneofs=[],
+    serialized_start=4236,
+    serialized_end=4294,
+)
+
+_OCEANMESSAGE_RESULTS_PERFORMATIVE = _descriptor.Descriptor(
+    name="Results_Performative",
+    full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Results_Performative",
+    filename=None,
+    file=DESCRIPTOR,
+    containing_type=None,
+    fields=[
+        _descriptor.FieldDescriptor(
+            name="content",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Results_Performative.content",
+            index=0,
+            number=1,
+            type=12,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=_b(""),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+    ],
+    extensions=[],
+    nested_types=[],
+    enum_types=[],
+    serialized_options=None,
+    is_extendable=False,
+    syntax="proto3",
+    extension_ranges=[],
+    oneofs=[],
+    serialized_start=4296,
+    serialized_end=4335,
+)
+
+_OCEANMESSAGE_PURCHASE_DATATOKENS_PERFORMATIVE = _descriptor.Descriptor(
+    name="Purchase_Datatokens_Performative",
+    full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Purchase_Datatokens_Performative",
+    filename=None,
+    file=DESCRIPTOR,
+    containing_type=None,
+    fields=[
+        _descriptor.FieldDescriptor(
+            name="pool_addresses",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Purchase_Datatokens_Performative.pool_addresses",
+            index=0,
+            number=1,
+            type=9,
+            cpp_type=9,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="datatoken_amts",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Purchase_Datatokens_Performative.datatoken_amts",
+            index=1,
+            number=2,
+            type=5,
+            cpp_type=1,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="max_costs_ocean",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Purchase_Datatokens_Performative.max_costs_ocean",
+            index=2,
+            number=3,
+            type=5,
+            cpp_type=1,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+    ],
+    extensions=[],
+    nested_types=[],
+    enum_types=[],
+    serialized_options=None,
+    is_extendable=False,
+    syntax="proto3",
+    extension_ranges=[],
+    oneofs=[],
+    serialized_start=4337,
+    serialized_end=4444,
+)
+
+_OCEANMESSAGE_PURCHASE_RECIEPT_PERFORMATIVE = _descriptor.Descriptor(
+    name="Purchase_Reciept_Performative",
+    full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Purchase_Reciept_Performative",
+    filename=None,
+    file=DESCRIPTOR,
+    containing_type=None,
+    fields=[
+        _descriptor.FieldDescriptor(
+            name="pool_addresses",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Purchase_Reciept_Performative.pool_addresses",
+            index=0,
+            number=1,
+            type=9,
+            cpp_type=9,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="datatoken_addresses",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Purchase_Reciept_Performative.datatoken_addresses",
+            index=1,
+            number=2,
+            type=9,
+            cpp_type=9,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="errors",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Purchase_Reciept_Performative.errors",
+            index=2,
+            number=3,
+            type=9,
+            cpp_type=9,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+    ],
+    extensions=[],
+    nested_types=[],
+    enum_types=[],
+    serialized_options=None,
+    is_extendable=False,
+    syntax="proto3",
+    extension_ranges=[],
+    oneofs=[],
+    serialized_start=4446,
+    serialized_end=4546,
+)
+
+_OCEANMESSAGE_RESULT_CHUNK_PERFORMATIVE = _descriptor.Descriptor(
+    name="Result_Chunk_Performative",
+    full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Result_Chunk_Performative",
+    filename=None,
+    file=DESCRIPTOR,
+    containing_type=None,
+    fields=[
+        _descriptor.FieldDescriptor(
+            name="content",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Result_Chunk_Performative.content",
+            index=0,
+            number=1,
+            type=12,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=_b(""),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="sequence",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Result_Chunk_Performative.sequence",
+            index=1,
+            number=2,
+            type=5,
+            cpp_type=1,
+            label=1,
+            has_default_value=False,
+            default_value=0,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="is_last",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Result_Chunk_Performative.is_last",
+            index=2,
+            number=3,
+            type=8,
+            cpp_type=7,
+            label=1,
+            has_default_value=False,
+            default_value=False,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="digest",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Result_Chunk_Performative.digest",
+            index=3,
+            number=4,
+            type=9,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=_b("").decode("utf-8"),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+    ],
+    extensions=[],
+    nested_types=[],
+    enum_types=[],
+    serialized_options=None,
+    is_extendable=False,
+    syntax="proto3",
+    extension_ranges=[],
+    oneofs=[],
+    serialized_start=4548,
+    serialized_end=4643,
+)
+
+_OCEANMESSAGE_DOWNLOAD_RECIEPT_PERFORMATIVE = _descriptor.Descriptor(
+    name="Download_Reciept_Performative",
+    full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Download_Reciept_Performative",
+    filename=None,
+    file=DESCRIPTOR,
+    containing_type=None,
+    fields=[
+        _descriptor.FieldDescriptor(
+            name="did",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Download_Reciept_Performative.did",
+            index=0,
+            number=1,
+            type=9,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=_b("").decode("utf-8"),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="file_path",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Download_Reciept_Performative.file_path",
+            index=1,
+            number=2,
+            type=9,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=_b("").decode("utf-8"),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="size",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Download_Reciept_Performative.size",
+            index=2,
+            number=3,
+            type=3,
+            cpp_type=2,
+            label=1,
+            has_default_value=False,
+            default_value=0,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+    ],
+    extensions=[],
+    nested_types=[],
+    enum_types=[],
+    serialized_options=None,
+    is_extendable=False,
+    syntax="proto3",
+    extension_ranges=[],
+    oneofs=[],
+    serialized_start=4645,
+    serialized_end=4722,
+)
+
+_OCEANMESSAGE_DEPLOY_BATCH_PERFORMATIVE = _descriptor.Descriptor(
+    name="Deploy_Batch_Performative",
+    full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Deploy_Batch_Performative",
+    filename=None,
+    file=DESCRIPTOR,
+    containing_type=None,
+    fields=[
+        _descriptor.FieldDescriptor(
+            name="asset_specs",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Deploy_Batch_Performative.asset_specs",
+            index=0,
+            number=1,
+            type=11,
+            cpp_type=10,
+            label=1,
+            has_default_value=False,
+            default_value=None,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+    ],
+    extensions=[],
+    nested_types=[],
+    enum_types=[],
+    serialized_options=None,
+    is_extendable=False,
+    syntax="proto3",
+    extension_ranges=[],
+    oneofs=[],
+    serialized_start=4724,
+    serialized_end=4827,
+)
+
+_OCEANMESSAGE_BATCH_DEPLOYMENT_RECIEPT_PERFORMATIVE = _descriptor.Descriptor(
+    name="Batch_Deployment_Reciept_Performative",
+    full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Batch_Deployment_Reciept_Performative",
+    filename=None,
+    file=DESCRIPTOR,
+    containing_type=None,
+    fields=[
+        _descriptor.FieldDescriptor(
+            name="types",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Batch_Deployment_Reciept_Performative.types",
+            index=0,
+            number=1,
+            type=9,
+            cpp_type=9,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="dids",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Batch_Deployment_Reciept_Performative.dids",
+            index=1,
+            number=2,
+            type=9,
+            cpp_type=9,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="datatoken_contract_addresses",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Batch_Deployment_Reciept_Performative.datatoken_contract_addresses",
+            index=2,
+            number=3,
+            type=9,
+            cpp_type=9,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="errors",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Batch_Deployment_Reciept_Performative.errors",
+            index=3,
+            number=4,
+            type=9,
+            cpp_type=9,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+    ],
+    extensions=[],
+    nested_types=[],
+    enum_types=[],
+    serialized_options=None,
+    is_extendable=False,
+    syntax="proto3",
+    extension_ranges=[],
+    oneofs=[],
+    serialized_start=4829,
+    serialized_end=4951,
+)
+
+_OCEANMESSAGE_SUBSCRIBE_EVENTS_PERFORMATIVE = _descriptor.Descriptor(
+    name="Subscribe_Events_Performative",
+    full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Subscribe_Events_Performative",
+    filename=None,
+    file=DESCRIPTOR,
+    containing_type=None,
+    fields=[
+        _descriptor.FieldDescriptor(
+            name="event_names",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Subscribe_Events_Performative.event_names",
+            index=0,
+            number=1,
+            type=9,
+            cpp_type=9,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="addresses",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Subscribe_Events_Performative.addresses",
+            index=1,
+            number=2,
+            type=9,
+            cpp_type=9,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+    ],
+    extensions=[],
+    nested_types=[],
+    enum_types=[],
+    serialized_options=None,
+    is_extendable=False,
+    syntax="proto3",
+    extension_ranges=[],
+    oneofs=[],
+    serialized_start=4953,
+    serialized_end=5024,
+)
+
+_OCEANMESSAGE_CHAIN_EVENT_PERFORMATIVE = _descriptor.Descriptor(
+    name="Chain_Event_Performative",
+    full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Chain_Event_Performative",
+    filename=None,
+    file=DESCRIPTOR,
+    containing_type=None,
+    fields=[
+        _descriptor.FieldDescriptor(
+            name="event_name",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Chain_Event_Performative.event_name",
+            index=0,
+            number=1,
+            type=9,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=_b("").decode("utf-8"),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="address",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Chain_Event_Performative.address",
+            index=1,
+            number=2,
+            type=9,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=_b("").decode("utf-8"),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="block_number",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Chain_Event_Performative.block_number",
+            index=2,
+            number=3,
+            type=3,
+            cpp_type=2,
+            label=1,
+            has_default_value=False,
+            default_value=0,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="transaction_hash",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Chain_Event_Performative.transaction_hash",
+            index=3,
+            number=4,
+            type=9,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=_b("").decode("utf-8"),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="log_index",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Chain_Event_Performative.log_index",
+            index=4,
+            number=5,
+            type=5,
+            cpp_type=1,
+            label=1,
+            has_default_value=False,
+            default_value=0,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="event_args",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Chain_Event_Performative.event_args",
+            index=5,
+            number=6,
+            type=9,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=_b("").decode("utf-8"),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="removed",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Chain_Event_Performative.removed",
+            index=6,
+            number=7,
+            type=8,
+            cpp_type=7,
+            label=1,
+            has_default_value=False,
+            default_value=False,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+    ],
+    extensions=[],
+    nested_types=[],
+    enum_types=[],
+    serialized_options=None,
+    is_extendable=False,
+    syntax="proto3",
+    extension_ranges=[],
+    oneofs=[],
+    serialized_start=5027,
+    serialized_end=5194,
+)
+
+_OCEANMESSAGE_D2C_MULTI_JOB_PERFORMATIVE = _descriptor.Descriptor(
+    name="D2C_Multi_Job_Performative",
+    full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.D2C_Multi_Job_Performative",
+    filename=None,
+    file=DESCRIPTOR,
+    containing_type=None,
+    fields=[
+        _descriptor.FieldDescriptor(
+            name="data_dids",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.D2C_Multi_Job_Performative.data_dids",
+            index=0,
+            number=1,
+            type=9,
+            cpp_type=9,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="algo_did",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.D2C_Multi_Job_Performative.algo_did",
+            index=1,
+            number=2,
+            type=9,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=_b("").decode("utf-8"),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+    ],
+    extensions=[],
+    nested_types=[],
+    enum_types=[],
+    serialized_options=None,
+    is_extendable=False,
+    syntax="proto3",
+    extension_ranges=[],
+    oneofs=[],
+    serialized_start=5196,
+    serialized_end=5261,
+)
+
+_OCEANMESSAGE_D2C_RESULTS_PERFORMATIVE = _descriptor.Descriptor(
+    name="D2C_Results_Performative",
+    full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.D2C_Results_Performative",
+    filename=None,
+    file=DESCRIPTOR,
+    containing_type=None,
+    fields=[
+        _descriptor.FieldDescriptor(
+            name="data_dids",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.D2C_Results_Performative.data_dids",
+            index=0,
+            number=1,
+            type=9,
+            cpp_type=9,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="job_ids",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.D2C_Results_Performative.job_ids",
+            index=1,
+            number=2,
+            type=9,
+            cpp_type=9,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="file_paths",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.D2C_Results_Performative.file_paths",
+            index=2,
+            number=3,
+            type=9,
+            cpp_type=9,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="errors",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.D2C_Results_Performative.errors",
+            index=3,
+            number=4,
+            type=9,
+            cpp_type=9,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+    ],
+    extensions=[],
+    nested_types=[],
+    enum_types=[],
+    serialized_options=None,
+    is_extendable=False,
+    syntax="proto3",
+    extension_ranges=[],
+    oneofs=[],
+    serialized_start=5263,
+    serialized_end=5361,
+)
+
+_OCEANMESSAGE_PERMISSION_DATASETS_PERFORMATIVE = _descriptor.Descriptor(
+    name="Permission_Datasets_Performative",
+    full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Permission_Datasets_Performative",
+    filename=None,
+    file=DESCRIPTOR,
+    containing_type=None,
+    fields=[
+        _descriptor.FieldDescriptor(
+            name="data_dids",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Permission_Datasets_Performative.data_dids",
+            index=0,
+            number=1,
+            type=9,
+            cpp_type=9,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="algo_dids",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Permission_Datasets_Performative.algo_dids",
+            index=1,
+            number=2,
+            type=9,
+            cpp_type=9,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+    ],
+    extensions=[],
+    nested_types=[],
+    enum_types=[],
+    serialized_options=None,
+    is_extendable=False,
+    syntax="proto3",
+    extension_ranges=[],
+    oneofs=[],
+    serialized_start=5363,
+    serialized_end=5435,
+)
+
+_OCEANMESSAGE_PERMISSION_RECIEPT_PERFORMATIVE = _descriptor.Descriptor(
+    name="Permission_Reciept_Performative",
+    full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Permission_Reciept_Performative",
+    filename=None,
+    file=DESCRIPTOR,
+    containing_type=None,
+    fields=[
+        _descriptor.FieldDescriptor(
+            name="data_dids",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Permission_Reciept_Performative.data_dids",
+            index=0,
+            number=1,
+            type=9,
+            cpp_type=9,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="errors",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Permission_Reciept_Performative.errors",
+            index=1,
+            number=2,
+            type=9,
+            cpp_type=9,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+    ],
+    extensions=[],
+    nested_types=[],
+    enum_types=[],
+    serialized_options=None,
+    is_extendable=False,
+    syntax="proto3",
+    extension_ranges=[],
+    oneofs=[],
+    serialized_start=5437,
+    serialized_end=5505,
+)
+
+_OCEANMESSAGE_ERROR_PERFORMATIVE_ERRORDATAENTRY = _descriptor.Descriptor(
+    name="ErrorDataEntry",
+    full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Error_Performative.ErrorDataEntry",
+    filename=None,
+    file=DESCRIPTOR,
+    containing_type=None,
+    fields=[
+        _descriptor.FieldDescriptor(
+            name="key",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Error_Performative.ErrorDataEntry.key",
+            index=0,
+            number=1,
+            type=9,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=_b("").decode("utf-8"),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="value",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Error_Performative.ErrorDataEntry.value",
+            index=1,
+            number=2,
+            type=12,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=_b(""),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+    ],
+    extensions=[],
+    nested_types=[],
+    enum_types=[],
+    serialized_options=_b("8\001"),
+    is_extendable=False,
+    syntax="proto3",
+    extension_ranges=[],
+    oneofs=[],
+    serialized_start=5721,
+    serialized_end=5769,
+)
+
+_OCEANMESSAGE_ERROR_PERFORMATIVE = _descriptor.Descriptor(
+    name="Error_Performative",
+    full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Error_Performative",
+    filename=None,
+    file=DESCRIPTOR,
+    containing_type=None,
+    fields=[
+        _descriptor.FieldDescriptor(
+            name="error_code",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Error_Performative.error_code",
+            index=0,
+            number=1,
+            type=11,
+            cpp_type=10,
+            label=1,
+            has_default_value=False,
+            default_value=None,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="error_msg",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Error_Performative.error_msg",
+            index=1,
+            number=2,
+            type=9,
+            cpp_type=9,
+            label=1,
+            has_default_value=False,
+            default_value=_b("").decode("utf-8"),
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="error_data",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Error_Performative.error_data",
+            index=2,
+            number=3,
+            type=11,
+            cpp_type=10,
+            label=3,
+            has_default_value=False,
+            default_value=[],
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+    ],
+    extensions=[],
+    nested_types=[_OCEANMESSAGE_ERROR_PERFORMATIVE_ERRORDATAENTRY,],
+    enum_types=[],
+    serialized_options=None,
+    is_extendable=False,
+    syntax="proto3",
+    extension_ranges=[],
+    oneofs=[],
+    serialized_start=5508,
+    serialized_end=5769,
+)
+
+_OCEANMESSAGE_END_PERFORMATIVE = _descriptor.Descriptor(
+    name="End_Performative",
+    full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.End_Performative",
+    filename=None,
+    file=DESCRIPTOR,
+    containing_type=None,
+    fields=[],
+    extensions=[],
+    nested_types=[],
+    enum_types=[],
+    serialized_options=None,
+    is_extendable=False,
+    syntax="proto3",
+    extension_ranges=[],
+    oneofs=[],
+    serialized_start=5771,
+    serialized_end=5789,
+)
+
+_OCEANMESSAGE = _descriptor.Descriptor(
+    name="OceanMessage",
+    full_name="aea.eightballer.ocean.v0_1_0.OceanMessage",
+    filename=None,
+    file=DESCRIPTOR,
+    containing_type=None,
+    fields=[
+        _descriptor.FieldDescriptor(
+            name="batch_deployment_reciept",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.batch_deployment_reciept",
+            index=0,
+            number=5,
+            type=11,
+            cpp_type=10,
+            label=1,
+            has_default_value=False,
+            default_value=None,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="chain_event",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.chain_event",
+            index=1,
+            number=6,
+            type=11,
+            cpp_type=10,
+            label=1,
+            has_default_value=False,
+            default_value=None,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="create_pool",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.create_pool",
+            index=2,
+            number=7,
+            type=11,
+            cpp_type=10,
+            label=1,
+            has_default_value=False,
+            default_value=None,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="d2c_job",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.d2c_job",
+            index=3,
+            number=8,
+            type=11,
+            cpp_type=10,
+            label=1,
+            has_default_value=False,
+            default_value=None,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="d2c_multi_job",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.d2c_multi_job",
+            index=4,
+            number=9,
+            type=11,
+            cpp_type=10,
+            label=1,
+            has_default_value=False,
+            default_value=None,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="d2c_results",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.d2c_results",
+            index=5,
+            number=10,
+            type=11,
+            cpp_type=10,
+            label=1,
+            has_default_value=False,
+            default_value=None,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="deploy_algorithm",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.deploy_algorithm",
+            index=6,
+            number=11,
+            type=11,
+            cpp_type=10,
+            label=1,
+            has_default_value=False,
+            default_value=None,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="deploy_batch",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.deploy_batch",
+            index=7,
+            number=12,
+            type=11,
+            cpp_type=10,
+            label=1,
+            has_default_value=False,
+            default_value=None,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="deploy_d2c",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.deploy_d2c",
+            index=8,
+            number=13,
+            type=11,
+            cpp_type=10,
+            label=1,
+            has_default_value=False,
+            default_value=None,
+            message_type=None,
+            enum_type=None,
+            containing_type=None,
+            is_extension=False,
+            extension_scope=None,
+            serialized_options=None,
+            file=DESCRIPTOR,
+        ),
+        _descriptor.FieldDescriptor(
+            name="deploy_data_download",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.deploy_data_download",
+            index=9,
+            number=14,
             type=11,
             cpp_type=10,
             label=1,
@@ -1237,15 +2758,15 @@ _OCEANMESSAGE_ERROR_PERFORMATIVE = _descriptor.Descriptor(
             file=DESCRIPTOR,
         ),
         _descriptor.FieldDescriptor(
-            name="error_msg",
-            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Error_Performative.error_msg",
-            index=1,
-            number=2,
-            type=9,
-            cpp_type=9,
+            name="deployment_reciept",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.deployment_reciept",
+            index=10,
+            number=15,
+            type=11,
+            cpp_type=10,
             label=1,
             has_default_value=False,
-            default_value=_b("").decode("utf-8"),
+            default_value=None,
             message_type=None,
             enum_type=None,
             containing_type=None,
@@ -1255,15 +2776,15 @@ _OCEANMESSAGE_ERROR_PERFORMATIVE = _descriptor.Descriptor(
             file=DESCRIPTOR,
         ),
         _descriptor.FieldDescriptor(
-            name="error_data",
-            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.Error_Performative.error_data",
-            index=2,
-            number=3,
+            name="download_job",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.download_job",
+            index=11,
+            number=16,
             type=11,
             cpp_type=10,
-            label=3,
+            label=1,
             has_default_value=False,
-            default_value=[],
+            default_value=None,
             message_type=None,
             enum_type=None,
             containing_type=None,
@@ -1272,50 +2793,11 @@ _OCEANMESSAGE_ERROR_PERFORMATIVE = _descriptor.Descriptor(
             serialized_options=None,
             file=DESCRIPTOR,
         ),
-    ],
-    extensions=[],
-    nested_types=[_OCEANMESSAGE_ERROR_PERFORMATIVE_ERRORDATAENTRY,],
-    enum_types=[],
-    serialized_options=None,
-    is_extendable=False,
-    syntax="proto3",
-    extension_ranges=[],
-    oneofs=[],
-    serialized_start=2673,
-    serialized_end=2934,
-)
-
-_OCEANMESSAGE_END_PERFORMATIVE = _descriptor.Descriptor(
-    name="End_Performative",
-    full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.End_Performative",
-    filename=None,
-    file=DESCRIPTOR,
-    containing_type=None,
-    fields=[],
-    extensions=[],
-    nested_types=[],
-    enum_types=[],
-    serialized_options=None,
-    is_extendable=False,
-    syntax="proto3",
-    extension_ranges=[],
-    oneofs=[],
-    serialized_start=2936,
-    serialized_end=2954,
-)
-
-_OCEANMESSAGE = _descriptor.Descriptor(
-    name="OceanMessage",
-    full_name="aea.eightballer.ocean.v0_1_0.OceanMessage",
-    filename=None,
-    file=DESCRIPTOR,
-    containing_type=None,
-    fields=[
         _descriptor.FieldDescriptor(
-            name="create_pool",
-            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.create_pool",
-            index=0,
-            number=5,
+            name="download_reciept",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.download_reciept",
+            index=12,
+            number=17,
             type=11,
             cpp_type=10,
             label=1,
@@ -1330,10 +2812,10 @@ _OCEANMESSAGE = _descriptor.Descriptor(
             file=DESCRIPTOR,
         ),
         _descriptor.FieldDescriptor(
-            name="d2c_job",
-            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.d2c_job",
-            index=1,
-            number=6,
+            name="end",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.end",
+            index=13,
+            number=18,
             type=11,
             cpp_type=10,
             label=1,
@@ -1348,10 +2830,10 @@ _OCEANMESSAGE = _descriptor.Descriptor(
             file=DESCRIPTOR,
         ),
         _descriptor.FieldDescriptor(
-            name="deploy_algorithm",
-            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.deploy_algorithm",
-            index=2,
-            number=7,
+            name="error",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.error",
+            index=14,
+            number=19,
             type=11,
             cpp_type=10,
             label=1,
@@ -1366,10 +2848,10 @@ _OCEANMESSAGE = _descriptor.Descriptor(
             file=DESCRIPTOR,
         ),
         _descriptor.FieldDescriptor(
-            name="deploy_d2c",
-            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.deploy_d2c",
-            index=3,
-            number=8,
+            name="permission_dataset",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.permission_dataset",
+            index=15,
+            number=20,
             type=11,
             cpp_type=10,
             label=1,
@@ -1384,10 +2866,10 @@ _OCEANMESSAGE = _descriptor.Descriptor(
             file=DESCRIPTOR,
         ),
         _descriptor.FieldDescriptor(
-            name="deploy_data_download",
-            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.deploy_data_download",
-            index=4,
-            number=9,
+            name="permission_datasets",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.permission_datasets",
+            index=16,
+            number=21,
             type=11,
             cpp_type=10,
             label=1,
@@ -1402,10 +2884,10 @@ _OCEANMESSAGE = _descriptor.Descriptor(
             file=DESCRIPTOR,
         ),
         _descriptor.FieldDescriptor(
-            name="deployment_reciept",
-            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.deployment_reciept",
-            index=5,
-            number=10,
+            name="permission_reciept",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.permission_reciept",
+            index=17,
+            number=22,
             type=11,
             cpp_type=10,
             label=1,
@@ -1420,10 +2902,10 @@ _OCEANMESSAGE = _descriptor.Descriptor(
             file=DESCRIPTOR,
         ),
         _descriptor.FieldDescriptor(
-            name="download_job",
-            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.download_job",
-            index=6,
-            number=11,
+            name="pool_deployment_reciept",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.pool_deployment_reciept",
+            index=18,
+            number=23,
             type=11,
             cpp_type=10,
             label=1,
@@ -1438,10 +2920,10 @@ _OCEANMESSAGE = _descriptor.Descriptor(
             file=DESCRIPTOR,
         ),
         _descriptor.FieldDescriptor(
-            name="end",
-            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.end",
-            index=7,
-            number=12,
+            name="purchase_datatokens",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.purchase_datatokens",
+            index=19,
+            number=24,
             type=11,
             cpp_type=10,
             label=1,
@@ -1456,10 +2938,10 @@ _OCEANMESSAGE = _descriptor.Descriptor(
             file=DESCRIPTOR,
         ),
         _descriptor.FieldDescriptor(
-            name="error",
-            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.error",
-            index=8,
-            number=13,
+            name="purchase_reciept",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.purchase_reciept",
+            index=20,
+            number=25,
             type=11,
             cpp_type=10,
             label=1,
@@ -1474,10 +2956,10 @@ _OCEANMESSAGE = _descriptor.Descriptor(
             file=DESCRIPTOR,
         ),
         _descriptor.FieldDescriptor(
-            name="permission_dataset",
-            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.permission_dataset",
-            index=9,
-            number=14,
+            name="result_chunk",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.result_chunk",
+            index=21,
+            number=26,
             type=11,
             cpp_type=10,
             label=1,
@@ -1492,10 +2974,10 @@ _OCEANMESSAGE = _descriptor.Descriptor(
             file=DESCRIPTOR,
         ),
         _descriptor.FieldDescriptor(
-            name="pool_deployment_reciept",
-            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.pool_deployment_reciept",
-            index=10,
-            number=15,
+            name="results",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.results",
+            index=22,
+            number=27,
             type=11,
             cpp_type=10,
             label=1,
@@ -1510,10 +2992,10 @@ _OCEANMESSAGE = _descriptor.Descriptor(
             file=DESCRIPTOR,
         ),
         _descriptor.FieldDescriptor(
-            name="results",
-            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.results",
-            index=11,
-            number=16,
+            name="subscribe_events",
+            full_name="aea.eightballer.ocean.v0_1_0.OceanMessage.subscribe_events",
+            index=23,
+            number=28,
             type=11,
             cpp_type=10,
             label=1,
@@ -1531,6 +3013,7 @@ _OCEANMESSAGE = _descriptor.Descriptor(
     extensions=[],
     nested_types=[
         _OCEANMESSAGE_ERRORCODE,
+        _OCEANMESSAGE_ASSETSPECS,
         _OCEANMESSAGE_DEPLOY_DATA_DOWNLOAD_PERFORMATIVE,
         _OCEANMESSAGE_DEPLOY_D2C_PERFORMATIVE,
         _OCEANMESSAGE_DEPLOY_ALGORITHM_PERFORMATIVE,
@@ -1541,6 +3024,18 @@ _OCEANMESSAGE = _descriptor.Descriptor(
         _OCEANMESSAGE_PERMISSION_DATASET_PERFORMATIVE,
         _OCEANMESSAGE_D2C_JOB_PERFORMATIVE,
         _OCEANMESSAGE_RESULTS_PERFORMATIVE,
+        _OCEANMESSAGE_PURCHASE_DATATOKENS_PERFORMATIVE,
+        _OCEANMESSAGE_PURCHASE_RECIEPT_PERFORMATIVE,
+        _OCEANMESSAGE_RESULT_CHUNK_PERFORMATIVE,
+        _OCEANMESSAGE_DOWNLOAD_RECIEPT_PERFORMATIVE,
+        _OCEANMESSAGE_DEPLOY_BATCH_PERFORMATIVE,
+        _OCEANMESSAGE_BATCH_DEPLOYMENT_RECIEPT_PERFORMATIVE,
+        _OCEANMESSAGE_SUBSCRIBE_EVENTS_PERFORMATIVE,
+        _OCEANMESSAGE_CHAIN_EVENT_PERFORMATIVE,
+        _OCEANMESSAGE_D2C_MULTI_JOB_PERFORMATIVE,
+        _OCEANMESSAGE_D2C_RESULTS_PERFORMATIVE,
+        _OCEANMESSAGE_PERMISSION_DATASETS_PERFORMATIVE,
+        _OCEANMESSAGE_PERMISSION_RECIEPT_PERFORMATIVE,
         _OCEANMESSAGE_ERROR_PERFORMATIVE,
         _OCEANMESSAGE_END_PERFORMATIVE,
     ],
@@ -1559,7 +3054,7 @@ _OCEANMESSAGE = _descriptor.Descriptor(
         ),
     ],
     serialized_start=46,
-    serialized_end=2970,
+    serialized_end=5805,
 )
 
 _OCEANMESSAGE_ERRORCODE.fields_by_name[
@@ -1567,6 +3062,11 @@ _OCEANMESSAGE_ERRORCODE.fields_by_name[
 ].enum_type = _OCEANMESSAGE_ERRORCODE_ERRORCODEENUM
 _OCEANMESSAGE_ERRORCODE.containing_type = _OCEANMESSAGE
 _OCEANMESSAGE_ERRORCODE_ERRORCODEENUM.containing_type = _OCEANMESSAGE_ERRORCODE
+_OCEANMESSAGE_ASSETSPECS_ASSETSPEC.containing_type = _OCEANMESSAGE_ASSETSPECS
+_OCEANMESSAGE_ASSETSPECS.fields_by_name[
+    "asset_specs"
+].message_type = _OCEANMESSAGE_ASSETSPECS_ASSETSPEC
+_OCEANMESSAGE_ASSETSPECS.containing_type = _OCEANMESSAGE
 _OCEANMESSAGE_DEPLOY_DATA_DOWNLOAD_PERFORMATIVE.containing_type = _OCEANMESSAGE
 _OCEANMESSAGE_DEPLOY_D2C_PERFORMATIVE.containing_type = _OCEANMESSAGE
 _OCEANMESSAGE_DEPLOY_ALGORITHM_PERFORMATIVE.containing_type = _OCEANMESSAGE
@@ -1577,6 +3077,21 @@ _OCEANMESSAGE_DOWNLOAD_JOB_PERFORMATIVE.containing_type = _OCEANMESSAGE
 _OCEANMESSAGE_PERMISSION_DATASET_PERFORMATIVE.containing_type = _OCEANMESSAGE
 _OCEANMESSAGE_D2C_JOB_PERFORMATIVE.containing_type = _OCEANMESSAGE
 _OCEANMESSAGE_RESULTS_PERFORMATIVE.containing_type = _OCEANMESSAGE
+_OCEANMESSAGE_PURCHASE_DATATOKENS_PERFORMATIVE.containing_type = _OCEANMESSAGE
+_OCEANMESSAGE_PURCHASE_RECIEPT_PERFORMATIVE.containing_type = _OCEANMESSAGE
+_OCEANMESSAGE_RESULT_CHUNK_PERFORMATIVE.containing_type = _OCEANMESSAGE
+_OCEANMESSAGE_DOWNLOAD_RECIEPT_PERFORMATIVE.containing_type = _OCEANMESSAGE
+_OCEANMESSAGE_DEPLOY_BATCH_PERFORMATIVE.fields_by_name[
+    "asset_specs"
+].message_type = _OCEANMESSAGE_ASSETSPECS
+_OCEANMESSAGE_DEPLOY_BATCH_PERFORMATIVE.containing_type = _OCEANMESSAGE
+_OCEANMESSAGE_BATCH_DEPLOYMENT_RECIEPT_PERFORMATIVE.containing_type = _OCEANMESSAGE
+_OCEANMESSAGE_SUBSCRIBE_EVENTS_PERFORMATIVE.containing_type = _OCEANMESSAGE
+_OCEANMESSAGE_CHAIN_EVENT_PERFORMATIVE.containing_type = _OCEANMESSAGE
+_OCEANMESSAGE_D2C_MULTI_JOB_PERFORMATIVE.containing_type = _OCEANMESSAGE
+_OCEANMESSAGE_D2C_RESULTS_PERFORMATIVE.containing_type = _OCEANMESSAGE
+_OCEANMESSAGE_PERMISSION_DATASETS_PERFORMATIVE.containing_type = _OCEANMESSAGE
+_OCEANMESSAGE_PERMISSION_RECIEPT_PERFORMATIVE.containing_type = _OCEANMESSAGE
 _OCEANMESSAGE_ERROR_PERFORMATIVE_ERRORDATAENTRY.containing_type = (
     _OCEANMESSAGE_ERROR_PERFORMATIVE
 )
@@ -1588,15 +3103,30 @@ _OCEANMESSAGE_ERROR_PERFORMATIVE.fields_by_name[
 ].message_type = _OCEANMESSAGE_ERROR_PERFORMATIVE_ERRORDATAENTRY
 _OCEANMESSAGE_ERROR_PERFORMATIVE.containing_type = _OCEANMESSAGE
 _OCEANMESSAGE_END_PERFORMATIVE.containing_type = _OCEANMESSAGE
+_OCEANMESSAGE.fields_by_name[
+    "batch_deployment_reciept"
+].message_type = _OCEANMESSAGE_BATCH_DEPLOYMENT_RECIEPT_PERFORMATIVE
+_OCEANMESSAGE.fields_by_name[
+    "chain_event"
+].message_type = _OCEANMESSAGE_CHAIN_EVENT_PERFORMATIVE
 _OCEANMESSAGE.fields_by_name[
     "create_pool"
 ].message_type = _OCEANMESSAGE_CREATE_POOL_PERFORMATIVE
 _OCEANMESSAGE.fields_by_name[
     "d2c_job"
 ].message_type = _OCEANMESSAGE_D2C_JOB_PERFORMATIVE
+_OCEANMESSAGE.fields_by_name[
+    "d2c_multi_job"
+].message_type = _OCEANMESSAGE_D2C_MULTI_JOB_PERFORMATIVE
+_OCEANMESSAGE.fields_by_name[
+    "d2c_results"
+].message_type = _OCEANMESSAGE_D2C_RESULTS_PERFORMATIVE
 _OCEANMESSAGE.fields_by_name[
     "deploy_algorithm"
 ].message_type = _OCEANMESSAGE_DEPLOY_ALGORITHM_PERFORMATIVE
+_OCEANMESSAGE.fields_by_name[
+    "deploy_batch"
+].message_type = _OCEANMESSAGE_DEPLOY_BATCH_PERFORMATIVE
 _OCEANMESSAGE.fields_by_name[
     "deploy_d2c"
 ].message_type = _OCEANMESSAGE_DEPLOY_D2C_PERFORMATIVE
@@ -1609,17 +3139,50 @@ _OCEANMESSAGE.fields_by_name[
 _OCEANMESSAGE.fields_by_name[
     "download_job"
 ].message_type = _OCEANMESSAGE_DOWNLOAD_JOB_PERFORMATIVE
+_OCEANMESSAGE.fields_by_name[
+    "download_reciept"
+].message_type = _OCEANMESSAGE_DOWNLOAD_RECIEPT_PERFORMATIVE
 _OCEANMESSAGE.fields_by_name["end"].message_type = _OCEANMESSAGE_END_PERFORMATIVE
 _OCEANMESSAGE.fields_by_name["error"].message_type = _OCEANMESSAGE_ERROR_PERFORMATIVE
 _OCEANMESSAGE.fields_by_name[
     "permission_dataset"
 ].message_type = _OCEANMESSAGE_PERMISSION_DATASET_PERFORMATIVE
+_OCEANMESSAGE.fields_by_name[
+    "permission_datasets"
+].message_type = _OCEANMESSAGE_PERMISSION_DATASETS_PERFORMATIVE
+_OCEANMESSAGE.fields_by_name[
+    "permission_reciept"
+].message_type = _OCEANMESSAGE_PERMISSION_RECIEPT_PERFORMATIVE
 _OCEANMESSAGE.fields_by_name[
     "pool_deployment_reciept"
 ].message_type = _OCEANMESSAGE_POOL_DEPLOYMENT_RECIEPT_PERFORMATIVE
+_OCEANMESSAGE.fields_by_name[
+    "purchase_datatokens"
+].message_type = _OCEANMESSAGE_PURCHASE_DATATOKENS_PERFORMATIVE
+_OCEANMESSAGE.fields_by_name[
+    "purchase_reciept"
+].message_type = _OCEANMESSAGE_PURCHASE_RECIEPT_PERFORMATIVE
+_OCEANMESSAGE.fields_by_name[
+    "result_chunk"
+].message_type = _OCEANMESSAGE_RESULT_CHUNK_PERFORMATIVE
 _OCEANMESSAGE.fields_by_name[
     "results"
 ].message_type = _OCEANMESSAGE_RESULTS_PERFORMATIVE
+_OCEANMESSAGE.fields_by_name[
+    "subscribe_events"
+].message_type = _OCEANMESSAGE_SUBSCRIBE_EVENTS_PERFORMATIVE
+_OCEANMESSAGE.oneofs_by_name["performative"].fields.append(
+    _OCEANMESSAGE.fields_by_name["batch_deployment_reciept"]
+)
+_OCEANMESSAGE.fields_by_name[
+    "batch_deployment_reciept"
+].containing_oneof = _OCEANMESSAGE.oneofs_by_name["performative"]
+_OCEANMESSAGE.oneofs_by_name["performative"].fields.append(
+    _OCEANMESSAGE.fields_by_name["chain_event"]
+)
+_OCEANMESSAGE.fields_by_name[
+    "chain_event"
+].containing_oneof = _OCEANMESSAGE.oneofs_by_name["performative"]
 _OCEANMESSAGE.oneofs_by_name["performative"].fields.append(
     _OCEANMESSAGE.fields_by_name["create_pool"]
 )
@@ -1632,12 +3195,30 @@ _OCEANMESSAGE.oneofs_by_name["performative"].fields.append(
 _OCEANMESSAGE.fields_by_name["d2c_job"].containing_oneof = _OCEANMESSAGE.oneofs_by_name[
     "performative"
 ]
+_OCEANMESSAGE.oneofs_by_name["performative"].fields.append(
+    _OCEANMESSAGE.fields_by_name["d2c_multi_job"]
+)
+_OCEANMESSAGE.fields_by_name[
+    "d2c_multi_job"
+].containing_oneof = _OCEANMESSAGE.oneofs_by_name["performative"]
+_OCEANMESSAGE.oneofs_by_name["performative"].fields.append(
+    _OCEANMESSAGE.fields_by_name["d2c_results"]
+)
+_OCEANMESSAGE.fields_by_name[
+    "d2c_results"
+].containing_oneof = _OCEANMESSAGE.oneofs_by_name["performative"]
 _OCEANMESSAGE.oneofs_by_name["performative"].fields.append(
     _OCEANMESSAGE.fields_by_name["deploy_algorithm"]
 )
 _OCEANMESSAGE.fields_by_name[
     "deploy_algorithm"
 ].containing_oneof = _OCEANMESSAGE.oneofs_by_name["performative"]
+_OCEANMESSAGE.oneofs_by_name["performative"].fields.append(
+    _OCEANMESSAGE.fields_by_name["deploy_batch"]
+)
+_OCEANMESSAGE.fields_by_name[
+    "deploy_batch"
+].containing_oneof = _OCEANMESSAGE.oneofs_by_name["performative"]
 _OCEANMESSAGE.oneofs_by_name["performative"].fields.append(
     _OCEANMESSAGE.fields_by_name["deploy_d2c"]
 )
@@ -1662,6 +3243,12 @@ _OCEANMESSAGE.oneofs_by_name["performative"].fields.append(
 _OCEANMESSAGE.fields_by_name[
     "download_job"
 ].containing_oneof = _OCEANMESSAGE.oneofs_by_name["performative"]
+_OCEANMESSAGE.oneofs_by_name["performative"].fields.append(
+    _OCEANMESSAGE.fields_by_name["download_reciept"]
+)
+_OCEANMESSAGE.fields_by_name[
+    "download_reciept"
+].containing_oneof = _OCEANMESSAGE.oneofs_by_name["performative"]
 _OCEANMESSAGE.oneofs_by_name["performative"].fields.append(
     _OCEANMESSAGE.fields_by_name["end"]
 )
@@ -1680,18 +3267,54 @@ _OCEANMESSAGE.oneofs_by_name["performative"].fields.append(
 _OCEANMESSAGE.fields_by_name[
     "permission_dataset"
 ].containing_oneof = _OCEANMESSAGE.oneofs_by_name["performative"]
+_OCEANMESSAGE.oneofs_by_name["performative"].fields.append(
+    _OCEANMESSAGE.fields_by_name["permission_datasets"]
+)
+_OCEANMESSAGE.fields_by_name[
+    "permission_datasets"
+].containing_oneof = _OCEANMESSAGE.oneofs_by_name["performative"]
+_OCEANMESSAGE.oneofs_by_name["performative"].fields.append(
+    _OCEANMESSAGE.fields_by_name["permission_reciept"]
+)
+_OCEANMESSAGE.fields_by_name[
+    "permission_reciept"
+].containing_oneof = _OCEANMESSAGE.oneofs_by_name["performative"]
 _OCEANMESSAGE.oneofs_by_name["performative"].fields.append(
     _OCEANMESSAGE.fields_by_name["pool_deployment_reciept"]
 )
 _OCEANMESSAGE.fields_by_name[
     "pool_deployment_reciept"
 ].containing_oneof = _OCEANMESSAGE.oneofs_by_name["performative"]
+_OCEANMESSAGE.oneofs_by_name["performative"].fields.append(
+    _OCEANMESSAGE.fields_by_name["purchase_datatokens"]
+)
+_OCEANMESSAGE.fields_by_name[
+    "purchase_datatokens"
+].containing_oneof = _OCEANMESSAGE.oneofs_by_name["performative"]
+_OCEANMESSAGE.oneofs_by_name["performative"].fields.append(
+    _OCEANMESSAGE.fields_by_name["purchase_reciept"]
+)
+_OCEANMESSAGE.fields_by_name[
+    "purchase_reciept"
+].containing_oneof = _OCEANMESSAGE.oneofs_by_name["performative"]
+_OCEANMESSAGE.oneofs_by_name["performative"].fields.append(
+    _OCEANMESSAGE.fields_by_name["result_chunk"]
+)
+_OCEANMESSAGE.fields_by_name[
+    "result_chunk"
+].containing_oneof = _OCEANMESSAGE.oneofs_by_name["performative"]
 _OCEANMESSAGE.oneofs_by_name["performative"].fields.append(
     _OCEANMESSAGE.fields_by_name["results"]
 )
 _OCEANMESSAGE.fields_by_name["results"].containing_oneof = _OCEANMESSAGE.oneofs_by_name[
     "performative"
 ]
+_OCEANMESSAGE.oneofs_by_name["performative"].fields.append(
+    _OCEANMESSAGE.fields_by_name["subscribe_events"]
+)
+_OCEANMESSAGE.fields_by_name[
+    "subscribe_events"
+].containing_oneof = _OCEANMESSAGE.oneofs_by_name["performative"]
 DESCRIPTOR.message_types_by_name["OceanMessage"] = _OCEANMESSAGE
 _sym_db.RegisterFileDescriptor(DESCRIPTOR)
 
@@ -1708,6 +3331,24 @@ OceanMessage = _reflection.GeneratedProtocolMessageType(
                 # @@protoc_insertion_point(class_scope:aea.eightballer.ocean.v0_1_0.OceanMessage.ErrorCode)
             ),
         ),
+        AssetSpecs=_reflection.GeneratedProtocolMessageType(
+            "AssetSpecs",
+            (_message.Message,),
+            dict(
+                AssetSpec=_reflection.GeneratedProtocolMessageType(
+                    "AssetSpec",
+                    (_message.Message,),
+                    dict(
+                        DESCRIPTOR=_OCEANMESSAGE_ASSETSPECS_ASSETSPEC,
+                        __module__="ocean_pb2"
+                        # @@protoc_insertion_point(class_scope:aea.eightballer.ocean.v0_1_0.OceanMessage.AssetSpecs.AssetSpec)
+                    ),
+                ),
+                DESCRIPTOR=_OCEANMESSAGE_ASSETSPECS,
+                __module__="ocean_pb2"
+                # @@protoc_insertion_point(class_scope:aea.eightballer.ocean.v0_1_0.OceanMessage.AssetSpecs)
+            ),
+        ),
         Deploy_Data_Download_Performative=_reflection.GeneratedProtocolMessageType(
             "Deploy_Data_Download_Performative",
             (_message.Message,),
@@ -1798,6 +3439,114 @@ OceanMessage = _reflection.GeneratedProtocolMessageType(
                 # @@protoc_insertion_point(class_scope:aea.eightballer.ocean.v0_1_0.OceanMessage.Results_Performative)
             ),
         ),
+        Purchase_Datatokens_Performative=_reflection.GeneratedProtocolMessageType(
+            "Purchase_Datatokens_Performative",
+            (_message.Message,),
+            dict(
+                DESCRIPTOR=_OCEANMESSAGE_PURCHASE_DATATOKENS_PERFORMATIVE,
+                __module__="ocean_pb2"
+                # @@protoc_insertion_point(class_scope:aea.eightballer.ocean.v0_1_0.OceanMessage.Purchase_Datatokens_Performative)
+            ),
+        ),
+        Purchase_Reciept_Performative=_reflection.GeneratedProtocolMessageType(
+            "Purchase_Reciept_Performative",
+            (_message.Message,),
+            dict(
+                DESCRIPTOR=_OCEANMESSAGE_PURCHASE_RECIEPT_PERFORMATIVE,
+                __module__="ocean_pb2"
+                # @@protoc_insertion_point(class_scope:aea.eightballer.ocean.v0_1_0.OceanMessage.Purchase_Reciept_Performative)
+            ),
+        ),
+        Result_Chunk_Performative=_reflection.GeneratedProtocolMessageType(
+            "Result_Chunk_Performative",
+            (_message.Message,),
+            dict(
+                DESCRIPTOR=_OCEANMESSAGE_RESULT_CHUNK_PERFORMATIVE,
+                __module__="ocean_pb2"
+                # @@protoc_insertion_point(class_scope:aea.eightballer.ocean.v0_1_0.OceanMessage.Result_Chunk_Performative)
+            ),
+        ),
+        Download_Reciept_Performative=_reflection.GeneratedProtocolMessageType(
+            "Download_Reciept_Performative",
+            (_message.Message,),
+            dict(
+                DESCRIPTOR=_OCEANMESSAGE_DOWNLOAD_RECIEPT_PERFORMATIVE,
+                __module__="ocean_pb2"
+                # @@protoc_insertion_point(class_scope:aea.eightballer.ocean.v0_1_0.OceanMessage.Download_Reciept_Performative)
+            ),
+        ),
+        Deploy_Batch_Performative=_reflection.GeneratedProtocolMessageType(
+            "Deploy_Batch_Performative",
+            (_message.Message,),
+            dict(
+                DESCRIPTOR=_OCEANMESSAGE_DEPLOY_BATCH_PERFORMATIVE,
+                __module__="ocean_pb2"
+                # @@protoc_insertion_point(class_scope:aea.eightballer.ocean.v0_1_0.OceanMessage.Deploy_Batch_Performative)
+            ),
+        ),
+        Batch_Deployment_Reciept_Performative=_reflection.GeneratedProtocolMessageType(
+            "Batch_Deployment_Reciept_Performative",
+            (_message.Message,),
+            dict(
+                DESCRIPTOR=_OCEANMESSAGE_BATCH_DEPLOYMENT_RECIEPT_PERFORMATIVE,
+                __module__="ocean_pb2"
+                # @@protoc_insertion_point(class_scope:aea.eightballer.ocean.v0_1_0.OceanMessage.Batch_Deployment_Reciept_Performative)
+            ),
+        ),
+        Subscribe_Events_Performative=_reflection.GeneratedProtocolMessageType(
+            "Subscribe_Events_Performative",
+            (_message.Message,),
+            dict(
+                DESCRIPTOR=_OCEANMESSAGE_SUBSCRIBE_EVENTS_PERFORMATIVE,
+                __module__="ocean_pb2"
+                # @@protoc_insertion_point(class_scope:aea.eightballer.ocean.v0_1_0.OceanMessage.Subscribe_Events_Performative)
+            ),
+        ),
+        Chain_Event_Performative=_reflection.GeneratedProtocolMessageType(
+            "Chain_Event_Performative",
+            (_message.Message,),
+            dict(
+                DESCRIPTOR=_OCEANMESSAGE_CHAIN_EVENT_PERFORMATIVE,
+                __module__="ocean_pb2"
+                # @@protoc_insertion_point(class_scope:aea.eightballer.ocean.v0_1_0.OceanMessage.Chain_Event_Performative)
+            ),
+        ),
+        D2C_Multi_Job_Performative=_reflection.GeneratedProtocolMessageType(
+            "D2C_Multi_Job_Performative",
+            (_message.Message,),
+            dict(
+                DESCRIPTOR=_OCEANMESSAGE_D2C_MULTI_JOB_PERFORMATIVE,
+                __module__="ocean_pb2"
+                # @@protoc_insertion_point(class_scope:aea.eightballer.ocean.v0_1_0.OceanMessage.D2C_Multi_Job_Performative)
+            ),
+        ),
+        D2C_Results_Performative=_reflection.GeneratedProtocolMessageType(
+            "D2C_Results_Performative",
+            (_message.Message,),
+            dict(
+                DESCRIPTOR=_OCEANMESSAGE_D2C_RESULTS_PERFORMATIVE,
+                __module__="ocean_pb2"
+                # @@protoc_insertion_point(class_scope:aea.eightballer.ocean.v0_1_0.OceanMessage.D2C_Results_Performative)
+            ),
+        ),
+        Permission_Datasets_Performative=_reflection.GeneratedProtocolMessageType(
+            "Permission_Datasets_Performative",
+            (_message.Message,),
+            dict(
+                DESCRIPTOR=_OCEANMESSAGE_PERMISSION_DATASETS_PERFORMATIVE,
+                __module__="ocean_pb2"
+                # @@protoc_insertion_point(class_scope:aea.eightballer.ocean.v0_1_0.OceanMessage.Permission_Datasets_Performative)
+            ),
+        ),
+        Permission_Reciept_Performative=_reflection.GeneratedProtocolMessageType(
+            "Permission_Reciept_Performative",
+            (_message.Message,),
+            dict(
+                DESCRIPTOR=_OCEANMESSAGE_PERMISSION_RECIEPT_PERFORMATIVE,
+                __module__="ocean_pb2"
+                # @@protoc_insertion_point(class_scope:aea.eightballer.ocean.v0_1_0.OceanMessage.Permission_Reciept_Performative)
+            ),
+        ),
         Error_Performative=_reflection.GeneratedProtocolMessageType(
             "Error_Performative",
             (_message.Message,),
@@ -1832,6 +3581,8 @@ OceanMessage = _reflection.GeneratedProtocolMessageType(
 )
 _sym_db.RegisterMessage(OceanMessage)
 _sym_db.RegisterMessage(OceanMessage.ErrorCode)
+_sym_db.RegisterMessage(OceanMessage.AssetSpecs)
+_sym_db.RegisterMessage(OceanMessage.AssetSpecs.AssetSpec)
 _sym_db.RegisterMessage(OceanMessage.Deploy_Data_Download_Performative)
 _sym_db.RegisterMessage(OceanMessage.Deploy_D2C_Performative)
 _sym_db.RegisterMessage(OceanMessage.Deploy_Algorithm_Performative)
@@ -1842,6 +3593,18 @@ _sym_db.RegisterMessage(OceanMessage.Download_Job_Performative)
 _sym_db.RegisterMessage(OceanMessage.Permission_Dataset_Performative)
 _sym_db.RegisterMessage(OceanMessage.D2C_Job_Performative)
 _sym_db.RegisterMessage(OceanMessage.Results_Performative)
+_sym_db.RegisterMessage(OceanMessage.Purchase_Datatokens_Performative)
+_sym_db.RegisterMessage(OceanMessage.Purchase_Reciept_Performative)
+_sym_db.RegisterMessage(OceanMessage.Result_Chunk_Performative)
+_sym_db.RegisterMessage(OceanMessage.Download_Reciept_Performative)
+_sym_db.RegisterMessage(OceanMessage.Deploy_Batch_Performative)
+_sym_db.RegisterMessage(OceanMessage.Batch_Deployment_Reciept_Performative)
+_sym_db.RegisterMessage(OceanMessage.Subscribe_Events_Performative)
+_sym_db.RegisterMessage(OceanMessage.Chain_Event_Performative)
+_sym_db.RegisterMessage(OceanMessage.D2C_Multi_Job_Performative)
+_sym_db.RegisterMessage(OceanMessage.D2C_Results_Performative)
+_sym_db.RegisterMessage(OceanMessage.Permission_Datasets_Performative)
+_sym_db.RegisterMessage(OceanMessage.Permission_Reciept_Performative)
 _sym_db.RegisterMessage(OceanMessage.Error_Performative)
 _sym_db.RegisterMessage(OceanMessage.Error_Performative.ErrorDataEntry)
 _sym_db.RegisterMessage(OceanMessage.End_Performative)
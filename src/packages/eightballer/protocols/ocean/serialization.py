@@ -26,10 +26,14 @@ from aea.mail.base_pb2 import DialogueMessage
 from aea.mail.base_pb2 import Message as ProtobufMessage
 from aea.protocols.base import Message, Serializer
 
+# fmt: off
 from packages.eightballer.protocols.ocean import ocean_pb2
-from packages.eightballer.protocols.ocean.custom_types import ErrorCode
+from packages.eightballer.protocols.ocean.custom_types import (AssetSpecs,
+                                                               ErrorCode)
 from packages.eightballer.protocols.ocean.message import OceanMessage
 
+# fmt: on
+
 
 class OceanSerializer(Serializer):
     """Serialization for the 'ocean' protocol."""
@@ -178,6 +182,118 @@ class OceanSerializer(Serializer):
             content = msg.content
             performative.content = content
             ocean_msg.results.CopyFrom(performative)
+        elif performative_id == OceanMessage.Performative.PURCHASE_DATATOKENS:
+            performative = ocean_pb2.OceanMessage.Purchase_Datatokens_Performative()  # type: ignore
+            pool_addresses = msg.pool_addresses
+            performative.pool_addresses.extend(pool_addresses)
+            datatoken_amts = msg.datatoken_amts
+            performative.datatoken_amts.extend(datatoken_amts)
+            max_costs_ocean = msg.max_costs_ocean
+            performative.max_costs_ocean.extend(max_costs_ocean)
+            ocean_msg.purchase_datatokens.CopyFrom(performative)
+        elif performative_id == OceanMessage.Performative.PURCHASE_RECIEPT:
+            performative = ocean_pb2.OceanMessage.Purchase_Reciept_Performative()  # type: ignore
+            pool_addresses = msg.pool_addresses
+            performative.pool_addresses.extend(pool_addresses)
+            datatoken_addresses = msg.datatoken_addresses
+            performative.datatoken_addresses.extend(datatoken_addresses)
+            errors = msg.errors
+            performative.errors.extend(errors)
+            ocean_msg.purchase_reciept.CopyFrom(performative)
+        elif performative_id == OceanMessage.Performative.RESULT_CHUNK:
+            performative = ocean_pb2.OceanMessage.Result_Chunk_Performative()  # type: ignore
+            content = msg.content
+            performative.content = content
+            sequence = msg.sequence
+            performative.sequence = sequence
+            is_last = msg.is_last
+            performative.is_last = is_last
+            digest = msg.digest
+            performative.digest = digest
+            ocean_msg.result_chunk.CopyFrom(performative)
+        elif performative_id == OceanMessage.Performative.DOWNLOAD_RECIEPT:
+            performative = ocean_pb2.OceanMessage.Download_Reciept_Performative()  # type: ignore
+            did = msg.did
+            performative.did = did
+            file_path = msg.file_path
+            performative.file_path = file_path
+            size = msg.size
+            performative.size = size
+            ocean_msg.download_reciept.CopyFrom(performative)
+        elif performative_id == OceanMessage.Performative.DEPLOY_BATCH:
+            performative = ocean_pb2.OceanMessage.Deploy_Batch_Performative()  # type: ignore
+            asset_specs = msg.asset_specs
+            AssetSpecs.encode(performative.asset_specs, asset_specs)
+            ocean_msg.deploy_batch.CopyFrom(performative)
+        elif performative_id == OceanMessage.Performative.BATCH_DEPLOYMENT_RECIEPT:
+            performative = ocean_pb2.OceanMessage.Batch_Deployment_Reciept_Performative()  # type: ignore
+            types = msg.types
+            performative.types.extend(types)
+            dids = msg.dids
+            performative.dids.extend(dids)
+            datatoken_contract_addresses = msg.datatoken_contract_addresses
+            performative.datatoken_contract_addresses.extend(
+                datatoken_contract_addresses
+            )
+            errors = msg.errors
+            performative.errors.extend(errors)
+            ocean_msg.batch_deployment_reciept.CopyFrom(performative)
+        elif performative_id == OceanMessage.Performative.SUBSCRIBE_EVENTS:
+            performative = ocean_pb2.OceanMessage.Subscribe_Events_Performative()  # type: ignore
+            event_names = msg.event_names
+            performative.event_names.extend(event_names)
+            addresses = msg.addresses
+            performative.addresses.extend(addresses)
+            ocean_msg.subscribe_events.CopyFrom(performative)
+        elif performative_id == OceanMessage.Performative.CHAIN_EVENT:
+            performative = ocean_pb2.OceanMessage.Chain_Event_Performative()  # type: ignore
+            event_name = msg.event_name
+            performative.event_name = event_name
+            address = msg.address
+            performative.address = address
+            block_number = msg.block_number
+            performative.block_number = block_number
+            transaction_hash = msg.transaction_hash
+            performative.transaction_hash = transaction_hash
+            log_index = msg.log_index
+            performative.log_index = log_index
+            event_args = msg.event_args
+            performative.event_args = event_args
+            removed = msg.removed
+            performative.removed = removed
+            ocean_msg.chain_event.CopyFrom(performative)
+        elif performative_id == OceanMessage.Performative.D2C_MULTI_JOB:
+            performative = ocean_pb2.OceanMessage.D2C_Multi_Job_Performative()  # type: ignore
+            data_dids = msg.data_dids
+            performative.data_dids.extend(data_dids)
+            algo_did = msg.algo_did
+            performative.algo_did = algo_did
+            ocean_msg.d2c_multi_job.CopyFrom(performative)
+        elif performative_id == OceanMessage.Performative.D2C_RESULTS:
+            performative = ocean_pb2.OceanMessage.D2C_Results_Performative()  # type: ignore
+            data_dids = msg.data_dids
+            performative.data_dids.extend(data_dids)
+            job_ids = msg.job_ids
+            performative.job_ids.extend(job_ids)
+            file_paths = msg.file_paths
+            performative.file_paths.extend(file_paths)
+            errors = msg.errors
+            performative.errors.extend(errors)
+            ocean_msg.d2c_results.CopyFrom(performative)
+        elif performative_id == OceanMessage.Performative.PERMISSION_DATASETS:
+            performative = ocean_pb2.OceanMessage.Permission_Datasets_Performative()  # type: ignore
+            data_dids = msg.data_dids
+            performative.data_dids.extend(data_dids)
+            algo_dids = msg.algo_dids
+            performative.algo_dids.extend(algo_dids)
+            ocean_msg.permission_datasets.CopyFrom(performative)
+        elif performative_id == OceanMessage.Performative.PERMISSION_RECIEPT:
+            performative = ocean_pb2.OceanMessage.Permission_Reciept_Performative()  # type: ignore
+            data_dids = msg.data_dids
+            performative.data_dids.extend(data_dids)
+            errors = msg.errors
+            performative.errors.extend(errors)
+            ocean_msg.permission_reciept.CopyFrom(performative)
         elif performative_id == OceanMessage.Performative.ERROR:
             performative = ocean_pb2.OceanMessage.Error_Performative()  # type: ignore
             error_code = msg.error_code
@@ -329,6 +445,118 @@ class OceanSerializer(Serializer):
         elif performative_id == OceanMessage.Performative.RESULTS:
             content = ocean_pb.results.content
             performative_content["content"] = content
+        elif performative_id == OceanMessage.Performative.PURCHASE_DATATOKENS:
+            pool_addresses = ocean_pb.purchase_datatokens.pool_addresses
+            pool_addresses_tuple = tuple(pool_addresses)
+            performative_content["pool_addresses"] = pool_addresses_tuple
+            datatoken_amts = ocean_pb.purchase_datatokens.datatoken_amts
+            datatoken_amts_tuple = tuple(datatoken_amts)
+            performative_content["datatoken_amts"] = datatoken_amts_tuple
+            max_costs_ocean = ocean_pb.purchase_datatokens.max_costs_ocean
+            max_costs_ocean_tuple = tuple(max_costs_ocean)
+            performative_content["max_costs_ocean"] = max_costs_ocean_tuple
+        elif performative_id == OceanMessage.Performative.PURCHASE_RECIEPT:
+            pool_addresses = ocean_pb.purchase_reciept.pool_addresses
+            pool_addresses_tuple = tuple(pool_addresses)
+            performative_content["pool_addresses"] = pool_addresses_tuple
+            datatoken_addresses = ocean_pb.purchase_reciept.datatoken_addresses
+            datatoken_addresses_tuple = tuple(datatoken_addresses)
+            performative_content["datatoken_addresses"] = datatoken_addresses_tuple
+            errors = ocean_pb.purchase_reciept.errors
+            errors_tuple = tuple(errors)
+            performative_content["errors"] = errors_tuple
+        elif performative_id == OceanMessage.Performative.RESULT_CHUNK:
+            content = ocean_pb.result_chunk.content
+            performative_content["content"] = content
+            sequence = ocean_pb.result_chunk.sequence
+            performative_content["sequence"] = sequence
+            is_last = ocean_pb.result_chunk.is_last
+            performative_content["is_last"] = is_last
+            digest = ocean_pb.result_chunk.digest
+            performative_content["digest"] = digest
+        elif performative_id == OceanMessage.Performative.DOWNLOAD_RECIEPT:
+            did = ocean_pb.download_reciept.did
+            performative_content["did"] = did
+            file_path = ocean_pb.download_reciept.file_path
+            performative_content["file_path"] = file_path
+            size = ocean_pb.download_reciept.size
+            performative_content["size"] = size
+        elif performative_id == OceanMessage.Performative.DEPLOY_BATCH:
+            pb2_asset_specs = ocean_pb.deploy_batch.asset_specs
+            asset_specs = AssetSpecs.decode(pb2_asset_specs)
+            performative_content["asset_specs"] = asset_specs
+        elif performative_id == OceanMessage.Performative.BATCH_DEPLOYMENT_RECIEPT:
+            types = ocean_pb.batch_deployment_reciept.types
+            types_tuple = tuple(types)
+            performative_content["types"] = types_tuple
+            dids = ocean_pb.batch_deployment_reciept.dids
+            dids_tuple = tuple(dids)
+            performative_content["dids"] = dids_tuple
+            datatoken_contract_addresses = (
+                ocean_pb.batch_deployment_reciept.datatoken_contract_addresses
+            )
+            datatoken_contract_addresses_tuple = tuple(datatoken_contract_addresses)
+            performative_content[
+                "datatoken_contract_addresses"
+            ] = datatoken_contract_addresses_tuple
+            errors = ocean_pb.batch_deployment_reciept.errors
+            errors_tuple = tuple(errors)
+            performative_content["errors"] = errors_tuple
+        elif performative_id == OceanMessage.Performative.SUBSCRIBE_EVENTS:
+            event_names = ocean_pb.subscribe_events.event_names
+            event_names_tuple = tuple(event_names)
+            performative_content["event_names"] = event_names_tuple
+            addresses = ocean_pb.subscribe_events.addresses
+            addresses_tuple = tuple(addresses)
+            performative_content["addresses"] = addresses_tuple
+        elif performative_id == OceanMessage.Performative.CHAIN_EVENT:
+            event_name = ocean_pb.chain_event.event_name
+            performative_content["event_name"] = event_name
+            address = ocean_pb.chain_event.address
+            performative_content["address"] = address
+            block_number = ocean_pb.chain_event.block_number
+            performative_content["block_number"] = block_number
+            transaction_hash = ocean_pb.chain_event.transaction_hash
+            performative_content["transaction_hash"] = transaction_hash
+            log_index = ocean_pb.chain_event.log_index
+            performative_content["log_index"] = log_index
+            event_args = ocean_pb.chain_event.event_args
+            performative_content["event_args"] = event_args
+            removed = ocean_pb.chain_event.removed
+            performative_content["removed"] = removed
+        elif performative_id == OceanMessage.Performative.D2C_MULTI_JOB:
+            data_dids = ocean_pb.d2c_multi_job.data_dids
+            data_dids_tuple = tuple(data_dids)
+            performative_content["data_dids"] = data_dids_tuple
+            algo_did = ocean_pb.d2c_multi_job.algo_did
+            performative_content["algo_did"] = algo_did
+        elif performative_id == OceanMessage.Performative.D2C_RESULTS:
+            data_dids = ocean_pb.d2c_results.data_dids
+            data_dids_tuple = tuple(data_dids)
+            performative_content["data_dids"] = data_dids_tuple
+            job_ids = ocean_pb.d2c_results.job_ids
+            job_ids_tuple = tuple(job_ids)
+            performative_content["job_ids"] = job_ids_tuple
+            file_paths = ocean_pb.d2c_results.file_paths
+            file_paths_tuple = tuple(file_paths)
+            performative_content["file_paths"] = file_paths_tuple
+            errors = ocean_pb.d2c_results.errors
+            errors_tuple = tuple(errors)
+            performative_content["errors"] = errors_tuple
+        elif performative_id == OceanMessage.Performative.PERMISSION_DATASETS:
+            data_dids = ocean_pb.permission_datasets.data_dids
+            data_dids_tuple = tuple(data_dids)
+            performative_content["data_dids"] = data_dids_tuple
+            algo_dids = ocean_pb.permission_datasets.algo_dids
+            algo_dids_tuple = tuple(algo_dids)
+            performative_content["algo_dids"] = algo_dids_tuple
+        elif performative_id == OceanMessage.Performative.PERMISSION_RECIEPT:
+            data_dids = ocean_pb.permission_reciept.data_dids
+            data_dids_tuple = tuple(data_dids)
+            performative_content["data_dids"] = data_dids_tuple
+            errors = ocean_pb.permission_reciept.errors
+            errors_tuple = tuple(errors)
+            performative_content["errors"] = errors_tuple
         elif performative_id == OceanMessage.Performative.ERROR:
             pb2_error_code = ocean_pb.error.error_code
             error_code = ErrorCode.decode(pb2_error_code)
@@ -185,31 +185,21 @@ class OceanC2DBehaviour(Behaviour):
         if strategy.is_in_flight or not strategy.is_c2d_active:
             return
 
-        if strategy.purchased_data is not None and not strategy.has_purchased_datatoken:
-            self.log.info("purchasing data from the datapool")
+        if strategy.purchased_data is not None and not (
+            strategy.has_purchased_datatoken and strategy.has_purchased_algtoken
+        ):
+            pool_addresses = []
+            if not strategy.has_purchased_datatoken:
+                pool_addresses.append(strategy.purchased_data["datapool_address"])
+            if not strategy.has_purchased_algtoken:
+                pool_addresses.append(strategy.purchased_data["algpool_address"])
+            self.log.info(f"purchasing datatokens from {len(pool_addresses)} pools")
 
             self.__create_envelope(
-                OceanMessage.Performative.DOWNLOAD_JOB, **{
-                    "datatoken_address": "unused",
-                    "datatoken_amt": 2,
-                    "max_cost_ocean": 1,
-                    "asset_did": "unused",
-                    "pool_address": strategy.purchased_data["datapool_address"],
-                }
-            )
-
-            return
-
-        if strategy.purchased_data is not None and strategy.has_purchased_datatoken and not strategy.has_purchased_algtoken:
-            self.log.info("purchasing data from the datapool")
-
-            self.__create_envelope(
-                OceanMessage.Performative.DOWNLOAD_JOB, **{
-                    "datatoken_address": "unused",
-                    "datatoken_amt": 2,
-                    "max_cost_ocean": 1,
-                    "asset_did": "unused",
-                    "pool_address": strategy.purchased_data["algpool_address"],
+                OceanMessage.Performative.PURCHASE_DATATOKENS, **{
+                    "pool_addresses": tuple(pool_addresses),
+                    "datatoken_amts": (2,) * len(pool_addresses),
+                    "max_costs_ocean": (1,) * len(pool_addresses),
                 }
             )
 
@@ -43,13 +43,22 @@ class OceanHandler(Handler):
         """
         strategy = cast(GenericStrategy, self.context.strategy)
 
-        if message.performative == OceanMessage.Performative.DOWNLOAD_JOB:
+        if message.performative == OceanMessage.Performative.PURCHASE_RECIEPT:
             strategy.is_in_flight = False
-            if not strategy.has_purchased_datatoken:
-                strategy.has_purchased_datatoken = True
-
-            elif not strategy.has_purchased_algtoken:
-                strategy.has_purchased_algtoken = True
+            for pool_address, error in zip(message.pool_addresses, message.errors):
+                if error:
+                    self.log.error(f"Failed to purchase from {pool_address}: {error}")
+                elif pool_address == strategy.purchased_data["datapool_address"]:
+                    strategy.has_purchased_datatoken = True
+                elif pool_address == strategy.purchased_data["algpool_address"]:
+                    strategy.has_purchased_algtoken = True
+
+        elif message.performative == OceanMessage.Performative.ERROR:
+            self.log.error(
+                f"Ocean operation failed ({message.error_code.name}): {message.error_msg}"
+            )
+            strategy.is_in_flight = False
+            return
 
         self.log.info(f"Received the result from C2D ! {message}")
 
@@ -1,3 +1,4 @@
+import os
 from typing import Any, Optional, cast
 
 from aea.helpers.search.models import Description
@@ -255,6 +256,10 @@ class OceanC2DBehaviour(OceanBehaviourBase):
             and strategy.is_pool_deployed
         ):
             self.log.info(f"Completed the c2d deployment.")
+            self.__send(
+                OceanMessage.Performative.SUBSCRIBE_EVENTS,
+                **strategy.get_event_subscription(),
+            )
             strategy.is_d2c_active = False
             strategy.is_processing = False
             strategy.has_completed_d2c_job = True
@@ -263,6 +268,10 @@ class OceanC2DBehaviour(OceanBehaviourBase):
         self, performative: OceanMessage.Performative, **kwargs
     ) -> None:
         strategy = cast(GenericStrategy, self.context.strategy)
+        self.__send(performative, **kwargs)
+        strategy.is_in_flight = True
+
+    def __send(self, performative: OceanMessage.Performative, **kwargs) -> None:
         receiver_id = "eightballer/ocean:0.1.0"
         msg = OceanMessage(performative=performative, **kwargs)
         msg.sender = str(SENDER_ID)
@@ -271,7 +280,6 @@ class OceanC2DBehaviour(OceanBehaviourBase):
             to=receiver_id, sender=str(SENDER_ID), message=msg
         )
         self.context.outbox.put(file_upload_envolope)
-        strategy.is_in_flight = True
 
 
 class OceanSellerBehaviour(Behaviour):
@@ -306,17 +314,15 @@ class OceanSellerBehaviour(Behaviour):
     def __upload_data(
         self,
     ) -> None:
-        with open("../EXAMPLE_DATA.csv", "rb") as f:
-            bytes = f.read()
-            filename = "EXAMPLE_FILE"
-            fileid = "EXAMPLE_ID"
+        # the connection streams the file from disk, it is never loaded here
+        file_path = os.path.abspath("../EXAMPLE_DATA.csv")
+        fileid = "EXAMPLE_ID"
 
         receiver_id = "eightballer/storj_file_transfer:0.1.0"
         msg = FileStorageMessage(
-            performative=FileStorageMessage.Performative.FILE_UPLOAD,
-            content=bytes,
+            performative=FileStorageMessage.Performative.FILE_UPLOAD_PATH,
+            file_path=file_path,
             key=fileid,
-            filename=filename,
         )
         msg.sender = str(SENDER_ID)
         msg.to = receiver_id
@@ -21,6 +21,8 @@ from packages.fetchai.protocols.oef_search.message import OefSearchMessage
 
 LEDGER_API_ADDRESS = str(LEDGER_CONNECTION_PUBLIC_ID)
 
+import os
+import time
 from typing import Optional, cast
 
 from aea.configurations.base import PublicId
@@ -30,8 +32,11 @@ from aea.skills.base import Handler
 from packages.eightballer.protocols.file_storage.message import \
     FileStorageMessage
 from packages.eightballer.protocols.ocean.message import OceanMessage
+from packages.eightballer.skills.ocean_seller.results import ResultWriter
 from packages.eightballer.skills.ocean_seller.strategy import GenericStrategy
 
+RESULTS_DIRECTORY = "results"
+
 
 class StorjHandler(Handler):
     """This class scaffolds a handler."""
@@ -50,10 +55,31 @@ class StorjHandler(Handler):
         :param message: the message
         """
         strategy = cast(GenericStrategy, self.context.strategy)
-        strategy.data_to_compute_params.update({"dataset_url": message.access_url})
-        strategy.has_uploaded_data = True
-        strategy.is_processing = False
-        self.log(f"receieved new url and saved in strategy {message.access_url}")
+        if message.performative in (
+            FileStorageMessage.Performative.FILE_DOWNLOAD,
+            FileStorageMessage.Performative.UPLOAD_RECIEPT,
+        ):
+            strategy.data_to_compute_params.update({"dataset_url": message.access_url})
+            strategy.has_uploaded_data = True
+            strategy.is_processing = False
+            self.log(f"receieved new url and saved in strategy {message.access_url}")
+            if message.performative == FileStorageMessage.Performative.UPLOAD_RECIEPT:
+                self.log(f"uploaded {message.size} bytes with sha256 {message.digest}")
+        elif message.performative == FileStorageMessage.Performative.FETCH_RECIEPT:
+            if message.error:
+                self.context.logger.error(
+                    f"could not fetch {message.key}: {message.error}"
+                )
+            else:
+                self.log(f"fetched {message.key} to {message.file_path}")
+        elif message.performative == FileStorageMessage.Performative.ERROR:
+            # the upload failed, it is tried again on the next tick
+            strategy.is_processing = False
+            self.context.logger.error(f"storage error: {message.error_msg}")
+        else:
+            self.context.logger.warning(
+                f"unexpected storage message: {message.performative}"
+            )
 
     def teardown(self) -> None:
         """Implement the handler teardown."""
@@ -69,6 +95,7 @@ class OceanHandler(Handler):
         """Implement the setup."""
         self.log = self.context.logger
         self.log.info(f"setting up ocean handler ")
+        self._result_writer = None  # type: Optional[ResultWriter]
 
     def handle(self, message: Message) -> None:
         """
@@ -108,6 +135,10 @@ class OceanHandler(Handler):
                     "datatoken_address"
                 ] = message.datatoken_contract_address
                 strategy.download_params["asset_did"] = message.did
+                strategy.data_download_address = {
+                    "did": message.did,
+                    "datatoken_contract_address": message.datatoken_contract_address,
+                }
             else:
                 raise ValueError(
                     f"Performative not valid: {message.performative}, {message.type}"
@@ -124,15 +155,66 @@ class OceanHandler(Handler):
                 strategy.has_completed_download_job = True
 
             strategy.is_in_flight = False
+        elif message.performative == OceanMessage.Performative.RESULT_CHUNK:
+            if self._result_writer is None:
+                path = os.path.join(RESULTS_DIRECTORY, f"result.{int(time.time())}")
+                self._result_writer = ResultWriter(path)
+            writer = self._result_writer
+            try:
+                is_complete = writer.write(
+                    message.sequence, message.content, message.is_last, message.digest
+                )
+            except ValueError as e:
+                self.log.error(f"Failed to receive the d2c results: {e}")
+                self._result_writer = None
+                strategy.is_in_flight = False
+                return
+            if is_complete:
+                self.log.info(f"results for d2c job written to {writer.path}!")
+                self._result_writer = None
+                if strategy.is_d2c_active:
+                    strategy.has_completed_d2c_job = True
+                strategy.is_in_flight = False
+        elif message.performative == OceanMessage.Performative.DOWNLOAD_RECIEPT:
+            self.log.info(
+                f"Downloaded {message.size} bytes of {message.did} to {message.file_path}"
+            )
+            if strategy.is_download_active:
+                strategy.has_completed_download_job = True
+            strategy.is_in_flight = False
+        elif message.performative == OceanMessage.Performative.BATCH_DEPLOYMENT_RECIEPT:
+            for type_, did, address, error in zip(
+                message.types,
+                message.dids,
+                message.datatoken_contract_addresses,
+                message.errors,
+            ):
+                if error:
+                    self.log.error(f"Failed to deploy {type_} asset: {error}")
+                else:
+                    self.log.info(f"Deployed {type_} asset {did} with datatoken {address}")
+            strategy.is_in_flight = False
         elif message.performative == OceanMessage.Performative.POOL_DEPLOYMENT_RECIEPT:
             self.log.info(f"Sucecssfully deployed pool for asset!")
             strategy.is_in_flight = False
             strategy.is_pool_deployed = True
 
             if not strategy.download_params.get("datapool_address", None):
-                strategy.download_params["datapool_address"] = message.pool_address
+                strategy.record_pool_address("datapool_address", message.pool_address)
             else:
-                strategy.download_params["algpool_address"] = message.pool_address
+                strategy.record_pool_address("algpool_address", message.pool_address)
+        elif message.performative == OceanMessage.Performative.CHAIN_EVENT:
+            status = "reverted by a reorg" if message.removed else "seen"
+            self.log.info(
+                f"{message.event_name} of {message.address} in block "
+                f"{message.block_number} {status}: {message.event_args}"
+            )
+        elif message.performative == OceanMessage.Performative.ERROR:
+            # the operation failed or its endpoint is down, it is sent again later
+            self.log.error(
+                f"Ocean operation failed ({message.error_code.name}): {message.error_msg}"
+            )
+            strategy.is_in_flight = False
 
         else:
             raise ValueError("Unhandled Message!!!")
@@ -140,6 +222,8 @@ class OceanHandler(Handler):
     def teardown(self) -> None:
         """Implement the handler teardown."""
         self.log.info(f"tearing down handler ")
+        if self._result_writer is not None:
+            self._result_writer.abort()
 
 
 class GenericFipaHandler(Handler):
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2021 eightballer
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""A durable record of what the seller has already deployed."""
+import json
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional
+
+DEFAULT_REGISTRY_PATH = "deployments.db"
+
+
+class DeploymentRegistry:
+    """
+    Persists the published assets, datatokens, pools and permissions.
+
+    Each step of the deployment is stored under a name as a JSON value, so a
+    restarted agent can load what it already did and carry on from the first
+    unfinished step instead of deploying everything again.
+    """
+
+    def __init__(self, path: str = DEFAULT_REGISTRY_PATH) -> None:
+        """
+        Initialise the registry, creating the database if needed.
+
+        :param path: the path of the SQLite database, `:memory:` for a transient one.
+        """
+        self.path = path
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS deployments ("
+                "name TEXT PRIMARY KEY, value TEXT NOT NULL, updated_at REAL NOT NULL)"
+            )
+
+    def get(self, name: str, default: Optional[Any] = None) -> Any:
+        """
+        Get a recorded step.
+
+        :param name: the name of the step.
+        :param default: returned when the step has not been recorded.
+        :return: the recorded value.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value FROM deployments WHERE name = ?", (name,)
+            ).fetchone()
+        return default if row is None else json.loads(row[0])
+
+    def set(self, name: str, value: Any) -> None:
+        """Record a step, replacing any previous value."""
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO deployments (name, value, updated_at) "
+                "VALUES (?, ?, ?)",
+                (name, json.dumps(value), time.time()),
+            )
+
+    def load(self) -> Dict[str, Any]:
+        """Get all the recorded steps."""
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT name, value FROM deployments"
+            ).fetchall()
+        return {name: json.loads(value) for name, value in rows}
+
+    def clear(self) -> None:
+        """Forget all the recorded steps, e.g. to redeploy on a new network."""
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM deployments")
+
+    def close(self) -> None:
+        """Close the database."""
+        with self._lock:
+            self._connection.close()
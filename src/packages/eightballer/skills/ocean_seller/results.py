@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2021 eightballer
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+"""Reassembles a compute result sent in chunks."""
+import hashlib
+import os
+from typing import Optional
+
+
+class ResultWriter:
+    """
+    Writes the chunks of a compute result to a file as they arrive.
+
+    Chunks must arrive in order, the digest carried by the last chunk is
+    checked against the digest of everything written.
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Initialise the writer.
+
+        :param path: the file to write the result to.
+        """
+        self.path = path
+        self.size = 0
+        self._next_sequence = 0
+        self._digest = hashlib.sha256()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(path, "wb")  # pylint: disable=consider-using-with
+
+    @property
+    def is_open(self) -> bool:
+        """Check whether more chunks are expected."""
+        return not self._file.closed
+
+    def write(
+        self, sequence: int, content: bytes, is_last: bool, digest: Optional[str] = ""
+    ) -> bool:
+        """
+        Write a chunk of the result.
+
+        :param sequence: the position of the chunk, starting at 0.
+        :param content: the bytes of the chunk.
+        :param is_last: whether this is the last chunk.
+        :param digest: the sha256 hex digest of the whole result, on the last chunk.
+        :return: whether the result is complete.
+        """
+        if sequence != self._next_sequence:
+            self.abort()
+            raise ValueError(
+                f"Expected chunk {self._next_sequence} of {self.path}, got {sequence}."
+            )
+        self._file.write(content)
+        self._digest.update(content)
+        self.size += len(content)
+        self._next_sequence += 1
+        if not is_last:
+            return False
+        self._file.close()
+        if digest != self._digest.hexdigest():
+            os.remove(self.path)
+            raise ValueError(f"Digest mismatch for {self.path}, the result is removed.")
+        return True
+
+    def abort(self) -> None:
+        """Stop writing and remove the partial result."""
+        if self.is_open:
+            self._file.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
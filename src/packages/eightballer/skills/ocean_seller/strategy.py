@@ -15,6 +15,9 @@ from aea.helpers.search.models import Description, Location, Query
 from aea.helpers.transaction.base import Terms
 from aea.skills.base import Model
 
+from packages.eightballer.skills.ocean_seller.registry import (
+    DEFAULT_REGISTRY_PATH, DeploymentRegistry)
+
 DEFAULT_IS_LEDGER_TX = True
 
 DEFAULT_UNIT_PRICE = 4
@@ -64,6 +67,8 @@ class GenericStrategy(Model):
     _is_d2c_active = False
     _is_download_active = False
 
+    _registry = None  # type: Optional[DeploymentRegistry]
+
     @property
     def is_d2c_active(self):
         return self._is_d2c_active
@@ -119,6 +124,7 @@ class GenericStrategy(Model):
     @is_data_permissioned.setter
     def is_data_permissioned(self, value):
         self._is_data_permissioned = value
+        self._record("data_permissioned", value)
 
     @property
     def is_data_download_deployed(self):
@@ -167,6 +173,7 @@ class GenericStrategy(Model):
     @algorithm_address.setter
     def algorithm_address(self, value):
         self._deployments["algorithm"] = value
+        self._record("algorithm", value)
 
     @property
     def data_to_compute_address(self):
@@ -175,6 +182,7 @@ class GenericStrategy(Model):
     @data_to_compute_address.setter
     def data_to_compute_address(self, value):
         self._deployments["data_to_compute"] = value
+        self._record("data_to_compute", value)
 
     @property
     def data_download_address(self):
@@ -183,6 +191,7 @@ class GenericStrategy(Model):
     @data_download_address.setter
     def data_download_address(self, value):
         self._deployments["data_download"] = value
+        self._record("data_download", value)
 
     @property
     def is_pool_deployed(self):
@@ -282,6 +291,7 @@ class GenericStrategy(Model):
         self._download_params = kwargs.pop("download_params")
         self._datapool_params = kwargs.pop("datapool_params")
         self._deployments = kwargs.pop("deployments")
+        self._registry_path = kwargs.pop("registry_path", DEFAULT_REGISTRY_PATH)
 
         self._is_seller_active = False
         self.upload_data = True
@@ -307,6 +317,8 @@ class GenericStrategy(Model):
     def setup(self):
         self.log = self.context.logger
         self.log.info(f"Initialised the strategy.")
+        self._registry = DeploymentRegistry(self._registry_path)
+        self._restore()
         if self.data_to_compute_address != {}:
             self.is_data_to_compute_deployed = True
         if self.algorithm_address != {}:
@@ -316,6 +328,48 @@ class GenericStrategy(Model):
         self.is_download_active = False
         self.is_processing = False
 
+    def teardown(self):
+        if self._registry is not None:
+            self._registry.close()
+            self._registry = None
+
+    def _record(self, name: str, value: Any) -> None:
+        """Persist a deployment step, once the registry is open."""
+        if self._registry is not None:
+            self._registry.set(name, value)
+
+    def _restore(self) -> None:
+        """Load the deployment steps completed before a restart."""
+        recorded = self._registry.load()
+        for name in ("data_to_compute", "algorithm", "data_download"):
+            if recorded.get(name):
+                self._deployments[name] = recorded[name]
+        self._is_data_permissioned = recorded.get("data_permissioned", False)
+        for name in ("datapool_address", "algpool_address"):
+            if recorded.get(name):
+                self._download_params[name] = recorded[name]
+        self._is_pool_deployed = bool(recorded.get("algpool_address"))
+        if self.data_download_address:
+            self._is_data_download_deployed = True
+            self._download_params[
+                "datatoken_address"
+            ] = self.data_download_address["datatoken_contract_address"]
+            self._download_params["asset_did"] = self.data_download_address["did"]
+        if recorded:
+            self.log.info(
+                f"Restored the deployments from {self._registry_path}: {sorted(recorded)}"
+            )
+
+    def record_pool_address(self, name: str, address: str) -> None:
+        """
+        Record the address of a deployed pool.
+
+        :param name: `datapool_address` or `algpool_address`.
+        :param address: the address of the pool.
+        """
+        self._download_params[name] = address
+        self._record(name, address)
+
     @property
     def data_for_sale(self) -> Dict[str, str]:
         """Get the data for sale."""
@@ -483,6 +537,19 @@ class GenericStrategy(Model):
             )
         return {"algo_did": algo_did, "data_did": data_did}
 
+    def get_event_subscription(self) -> Dict[str, Tuple[str, ...]]:
+        """Get the orders and trades of the deployed datatokens and pools to follow."""
+        addresses = [
+            self.data_to_compute_address.get("datatoken_contract_address"),
+            self.algorithm_address.get("datatoken_contract_address"),
+            self.download_params.get("datapool_address"),
+            self.download_params.get("algpool_address"),
+        ]
+        return {
+            "event_names": ("OrderStarted", "LOG_SWAP", "LOG_JOIN"),
+            "addresses": tuple(address for address in addresses if address),
+        }
+
     def get_create_pool_request(self, is_data=True):
         if is_data:
             data_did = self.data_to_compute_address.get("datatoken_contract_address", None)
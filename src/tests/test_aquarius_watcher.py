@@ -0,0 +1,59 @@
+#
+# Copyright 2021 Ocean Protocol Foundation
+# SPDX-License-Identifier: Apache-2.0
+#
+from packages.eightballer.connections.ocean.aquarius_watcher import (
+    AquariusWatcher,
+    PendingAsset,
+    PendingReceipt,
+)
+
+
+def test_backoff_is_exponential_and_bounded():
+    """Tests that an asset is checked less and less often."""
+    watcher = AquariusWatcher(min_interval=1.0, max_interval=5.0, jitter=0.0)
+    asset = PendingAsset("did:op:1", "receipt", started_at=0.0)
+    watcher.watch(asset)
+    assert watcher.due(now=0.0) == [asset]
+
+    intervals = []
+    for _ in range(5):
+        watcher.backoff(asset, now=0.0)
+        intervals.append(asset.interval)
+    assert intervals == [1.0, 2.0, 4.0, 5.0, 5.0]
+    assert watcher.due(now=4.0) == []
+    assert watcher.due(now=5.0) == [asset]
+
+
+def test_jitter_spreads_checks():
+    """Tests that the jitter keeps the next check within its bounds."""
+    watcher = AquariusWatcher(min_interval=10.0, jitter=0.5)
+    asset = PendingAsset("did:op:1", "receipt", started_at=0.0)
+    watcher.backoff(asset, now=0.0)
+    assert 5.0 <= asset.next_check_at <= 15.0
+
+
+def test_expired_assets():
+    """Tests that assets pending for too long are reported."""
+    watcher = AquariusWatcher(timeout=60.0)
+    asset = PendingAsset("did:op:1", "receipt", started_at=0.0)
+    watcher.watch(asset)
+    assert watcher.expired(now=30.0) == []
+    assert watcher.expired(now=61.0) == [asset]
+    watcher.unwatch(asset)
+    assert len(watcher) == 0
+
+
+def test_receipt_waits_for_all_assets():
+    """A receipt is ready once every asset it lists has resolved."""
+    receipt = PendingReceipt("envelope", ["did:op:1", "did:op:2"])
+    assert not receipt.resolve("did:op:1")
+    assert receipt.resolve("did:op:2")
+
+
+def test_expired_receipt_is_never_ready():
+    """A receipt with an asset that timed out is dropped."""
+    receipt = PendingReceipt("envelope", ["did:op:1", "did:op:2"])
+    receipt.expired = True
+    receipt.resolve("did:op:1")
+    assert not receipt.resolve("did:op:2")
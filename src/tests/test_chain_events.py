@@ -0,0 +1,77 @@
+#
+# Copyright 2021 Ocean Protocol Foundation
+# SPDX-License-Identifier: Apache-2.0
+#
+from packages.eightballer.connections.ocean.chain_events import (
+    ChainEventWatcher, ChainLog, EventSubscription)
+
+
+def _log(block_number, log_index=0, event_name="OrderStarted", address="0xAbC"):
+    return ChainLog(
+        event_name, address, block_number, f"h{block_number}", "0x1", log_index, {}
+    )
+
+
+def test_ranges_follow_the_head():
+    """Tests that blocks are scanned once, in bounded ranges behind the head."""
+    watcher = ChainEventWatcher(confirmations=2, max_block_range=10)
+    assert watcher.next_range(100) == (98, 98)
+    watcher.advance(98, 98, "h98", [])
+    assert watcher.next_range(100) is None
+    assert watcher.next_range(150) == (99, 108)
+
+
+def test_reorg_rewinds_and_removes_sent_events():
+    """Tests that events of blocks dropped by a reorg are returned as removed."""
+    watcher = ChainEventWatcher()
+    watcher.next_range(10)
+    watcher.advance(10, 10, "h10", [_log(10)])
+    watcher.advance(11, 12, "h12", [_log(12, 1), _log(11)])
+    chain = {10: "h10", 12: "other"}
+    removed = watcher.rewind(chain.get)
+    assert [log.block_number for log in removed] == [12, 11]
+    assert all(log.removed for log in removed)
+    assert watcher.cursor == 10
+    assert watcher.rewind(chain.get) == []
+
+
+def test_subscriptions_match_names_and_addresses():
+    """Tests that events are sent to the subscriptions naming them."""
+    watcher = ChainEventWatcher()
+    any_address = EventSubscription("skill_a", "ocean", ["OrderStarted"], [])
+    one_pool = EventSubscription("skill_b", "ocean", ["LOG_SWAP"], ["0xabc"])
+    watcher.subscribe(any_address)
+    watcher.subscribe(one_pool)
+    watcher.subscribe(EventSubscription("skill_a", "ocean", ["OrderStarted"], []))
+    assert watcher.event_names == {"OrderStarted", "LOG_SWAP"}
+    assert [subscription.to for subscription in watcher.subscribers(_log(1))] == [
+        "skill_a"
+    ]
+    assert watcher.subscribers(_log(1, event_name="LOG_SWAP")) == [one_pool]
+    assert watcher.subscribers(_log(1, event_name="LOG_SWAP", address="0xdef")) == []
+
+
+def test_blocks_scanned_without_subscriptions_are_scanned_again():
+    """Tests that the first subscription gets the blocks scanned before it."""
+    watcher = ChainEventWatcher()
+    assert watcher.next_range(10) == (10, 10)
+    watcher.advance(10, 10, "h10", [_log(10, event_name="MetadataCreated")])
+    watcher.advance(*watcher.next_range(12), "h12", [])
+    watcher.subscribe(EventSubscription("skill_a", "ocean", ["OrderStarted"], []))
+    assert watcher.next_range(12) == (10, 12)
+    assert watcher.scan_event_names() == {"OrderStarted"}
+    assert watcher.advance(10, 12, "h12", [_log(11)])[0].block_number == 11
+    assert watcher.next_range(12) is None
+
+
+def test_range_scanned_during_a_subscription_is_scanned_again():
+    """Tests that a range scanned without the events of a new subscription is dropped."""
+    watcher = ChainEventWatcher()
+    watcher.subscribe(EventSubscription("skill_a", "ocean", ["OrderStarted"], []))
+    assert watcher.scan_event_names() == {"OrderStarted"}
+    blocks = watcher.next_range(10)
+    watcher.subscribe(EventSubscription("skill_b", "ocean", ["LOG_SWAP"], []))
+    assert watcher.advance(*blocks, "h10", [_log(10)]) == []
+    assert watcher.next_range(10) == blocks
+    assert watcher.scan_event_names() == {"OrderStarted", "LOG_SWAP"}
+    assert len(watcher.advance(*blocks, "h10", [_log(10)])) == 1
@@ -0,0 +1,68 @@
+#
+# Copyright 2021 Ocean Protocol Foundation
+# SPDX-License-Identifier: Apache-2.0
+#
+from packages.eightballer.connections.ocean.compute_tracker import (
+    ComputeJob, ComputeJobGroup, ComputeJobTracker)
+
+
+def _job(started_at=0.0):
+    return ComputeJob("job", "did:op:data", to="buyer", sender="seller", started_at=started_at)
+
+
+def test_new_job_is_due_immediately():
+    """Tests that a freshly tracked job is polled on the next tick."""
+    tracker = ComputeJobTracker(min_interval=2.0, max_interval=30.0)
+    job = _job()
+    tracker.track(job)
+    assert tracker.due(now=0.0) == [job]
+
+
+def test_backoff_doubles_while_status_is_unchanged():
+    """Tests that the poll interval backs off until the status changes."""
+    tracker = ComputeJobTracker(min_interval=2.0, max_interval=10.0)
+    job = _job()
+    tracker.track(job)
+
+    tracker.update(job, 20, now=0.0)
+    assert job.interval == 2.0
+    intervals = []
+    for _ in range(4):
+        tracker.update(job, 20, now=0.0)
+        intervals.append(job.interval)
+    assert intervals == [4.0, 8.0, 10.0, 10.0]
+    assert tracker.due(now=9.0) == []
+
+    tracker.update(job, 30, now=0.0)
+    assert job.interval == 2.0
+    assert tracker.due(now=2.0) == [job]
+
+
+def test_completed_failed_and_expired_jobs():
+    """Tests that terminal and timed out jobs are reported."""
+    tracker = ComputeJobTracker(timeout=100.0)
+    job = _job()
+    tracker.track(job)
+
+    tracker.update(job, 70, now=1.0)
+    assert tracker.is_completed(job)
+    tracker.update(job, 31, now=1.0)
+    assert tracker.is_failed(job)
+    assert tracker.expired(now=50.0) == []
+    assert tracker.expired(now=101.0) == [job]
+    tracker.untrack(job)
+    assert len(tracker) == 0
+
+
+def test_group_completes_once_sealed_and_finished():
+    """Tests that a group completes once, after its last job has finished."""
+    group = ComputeJobGroup(["did:1", "did:2", "did:3"], to="buyer", sender="seller")
+    group.fail(["did:3"], "order failed")
+    group.add("job1", ["did:1", "did:2"])
+    assert not group.finish("job0")
+    assert not group.seal()
+    assert group.finish("job1", file_path="/results/job1")
+    assert not group.finish("job1")
+    assert group.job_ids == {"did:1": "job1", "did:2": "job1", "did:3": ""}
+    assert group.file_paths["did:2"] == "/results/job1"
+    assert group.errors == {"did:1": "", "did:2": "", "did:3": "order failed"}
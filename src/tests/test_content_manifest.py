@@ -0,0 +1,21 @@
+#
+# Copyright 2021 Ocean Protocol Foundation
+# SPDX-License-Identifier: Apache-2.0
+#
+from packages.eightballer.connections.storj_file_transfer.manifest import (
+    ContentManifest, content_key)
+
+
+def test_stored_objects_survive_a_restart(tmp_path):
+    """Tests that stored objects are found by digest after the manifest is reopened."""
+    path = str(tmp_path / "manifest.db")
+    manifest = ContentManifest(path)
+    manifest.put("abc", content_key("abc"), 10)
+    manifest.close()
+
+    manifest = ContentManifest(path)
+    assert manifest.get("abc") == "sha256/abc"
+    assert manifest.get("def") is None
+    manifest.remove("abc")
+    assert manifest.get("abc") is None
+    manifest.close()
@@ -0,0 +1,51 @@
+#
+# Copyright 2021 Ocean Protocol Foundation
+# SPDX-License-Identifier: Apache-2.0
+#
+from packages.eightballer.connections.ocean.ddo_cache import DDOCache
+
+
+def test_resolve_loads_once_and_counts():
+    """Tests that a ddo is only loaded on the first lookup."""
+    calls = []
+
+    def loader(did):
+        calls.append(did)
+        return {"did": did}
+
+    cache = DDOCache()
+    assert cache.resolve("did:op:1", loader) == {"did": "did:op:1"}
+    assert cache.resolve("did:op:1", loader) == {"did": "did:op:1"}
+    assert calls == ["did:op:1"]
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_unresolved_dids_are_not_cached():
+    """Tests that a did which is not indexed yet is looked up again."""
+    cache = DDOCache()
+    assert cache.resolve("did:op:1", lambda did: None) is None
+    assert len(cache) == 0
+
+
+def test_eviction_expiry_and_invalidation():
+    """Tests that entries leave the cache when full, stale or invalidated."""
+    cache = DDOCache(maxsize=2, ttl=10.0)
+    cache.put("a", 1, now=0.0)
+    cache.put("b", 2, now=0.0)
+    assert cache.get("a", now=1.0) == 1
+    cache.put("c", 3, now=1.0)
+    assert cache.get("b", now=1.0) is None
+    assert cache.get("a", now=20.0) is None
+    cache.invalidate("c")
+    assert cache.get("c", now=1.0) is None
+
+
+def test_changes_to_a_ddo_are_not_shared():
+    """Tests that a caller changing its ddo does not change the cached one."""
+    cache = DDOCache()
+    ddo = {"trusted_algorithms": ["did:op:algo"]}
+    cache.put("did:op:1", ddo)
+    ddo["trusted_algorithms"].append("did:op:uncommitted")
+    cache.get("did:op:1")["trusted_algorithms"].append("did:op:uncommitted")
+    assert cache.get("did:op:1") == {"trusted_algorithms": ["did:op:algo"]}
@@ -0,0 +1,23 @@
+#
+# Copyright 2021 Ocean Protocol Foundation
+# SPDX-License-Identifier: Apache-2.0
+#
+from packages.eightballer.skills.ocean_seller.registry import DeploymentRegistry
+
+
+def test_steps_survive_a_restart(tmp_path):
+    """Tests that recorded steps are loaded by a new registry on the same file."""
+    path = str(tmp_path / "deployments.db")
+    registry = DeploymentRegistry(path)
+    registry.set("algorithm", {"did": "did:op:1", "datatoken_contract_address": "0x1"})
+    registry.set("data_permissioned", True)
+    registry.close()
+
+    registry = DeploymentRegistry(path)
+    assert registry.load() == {
+        "algorithm": {"did": "did:op:1", "datatoken_contract_address": "0x1"},
+        "data_permissioned": True,
+    }
+    assert registry.get("datapool_address", "") == ""
+    registry.clear()
+    assert registry.load() == {}
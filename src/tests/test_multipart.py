@@ -0,0 +1,112 @@
+#
+# Copyright 2021 Ocean Protocol Foundation
+# SPDX-License-Identifier: Apache-2.0
+#
+import hashlib
+import io
+import threading
+
+import pytest
+
+# fmt: off
+from packages.eightballer.connections.storj_file_transfer.multipart import (
+    MIN_PART_SIZE, MultipartUploader, RangedDownloader, SequentialDigest)
+
+# fmt: on
+
+
+class _S3:
+    def __init__(self, failures=0):
+        self.failures = failures
+        self.parts = {}
+        self.completed = None
+        self.aborted = False
+        self._lock = threading.Lock()
+
+    def create_multipart_upload(self, Bucket, Key):
+        return {"UploadId": "upload"}
+
+    def upload_part(self, Bucket, Key, UploadId, PartNumber, Body):
+        with self._lock:
+            if self.failures:
+                self.failures -= 1
+                raise ConnectionError("reset")
+            self.parts[PartNumber] = Body
+        return {"ETag": f"etag{PartNumber}"}
+
+    def complete_multipart_upload(self, Bucket, Key, UploadId, MultipartUpload):
+        self.completed = MultipartUpload["Parts"]
+        return {"Key": Key}
+
+    def abort_multipart_upload(self, Bucket, Key, UploadId):
+        self.aborted = True
+
+    def head_object(self, Bucket, Key):
+        return {"ContentLength": len(self.parts[Key])}
+
+    def get_object(self, Bucket, Key, Range):
+        start, end = map(int, Range[len("bytes=") :].split("-"))
+        with self._lock:
+            if self.failures:
+                self.failures -= 1
+                # a connection dropped half way through the range
+                end = start + (end - start) // 2
+        return {"Body": io.BytesIO(self.parts[Key][start : end + 1])}
+
+
+def test_parts_are_uploaded_and_retried():
+    """Tests that a payload is split in ordered parts and failed parts are resent."""
+    payload = bytes(range(256)) * (MIN_PART_SIZE // 256) * 2 + b"tail"
+    s3 = _S3(failures=2)
+    uploader = MultipartUploader(s3, "bucket", part_size=1, sleep=lambda _: None)
+    uploader.upload("key", len(payload), lambda o, n: payload[o : o + n])
+    assert [part["PartNumber"] for part in s3.completed] == [1, 2, 3]
+    assert b"".join(s3.parts[n] for n in (1, 2, 3)) == payload
+    assert uploader.stats() == {"parts": 3, "retries": 2}
+
+
+def test_failed_upload_is_aborted():
+    """Tests that a part failing every attempt aborts the upload."""
+    s3 = _S3(failures=10)
+    uploader = MultipartUploader(s3, "bucket", attempts=2, sleep=lambda _: None)
+    with pytest.raises(ConnectionError):
+        uploader.upload("key", 10, lambda o, n: b"x" * n)
+    assert s3.aborted and s3.completed is None
+
+
+def test_parts_are_hashed_as_they_are_read():
+    """Tests that the digest of parts read by several threads is that of the payload."""
+    payload = bytes(range(256)) * (MIN_PART_SIZE // 256) * 3 + b"tail"
+    uploader = MultipartUploader(_S3(), "bucket", part_size=1, max_workers=4)
+    digest = SequentialDigest()
+    uploader.upload("key", len(payload), digest.wrap(lambda o, n: payload[o : o + n]))
+    assert digest.hexdigest() == hashlib.sha256(payload).hexdigest()
+
+
+def test_unreadable_part_releases_the_parts_after_it():
+    """Tests that a part which can not be read fails the upload instead of hanging."""
+
+    def read(offset, length):
+        if offset == 0:
+            raise IOError("disk error")
+        return b"x" * length
+
+    s3 = _S3()
+    uploader = MultipartUploader(s3, "bucket", part_size=1, max_workers=4)
+    digest = SequentialDigest()
+    with pytest.raises(IOError):
+        uploader.upload("key", MIN_PART_SIZE * 3, digest.wrap(read))
+    assert s3.aborted and digest.failed
+
+
+def test_ranges_are_downloaded_and_retried(tmp_path):
+    """Tests that an object is fetched in ranges and short ranges are fetched again."""
+    payload = bytes(range(256)) * (MIN_PART_SIZE // 256) * 2 + b"tail"
+    s3 = _S3(failures=2)
+    s3.parts["key"] = payload
+    path = tmp_path / "object"
+    downloader = RangedDownloader(s3, "bucket", part_size=1, sleep=lambda _: None)
+    size, digest = downloader.download("key", str(path), chunk_size=4096)
+    assert path.read_bytes() == payload
+    assert (size, digest) == (len(payload), hashlib.sha256(payload).hexdigest())
+    assert downloader.stats() == {"parts": 3, "retries": 2}
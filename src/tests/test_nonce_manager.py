@@ -0,0 +1,45 @@
+#
+# Copyright 2021 Ocean Protocol Foundation
+# SPDX-License-Identifier: Apache-2.0
+#
+from packages.eightballer.connections.ocean.nonce_manager import NonceManager
+
+
+class TimeExhausted(Exception):
+    """Stands in for the web3 error raised when a receipt never arrives."""
+
+
+def test_nonces_are_assigned_locally():
+    """Tests that the node is only asked for the first nonce."""
+    calls = []
+
+    def get_transaction_count(address):
+        calls.append(address)
+        return 7
+
+    manager = NonceManager("0xabc", get_transaction_count)
+    assert [manager.next_nonce() for _ in range(3)] == [7, 8, 9]
+    assert calls == ["0xabc"]
+    assert manager.in_flight == 3
+    manager.confirm()
+    assert manager.last_nonce() == 9
+    assert manager.in_flight == 2
+
+
+def test_dropped_transaction_resyncs():
+    """Tests that a dropped transaction makes the next one reuse its nonce."""
+    pending = [3]
+    manager = NonceManager("0xabc", lambda address: pending[0])
+    manager.next_nonce()
+    assert manager.next_nonce() == 4
+    assert manager.fail(TimeExhausted("receipt not found"))
+    assert manager.next_nonce() == 3
+
+
+def test_other_errors_keep_the_counter():
+    """Tests that a reverted transaction does not re-synchronise the nonces."""
+    manager = NonceManager("0xabc", lambda address: 0)
+    manager.next_nonce()
+    assert not manager.fail(ValueError("execution reverted"))
+    assert manager.fail(ValueError("{'message': 'nonce too low'}"))
+    assert manager.in_flight == 0
@@ -7,13 +7,35 @@
 # import pytest
 
 import os
+from concurrent.futures import Future
+from types import SimpleNamespace
+
+import pytest
 from aea.mail.base import Envelope
 from aea.configurations.base import ComponentType, ConnectionConfig, PublicId
+from ocean_lib.web3_internal.wallet import Wallet
 
-from packages.eightballer.connections.ocean.connection import OceanConnection
+from packages.eightballer.connections.ocean.connection import (
+    NONCE_MANAGERS,
+    OceanConnection,
+    _add_nonce_manager,
+    _get_nonce,
+    _library_get_nonce,
+    _remove_nonce_manager,
+)
+from packages.eightballer.connections.ocean.nonce_manager import NonceManager
+from packages.eightballer.connections.ocean.order_ledger import OrderLedger
+from packages.eightballer.connections.ocean.wallet_pool import WalletPool
 from packages.eightballer.protocols.ocean.message import OceanMessage
 
 
+def _connection(**config):
+    """Get a connection which is not connected to the network."""
+    return OceanConnection(
+        ConnectionConfig("ocean", "eightballer", "0.1.0", **config), "None"
+    )
+
+
 def test_datatoken_creation():
     """Tests that _deploy_datatoken function works as expected."""
 
@@ -49,3 +71,155 @@ def test_datatoken_creation():
     datatoken = ocean._deploy_datatoken(envelope)
 
     assert datatoken.name == "DataTokenTemplate"
+
+
+def test_every_nonce_of_a_call_is_settled():
+    """Tests that a call sending several transactions settles all their nonces."""
+    connection = _connection()
+    pending = [0]
+    manager = NonceManager("0xAbc", lambda address: pending[0])
+    _add_nonce_manager(manager)
+
+    def approve_then_swap(error=None):
+        _get_nonce(None, "0xAbc")
+        _get_nonce(None, "0xAbc")
+        if error is not None:
+            raise error
+
+    try:
+        connection._transact(approve_then_swap)
+        assert manager.in_flight == 0
+        with pytest.raises(ValueError):
+            connection._transact(approve_then_swap, ValueError("nonce too low"))
+        assert manager.in_flight == 0
+        # the approve was mined and the swap was not, its nonce is handed out again
+        pending[0] = 3
+        assert manager.next_nonce() == 3
+    finally:
+        _remove_nonce_manager("0xAbc")
+
+
+def test_nonces_are_given_back_to_ocean_lib():
+    """Tests that ocean_lib assigns the nonces when no account has a manager."""
+    assert Wallet._get_nonce is _library_get_nonce
+    _add_nonce_manager(NonceManager("0xAbc", lambda address: 0))
+    try:
+        assert Wallet._get_nonce is _get_nonce
+    finally:
+        _remove_nonce_manager("0xAbc")
+    assert Wallet._get_nonce is _library_get_nonce and not NONCE_MANAGERS
+
+
+def test_download_job_replies_with_a_reference(tmp_path):
+    """Tests that a download job downloads the asset and replies with its path."""
+    connection = _connection(max_inline_download_size=4)
+    connection.wallets = WalletPool([SimpleNamespace(address="0xabc")])
+    connection.order_ledger = OrderLedger(":memory:")
+    service = SimpleNamespace(index=0, main={"timeout": 0})
+    connection._resolve = lambda did: SimpleNamespace(
+        did=did, get_service=lambda service_type: service
+    )
+
+    def order(did, service, consumer_address=None):
+        future = Future()
+        future.set_result("0xorder")
+        return future
+
+    def download(did, service_index, consumer_wallet, order_tx_id, destination):
+        path = tmp_path / "datafile"
+        path.write_bytes(b"0123456789")
+        return str(path)
+
+    connection._order = order
+    connection.ocean = SimpleNamespace(
+        get_data_token=lambda address: SimpleNamespace(
+            balanceOf=lambda address: 10 ** 18
+        ),
+        assets=SimpleNamespace(download=download),
+    )
+    replies = []
+    connection.put_envelope = replies.append
+
+    message = OceanMessage(
+        OceanMessage.Performative.DOWNLOAD_JOB,
+        datatoken_address="0xdt",
+        datatoken_amt=1,
+        max_cost_ocean=1,
+        asset_did="did:op:1",
+        pool_address="0xpool",
+    )
+    message.sender = "msg.sender"
+    message.to = "test"
+    envelope = Envelope(to="test", sender="msg.sender", message=message)
+    connection._handle(connection._handlers[message.performative], envelope)
+
+    (reply,) = replies
+    assert reply.to == "msg.sender"
+    assert reply.message.performative == OceanMessage.Performative.DOWNLOAD_RECIEPT
+    assert reply.message.did == "did:op:1"
+    assert reply.message.file_path == str(tmp_path / "datafile")
+    assert reply.message.size == 10
+
+
+def _download_with_ledger(error):
+    """Dispatch a download whose order is in the ledger and whose provider fails."""
+    connection = _connection()
+    connection.resilience._sleep = lambda delay: None
+    connection.wallets = WalletPool([SimpleNamespace(address="0xABC")])
+    connection.order_ledger = OrderLedger(":memory:")
+    connection.order_ledger.put(OrderLedger.key("did:op:1", 0, "0xabc"), "0xorder", 0)
+    service = SimpleNamespace(index=0, main={"timeout": 0})
+    connection._resolve = lambda did: SimpleNamespace(
+        did=did, get_service=lambda service_type: service
+    )
+    consumers, orders = [], []
+
+    def order(did, service, consumer_address=None):
+        consumers.append(consumer_address)
+        future = Future()
+        future.set_result(
+            connection.order_ledger.get(connection._order_key(did, service))
+        )
+        return future
+
+    def purchase(message):
+        raise AssertionError("the order is paid already")
+
+    def download(did, service_index, consumer_wallet, order_tx_id, destination):
+        orders.append(order_tx_id)
+        raise error
+
+    connection._order = order
+    connection._purchase_datatoken = purchase
+    connection.ocean = SimpleNamespace(
+        get_data_token=lambda address: SimpleNamespace(balanceOf=lambda address: 0),
+        assets=SimpleNamespace(download=download),
+    )
+
+    message = OceanMessage(
+        OceanMessage.Performative.DOWNLOAD_JOB,
+        datatoken_address="0xdt",
+        datatoken_amt=1,
+        max_cost_ocean=1,
+        asset_did="did:op:1",
+        pool_address="0xpool",
+    )
+    message.sender = "msg.sender"
+    message.to = "test"
+    envelope = Envelope(to="test", sender="msg.sender", message=message)
+    with pytest.raises(type(error)):
+        connection._handle(connection._handlers[message.performative], envelope)
+
+    assert consumers == ["0xABC"]
+    assert set(orders) == {"0xorder"}
+    return connection.order_ledger.get(OrderLedger.key("did:op:1", 0, "0xabc"))
+
+
+def test_download_job_reuses_the_order_of_the_wallet():
+    """Tests that a download reuses the order of the wallet and drops it if rejected."""
+    assert _download_with_ledger(ValueError("order is not valid")) is None
+
+
+def test_download_job_keeps_the_order_on_transient_errors():
+    """Tests that a provider which cannot be reached does not lose a paid order."""
+    assert _download_with_ledger(ConnectionError("provider is down")) == "0xorder"
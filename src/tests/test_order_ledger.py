@@ -0,0 +1,28 @@
+#
+# Copyright 2021 Ocean Protocol Foundation
+# SPDX-License-Identifier: Apache-2.0
+#
+from packages.eightballer.connections.ocean.order_ledger import OrderLedger
+
+
+def test_orders_are_reused_until_they_expire(tmp_path):
+    """Tests that an order is reused while valid, and survives a restart."""
+    path = str(tmp_path / "orders.db")
+    ledger = OrderLedger(path, min_validity=60)
+    key = OrderLedger.key("did:op:1", 3, "0xAbC")
+    ledger.put(key, "0xtx", timeout=3600, now=0)
+    ledger.put(OrderLedger.key("did:op:2", 0, "0xabc"), "0xforever", timeout=0, now=0)
+    ledger.close()
+
+    ledger = OrderLedger(path, min_validity=60)
+    assert ledger.get(OrderLedger.key("did:op:1", 3, "0xabc"), now=100) == "0xtx"
+    assert ledger.get(OrderLedger.key("did:op:1", 3, "0xdef"), now=100) is None
+    assert ledger.get(OrderLedger.key("did:op:1", 2, "0xabc"), now=100) is None
+    assert ledger.get(key, now=3540) is None
+    assert ledger.prune(now=3600) == 1
+    assert (
+        ledger.get(OrderLedger.key("did:op:2", 0, "0xabc"), now=10 ** 9) == "0xforever"
+    )
+    ledger.remove(OrderLedger.key("did:op:2", 0, "0xabc"))
+    assert ledger.get(OrderLedger.key("did:op:2", 0, "0xabc")) is None
+    ledger.close()
@@ -0,0 +1,92 @@
+#
+# Copyright 2021 Ocean Protocol Foundation
+# SPDX-License-Identifier: Apache-2.0
+#
+import pytest
+
+# fmt: off
+from packages.eightballer.connections.ocean.pool_math import (WEI, PoolQuoter,
+                                                              PoolSnapshot)
+
+# fmt: on
+
+FEE = WEI // 1000  # 0.1%
+
+
+def _state(datatoken, ocean_balance, datatoken_balance, weights=(5, 5)):
+    return (
+        datatoken,
+        ocean_balance * WEI,
+        datatoken_balance * WEI,
+        weights[0] * WEI,
+        weights[1] * WEI,
+        FEE,
+    )
+
+
+def test_prices_match_balancer_formulas():
+    """Tests spot and in given out prices of an equal weight pool."""
+    snapshot = PoolSnapshot(1, {"0xpool": _state("0xdt", 100, 1000)})
+    assert snapshot.spot_prices()[0] == pytest.approx(0.1 / 0.999)
+    assert snapshot.in_given_out(10)[0] == pytest.approx(100 * (1000 / 990 - 1) / 0.999)
+    bought = snapshot.out_given_in(snapshot.in_given_out(10)[0])[0]
+    assert bought == pytest.approx(10)
+
+
+def test_cheapest_pool_of_a_datatoken():
+    """Tests that the cheapest pool trading the datatoken is picked."""
+    snapshot = PoolSnapshot(
+        1,
+        {
+            "0xexpensive": _state("0xdt", 200, 1000),
+            "0xcheap": _state("0xdt", 100, 1000),
+            "0xother": _state("0xother", 1, 1000),
+            "0xshallow": _state("0xdt", 1, 6),
+        },
+    )
+    pool, cost = snapshot.cheapest(10, "0xDT")
+    assert pool == "0xcheap"
+    assert cost == pytest.approx(snapshot.in_given_out(10)[1])
+    assert snapshot.cheapest(1000, "0xdt") is None
+
+
+def test_pools_are_read_once_per_block():
+    """Tests that quotes at the same block do not read the pools again."""
+    reads = []
+
+    def read_pool(pool):
+        reads.append(pool)
+        return _state("0xdt", 100, 1000)
+
+    quoter = PoolQuoter(read_pool)
+    quoter.snapshot(1, ["0xpool"])
+    quoter.snapshot(1, ["0xpool"])
+    assert reads == ["0xpool"]
+    quoter.snapshot(2, ["0xpool"])
+    assert reads == ["0xpool", "0xpool"]
+    assert quoter.max_cost(1.0) == WEI + WEI * 5 // 1000
+
+
+def test_only_requested_pools_are_read_and_failures_are_isolated():
+    """Tests that a quote reads its pools only and a failing pool does not fail it."""
+    reads = []
+
+    def read_pool(pool):
+        reads.append(pool)
+        if pool == "0xbroken":
+            raise ValueError("execution reverted")
+        return _state("0xdt" if pool != "0xother" else "0xodt", 100, 1000)
+
+    quoter = PoolQuoter(read_pool)
+    quoter.add("0xother", "0xbroken")
+    snapshot = quoter.snapshot(1, ["0xpool"])
+    assert reads == ["0xpool"] and snapshot.pools == ["0xpool"]
+    # pools which have not been read yet may trade the datatoken
+    assert quoter.pools_of("0xDT") == ["0xother", "0xbroken", "0xpool"]
+
+    snapshot = quoter.snapshot(1, quoter.pools_of("0xdt"))
+    assert reads == ["0xpool", "0xother", "0xbroken"]
+    assert snapshot.pools == ["0xother", "0xpool"]
+    assert quoter.pools_of("0xdt") == ["0xbroken", "0xpool"]
+    assert str(snapshot.errors["0xbroken"]) == "execution reverted"
+    assert snapshot.cheapest(10, "0xdt")[0] == "0xpool"
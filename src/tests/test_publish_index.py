@@ -0,0 +1,51 @@
+#
+# Copyright 2021 Ocean Protocol Foundation
+# SPDX-License-Identifier: Apache-2.0
+#
+from packages.eightballer.connections.ocean.publish_index import PublishIndex
+
+
+def _attributes(creator, date_published):
+    return {
+        "main": {
+            "name": "DATA_dataAssetAccessServiceAgreement",
+            "creator": creator,
+            "timeout": 86400,
+            "datePublished": date_published,
+            "cost": 1.0,
+        }
+    }
+
+
+def test_content_hash_ignores_publisher_and_date():
+    """Tests that republishing the same content gives the same hash."""
+    metadata = {"main": {"type": "dataset", "files": [{"url": "https://a"}]}}
+    first = PublishIndex.content_hash(
+        metadata, "access", _attributes("0x1", "2021-01-01T00:00:00Z")
+    )
+    second = PublishIndex.content_hash(
+        metadata, "access", _attributes("0x2", "2021-06-01T00:00:00Z")
+    )
+    other_url = PublishIndex.content_hash(
+        {"main": {"type": "dataset", "files": [{"url": "https://b"}]}},
+        "access",
+        _attributes("0x1", "2021-01-01T00:00:00Z"),
+    )
+    other_service = PublishIndex.content_hash(
+        metadata, "compute", _attributes("0x1", "2021-01-01T00:00:00Z")
+    )
+    assert first == second
+    assert len({first, other_url, other_service}) == 3
+
+
+def test_published_assets_survive_a_restart(tmp_path):
+    """Tests that the index is read back from its database."""
+    path = str(tmp_path / "published_assets.db")
+    index = PublishIndex(path)
+    index.put("hash", "did:op:1", "0xtoken", "0xpublisher")
+    index.close()
+
+    index = PublishIndex(path)
+    assert index.get("hash") == ("did:op:1", "0xtoken", "0xpublisher")
+    index.remove("hash")
+    assert index.get("hash") is None
@@ -0,0 +1,55 @@
+#
+# Copyright 2021 Ocean Protocol Foundation
+# SPDX-License-Identifier: Apache-2.0
+#
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from packages.eightballer.connections.ocean.read_cache import BlockReadCache
+
+
+class _Node:
+    def __init__(self):
+        self.block = 10
+        self.batches = []
+
+    def execute(self, calls, block):
+        self.batches.append((calls, block))
+        return [
+            None if data == "0xbad" else f"{to}{data}@{block}" for to, data in calls
+        ]
+
+
+def test_reads_are_cached_per_block():
+    """Tests that a read is made once per block and refreshed with the block."""
+    node = _Node()
+    cache = BlockReadCache(node.execute, lambda: node.block, block_ttl=0)
+    assert cache.read("0xA", "0x01") == "0xa0x01@10"
+    assert cache.read("0xa", "0x01") == "0xa0x01@10"
+    node.block = 11
+    assert cache.read("0xa", "0x01") == "0xa0x01@11"
+    cache.observe_block(12)
+    assert cache.read("0xa", "0x01") == "0xa0x01@12"
+    assert len(node.batches) == 3
+    assert cache.stats()["hits"] == 1
+    with pytest.raises(ValueError):
+        cache.read("0xa", "0xbad")
+
+
+def test_concurrent_reads_are_batched():
+    """Tests that reads made together are executed in bounded batches."""
+    node = _Node()
+    cache = BlockReadCache(
+        node.execute, lambda: node.block, batch_window=0.2, max_batch_size=5
+    )
+    with ThreadPoolExecutor(8) as executor:
+        results = list(
+            executor.map(lambda i: cache.read("0xa", f"0x{i % 6}"), range(8))
+        )
+    assert results == [f"0xa0x{i % 6}@10" for i in range(8)]
+    assert sum(len(calls) for calls, _ in node.batches) == 6
+    assert all(len(calls) <= 5 for calls, _ in node.batches)
+    assert len(node.batches) <= 2
+    stats = cache.stats()
+    assert stats["hits"] == 2 and stats["misses"] == 6
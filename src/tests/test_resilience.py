@@ -0,0 +1,80 @@
+#
+# Copyright 2021 Ocean Protocol Foundation
+# SPDX-License-Identifier: Apache-2.0
+#
+import pytest
+
+from packages.eightballer.connections.ocean.resilience import (
+    CircuitBreaker, CircuitOpenError, Resilience, is_transient)
+
+OPERATIONS = {"resolve": ("aquarius", 3), "start": ("aquarius", 1)}
+
+
+def _failing(*errors):
+    calls = []
+
+    def fn():
+        calls.append(None)
+        if len(calls) <= len(errors):
+            raise errors[len(calls) - 1]
+        return "ok"
+
+    return fn, calls
+
+
+def test_transient_errors_are_retried():
+    """Tests that connection errors are retried and other errors are not."""
+    delays = []
+    resilience = Resilience(OPERATIONS, sleep=delays.append)
+    fn, calls = _failing(ConnectionError(), TimeoutError())
+    assert resilience.call("resolve", fn) == "ok"
+    assert len(calls) == 3 and len(delays) == 2
+
+    fn, calls = _failing(ValueError("not found"))
+    with pytest.raises(ValueError):
+        resilience.call("resolve", fn)
+    assert len(calls) == 1
+
+    fn, calls = _failing(ConnectionError())
+    with pytest.raises(ConnectionError):
+        resilience.call("start", fn)
+    assert len(calls) == 1
+
+
+def test_breaker_opens_and_probes_once():
+    """Tests that an open circuit fails fast until a single probe closes it."""
+    breaker = CircuitBreaker("provider", failure_threshold=2, reset_timeout=10)
+    breaker.record_failure(now=0)
+    breaker.before_call(now=0)
+    breaker.record_failure(now=0)
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call(now=5)
+    breaker.before_call(now=11)
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call(now=11)
+    breaker.record_failure(now=11)
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call(now=15)
+    breaker.before_call(now=22)
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    breaker.before_call(now=22)
+
+
+def test_operations_share_the_breaker_of_their_endpoint():
+    """Tests that failures of one operation open the circuit of the others."""
+    resilience = Resilience(OPERATIONS, failure_threshold=3, sleep=lambda _: None)
+    fn, calls = _failing(*[OSError()] * 3)
+    with pytest.raises(OSError):
+        resilience.call("resolve", fn)
+    with pytest.raises(CircuitOpenError):
+        resilience.call("start", fn)
+    assert len(calls) == 3
+    assert resilience.stats() == {"aquarius": CircuitBreaker.OPEN}
+
+
+def test_only_unreachable_endpoints_are_transient():
+    """Tests that errors from reaching an endpoint are told from failed calls."""
+    assert is_transient(ConnectionError())
+    assert is_transient(CircuitOpenError("provider"))
+    assert not is_transient(ValueError("order is not valid"))
@@ -0,0 +1,31 @@
+#
+# Copyright 2021 Ocean Protocol Foundation
+# SPDX-License-Identifier: Apache-2.0
+#
+import hashlib
+import os
+
+import pytest
+
+from packages.eightballer.skills.ocean_seller.results import ResultWriter
+
+
+def test_chunks_are_reassembled_and_verified(tmp_path):
+    """Tests that in order chunks with the right digest give the whole result."""
+    path = str(tmp_path / "result")
+    writer = ResultWriter(path)
+    digest = hashlib.sha256(b"abcdef").hexdigest()
+    assert not writer.write(0, b"abc", False)
+    assert writer.write(1, b"def", True, digest)
+    with open(path, "rb") as f:
+        assert f.read() == b"abcdef"
+
+
+def test_out_of_order_chunk_removes_the_result(tmp_path):
+    """Tests that a missing chunk aborts the transfer."""
+    path = str(tmp_path / "result")
+    writer = ResultWriter(path)
+    writer.write(0, b"abc", False)
+    with pytest.raises(ValueError):
+        writer.write(2, b"ghi", False)
+    assert not os.path.exists(path)
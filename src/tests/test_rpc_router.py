@@ -0,0 +1,90 @@
+#
+# Copyright 2021 Ocean Protocol Foundation
+# SPDX-License-Identifier: Apache-2.0
+#
+import json
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from packages.eightballer.connections.ocean.resilience import CircuitBreaker
+from packages.eightballer.connections.ocean.rpc_router import RPCRouter
+
+
+def _node(name, delay):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            time.sleep(delay)
+            body = json.dumps(
+                {"jsonrpc": "2.0", "id": request["id"], "result": name}
+            ).encode()
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+@pytest.fixture
+def nodes():
+    servers = {}
+
+    def start(name, delay=0.0):
+        servers[name], url = _node(name, delay)
+        return url
+
+    yield start
+    for server in servers.values():
+        server.shutdown()
+        server.server_close()
+
+
+def _closed_url():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return f"http://127.0.0.1:{sock.getsockname()[1]}"
+
+
+def test_reads_go_to_the_fastest_and_writes_to_the_primary(nodes):
+    """Tests that reads follow latency while transactions stay on the primary."""
+    router = RPCRouter([nodes("primary", 0.05), nodes("fast")], min_hedge_delay=1)
+    for _ in range(3):
+        router.make_request("eth_blockNumber", [])
+    assert router.make_request("eth_blockNumber", [])["result"] == "fast"
+    assert router.make_request("eth_sendRawTransaction", ["0x"])["result"] == "primary"
+    router.close()
+
+
+def test_slow_reads_are_hedged(nodes):
+    """Tests that a read still unanswered after the hedge delay is sent again."""
+    router = RPCRouter([nodes("slow", 2.0), nodes("other")], min_hedge_delay=0.05)
+    started_at = time.time()
+    assert router.make_request("eth_call", [])["result"] == "other"
+    assert time.time() - started_at < 1.0
+    assert router.stats()["hedges_won"] == 1
+    router.close()
+
+
+def test_unreachable_nodes_are_failed_over(nodes):
+    """Tests that a node which can not be reached is skipped, then taken out."""
+    down = _closed_url()
+    router = RPCRouter([down, nodes("up")], failure_threshold=2)
+    for _ in range(3):
+        assert router.make_request("eth_sendRawTransaction", [])["result"] == "up"
+    assert router.make_request("eth_chainId", [])["result"] == "up"
+    assert router.stats()[down]["state"] == CircuitBreaker.OPEN
+    assert router.stats()[down]["requests"] == 2
+    router.close()
@@ -0,0 +1,31 @@
+#
+# Copyright 2021 Ocean Protocol Foundation
+# SPDX-License-Identifier: Apache-2.0
+#
+from collections import namedtuple
+
+from packages.eightballer.connections.ocean.wallet_pool import WalletPool
+
+FakeWallet = namedtuple("FakeWallet", "address")
+
+
+def test_new_work_goes_to_the_least_busy_wallet():
+    """Tests that concurrent operations are spread over the wallets."""
+    wallets = [FakeWallet("0xA"), FakeWallet("0xB"), FakeWallet("0xC")]
+    pool = WalletPool(wallets)
+    acquired = [pool.acquire() for _ in range(3)]
+    assert acquired == wallets
+    pool.release(wallets[1])
+    assert pool.acquire() == wallets[1]
+
+
+def test_owned_assets_keep_their_wallet():
+    """Tests that operations on an owned asset always use its owner."""
+    wallets = [FakeWallet("0xA"), FakeWallet("0xB")]
+    pool = WalletPool(wallets)
+    pool.assign(wallets[1], "did:op:1", "0xToken")
+    for _ in range(3):
+        assert pool.acquire("did:op:1") == wallets[1]
+    assert pool.acquire("did:op:2", "0xtoken") == wallets[1]
+    assert pool.owner("DID:OP:1") == wallets[1]
+    assert pool.get("0xa") == wallets[0]